@@ -197,18 +197,9 @@ with wizard.file_download_progress("large_file.zip", 1024000) as (progress, task
 # Dependency progress
 print("\nDependency progress:")
 dependencies = ["requests", "click", "rich", "loguru"]
-gen = wizard.dependency_progress(dependencies)
-first_yield = gen.__enter__()
-progress, task, dep = first_yield
-progress.advance(task)
-try:
-    while True:
-        progress, task, dep = next(gen.gen)
-        progress.advance(task)
+with wizard.dependency_progress(dependencies) as (progress, task, items):
+    for _dependency in items:
         time.sleep(0.1)
-except (StopIteration, AttributeError):
-    pass
-gen.__exit__(None, None, None)
 
 # Step progress
 print("\nStep progress:")
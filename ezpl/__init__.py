@@ -55,10 +55,11 @@ if sys.version_info < (3, 10):
 # IMPORTS
 # =============================================================================
 
+from typing import TYPE_CHECKING
+
 # ------------------------------------------------
-# CORE CONFIG & EXCEPTIONS
+# CORE EXCEPTIONS
 # ------------------------------------------------
-from .config import ConfigurationManager
 from .core.exceptions import (
     ConfigurationError,
     EzplError,
@@ -68,61 +69,104 @@ from .core.exceptions import (
     LoggingError,
     ValidationError,
 )
+from .core.lazy import lazy_exports
 
 # ------------------------------------------------
-# MAIN CLASS & HANDLERS
+# LAZY EXPORTS
 # ------------------------------------------------
-from .ezpl import Ezpl
-from .handlers import ConsolePrinter, EzLogger, EzPrinter, FileLogger, RichWizard
-from .handlers.console import ConsolePrinterWrapper
+# Loaded on first access by __getattr__, so `import ezpl` does not pay for
+# loguru, Rich, the handlers or the wizard: name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # Main class & handlers
+    "Ezpl": (".ezpl", "Ezpl"),
+    "ConsolePrinter": (".handlers.console", "ConsolePrinter"),
+    "ConsolePrinterWrapper": (".handlers.console", "ConsolePrinterWrapper"),
+    "FileLogger": (".handlers.file", "FileLogger"),
+    "RingBufferHandler": (".handlers.ring_buffer", "RingBufferHandler"),
+    "RichWizard": (".handlers.wizard.core", "RichWizard"),
+    "EzPrinter": (".handlers.console", "ConsolePrinter"),
+    "EzLogger": (".handlers.file", "FileLogger"),
+    # Type aliases: Printer is the console printer handler (EzPrinter),
+    # Logger the file logger handler (EzLogger)
+    "Printer": (".handlers.console", "ConsolePrinter"),
+    "Logger": (".handlers.file", "FileLogger"),
+    # Configuration
+    "ConfigurationManager": (".config.manager", "ConfigurationManager"),
+    # Types
+    "LogLevel": (".types.log_level", "LogLevel"),
+    "Pattern": (".types.patterns", "Pattern"),
+    "PATTERN_COLORS": (".types.patterns", "PATTERN_COLORS"),
+    "get_pattern_color": (".types.patterns", "get_pattern_color"),
+    "get_pattern_color_by_name": (".types.patterns", "get_pattern_color_by_name"),
+    "register_pattern": (".types.patterns", "register_pattern"),
+    "unregister_pattern": (".types.patterns", "unregister_pattern"),
+    "set_pattern_color": (".types.patterns", "set_pattern_color"),
+}
+
+if TYPE_CHECKING:
+    from .config import ConfigurationManager
+    from .ezpl import Ezpl
+    from .handlers import (
+        ConsolePrinter,
+        EzLogger,
+        EzPrinter,
+        FileLogger,
+        RichWizard,
+        RingBufferHandler,
+    )
+    from .handlers.console import ConsolePrinterWrapper
+    from .types import (
+        PATTERN_COLORS,
+        LogLevel,
+        Pattern,
+        get_pattern_color,
+        get_pattern_color_by_name,
+        register_pattern,
+        set_pattern_color,
+        unregister_pattern,
+    )
 
-# ------------------------------------------------
-# TYPES
-# ------------------------------------------------
-from .types import (
-    PATTERN_COLORS,
-    LogLevel,
-    Pattern,
-    get_pattern_color,
-    get_pattern_color_by_name,
-)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 # =============================================================================
 # TYPE ALIASES
 # =============================================================================
 
 # Canonical type aliases for users.
-# They mirror the internal EzPrinter / EzLogger types.
+# They mirror the internal EzPrinter / EzLogger types and, like them, are
+# loaded on first access (see _LAZY_EXPORTS).
 
-# ------------------------------------------------
-# PRINTER TYPE ALIAS
-# ------------------------------------------------
-Printer = EzPrinter
-"""Type alias for EzPrinter (console printer handler).
-Use this type when you want to annotate a variable that represents a printer.
-
-Example:
-    >>> from ezpl import Ezpl, Printer
-    >>> ezpl = Ezpl()
-    >>> printer: Printer = ezpl.get_printer()
-    >>> printer.info("Hello!")
-    >>> printer.success("Done!")
-    >>> printer.print_json({"key": "value"})
-"""
+if TYPE_CHECKING:
+    # ------------------------------------------------
+    # PRINTER TYPE ALIAS
+    # ------------------------------------------------
+    Printer = EzPrinter
+    """Type alias for EzPrinter (console printer handler).
+    Use this type when you want to annotate a variable that represents a printer.
+
+    Example:
+        >>> from ezpl import Ezpl, Printer
+        >>> ezpl = Ezpl()
+        >>> printer: Printer = ezpl.get_printer()
+        >>> printer.info("Hello!")
+        >>> printer.success("Done!")
+        >>> printer.print_json({"key": "value"})
+    """
 
-# ------------------------------------------------
-# LOGGER TYPE ALIAS
-# ------------------------------------------------
-Logger = EzLogger
-"""Type alias for EzLogger (file logger handler).
-Use this type when you want to annotate a variable that represents a logger.
+    # ------------------------------------------------
+    # LOGGER TYPE ALIAS
+    # ------------------------------------------------
+    Logger = EzLogger
+    """Type alias for EzLogger (file logger handler).
+    Use this type when you want to annotate a variable that represents a logger.
 
-Example:
-    >>> from ezpl import Ezpl, Logger
-    >>> ezpl = Ezpl()
-    >>> logger: Logger = ezpl.get_logger()
-    >>> logger.info("Logged to file")
-"""
+    Example:
+        >>> from ezpl import Ezpl, Logger
+        >>> ezpl = Ezpl()
+        >>> logger: Logger = ezpl.get_logger()
+        >>> logger.info("Logged to file")
+    """
 
 # =============================================================================
 # MODULE EXPORTS
@@ -143,6 +187,7 @@ __all__ = [
     "FileLogger",
     "ConsolePrinterWrapper",
     "RichWizard",
+    "RingBufferHandler",
     # ------------------------------------------------
     # CONFIGURATION EXPORTS
     # ------------------------------------------------
@@ -159,6 +204,9 @@ __all__ = [
     "PATTERN_COLORS",
     "get_pattern_color",
     "get_pattern_color_by_name",
+    "register_pattern",
+    "unregister_pattern",
+    "set_pattern_color",
     # ------------------------------------------------
     # EXCEPTION EXPORTS
     # ------------------------------------------------
@@ -0,0 +1,48 @@
+"""
+Benchmarks module for Ezpl logging framework.
+
+This module measures throughput and latency of Ezpl's handlers and log
+utilities, stores results as JSON and compares them against a baseline.
+Run it with ``ezpl bench`` or ``python -m ezpl.benchmarks``.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+# ------------------------------------------------
+# RUNNER
+# ------------------------------------------------
+from .runner import (
+    BENCHMARKS,
+    BenchmarkContext,
+    BenchmarkResult,
+    benchmark,
+    compare_results,
+    generate_log_file,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    # ------------------------------------------------
+    # RUNNER EXPORTS
+    # ------------------------------------------------
+    "BENCHMARKS",
+    "BenchmarkContext",
+    "BenchmarkResult",
+    "benchmark",
+    "run_benchmarks",
+    "generate_log_file",
+    # ------------------------------------------------
+    # RESULTS EXPORTS
+    # ------------------------------------------------
+    "save_results",
+    "load_results",
+    "compare_results",
+]
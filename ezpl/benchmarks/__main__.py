@@ -0,0 +1,21 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Benchmarks Entry Point
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Run Ezpl benchmarks with ``python -m ezpl.benchmarks``.
+
+Accepts the same options as ``ezpl bench``.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Internal modules
+from ..cli.commands.bench import bench_command
+
+## ==> MAIN ENTRY POINT
+# ///////////////////////////////////////////////////////////////
+
+if __name__ == "__main__":
+    bench_command(prog_name="python -m ezpl.benchmarks")
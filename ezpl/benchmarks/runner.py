@@ -0,0 +1,538 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Benchmark Runner
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmark runner for Ezpl.
+
+This module provides the benchmark registry, timing helpers, JSON result
+storage and comparison against a saved baseline.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import json
+import platform
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Optional, Union
+
+# Internal modules
+from ..core.exceptions import FileOperationError, ValidationError
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class BenchmarkResult:
+    """
+    Result of one benchmark case.
+
+    Latencies are per operation: one record for handler benchmarks, one
+    full pass over the file for parser and statistics benchmarks.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        name: str,
+        ops: int,
+        seconds: float,
+        p50: float,
+        p99: float,
+        unit: str = "records",
+        params: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize a benchmark result.
+
+        Args:
+            name: Unique case name (e.g., 'parser.parse[100000]')
+            ops: Number of processed units (records or lines)
+            seconds: Total elapsed time in seconds
+            p50: Median latency per operation in seconds
+            p99: 99th percentile latency per operation in seconds
+            unit: Processed unit, used for the rate label
+            params: Case parameters (size, mode, ...)
+        """
+        self.name = name
+        self.ops = ops
+        self.seconds = seconds
+        self.p50 = p50
+        self.p99 = p99
+        self.unit = unit
+        self.params = params or {}
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def rate(self) -> float:
+        """Processed units per second."""
+        return self.ops / self.seconds if self.seconds > 0 else 0.0
+
+    # ///////////////////////////////////////////////////////////////
+    # SERIALIZATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the result
+        """
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "seconds": self.seconds,
+            "rate": self.rate,
+            "p50": self.p50,
+            "p99": self.p99,
+            "unit": self.unit,
+            "params": self.params,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkResult":
+        """
+        Build a result from its dictionary representation.
+
+        Args:
+            data: Dictionary produced by ``to_dict``
+
+        Returns:
+            BenchmarkResult instance
+        """
+        return cls(
+            name=data["name"],
+            ops=data["ops"],
+            seconds=data["seconds"],
+            p50=data["p50"],
+            p99=data["p99"],
+            unit=data.get("unit", "records"),
+            params=data.get("params"),
+        )
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __str__(self) -> str:
+        """String representation of the result."""
+        return f"{self.name}: {self.rate:,.0f} {self.unit}/s"
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the result."""
+        return (
+            f"BenchmarkResult(name={self.name!r}, rate={self.rate:.1f}, "
+            f"p50={self.p50:.3g}, p99={self.p99:.3g})"
+        )
+
+
+class BenchmarkContext:
+    """
+    Parameters and scratch space shared by benchmark functions.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        work_dir: Path,
+        iterations: int = 20000,
+        sizes: Iterable[int] = (100_000, 1_000_000),
+        repeats: int = 3,
+    ) -> None:
+        """
+        Initialize the context.
+
+        Args:
+            work_dir: Directory for generated files and benchmark logs
+            iterations: Records emitted by handler benchmarks
+            sizes: Line counts of generated files for parser benchmarks
+            repeats: Passes over each generated file
+        """
+        self.work_dir = Path(work_dir)
+        self.iterations = iterations
+        self.sizes = tuple(sizes)
+        self.repeats = repeats
+        self._generated: dict[int, Path] = {}
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def log_file(self, lines: int) -> Path:
+        """
+        Get a generated log file with the given number of lines.
+
+        Files are generated once and reused by all benchmarks of a run.
+
+        Args:
+            lines: Number of log lines
+
+        Returns:
+            Path to the generated file
+        """
+        path = self._generated.get(lines)
+        if path is None:
+            path = generate_log_file(self.work_dir / f"generated_{lines}.log", lines)
+            self._generated[lines] = path
+        return path
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Register a benchmark function.
+
+    The function receives a BenchmarkContext and returns a list of
+    BenchmarkResult (one per case).
+
+    Args:
+        name: Benchmark name used for selection (e.g., 'printer')
+
+    Returns:
+        Decorator registering the function
+    """
+
+    def decorator(
+        func: Callable[[BenchmarkContext], list[BenchmarkResult]],
+    ) -> Callable[[BenchmarkContext], list[BenchmarkResult]]:
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def time_calls(
+    name: str,
+    func: Callable[[], Any],
+    count: int,
+    unit: str = "records",
+    params: Optional[dict[str, Any]] = None,
+    drain: Optional[Callable[[], Any]] = None,
+) -> BenchmarkResult:
+    """
+    Time ``count`` calls of a function, one latency sample per call.
+
+    Args:
+        name: Case name
+        func: Function to call
+        count: Number of calls
+        unit: Processed unit
+        params: Case parameters
+        drain: Called once after the loop and included in the total time
+            (e.g., waiting for an asynchronous writer)
+
+    Returns:
+        BenchmarkResult of the case
+    """
+    samples = [0.0] * count
+    start = perf_counter()
+    for index in range(count):
+        call_start = perf_counter()
+        func()
+        samples[index] = perf_counter() - call_start
+    if drain is not None:
+        drain()
+    total = perf_counter() - start
+    return _build_result(name, count, total, samples, unit, params)
+
+
+def time_passes(
+    name: str,
+    func: Callable[[], Any],
+    repeats: int,
+    ops_per_pass: int,
+    unit: str = "lines",
+    params: Optional[dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """
+    Time full passes of a bulk operation, one latency sample per pass.
+
+    Args:
+        name: Case name
+        func: Function performing one pass
+        repeats: Number of passes
+        ops_per_pass: Units processed by one pass (for the rate)
+        unit: Processed unit
+        params: Case parameters
+
+    Returns:
+        BenchmarkResult of the case
+    """
+    samples = []
+    for _ in range(repeats):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return _build_result(
+        name, ops_per_pass * repeats, sum(samples), samples, unit, params
+    )
+
+
+def run_benchmarks(
+    only: Optional[Iterable[str]] = None,
+    iterations: int = 20000,
+    sizes: Iterable[int] = (100_000, 1_000_000),
+    repeats: int = 3,
+    work_dir: Optional[Path] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> list[BenchmarkResult]:
+    """
+    Run registered benchmarks.
+
+    Args:
+        only: Benchmark names to run (default: all)
+        iterations: Records emitted by handler benchmarks
+        sizes: Line counts of generated files for parser benchmarks
+        repeats: Passes over each generated file
+        work_dir: Scratch directory (default: a temporary directory)
+        on_result: Callback invoked as each result becomes available
+
+    Returns:
+        List of BenchmarkResult
+
+    Raises:
+        ValidationError: If an unknown benchmark name is requested
+    """
+    from . import suites  # noqa: F401 - registers the built-in benchmarks
+
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValidationError(
+            f"Unknown benchmark(s): {', '.join(unknown)} "
+            f"(available: {', '.join(BENCHMARKS)})",
+            "only",
+            ",".join(unknown),
+        )
+
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="ezpl-bench-") as tmp_dir:
+        context = BenchmarkContext(
+            Path(work_dir) if work_dir else Path(tmp_dir),
+            iterations=iterations,
+            sizes=sizes,
+            repeats=repeats,
+        )
+        context.work_dir.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            for result in BENCHMARKS[name](context):
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+    return results
+
+
+def generate_log_file(path: Path, lines: int) -> Path:
+    """
+    Write a log file in FileLogger's format.
+
+    Args:
+        path: Destination file
+        lines: Number of log lines
+
+    Returns:
+        Path to the generated file
+    """
+    levels = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR", "SUCCESS")
+    messages = (
+        "request handled in 12 ms",
+        "cache miss for key user:42",
+        "connection pool exhausted, retrying",
+        "payload {'id': 7, 'status': 'ok'}",
+        "timeout while contacting upstream",
+    )
+    chunk: list[str] = []
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(lines):
+            minute, second = divmod(index // 50 % 3600, 60)
+            chunk.append(
+                f"2024-01-15 10:{minute:02d}:{second:02d} | "
+                f"{levels[index % len(levels)]:<10} | "
+                f"service:handler_{index % 13}:{index % 400 + 1} - "
+                f"{messages[index % len(messages)]} #{index}\n"
+            )
+            if len(chunk) >= 10000:
+                f.writelines(chunk)
+                chunk.clear()
+        f.writelines(chunk)
+    return path
+
+
+def save_results(results: Iterable[BenchmarkResult], path: Union[str, Path]) -> Path:
+    """
+    Save results and environment metadata to a JSON file.
+
+    Args:
+        results: Benchmark results
+        path: Destination file
+
+    Returns:
+        Path of the written file
+
+    Raises:
+        FileOperationError: If the file cannot be written
+    """
+    from .. import __version__
+
+    path = Path(path)
+    document = {
+        "ezpl_version": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "results": [result.to_dict() for result in results],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    except OSError as e:
+        raise FileOperationError(
+            f"Failed to save benchmark results: {e}", str(path), "write"
+        ) from e
+    return path
+
+
+def load_results(path: Union[str, Path]) -> list[BenchmarkResult]:
+    """
+    Load results saved by ``save_results``.
+
+    Args:
+        path: JSON results file
+
+    Returns:
+        List of BenchmarkResult
+
+    Raises:
+        FileOperationError: If the file cannot be read or parsed
+    """
+    path = Path(path)
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+        return [BenchmarkResult.from_dict(data) for data in document["results"]]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise FileOperationError(
+            f"Failed to load benchmark results: {e}", str(path), "read"
+        ) from e
+
+
+def compare_results(
+    current: Iterable[BenchmarkResult],
+    baseline: Iterable[BenchmarkResult],
+    threshold: float = 0.10,
+) -> list[dict[str, Any]]:
+    """
+    Compare results against a baseline by throughput.
+
+    Args:
+        current: Results of this run
+        baseline: Saved baseline results
+        threshold: Relative throughput drop reported as a regression
+
+    Returns:
+        One dict per case with name, baseline_rate, current_rate, change
+        (relative throughput change) and status ('regression',
+        'improvement', 'ok', 'new' or 'missing')
+    """
+    baseline_by_name = {result.name: result for result in baseline}
+    comparisons = []
+    for result in current:
+        reference = baseline_by_name.pop(result.name, None)
+        if reference is None or reference.rate <= 0:
+            comparisons.append(
+                {
+                    "name": result.name,
+                    "baseline_rate": None,
+                    "current_rate": result.rate,
+                    "change": None,
+                    "status": "new",
+                }
+            )
+            continue
+        change = result.rate / reference.rate - 1.0
+        if change < -threshold:
+            status = "regression"
+        elif change > threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(
+            {
+                "name": result.name,
+                "baseline_rate": reference.rate,
+                "current_rate": result.rate,
+                "change": change,
+                "status": status,
+            }
+        )
+    for reference in baseline_by_name.values():
+        comparisons.append(
+            {
+                "name": reference.name,
+                "baseline_rate": reference.rate,
+                "current_rate": None,
+                "change": None,
+                "status": "missing",
+            }
+        )
+    return comparisons
+
+
+# ------------------------------------------------
+# PRIVATE HELPER FUNCTIONS
+# ------------------------------------------------
+
+
+def _build_result(
+    name: str,
+    ops: int,
+    total: float,
+    samples: list[float],
+    unit: str,
+    params: Optional[dict[str, Any]],
+) -> BenchmarkResult:
+    """Build a result from raw latency samples."""
+    samples = sorted(samples)
+    return BenchmarkResult(
+        name=name,
+        ops=ops,
+        seconds=total,
+        p50=_percentile(samples, 0.50),
+        p99=_percentile(samples, 0.99),
+        unit=unit,
+        params=params,
+    )
+
+
+def _percentile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted samples (0.0 if empty)."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, round(q * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# name -> benchmark function, filled by the @benchmark decorator
+BENCHMARKS: dict[str, Callable[[BenchmarkContext], list[BenchmarkResult]]] = {}
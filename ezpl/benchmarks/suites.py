@@ -0,0 +1,643 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Benchmark Suites
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Built-in benchmarks for Ezpl.
+
+This module registers benchmarks for ConsolePrinter.print_pattern,
+DynamicLayeredProgress updates, FileLogger.log, multi-process logging, LogParser, LogStatistics, Ezpl
+construction, LogExporter and the cold start of each CLI subcommand.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# External libraries
+from loguru import logger
+from rich.console import Console
+
+# Internal modules
+from ..cli.utils.log_export import LogExporter
+from ..cli.utils.log_parser import LogParser
+from ..cli.utils.log_stats import LogStatistics
+from ..handlers import (
+    ConsolePrinter,
+    FileLogger,
+    LogWriterServer,
+    SharedMemoryTransport,
+    SocketTransport,
+)
+from ..handlers.multiprocess import (
+    DEFAULT_RING_SIZE,
+    WRITER_ENV,
+    WRITER_KEY_ENV,
+    encode_frame,
+    shared_memory_supported,
+)
+from ..handlers.wizard.dynamic import DynamicLayeredProgress
+from .runner import (
+    BenchmarkContext,
+    BenchmarkResult,
+    benchmark,
+    time_calls,
+    time_passes,
+)
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Run in a fresh interpreter: import ezpl, build Ezpl() (plus an optional
+# statement), then print the construction time and the resident memory in
+# KiB (current RSS where /proc is available, peak RSS otherwise)
+_CONSTRUCTION_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from ezpl import Ezpl
+ezpl = Ezpl()
+{statement}
+elapsed = time.perf_counter() - start
+try:
+    with open("/proc/self/status") as status:
+        rss = next(int(l.split()[1]) for l in status if l.startswith("VmRSS:"))
+except (OSError, StopIteration):
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss = rss // 1024 if sys.platform == "darwin" else rss
+    except ImportError:
+        rss = 0
+print(elapsed, rss)
+"""
+
+# Run in a fresh interpreter: export a log file, then print the peak resident
+# memory in KiB (VmHWM where /proc is available, ru_maxrss otherwise)
+_EXPORT_SCRIPT = """
+import sys
+from ezpl.cli.utils.log_export import LogExporter
+LogExporter(sys.argv[1]).export(sys.argv[2], format=sys.argv[3])
+try:
+    with open("/proc/self/status") as status:
+        rss = next(int(l.split()[1]) for l in status if l.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss = rss // 1024 if sys.platform == "darwin" else rss
+    except ImportError:
+        rss = 0
+print(rss)
+"""
+
+# Export formats benchmarked: name -> (format, output suffix)
+_EXPORT_CASES = {
+    "json": ("json", ".json"),
+    "ndjson": ("ndjson", ".ndjson"),
+    "csv": ("csv", ".csv"),
+    "csv.gz": ("csv", ".csv.gz"),
+}
+
+# Lines of the generated file read by the `logs` subcommands
+_CLI_LOG_LINES = 1000
+
+# Worker processes of the multi-process benchmark
+_WORKERS = 8
+
+# Run in a worker process: log records through a FileLogger that writes the
+# file directly, or ships to the writer advertised in the environment
+_WORKER_SCRIPT = """
+import sys
+from loguru import logger
+from ezpl.handlers.file import FileLogger
+from ezpl.handlers.multiprocess import transport_from_environment
+logger.remove()
+transport = transport_from_environment(sys.argv[2]) if sys.argv[2] != "direct" else None
+handler = FileLogger(sys.argv[1], transport=transport)
+for index in range({count}):
+    handler.log("INFO", "processing item %d" % index)
+handler.close()
+"""
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class _NullWriter:
+    """Text stream discarding everything, so only rendering is measured."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+## ==> BENCHMARKS
+# ///////////////////////////////////////////////////////////////
+
+
+@benchmark("printer")
+def bench_printer(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """ConsolePrinter.print_pattern rendered by Rich, as plain text and async."""
+    results = []
+    cases = (
+        ("tty", True, "rich", False),
+        ("non-tty", False, "rich", False),
+        ("plain", False, "plain", False),
+        ("async", True, "rich", True),
+    )
+    for name, is_terminal, mode, async_render in cases:
+        printer = ConsolePrinter(
+            level="DEBUG",
+            mode=mode,
+            async_render=async_render,
+            queue_size=context.iterations,
+        )
+        printer._console = Console(
+            file=_NullWriter(),
+            force_terminal=is_terminal,
+            color_system="truecolor" if is_terminal else None,
+            width=120,
+        )
+        counter = iter(range(context.iterations))
+        # The async case includes draining the render queue in its throughput
+        results.append(
+            time_calls(
+                f"printer.print_pattern[{name}]",
+                lambda printer=printer, counter=counter: printer.print_pattern(
+                    "INFO", f"processing item {next(counter)}", "INFO"
+                ),
+                context.iterations,
+                params={
+                    "terminal": is_terminal,
+                    "mode": mode,
+                    "async": async_render,
+                },
+                drain=printer.close,
+            )
+        )
+    return results
+
+
+@benchmark("layered_progress")
+def bench_layered_progress(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """DynamicLayeredProgress per-item updates on a live terminal display."""
+    results = []
+    cases = (
+        ("update_layer[progress]", "progress", False),
+        ("update_layer[steps]", "steps", False),
+        ("advance_layer", "progress", True),
+    )
+    for name, layer_type, advance in cases:
+        console = Console(
+            file=_NullWriter(),
+            force_terminal=True,
+            color_system="truecolor",
+            width=120,
+        )
+        stages = [
+            {
+                "name": "work",
+                "type": layer_type,
+                "total": context.iterations,
+                "steps": [f"item {index}" for index in range(context.iterations)],
+            }
+        ]
+        progress = DynamicLayeredProgress(console, "", stages, fast=True)
+        progress.start()
+        counter = iter(range(context.iterations))
+        # Stopping pushes the last update and renders the final frame
+        results.append(
+            time_calls(
+                f"layered_progress.{name}",
+                (
+                    (lambda progress=progress: progress.advance_layer("work"))
+                    if advance
+                    else lambda progress=progress, counter=counter: (
+                        progress.update_layer("work", next(counter), "processing")
+                    )
+                ),
+                context.iterations,
+                unit="updates",
+                params={"type": layer_type, "advance": advance},
+                drain=progress.stop,
+            )
+        )
+    return results
+
+
+@benchmark("file_logger")
+def bench_file_logger(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """FileLogger.log written synchronously and through loguru's queue."""
+    results = []
+    for mode, enqueue in (("sync", False), ("async", True)):
+        logger.remove()  # Only the benchmarked handler may receive records
+        log_file = context.work_dir / f"file_logger_{mode}.log"
+        handler = FileLogger(log_file, level="DEBUG", enqueue=enqueue)
+        counter = iter(range(context.iterations))
+        # The async case includes draining the queue in its throughput
+        results.append(
+            time_calls(
+                f"file_logger.log[{mode}]",
+                lambda handler=handler, counter=counter: handler.log(
+                    "INFO", f"processing item {next(counter)}"
+                ),
+                context.iterations,
+                params={"mode": mode},
+                drain=handler.close,
+            )
+        )
+        log_file.unlink(missing_ok=True)
+    return results
+
+
+@benchmark("multiprocess")
+def bench_multiprocess(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """
+    Eight worker processes logging to one file, directly or via a writer
+    (socket or shared-memory transport), and the producer-side cost of
+    each transport's send.
+
+    Worker throughput is measured from worker launch until the file holds
+    every record, so it includes interpreter startup. The send cases call
+    transport.send in a loop in this process: their latencies are the
+    per-record cost paid by a worker, and their throughput includes the
+    writer draining the last records.
+    """
+    per_worker = max(1, context.iterations // _WORKERS)
+    total = per_worker * _WORKERS
+    script = _WORKER_SCRIPT.format(count=per_worker)
+    transports = ("socket", "shm") if shared_memory_supported() else ("socket",)
+    results = []
+    for transport in ("direct", *transports):
+        logger.remove()  # Only the benchmarked handler may receive records
+        log_file = context.work_dir / f"multiprocess_{transport}.log"
+        writer = FileLogger(log_file, level="DEBUG")
+        server = LogWriterServer(writer.write_remote) if transport != "direct" else None
+
+        def run(
+            server: Optional[LogWriterServer] = server,
+            log_file: Path = log_file,
+            transport: str = transport,
+        ) -> None:
+            env = server.environment() if server is not None else {}
+            _run_workers(
+                context.work_dir,
+                _WORKERS,
+                env,
+                "-c",
+                script,
+                str(log_file),
+                transport,
+            )
+            if server is not None:
+                _wait_received(server, total)
+
+        results.append(
+            time_passes(
+                f"multiprocess.{transport}[{_WORKERS}]",
+                run,
+                1,
+                total,
+                unit="records",
+                params={"transport": transport, "workers": _WORKERS},
+            )
+        )
+        if server is not None:
+            server.close()
+        writer.close()
+        log_file.unlink(missing_ok=True)
+
+    frame = encode_frame(20, "processing item 0\n")
+    for transport in transports:
+        server = LogWriterServer(lambda *_: None)
+        env = server.environment()
+        address, authkey = env[WRITER_ENV], bytes.fromhex(env[WRITER_KEY_ENV])
+        if transport == "shm":
+            # Room for every frame, so no record is dropped on a full ring
+            ring_size = DEFAULT_RING_SIZE + context.iterations * (len(frame) + 4)
+            sender: SocketTransport = SharedMemoryTransport(
+                address, authkey, ring_size=ring_size
+            )
+        else:
+            sender = SocketTransport(address, authkey)
+        sender.send(frame)  # Connect (and announce the ring) before timing
+        _wait_received(server, 1)
+        results.append(
+            time_calls(
+                f"multiprocess.send[{transport}]",
+                lambda sender=sender: sender.send(frame),
+                context.iterations,
+                params={"transport": transport},
+                drain=lambda server=server: _wait_received(
+                    server, context.iterations + 1
+                ),
+            )
+        )
+        sender.close()
+        server.close()
+    return results
+
+
+@benchmark("parser")
+def bench_parser(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """LogParser.parse and LogParser.search over generated files."""
+    results = []
+    for size in context.sizes:
+        parser = LogParser(context.log_file(size))
+        params: dict[str, Any] = {"lines": size}
+        results.append(
+            time_passes(
+                f"parser.parse[{size}]",
+                lambda parser=parser: _consume(parser.parse()),
+                context.repeats,
+                size,
+                params=params,
+            )
+        )
+        results.append(
+            time_passes(
+                f"parser.search[{size}]",
+                lambda parser=parser: _consume(parser.search(r"timeout|exhausted")),
+                context.repeats,
+                size,
+                params=params,
+            )
+        )
+    return results
+
+
+@benchmark("stats")
+def bench_stats(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """LogStatistics.get_all_stats over generated files."""
+    results = []
+    for size in context.sizes:
+        log_file = context.log_file(size)
+        results.append(
+            time_passes(
+                f"stats.get_all_stats[{size}]",
+                lambda log_file=log_file: LogStatistics(log_file).get_all_stats(),
+                context.repeats,
+                size,
+                params={"lines": size},
+            )
+        )
+    return results
+
+
+@benchmark("construction")
+def bench_construction(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """ConsolePrinter and Ezpl() construction, with and without the wizard."""
+    results = []
+    count = min(context.iterations, 2000)
+    for name, use_wizard in (("printer", False), ("printer+wizard", True)):
+        results.append(
+            time_calls(
+                f"construction.{name}",
+                lambda use_wizard=use_wizard: _build_printer(use_wizard),
+                count,
+                unit="instances",
+                params={"wizard": use_wizard},
+            )
+        )
+
+    # Fresh interpreters: import and construction time, plus resident memory
+    for name, statement in (
+        ("ezpl[cold]", ""),
+        ("ezpl+wizard[cold]", "ezpl.get_printer().wizard"),
+    ):
+        rss: list[int] = []
+        params: dict[str, Any] = {"wizard": bool(statement)}
+        result = time_passes(
+            f"construction.{name}",
+            lambda rss=rss, statement=statement: rss.append(
+                _construct_in_subprocess(context.work_dir, statement)
+            ),
+            context.repeats,
+            1,
+            unit="processes",
+            params=params,
+        )
+        params["rss_kib"] = int(statistics.median(rss))
+        results.append(result)
+    return results
+
+
+@benchmark("export")
+def bench_export(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """LogExporter throughput per format, plus the peak memory of an export."""
+    results = []
+    for size in context.sizes:
+        log_file = context.log_file(size)
+        exporter = LogExporter(log_file)
+        for name, (format, suffix) in _EXPORT_CASES.items():
+            output = context.work_dir / f"export-{size}{suffix}"
+            params: dict[str, Any] = {"lines": size, "format": format}
+            results.append(
+                time_passes(
+                    f"export.{name}[{size}]",
+                    lambda exporter=exporter, output=output, format=format: (
+                        exporter.export(output, format=format)
+                    ),
+                    context.repeats,
+                    size,
+                    params=params,
+                )
+            )
+            params["bytes"] = output.stat().st_size
+
+        # Fresh interpreters: peak memory should not grow with the file size
+        rss: list[int] = []
+        output = context.work_dir / f"export-{size}-cold.json"
+        params = {"lines": size, "format": "json"}
+        result = time_passes(
+            f"export.json[cold][{size}]",
+            lambda rss=rss, log_file=log_file, output=output: rss.append(
+                _export_in_subprocess(context.work_dir, log_file, output)
+            ),
+            context.repeats,
+            size,
+            params=params,
+        )
+        params["peak_rss_kib"] = int(statistics.median(rss))
+        results.append(result)
+    return results
+
+
+@benchmark("cli")
+def bench_cli(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """Cold start of each CLI subcommand, one fresh interpreter per run."""
+    log_file = str(context.log_file(_CLI_LOG_LINES))
+    cases = (
+        ("help", ["--help"]),
+        ("version", ["version"]),
+        ("info", ["info"]),
+        ("config.get", ["config", "get"]),
+        ("logs.tail", ["logs", "tail", "--file", log_file]),
+        ("logs.stats", ["logs", "stats", "--file", log_file]),
+    )
+    return [
+        time_passes(
+            f"cli.{name}",
+            lambda args=args: _run_python(
+                context.work_dir, "-m", "ezpl.cli.main", *args
+            ),
+            context.repeats,
+            1,
+            unit="processes",
+            params={"args": args},
+        )
+        for name, args in cases
+    ]
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _build_printer(use_wizard: bool) -> ConsolePrinter:
+    """Build a ConsolePrinter, optionally touching its wizard."""
+    printer = ConsolePrinter()
+    if use_wizard:
+        _ = printer.get_printer().wizard
+    return printer
+
+
+def _construct_in_subprocess(work_dir: Path, statement: str) -> int:
+    """
+    Build Ezpl() in a fresh interpreter with an isolated home directory.
+
+    Args:
+        work_dir: Working and home directory of the child process
+        statement: Extra statement run after construction
+
+    Returns:
+        Resident memory of the child process in KiB (0 if unavailable)
+    """
+    output = _run_python(
+        work_dir, "-c", _CONSTRUCTION_SCRIPT.format(statement=statement)
+    )
+    return int(output.split()[-1])
+
+
+def _export_in_subprocess(work_dir: Path, log_file: Path, output: Path) -> int:
+    """
+    Export a log file to JSON in a fresh interpreter.
+
+    Args:
+        work_dir: Working and home directory of the child process
+        log_file: Log file to export
+        output: Export destination
+
+    Returns:
+        Peak resident memory of the child process in KiB (0 if unavailable)
+    """
+    output = _run_python(
+        work_dir, "-c", _EXPORT_SCRIPT, str(log_file), str(output), "json"
+    )
+    return int(output.split()[-1])
+
+
+def _run_python(work_dir: Path, *args: str) -> str:
+    """
+    Run the interpreter with an isolated home directory.
+
+    Args:
+        work_dir: Working and home directory of the child process
+        *args: Interpreter arguments
+
+    Returns:
+        Standard output of the child process
+    """
+    # The interpreter itself, with arguments built by the benchmarks
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        cwd=work_dir,
+        env=_child_env(work_dir),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def _wait_received(server: LogWriterServer, total: int) -> None:
+    """
+    Wait until the writer received every frame still buffered in the
+    sockets or rings, or stops receiving (records dropped on a full ring).
+
+    Args:
+        server: Writer server
+        total: Number of records sent by the workers
+    """
+    received, idle_since = server.received, time.perf_counter()
+    while received < total and time.perf_counter() - idle_since < 1.0:
+        time.sleep(0.001)
+        if server.received != received:
+            received, idle_since = server.received, time.perf_counter()
+
+
+def _run_workers(
+    work_dir: Path, workers: int, extra_env: dict[str, str], *args: str
+) -> None:
+    """
+    Run several interpreters in parallel and wait for all of them.
+
+    Args:
+        work_dir: Working and home directory of the child processes
+        workers: Number of processes
+        extra_env: Environment variables added for the children
+        *args: Interpreter arguments
+
+    Raises:
+        subprocess.CalledProcessError: If a process fails
+    """
+    env = {**_child_env(work_dir), **extra_env}
+    processes = [
+        # The interpreter itself, with arguments built by the benchmarks
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, *args],
+            cwd=work_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        _, stderr = process.communicate()
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode, process.args, stderr=stderr
+            )
+
+
+def _child_env(work_dir: Path) -> dict[str, str]:
+    """Environment of benchmark child processes, without EZPL_* variables."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("EZPL_")}
+    package_root = str(Path(__file__).resolve().parents[2])
+    env.update(
+        HOME=str(work_dir),
+        USERPROFILE=str(work_dir),
+        PYTHONPATH=os.pathsep.join([package_root, env.get("PYTHONPATH", "")]),
+    )
+    return env
+
+
+def _consume(iterator: Any) -> int:
+    """Exhaust an iterator and return the number of items."""
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
@@ -3,16 +3,31 @@ CLI module for Ezpl logging framework.
 
 This module provides the command-line interface for managing Ezpl
 configuration, viewing logs, and performing various operations.
+The click application is imported on first access.
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
 
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_exports
+
 # ------------------------------------------------
-# CLI ENTRY POINT
+# CLI ENTRY POINT (lazy)
 # ------------------------------------------------
-from .main import cli
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "cli": (".main", "cli"),
+}
+
+if TYPE_CHECKING:
+    from .main import cli
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 # =============================================================================
 # MODULE EXPORTS
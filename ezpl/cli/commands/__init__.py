@@ -2,19 +2,40 @@
 CLI Commands module for Ezpl logging framework.
 
 This module contains all CLI command implementations.
+Commands are imported on first access, so running one command does not
+load the others.
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
 
+from typing import TYPE_CHECKING
+
+from ...core.lazy import lazy_exports
+
 # ------------------------------------------------
-# COMMAND GROUP IMPORTS
+# COMMAND GROUP IMPORTS (lazy)
 # ------------------------------------------------
-from .config import config_group
-from .info import info_command
-from .logs import logs_group
-from .version import version_command
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "bench_command": (".bench", "bench_command"),
+    "config_group": (".config", "config_group"),
+    "info_command": (".info", "info_command"),
+    "logs_group": (".logs", "logs_group"),
+    "version_command": (".version", "version_command"),
+}
+
+if TYPE_CHECKING:
+    from .bench import bench_command
+    from .config import config_group
+    from .info import info_command
+    from .logs import logs_group
+    from .version import version_command
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 # =============================================================================
 # MODULE EXPORTS
@@ -28,4 +49,5 @@ __all__ = [
     "config_group",
     "version_command",
     "info_command",
+    "bench_command",
 ]
@@ -0,0 +1,228 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - CLI Bench Command
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+CLI command for running performance benchmarks.
+
+This module provides the bench command for Ezpl.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+
+# External libraries
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+# Internal modules
+from ...benchmarks.runner import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+console = Console()
+
+## ==> COMMANDS
+# ///////////////////////////////////////////////////////////////
+
+
+@click.command(name="bench", help="Run performance benchmarks")
+@click.option(
+    "--only",
+    "-k",
+    multiple=True,
+    help=(
+        "Benchmark to run (printer, layered_progress, file_logger, multiprocess, "
+        "parser, stats, construction, export, cli); repeatable"
+    ),
+)
+@click.option(
+    "--iterations",
+    "-n",
+    type=click.IntRange(min=1),
+    default=20000,
+    help="Records emitted by handler benchmarks",
+)
+@click.option(
+    "--sizes",
+    default="100000,1000000",
+    help="Comma-separated line counts of generated files for parser benchmarks",
+)
+@click.option(
+    "--repeats",
+    type=click.IntRange(min=1),
+    default=3,
+    help="Passes over each generated file",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    help="Save results to a JSON file",
+)
+@click.option(
+    "--baseline",
+    "-b",
+    type=click.Path(exists=True, path_type=Path),
+    help="Compare results against a saved JSON baseline",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.10,
+    help="Relative throughput drop reported as a regression",
+)
+@click.option(
+    "--fail-on-regression",
+    is_flag=True,
+    default=False,
+    help="Exit with status 1 if a regression is detected",
+)
+def bench_command(
+    only: tuple[str, ...],
+    iterations: int,
+    sizes: str,
+    repeats: int,
+    output: Optional[Path],
+    baseline: Optional[Path],
+    threshold: float,
+    fail_on_regression: bool,
+) -> None:
+    """
+    Run performance benchmarks.
+
+    Measure records/sec and p50/p99 latency of ConsolePrinter, FileLogger,
+    LogParser and LogStatistics, optionally saving results as JSON and
+    comparing them against a baseline.
+    """
+    try:
+        size_values = [int(size) for size in sizes.split(",") if size.strip()]
+    except ValueError as e:
+        raise click.BadParameter(f"Invalid sizes: {sizes}", param_hint="--sizes") from e
+
+    try:
+        table = _results_table()
+        results = run_benchmarks(
+            only=only or None,
+            iterations=iterations,
+            sizes=size_values,
+            repeats=repeats,
+            on_result=lambda result: console.print(
+                f"[dim]done[/dim] {escape(result.name)}: "
+                f"{result.rate:,.0f} {result.unit}/s{_format_memory(result)}"
+            ),
+        )
+        for result in results:
+            _add_result_row(table, result)
+        console.print(table)
+
+        if output:
+            save_results(results, output)
+            console.print(f"[green]Results saved to[/green] {output}")
+
+        regressions = 0
+        if baseline:
+            comparisons = compare_results(results, load_results(baseline), threshold)
+            regressions = sum(1 for c in comparisons if c["status"] == "regression")
+            console.print(_comparison_table(comparisons, baseline))
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise SystemExit(1) from e
+
+    if regressions and fail_on_regression:
+        console.print(f"[bold red]{regressions} regression(s) detected[/bold red]")
+        raise SystemExit(1)
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _results_table() -> Table:
+    """Build the empty results table."""
+    table = Table(title="Benchmark Results", show_header=True, header_style="bold blue")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Rate", style="green", justify="right")
+    table.add_column("p50", style="white", justify="right")
+    table.add_column("p99", style="white", justify="right")
+    return table
+
+
+def _add_result_row(table: Table, result: BenchmarkResult) -> None:
+    """Add one result to the results table."""
+    table.add_row(
+        escape(result.name),
+        f"{result.rate:,.0f} {result.unit}/s",
+        _format_seconds(result.p50),
+        _format_seconds(result.p99),
+    )
+
+
+def _comparison_table(comparisons: list[dict[str, Any]], baseline: Path) -> Table:
+    """Build the baseline comparison table."""
+    styles = {
+        "regression": "bold red",
+        "improvement": "green",
+        "ok": "white",
+        "new": "dim",
+        "missing": "yellow",
+    }
+    table = Table(
+        title=f"Comparison with {baseline.name}",
+        show_header=True,
+        header_style="bold blue",
+    )
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+    for comparison in comparisons:
+        status = comparison["status"]
+        table.add_row(
+            escape(comparison["name"]),
+            _format_rate(comparison["baseline_rate"]),
+            _format_rate(comparison["current_rate"]),
+            (
+                f"{comparison['change']:+.1%}"
+                if comparison["change"] is not None
+                else "-"
+            ),
+            f"[{styles[status]}]{status}[/{styles[status]}]",
+        )
+    return table
+
+
+def _format_memory(result: BenchmarkResult) -> str:
+    """Format the resident memory reported by a case, if any."""
+    rss = result.params.get("rss_kib")
+    return f" (RSS {rss / 1024:.1f} MiB)" if rss else ""
+
+
+def _format_rate(rate: Optional[float]) -> str:
+    """Format a throughput value."""
+    return f"{rate:,.0f}/s" if rate is not None else "-"
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration in seconds for display (µs, ms or s)."""
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1000:.2f} ms"
+    return f"{seconds:.2f} s"
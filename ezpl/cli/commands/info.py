@@ -13,6 +13,7 @@ This module provides the info command for Ezpl.
 # ///////////////////////////////////////////////////////////////
 # Base imports
 from pathlib import Path
+from typing import Any, Optional
 
 import click
 
@@ -32,6 +33,7 @@ except ImportError:
     ezpl = None
 
 from ...config import ConfigurationManager
+from ...core.metrics import parse_prometheus
 
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
@@ -43,13 +45,29 @@ console = Console()
 
 
 @click.command(name="info", help="Display package information")
-def info_command() -> None:
+@click.option(
+    "--metrics",
+    is_flag=True,
+    default=False,
+    help="Display runtime metrics exported by an application",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(path_type=Path),
+    help="Prometheus textfile to read (default: from config)",
+)
+def info_command(metrics: bool, metrics_file: Optional[Path]) -> None:
     """
     Display package information.
 
     Show detailed information about the Ezpl package including
-    version, location, configuration, and dependencies.
+    version, location, configuration, and dependencies. With --metrics,
+    show the runtime metrics an application exported to its metrics file.
     """
+    if metrics or metrics_file:
+        _display_metrics(metrics_file)
+        return
+
     try:
         if not EZPL_AVAILABLE:
             console.print("[red]Ezpl not available[/red]")
@@ -149,3 +167,126 @@ def info_command() -> None:
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _display_metrics(metrics_file: Optional[Path]) -> None:
+    """
+    Display metrics read from a Prometheus textfile.
+
+    Args:
+        metrics_file: Textfile to read (default: configured metrics file)
+    """
+    try:
+        if metrics_file is None:
+            metrics_file = ConfigurationManager().get_metrics_file()
+        if metrics_file is None:
+            console.print(
+                "[yellow]No metrics file configured.[/yellow] "
+                "Set EZPL_METRICS_FILE in the application or use --metrics-file."
+            )
+            return
+        if not metrics_file.exists():
+            console.print(f"[yellow]Metrics file not found:[/yellow] {metrics_file}")
+            return
+
+        snapshot = parse_prometheus(metrics_file.read_text(encoding="utf-8"))
+        console.print(f"[dim]Metrics from {metrics_file}[/dim]\n")
+
+        # Records per sink and level
+        records_table = Table(
+            title="Records", show_header=True, header_style="bold blue"
+        )
+        records_table.add_column("Sink", style="cyan")
+        records_table.add_column("Level", style="white")
+        records_table.add_column("Count", style="green", justify="right")
+        for sink, levels in sorted(snapshot["records"].items()):
+            for level, count in sorted(levels.items()):
+                records_table.add_row(sink, level, str(count))
+        console.print(records_table)
+
+        # Per-sink counters
+        sinks = sorted(
+            set().union(
+                *(
+                    snapshot[family].keys()
+                    for family in (
+                        "bytes_written",
+                        "suppressed",
+                        "coalesced",
+                        "dropped",
+                    )
+                )
+            )
+        )
+        if sinks:
+            sink_table = Table(
+                title="Sinks", show_header=True, header_style="bold blue"
+            )
+            sink_table.add_column("Sink", style="cyan")
+            for column in ("Bytes", "Suppressed", "Coalesced", "Dropped"):
+                sink_table.add_column(column, style="green", justify="right")
+            for sink in sinks:
+                sink_table.add_row(
+                    sink,
+                    *(
+                        str(snapshot[family].get(sink, 0))
+                        for family in (
+                            "bytes_written",
+                            "suppressed",
+                            "coalesced",
+                            "dropped",
+                        )
+                    ),
+                )
+            console.print("\n")
+            console.print(sink_table)
+
+        # Queue depths
+        if snapshot["queue_depth"]:
+            queue_table = Table(
+                title="Queue Depth", show_header=True, header_style="bold blue"
+            )
+            queue_table.add_column("Queue", style="cyan")
+            queue_table.add_column("Depth", style="green", justify="right")
+            for name, depth in sorted(snapshot["queue_depth"].items()):
+                queue_table.add_row(name, f"{depth:g}")
+            console.print("\n")
+            console.print(queue_table)
+
+        # Latency histograms
+        if snapshot["latency"]:
+            latency_table = Table(
+                title="Latency", show_header=True, header_style="bold blue"
+            )
+            latency_table.add_column("Operation", style="cyan")
+            latency_table.add_column("Sink", style="white")
+            for column in ("Count", "Mean", "p50", "p99"):
+                latency_table.add_column(column, style="green", justify="right")
+            for operation, sinks_latency in sorted(snapshot["latency"].items()):
+                for sink, summary in sorted(sinks_latency.items()):
+                    latency_table.add_row(
+                        operation,
+                        sink,
+                        str(summary["count"]),
+                        _format_seconds(summary["mean"]),
+                        _format_seconds(summary["p50"]),
+                        _format_seconds(summary["p99"]),
+                    )
+            console.print("\n")
+            console.print(latency_table)
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+
+
+def _format_seconds(seconds: Any) -> str:
+    """Format a duration in seconds for display (µs or ms)."""
+    if seconds is None:
+        return "N/A"
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.1f} µs"
+    return f"{seconds * 1000:.2f} ms"
@@ -23,12 +23,13 @@ import click
 
 # External libraries
 from rich.console import Console
-from rich.table import Table
 
 # Internal modules
 from ...config import ConfigurationManager
 from ..utils.log_parser import LogParser
-from ..utils.log_stats import LogStatistics
+
+# LogStatistics, LogExporter and rich.table are imported by the commands
+# that use them
 
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
@@ -112,6 +113,47 @@ def _parse_size(size_str: str) -> int:
         raise click.ClickException(f"Invalid size format: {size_str}") from e
 
 
+def _parse_time(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[datetime]:
+    """
+    Parse a --since/--until value (click callback).
+
+    Args:
+        ctx: Click context
+        param: Option being parsed
+        value: Date ("2024-01-15"), date and time ("2024-01-15 10:30",
+            "2024-01-15T10:30:00") or age relative to now ("30s", "15m",
+            "2h", "7d")
+
+    Returns:
+        Local datetime, or None if the option was not given
+
+    Raises:
+        click.BadParameter: If the value cannot be parsed
+    """
+    if value is None:
+        return None
+    text = value.strip()
+    units = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+    if len(text) > 1 and text[-1].lower() in units:
+        try:
+            amount = float(text[:-1])
+        except ValueError:
+            pass  # Not an age, try absolute formats
+        else:
+            return datetime.now() - timedelta(**{units[text[-1].lower()]: amount})
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError as e:
+        raise click.BadParameter(
+            f"{value!r} is neither a date/time (YYYY-MM-DD[ HH:MM[:SS]]) "
+            "nor an age (30s, 15m, 2h, 7d)",
+            ctx=ctx,
+            param=param,
+        ) from e
+
+
 ## ==> COMMAND GROUP
 # ///////////////////////////////////////////////////////////////
 
@@ -284,6 +326,10 @@ def stats_command(file: Optional[Path], format: str) -> None:
 
     Show counts by level, file size, date ranges, and temporal distribution.
     """
+    from rich.table import Table
+
+    from ..utils.log_stats import LogStatistics
+
     try:
         log_file = _get_log_file(file)
         stats = LogStatistics(log_file)
@@ -402,12 +448,21 @@ def tail_command(file: Optional[Path], lines: int, follow: bool) -> None:
     type=click.Path(exists=True, path_type=Path),
     help="Directory to search (default: from config)",
 )
-def list_command(dir: Optional[Path]) -> None:
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Show at most N files (the rest are counted)",
+)
+def list_command(dir: Optional[Path], limit: Optional[int]) -> None:
     """
     List available log files.
 
-    Display all log files in the configured log directory.
+    Display all log files in the configured log directory, newest first.
     """
+    from ...handlers.wizard import RichWizard
+
     try:
         log_dir = _get_log_dir(dir)
 
@@ -424,28 +479,26 @@ def list_command(dir: Optional[Path]) -> None:
             console.print(f"[yellow]No log files found in {log_dir}[/yellow]")
             return
 
-        # Display as table
-        table = Table(
-            title=f"Log Files in {log_dir}", show_header=True, header_style="bold blue"
-        )
-        table.add_column("File", style="cyan")
-        table.add_column("Size", style="green")
-        table.add_column("Modified", style="white")
-
-        for log_file in log_files:
-            try:
-                size = log_file.stat().st_size
-                size_mb = size / (1024 * 1024)
-                modified = datetime.fromtimestamp(log_file.stat().st_mtime)
-                table.add_row(
+        def rows():
+            for log_file in log_files:
+                try:
+                    stat = log_file.stat()
+                except OSError as e:
+                    console.print(f"[bold red]Error:[/bold red] {e}")
+                    continue
+                yield (
                     log_file.name,
-                    f"{size_mb:.2f} MB",
-                    modified.strftime("%Y-%m-%d %H:%M:%S"),
+                    f"{stat.st_size / (1024 * 1024):.2f} MB",
+                    datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
                 )
-            except Exception as e:
-                console.print(f"[bold red]Error:[/bold red] {e}")
 
-        console.print(table)
+        # Display as a streamed table (rows are formatted page by page)
+        RichWizard(console).stream_table(
+            rows(),
+            columns=["File", "Size", "Modified"],
+            title=f"Log Files in {log_dir}",
+            max_rows=limit,
+        )
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -569,7 +622,7 @@ def clean_command(
 @click.option(
     "--format",
     "-F",
-    type=click.Choice(["json", "csv", "txt"], case_sensitive=False),
+    type=click.Choice(["json", "ndjson", "csv", "txt"], case_sensitive=False),
     default="json",
     help="Export format",
 )
@@ -579,57 +632,198 @@ def clean_command(
     type=click.Path(path_type=Path),
     help="Output file path (default: stdout)",
 )
-def export_command(file: Optional[Path], format: str, output: Optional[Path]) -> None:
+@click.option(
+    "--gzip",
+    "-z",
+    "compress",
+    is_flag=True,
+    help="Gzip the output (implied by a '.gz' output file)",
+)
+@click.option(
+    "--level",
+    "-l",
+    "levels",
+    type=str,
+    multiple=True,
+    help="Filter by log level (repeatable)",
+)
+@click.option(
+    "--since",
+    type=str,
+    callback=_parse_time,
+    help="Oldest entry: date/time or age (e.g., '2024-01-15 10:00', '2h')",
+)
+@click.option(
+    "--until",
+    type=str,
+    callback=_parse_time,
+    help="Newest entry: date/time or age",
+)
+def export_command(
+    file: Optional[Path],
+    format: str,
+    output: Optional[Path],
+    compress: bool,
+    levels: tuple[str, ...],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> None:
     """
     Export log file to different formats.
 
-    Convert log files to JSON, CSV, or plain text format.
+    Convert log files to JSON, NDJSON, CSV, or plain text format.
+    Entries are streamed, so memory use does not depend on the log size.
     """
+    from ..utils.log_export import LogExporter
+
     try:
         log_file = _get_log_file(file)
-        parser = LogParser(log_file)
-        entries = list(parser.parse())
+        exporter = LogExporter(log_file, since=since, until=until, levels=levels)
+        count = exporter.export(output, format=format.lower(), compress=compress)
 
-        if not entries:
-            console.print("[yellow]No log entries to export[/yellow]")
-            return
+        if output:
+            if count:
+                console.print(f"[green]✓[/green] Exported {count} entries to {output}")
+            else:
+                console.print("[yellow]No log entries to export[/yellow]")
 
-        # Export based on format
-        if format == "json":
-            data = [entry.to_dict() for entry in entries]
-            content = json.dumps(data, indent=2, default=str)
-        elif format == "csv":
-            import csv
-            from io import StringIO
-
-            output_buffer = StringIO()
-            writer = csv.DictWriter(
-                output_buffer,
-                fieldnames=[
-                    "timestamp",
-                    "level",
-                    "module",
-                    "function",
-                    "line",
-                    "message",
-                ],
-            )
-            writer.writeheader()
-            for entry in entries:
-                writer.writerow(entry.to_dict())
-            content = output_buffer.getvalue()
-        else:  # txt
-            content = "\n".join(entry.raw_line for entry in entries)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
 
-        # Write output
-        if output:
-            output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            console.print(f"[green]✓[/green] Exported to {output_path}")
-        else:
-            console.print(content)
+
+@logs_group.command(name="query", help="Query a SQLite log database")
+@click.option(
+    "--db",
+    "db",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+    help="Log database (written by SQLiteSink or 'ezpl logs import')",
+)
+@click.option(
+    "--level",
+    "-l",
+    "levels",
+    type=str,
+    multiple=True,
+    help="Filter by log level (repeatable)",
+)
+@click.option(
+    "--since",
+    type=str,
+    callback=_parse_time,
+    help="Oldest entry: date/time or age (e.g., '2024-01-15 10:00', '2h')",
+)
+@click.option(
+    "--until",
+    type=str,
+    callback=_parse_time,
+    help="Newest entry: date/time or age",
+)
+@click.option("--module", "-m", type=str, help="Filter by module name")
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Show at most N entries",
+)
+@click.option("--reverse", "-r", is_flag=True, help="Newest entries first")
+@click.option("--count", "-c", is_flag=True, help="Only print the number of entries")
+@click.option(
+    "--format",
+    "-F",
+    type=click.Choice(["txt", "table"], case_sensitive=False),
+    default="txt",
+    help="Output format",
+)
+def query_command(
+    db: Path,
+    levels: tuple[str, ...],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    module: Optional[str],
+    limit: Optional[int],
+    reverse: bool,
+    count: bool,
+    format: str,
+) -> None:
+    """
+    Query a SQLite log database.
+
+    Level, module and time-window filters are answered from the database
+    indexes; entries are streamed, oldest first unless --reverse is given.
+    """
+    from ...handlers.sinks.sqlite import LogDatabase
+
+    try:
+        with LogDatabase(db) as database:
+            filters = {
+                "level": levels,
+                "since": since,
+                "until": until,
+                "module": module,
+            }
+            if count:
+                click.echo(database.count(**filters))
+                return
+
+            rows = database.query(**filters, limit=limit, newest_first=reverse)
+            if format == "table":
+                from ...handlers.wizard import RichWizard
+
+                shown = RichWizard(console).stream_table(
+                    (
+                        (row.timestamp[:19], row.level, row.module, row.message)
+                        for row in rows
+                    ),
+                    columns=["Timestamp", "Level", "Module", "Message"],
+                    title=f"Log entries in {db.name}",
+                )
+            else:
+                shown = 0
+                for row in rows:
+                    click.echo(row.format())
+                    shown += 1
+            if not shown:
+                console.print("[yellow]No matching entries[/yellow]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+
+
+@logs_group.command(name="import", help="Import log files into a SQLite database")
+@click.argument(
+    "files",
+    nargs=-1,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--db",
+    "db",
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=True,
+    help="Log database (created if missing)",
+)
+def import_command(files: tuple[Path, ...], db: Path) -> None:
+    """
+    Import FileLogger text logs into a SQLite log database.
+
+    Imports the configured log file when no file is given. Tracebacks are
+    kept with the entry they follow.
+    """
+    from ...handlers.sinks.sqlite import LogDatabase
+
+    try:
+        log_files = list(files) or [_get_log_file(None)]
+        with LogDatabase(db) as database:
+            for log_file in log_files:
+                start = time.perf_counter()
+                imported = database.import_log_file(log_file)
+                elapsed = time.perf_counter() - start
+                console.print(
+                    f"[green]✓[/green] Imported {imported} entries from "
+                    f"{log_file} in {elapsed:.2f}s"
+                )
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -8,17 +8,19 @@ Main CLI entry point for Ezpl logging framework.
 
 This module provides the command-line interface for managing Ezpl
 configuration, viewing logs, and performing various operations.
+Subcommand modules are imported only when their command is resolved.
 """
 
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
+import importlib
+from typing import Any, Optional
+
 import click
 
 # External libraries
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
 # Internal modules
 try:
@@ -29,19 +31,80 @@ except ImportError:
     EZPL_AVAILABLE = False
     ezpl = None
 
-from .commands import config, info, logs, version
-
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
 
 console = Console()
 
+# Subcommand name -> (module, attribute), relative to ezpl.cli
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "logs": (".commands.logs", "logs_group"),
+    "config": (".commands.config", "config_group"),
+    "version": (".commands.version", "version_command"),
+    "info": (".commands.info", "info_command"),
+    "bench": (".commands.bench", "bench_command"),
+}
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on demand.
+
+    Running one subcommand only imports its own module, so `ezpl version`
+    does not pay for the configuration manager, log parser or statistics
+    used by the other commands. Listing commands (`ezpl --help`) still
+    imports every module to read their help texts.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, tuple[str, str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to (module, attribute),
+                module names being relative to ezpl.cli
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the names of eager and lazy subcommands."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a subcommand, importing its module on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import the module of a lazy subcommand and return the command."""
+        module_name, attribute = self.lazy_subcommands[cmd_name]
+        module = importlib.import_module(module_name, __package__)
+        command = getattr(module, attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module.__name__}.{attribute} is not a click command")
+        return command
+
+
 ## ==> CLI GROUP
 # ///////////////////////////////////////////////////////////////
 
 
 @click.group(
     name="ezpl",
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
     invoke_without_command=True,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
@@ -69,6 +132,9 @@ def cli(ctx: click.Context) -> None:
 def _display_welcome() -> None:
     """Display welcome message with Rich."""
     try:
+        from rich.panel import Panel
+        from rich.text import Text
+
         welcome_text = Text()
         welcome_text.append("🚀 ", style="bold bright_green")
         welcome_text.append("Ezpl CLI", style="bold bright_blue")
@@ -86,23 +152,6 @@ def _display_welcome() -> None:
         click.echo("🚀 Ezpl CLI - Modern Python Logging Framework")
 
 
-## ==> COMMAND GROUPS
-# ///////////////////////////////////////////////////////////////
-
-
-# Logs group
-cli.add_command(logs.logs_group)
-
-# Config group
-cli.add_command(config.config_group)
-
-# Version command
-cli.add_command(version.version_command)
-
-# Info command
-cli.add_command(info.info_command)
-
-
 ## ==> MAIN ENTRY POINT
 # ///////////////////////////////////////////////////////////////
 
@@ -2,25 +2,42 @@
 CLI utilities module for Ezpl logging framework.
 
 This module contains utility functions and classes for CLI operations:
-- Log parsing and analysis
+- Log parsing, analysis and export
 - Statistics calculation
 - User environment variable management
+
+Utilities are imported on first access.
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
 
-# ------------------------------------------------
-# ENVIRONMENT MANAGEMENT UTILITIES
-# ------------------------------------------------
-from .env_manager import UserEnvManager
+from typing import TYPE_CHECKING
+
+from ...core.lazy import lazy_exports
 
 # ------------------------------------------------
-# LOG PARSING & STATISTICS UTILITIES
+# CLI UTILITIES (lazy)
 # ------------------------------------------------
-from .log_parser import LogEntry, LogParser
-from .log_stats import LogStatistics
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "UserEnvManager": (".env_manager", "UserEnvManager"),
+    "LogEntry": (".log_parser", "LogEntry"),
+    "LogParser": (".log_parser", "LogParser"),
+    "LogExporter": (".log_export", "LogExporter"),
+    "LogStatistics": (".log_stats", "LogStatistics"),
+}
+
+if TYPE_CHECKING:
+    from .env_manager import UserEnvManager
+    from .log_export import LogExporter
+    from .log_parser import LogEntry, LogParser
+    from .log_stats import LogStatistics
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 # =============================================================================
 # MODULE EXPORTS
@@ -33,6 +50,7 @@ __all__ = [
     "LogParser",
     "LogEntry",
     "LogStatistics",
+    "LogExporter",
     # ------------------------------------------------
     # ENVIRONMENT UTILITIES EXPORTS
     # ------------------------------------------------
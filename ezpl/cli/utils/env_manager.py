@@ -42,11 +42,27 @@ class UserEnvManager:
         "indent-step": "EZPL_INDENT_STEP",
         "indent-symbol": "EZPL_INDENT_SYMBOL",
         "base-indent-symbol": "EZPL_BASE_INDENT_SYMBOL",
+        "printer-mode": "EZPL_PRINTER_MODE",
+        "printer-async": "EZPL_PRINTER_ASYNC",
+        "printer-queue-size": "EZPL_PRINTER_QUEUE_SIZE",
+        "printer-overflow": "EZPL_PRINTER_OVERFLOW",
         "file-logger-level": "EZPL_FILE_LOGGER_LEVEL",
+        "file-logger-async": "EZPL_FILE_LOGGER_ASYNC",
         "log-format": "EZPL_LOG_FORMAT",
         "log-rotation": "EZPL_LOG_ROTATION",
         "log-retention": "EZPL_LOG_RETENTION",
         "log-compression": "EZPL_LOG_COMPRESSION",
+        "rate-limit": "EZPL_RATE_LIMIT",
+        "rate-limit-burst": "EZPL_RATE_LIMIT_BURST",
+        "rate-limit-key": "EZPL_RATE_LIMIT_KEY",
+        "coalesce-window": "EZPL_COALESCE_WINDOW",
+        "ring-buffer-size": "EZPL_RING_BUFFER_SIZE",
+        "ring-buffer-level": "EZPL_RING_BUFFER_LEVEL",
+        "ring-buffer-dump-file": "EZPL_RING_BUFFER_DUMP_FILE",
+        "log-transport": "EZPL_LOG_TRANSPORT",
+        "log-transport-ring-size": "EZPL_LOG_TRANSPORT_RING_SIZE",
+        "metrics-file": "EZPL_METRICS_FILE",
+        "metrics-interval": "EZPL_METRICS_INTERVAL",
     }
 
     # ///////////////////////////////////////////////////////////////
@@ -0,0 +1,208 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Log Export Utility
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Streaming log export utility for CLI operations.
+
+This module provides functionality to export log files generated by Ezpl's
+FileLogger to JSON, NDJSON, CSV or plain text, one entry at a time, so
+memory use does not grow with the size of the log.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import csv
+import gzip
+import io
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+# Internal modules
+from .log_parser import LogEntry, LogParser
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Buffer of exported files (fewer, larger writes)
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class LogExporter:
+    """
+    Streaming exporter for Ezpl log files.
+
+    Entries are parsed, filtered and written one at a time:
+    - ``json``: a JSON array, written incrementally
+    - ``ndjson``: one JSON object per line
+    - ``csv``: a single csv.DictWriter pass
+    - ``txt``: the matching raw lines
+    """
+
+    FORMATS = ("json", "ndjson", "csv", "txt")
+
+    CSV_FIELDS = ["timestamp", "level", "module", "function", "line", "message"]
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        log_file: Path,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        levels: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Initialize the log exporter.
+
+        Args:
+            log_file: Path to the log file to export
+            since: Oldest exported timestamp (inclusive)
+            until: Newest exported timestamp (inclusive)
+            levels: Exported levels (case-insensitive, default: all)
+
+        Raises:
+            FileNotFoundError: If the log file doesn't exist
+        """
+        self.parser = LogParser(log_file)
+        self.since = since
+        self.until = until
+        self.levels = {level.upper() for level in levels} if levels else None
+
+    # ///////////////////////////////////////////////////////////////
+    # EXPORT METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def entries(self) -> Iterator[LogEntry]:
+        """
+        Parse the log file, applying the filters.
+
+        Yields:
+            Matching LogEntry objects
+        """
+        since, until, levels = self.since, self.until, self.levels
+        timed = since is not None or until is not None
+        for entry in self.parser.parse():
+            if levels is not None and entry.level.upper() not in levels:
+                continue
+            if timed:
+                timestamp = entry.timestamp
+                if timestamp is None:
+                    continue
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp > until:
+                    continue
+            yield entry
+
+    def write(self, stream: TextIO, format: str = "json") -> int:
+        """
+        Write the matching entries to a text stream.
+
+        Args:
+            stream: Destination (opened with newline='' for CSV)
+            format: Export format (see FORMATS)
+
+        Returns:
+            Number of exported entries
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {format}")
+        entries = self.entries()
+        count = 0
+
+        if format == "json":
+            # Same layout as json.dumps(entries, indent=2), one entry at a time
+            for entry in entries:
+                text = json.dumps(entry.to_dict(), indent=2, default=str)
+                stream.write(",\n  " if count else "[\n  ")
+                stream.write(text.replace("\n", "\n  "))
+                count += 1
+            stream.write("\n]\n" if count else "[]\n")
+        elif format == "ndjson":
+            for entry in entries:
+                stream.write(json.dumps(entry.to_dict(), default=str))
+                stream.write("\n")
+                count += 1
+        elif format == "csv":
+            writer = csv.DictWriter(
+                stream, fieldnames=self.CSV_FIELDS, extrasaction="ignore"
+            )
+            writer.writeheader()
+            for entry in entries:
+                writer.writerow(entry.to_dict())
+                count += 1
+        else:  # txt
+            for entry in entries:
+                stream.write(entry.raw_line)
+                stream.write("\n")
+                count += 1
+        return count
+
+    def export(
+        self,
+        output: Optional[Union[str, Path]] = None,
+        format: str = "json",
+        compress: bool = False,
+    ) -> int:
+        """
+        Export the matching entries to a file or to stdout.
+
+        Args:
+            output: Destination file (None: stdout); a '.gz' suffix
+                enables compression
+            format: Export format (see FORMATS)
+            compress: Gzip the output
+
+        Returns:
+            Number of exported entries
+
+        Raises:
+            ValueError: If the format is unknown
+            OSError: If the output cannot be written
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {format}")
+
+        if output is None:
+            if not compress:
+                return self.write(sys.stdout, format)
+            # Closing the wrapper finishes the gzip stream, not stdout
+            binary = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb")
+            with io.TextIOWrapper(binary, encoding="utf-8", newline="") as stream:
+                return self.write(stream, format)
+
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if compress or path.suffix == ".gz":
+            with gzip.open(path, "wt", encoding="utf-8", newline="") as stream:
+                return self.write(stream, format)
+        with open(
+            path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as stream:
+            return self.write(stream, format)
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return (
+            f"LogExporter(log_file={self.parser.log_file}, since={self.since}, "
+            f"until={self.until}, levels={self.levels})"
+        )
@@ -12,7 +12,11 @@ This module handles all configuration management.
 # CONFIGURATION IMPLEMENTATIONS
 # ------------------------------------------------
 from .defaults import DefaultConfiguration
-from .manager import ConfigurationManager
+from .manager import (
+    ConfigurationManager,
+    get_config_snapshot,
+    invalidate_config_snapshots,
+)
 
 # =============================================================================
 # MODULE EXPORTS
@@ -24,4 +28,6 @@ __all__ = [
     # ------------------------------------------------
     "ConfigurationManager",
     "DefaultConfiguration",
+    "get_config_snapshot",
+    "invalidate_config_snapshots",
 ]
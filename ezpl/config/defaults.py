@@ -73,12 +73,17 @@ class DefaultConfiguration:
     INDENT_STEP = 3
     INDENT_SYMBOL = ">"
     BASE_INDENT_SYMBOL = "~"
+    PRINTER_MODE = "auto"  # "auto" (plain when not a terminal), "rich" or "plain"
+    PRINTER_ASYNC = False  # Render on a background thread
+    PRINTER_QUEUE_SIZE = 10000  # Messages waiting for the render thread
+    PRINTER_OVERFLOW = "drop_new"  # "block", "drop_new" or "drop_old"
 
     # ///////////////////////////////////////////////////////////////
     # FILE LOGGER DEFAULTS
     # ///////////////////////////////////////////////////////////////
 
     FILE_LOGGER_LEVEL = "INFO"
+    FILE_LOGGER_ASYNC = False  # Write records from a background thread
     LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level:<10} | {module}:{function}:{line} - {message}"
 
     # Rotation settings (optional - None means no rotation)
@@ -86,6 +91,43 @@ class DefaultConfiguration:
     LOG_RETENTION = None  # e.g., "7 days", "1 month", "10 files"
     LOG_COMPRESSION = None  # e.g., "zip", "gz", "tar.gz"
 
+    # ///////////////////////////////////////////////////////////////
+    # RATE LIMITING DEFAULTS
+    # ///////////////////////////////////////////////////////////////
+
+    # Rate limiting (optional - None means disabled)
+    RATE_LIMIT = None  # Max records per second per key, e.g., 10
+    RATE_LIMIT_BURST = None  # Bucket capacity (default: the rate)
+    RATE_LIMIT_KEY = "callsite"  # "callsite" (module, function, line) or "message"
+
+    # Repeated-message coalescing (optional - None means disabled)
+    COALESCE_WINDOW = None  # Max seconds a run is held, e.g., 2.0
+
+    # ///////////////////////////////////////////////////////////////
+    # RING BUFFER DEFAULTS
+    # ///////////////////////////////////////////////////////////////
+
+    # In-memory flight recorder (optional - None means disabled)
+    RING_BUFFER_SIZE = None  # Number of records kept, e.g., 1000
+    RING_BUFFER_LEVEL = "DEBUG"  # Minimum level of recorded records
+    RING_BUFFER_DUMP_FILE = None  # Default: "<log file name>.recent.log"
+
+    # ///////////////////////////////////////////////////////////////
+    # MULTI-PROCESS DEFAULTS
+    # ///////////////////////////////////////////////////////////////
+
+    # How worker processes ship records to the log writer
+    LOG_TRANSPORT = "socket"  # "socket" or "shm" (shared-memory ring)
+    LOG_TRANSPORT_RING_SIZE = 1048576  # Bytes per worker ring (shm only)
+
+    # ///////////////////////////////////////////////////////////////
+    # METRICS DEFAULTS
+    # ///////////////////////////////////////////////////////////////
+
+    # Prometheus textfile export (optional - None means disabled)
+    METRICS_FILE = None  # e.g., "/var/lib/node_exporter/textfile/ezpl.prom"
+    METRICS_INTERVAL = 15.0  # Seconds between exports
+
     # ///////////////////////////////////////////////////////////////
     # CONFIGURATION DEFAULTS
     # ///////////////////////////////////////////////////////////////
@@ -129,11 +171,27 @@ class DefaultConfiguration:
             "indent-step": cls.INDENT_STEP,
             "indent-symbol": cls.INDENT_SYMBOL,
             "base-indent-symbol": cls.BASE_INDENT_SYMBOL,
+            "printer-mode": cls.PRINTER_MODE,
+            "printer-async": cls.PRINTER_ASYNC,
+            "printer-queue-size": cls.PRINTER_QUEUE_SIZE,
+            "printer-overflow": cls.PRINTER_OVERFLOW,
             "file-logger-level": cls.FILE_LOGGER_LEVEL,
+            "file-logger-async": cls.FILE_LOGGER_ASYNC,
             "log-format": cls.LOG_FORMAT,
             "log-rotation": cls.LOG_ROTATION,
             "log-retention": cls.LOG_RETENTION,
             "log-compression": cls.LOG_COMPRESSION,
+            "rate-limit": cls.RATE_LIMIT,
+            "rate-limit-burst": cls.RATE_LIMIT_BURST,
+            "rate-limit-key": cls.RATE_LIMIT_KEY,
+            "coalesce-window": cls.COALESCE_WINDOW,
+            "ring-buffer-size": cls.RING_BUFFER_SIZE,
+            "ring-buffer-level": cls.RING_BUFFER_LEVEL,
+            "ring-buffer-dump-file": cls.RING_BUFFER_DUMP_FILE,
+            "log-transport": cls.LOG_TRANSPORT,
+            "log-transport-ring-size": cls.LOG_TRANSPORT_RING_SIZE,
+            "metrics-file": cls.METRICS_FILE,
+            "metrics-interval": cls.METRICS_INTERVAL,
             "cli-version": cls.CLI_VERSION,
             "cli-prog-name": cls.CLI_PROG_NAME,
         }
@@ -165,6 +223,25 @@ class DefaultConfiguration:
             "indent-step": cls.INDENT_STEP,
             "indent-symbol": cls.INDENT_SYMBOL,
             "base-indent-symbol": cls.BASE_INDENT_SYMBOL,
+            "printer-mode": cls.PRINTER_MODE,
+            "printer-async": cls.PRINTER_ASYNC,
+            "printer-queue-size": cls.PRINTER_QUEUE_SIZE,
+            "printer-overflow": cls.PRINTER_OVERFLOW,
+        }
+
+    @classmethod
+    def get_rate_limit_defaults(cls) -> dict[str, Any]:
+        """
+        Get rate limiting and coalescing default values.
+
+        Returns:
+            Dictionary containing rate limiting and coalescing default values
+        """
+        return {
+            "rate-limit": cls.RATE_LIMIT,
+            "rate-limit-burst": cls.RATE_LIMIT_BURST,
+            "rate-limit-key": cls.RATE_LIMIT_KEY,
+            "coalesce-window": cls.COALESCE_WINDOW,
         }
 
     @classmethod
@@ -177,6 +254,7 @@ class DefaultConfiguration:
         """
         return {
             "file-logger-level": cls.FILE_LOGGER_LEVEL,
+            "file-logger-async": cls.FILE_LOGGER_ASYNC,
             "log-format": cls.LOG_FORMAT,
             "log-rotation": cls.LOG_ROTATION,
             "log-retention": cls.LOG_RETENTION,
@@ -8,6 +8,8 @@ Configuration manager for Ezpl logging framework.
 
 This module provides centralized configuration management with support for
 file-based configuration, environment variables, and runtime configuration.
+Parsed configurations are cached process-wide and reloaded only when the
+config file or the EZPL_* environment variables change.
 """
 
 # IMPORTS
@@ -15,17 +17,288 @@ file-based configuration, environment variables, and runtime configuration.
 # Base imports
 import json
 import os
+import threading
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Optional, Union
+from types import MappingProxyType
+from typing import Any, NamedTuple, Optional, Union
 
 # Internal modules
 from ..core.exceptions import FileOperationError
 from .defaults import DefaultConfiguration
 
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Environment variable -> configuration key
+ENV_MAPPINGS: dict[str, str] = {
+    "EZPL_LOG_LEVEL": "log-level",
+    "EZPL_LOG_FILE": "log-file",
+    "EZPL_LOG_DIR": "log-dir",
+    "EZPL_PRINTER_LEVEL": "printer-level",
+    "EZPL_INDENT_STEP": "indent-step",
+    "EZPL_INDENT_SYMBOL": "indent-symbol",
+    "EZPL_BASE_INDENT_SYMBOL": "base-indent-symbol",
+    "EZPL_PRINTER_MODE": "printer-mode",
+    "EZPL_PRINTER_ASYNC": "printer-async",
+    "EZPL_PRINTER_QUEUE_SIZE": "printer-queue-size",
+    "EZPL_PRINTER_OVERFLOW": "printer-overflow",
+    "EZPL_FILE_LOGGER_LEVEL": "file-logger-level",
+    "EZPL_FILE_LOGGER_ASYNC": "file-logger-async",
+    "EZPL_LOG_FORMAT": "log-format",
+    "EZPL_LOG_ROTATION": "log-rotation",
+    "EZPL_LOG_RETENTION": "log-retention",
+    "EZPL_LOG_COMPRESSION": "log-compression",
+    "EZPL_RATE_LIMIT": "rate-limit",
+    "EZPL_RATE_LIMIT_BURST": "rate-limit-burst",
+    "EZPL_RATE_LIMIT_KEY": "rate-limit-key",
+    "EZPL_COALESCE_WINDOW": "coalesce-window",
+    "EZPL_RING_BUFFER_SIZE": "ring-buffer-size",
+    "EZPL_RING_BUFFER_LEVEL": "ring-buffer-level",
+    "EZPL_RING_BUFFER_DUMP_FILE": "ring-buffer-dump-file",
+    "EZPL_LOG_TRANSPORT": "log-transport",
+    "EZPL_LOG_TRANSPORT_RING_SIZE": "log-transport-ring-size",
+    "EZPL_METRICS_FILE": "metrics-file",
+    "EZPL_METRICS_INTERVAL": "metrics-interval",
+}
+
+# Keys whose environment values must be numbers (kept as strings)
+_NUMERIC_KEYS = frozenset(
+    {
+        "rate-limit",
+        "rate-limit-burst",
+        "coalesce-window",
+        "metrics-interval",
+        "ring-buffer-size",
+        "log-transport-ring-size",
+        "printer-queue-size",
+    }
+)
+
+# Seconds during which get_config_snapshot() trusts a snapshot without
+# checking the config file again
+SNAPSHOT_CHECK_INTERVAL = 1.0
+
+# Process-wide snapshots, keyed by config file
+_snapshots: dict[Path, "_Snapshot"] = {}
+_snapshots_lock = threading.Lock()
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _optional_number(value: Any, number_type: type) -> Any:
+    """
+    Convert a configuration value to a number, treating empty values as None.
+
+    Values set through the CLI or the environment are strings, so numeric
+    settings are converted on read.
+
+    Args:
+        value: Raw configuration value
+        number_type: int or float
+
+    Returns:
+        Converted number, or None for None, "", "none" and zero values
+    """
+    if value is None or (
+        isinstance(value, str) and value.strip().lower() in ("", "none")
+    ):
+        return None
+    try:
+        number = number_type(float(value))
+    except (TypeError, ValueError):
+        return None
+    return number or None
+
+
+def _as_bool(value: Any) -> bool:
+    """
+    Convert a configuration value to a boolean.
+
+    Args:
+        value: Raw configuration value (bool, or a string from the CLI or
+            the environment)
+
+    Returns:
+        True for True, "1", "true", "yes" and "on" (case-insensitive)
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def get_config_snapshot(
+    config_file: Optional[Path] = None,
+    max_age: float = SNAPSHOT_CHECK_INTERVAL,
+) -> Mapping[str, Any]:
+    """
+    Get the shared, read-only configuration of a config file.
+
+    The configuration (defaults, then file, then environment) is parsed once
+    per process and shared by all callers. It is parsed again only when the
+    config file's mtime or size, or one of the EZPL_* environment variables,
+    changes. The file is checked at most once every ``max_age`` seconds, so
+    hot-path readers do not touch the filesystem. Thread-safe.
+
+    Args:
+        config_file: Path to the configuration file
+            (default: ~/.ezpl/config.json)
+        max_age: Seconds during which the file is not checked again
+            (0 to always check)
+
+    Returns:
+        Immutable mapping of configuration keys to values
+
+    Raises:
+        ValueError: If an environment variable has an invalid value
+    """
+    path = Path(config_file or DefaultConfiguration.CONFIG_FILE)
+    env_signature = _env_signature()
+    now = time.monotonic()
+
+    snapshot = _snapshots.get(path)
+    if (
+        snapshot is not None
+        and snapshot.env_signature == env_signature
+        and now - snapshot.checked_at < max_age
+    ):
+        return snapshot.config
+
+    with _snapshots_lock:
+        snapshot = _snapshots.get(path)
+        file_signature = _file_signature(path)
+        if (
+            snapshot is None
+            or snapshot.env_signature != env_signature
+            or snapshot.file_signature != file_signature
+        ):
+            config = MappingProxyType(_read_configuration(path))
+            snapshot = _Snapshot(config, file_signature, env_signature, now)
+        else:
+            snapshot = snapshot._replace(checked_at=now)
+        _snapshots[path] = snapshot
+    return snapshot.config
+
+
+def invalidate_config_snapshots(config_file: Optional[Path] = None) -> None:
+    """
+    Drop cached configuration snapshots.
+
+    Args:
+        config_file: Config file whose snapshot is dropped (default: all)
+    """
+    with _snapshots_lock:
+        if config_file is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(Path(config_file), None)
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _env_signature() -> tuple[Optional[str], ...]:
+    """Return the values of the EZPL_* variables read by the configuration."""
+    return tuple(os.environ.get(env_var) for env_var in ENV_MAPPINGS)
+
+
+def _read_configuration(config_file: Path) -> dict[str, Any]:
+    """
+    Read the configuration from defaults, file and environment variables.
+
+    Priority order:
+    1. Environment variables (highest priority)
+    2. Configuration file
+    3. Default values (lowest priority)
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        Merged configuration
+
+    Raises:
+        ValueError: If an environment variable has an invalid value
+    """
+    # Start with defaults
+    config = DefaultConfiguration.get_all_defaults().copy()
+
+    # Load from file if it exists
+    if config_file.exists():
+        try:
+            with open(config_file, encoding="utf-8") as f:
+                file_config = json.load(f)
+                config.update(file_config)
+        except (OSError, json.JSONDecodeError) as e:
+            # If file is corrupted, use defaults
+            print(f"Warning: Could not load config file {config_file}: {e}")
+
+    # Override with environment variables
+    config.update(_read_environment())
+    return config
+
+
+def _read_environment() -> dict[str, Any]:
+    """
+    Read configuration values from environment variables.
+
+    Environment variables are prefixed with 'EZPL_' and use uppercase with
+    underscores (e.g., EZPL_LOG_LEVEL).
+
+    Numeric variables set to "" or "none" disable their setting; other
+    values that are not numbers are ignored with a warning.
+
+    Returns:
+        Configuration values set in the environment
+
+    Raises:
+        ValueError: If EZPL_INDENT_STEP cannot be converted
+    """
+    config: dict[str, Any] = {}
+    for env_var, config_key in ENV_MAPPINGS.items():
+        value = os.getenv(env_var)
+        if value is None:
+            continue
+        # Convert string values to appropriate types
+        if config_key == "indent-step":
+            try:
+                config[config_key] = int(value)
+            except ValueError as e:
+                raise ValueError(f"Failed to convert {value} to int: {e}") from e
+        elif config_key in _NUMERIC_KEYS:
+            if value.strip().lower() not in ("", "none"):
+                try:
+                    float(value)
+                except ValueError:
+                    print(f"Warning: Ignoring {env_var}={value!r}: not a number")
+                    continue
+            config[config_key] = value
+        else:
+            config[config_key] = value
+    return config
+
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class _Snapshot(NamedTuple):
+    """Cached configuration of one config file."""
+
+    config: Mapping[str, Any]
+    file_signature: Optional[tuple[int, int]]
+    env_signature: tuple[Optional[str], ...]
+    checked_at: float
+
+
 class ConfigurationManager:
     """
     Centralized configuration manager for Ezpl.
@@ -58,62 +331,15 @@ class ConfigurationManager:
         """
         Load configuration from file and environment variables.
 
+        The shared snapshot is checked against the config file and the
+        environment, and is only parsed again if either changed.
+
         Priority order:
         1. Environment variables (highest priority)
         2. Configuration file
         3. Default values (lowest priority)
         """
-        # Start with defaults
-        self._config = DefaultConfiguration.get_all_defaults().copy()
-
-        # Load from file if it exists
-        if self._config_file.exists():
-            try:
-                with open(self._config_file, encoding="utf-8") as f:
-                    file_config = json.load(f)
-                    self._config.update(file_config)
-            except (OSError, json.JSONDecodeError) as e:
-                # If file is corrupted, use defaults
-                print(f"Warning: Could not load config file {self._config_file}: {e}")
-
-        # Override with environment variables
-        self._load_from_environment()
-
-    def _load_from_environment(self) -> None:
-        """
-        Load configuration from environment variables.
-
-        Environment variables should be prefixed with 'EZPL_' and use
-        uppercase with underscores (e.g., EZPL_LOG_LEVEL).
-        """
-        env_mappings = {
-            "EZPL_LOG_LEVEL": "log-level",
-            "EZPL_LOG_FILE": "log-file",
-            "EZPL_LOG_DIR": "log-dir",
-            "EZPL_PRINTER_LEVEL": "printer-level",
-            "EZPL_INDENT_STEP": "indent-step",
-            "EZPL_INDENT_SYMBOL": "indent-symbol",
-            "EZPL_BASE_INDENT_SYMBOL": "base-indent-symbol",
-            "EZPL_FILE_LOGGER_LEVEL": "file-logger-level",
-            "EZPL_LOG_FORMAT": "log-format",
-            "EZPL_LOG_ROTATION": "log-rotation",
-            "EZPL_LOG_RETENTION": "log-retention",
-            "EZPL_LOG_COMPRESSION": "log-compression",
-        }
-
-        for env_var, config_key in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                # Convert string values to appropriate types
-                if config_key in ["indent-step"]:
-                    try:
-                        self._config[config_key] = int(value)
-                    except ValueError as e:
-                        raise ValueError(
-                            f"Failed to convert {value} to int: {e}"
-                        ) from e
-                else:
-                    self._config[config_key] = value
+        self._config = dict(get_config_snapshot(self._config_file, max_age=0))
 
     # ///////////////////////////////////////////////////////////////
     # GETTER
@@ -175,6 +401,12 @@ class ConfigurationManager:
         """Get the current file logger level."""
         return self.get("file-logger-level", DefaultConfiguration.FILE_LOGGER_LEVEL)
 
+    def get_file_logger_async(self) -> bool:
+        """Get whether the file logger writes from a background thread."""
+        return _as_bool(
+            self.get("file-logger-async", DefaultConfiguration.FILE_LOGGER_ASYNC)
+        )
+
     def get_indent_step(self) -> int:
         """Get the current indent step."""
         return self.get("indent-step", DefaultConfiguration.INDENT_STEP)
@@ -187,6 +419,28 @@ class ConfigurationManager:
         """Get the current base indent symbol."""
         return self.get("base-indent-symbol", DefaultConfiguration.BASE_INDENT_SYMBOL)
 
+    def get_printer_mode(self) -> str:
+        """Get the printer render mode ('auto', 'rich' or 'plain')."""
+        return (self.get("printer-mode") or DefaultConfiguration.PRINTER_MODE).lower()
+
+    def get_printer_async(self) -> bool:
+        """Get whether the printer renders on a background thread."""
+        return _as_bool(self.get("printer-async", DefaultConfiguration.PRINTER_ASYNC))
+
+    def get_printer_queue_size(self) -> int:
+        """Get the maximum number of messages waiting for the render thread."""
+        size = _optional_number(
+            self.get("printer-queue-size", DefaultConfiguration.PRINTER_QUEUE_SIZE),
+            int,
+        )
+        return size or DefaultConfiguration.PRINTER_QUEUE_SIZE
+
+    def get_printer_overflow(self) -> str:
+        """Get the render queue overflow policy ('block', 'drop_new' or 'drop_old')."""
+        return (
+            self.get("printer-overflow") or DefaultConfiguration.PRINTER_OVERFLOW
+        ).lower()
+
     def get_log_format(self) -> str:
         """Get the current log format."""
         return self.get("log-format", DefaultConfiguration.LOG_FORMAT)
@@ -203,6 +457,76 @@ class ConfigurationManager:
         """Get the current log compression setting."""
         return self.get("log-compression", DefaultConfiguration.LOG_COMPRESSION)
 
+    def get_rate_limit(self) -> Optional[float]:
+        """Get the rate limit in records per second per key (None if disabled)."""
+        return _optional_number(
+            self.get("rate-limit", DefaultConfiguration.RATE_LIMIT), float
+        )
+
+    def get_rate_limit_burst(self) -> Optional[int]:
+        """Get the rate limit burst capacity (None for the default)."""
+        return _optional_number(
+            self.get("rate-limit-burst", DefaultConfiguration.RATE_LIMIT_BURST), int
+        )
+
+    def get_rate_limit_key(self) -> str:
+        """Get the rate limit keying mode ('callsite' or 'message')."""
+        return self.get("rate-limit-key") or DefaultConfiguration.RATE_LIMIT_KEY
+
+    def get_coalesce_window(self) -> Optional[float]:
+        """Get the repeated-message coalescing window in seconds (None if disabled)."""
+        return _optional_number(
+            self.get("coalesce-window", DefaultConfiguration.COALESCE_WINDOW), float
+        )
+
+    def get_ring_buffer_size(self) -> Optional[int]:
+        """Get the number of records kept in memory (None if disabled)."""
+        return _optional_number(
+            self.get("ring-buffer-size", DefaultConfiguration.RING_BUFFER_SIZE), int
+        )
+
+    def get_ring_buffer_level(self) -> str:
+        """Get the minimum level of records kept in memory."""
+        return self.get("ring-buffer-level") or DefaultConfiguration.RING_BUFFER_LEVEL
+
+    def get_ring_buffer_dump_file(self) -> Path:
+        """Get the file recent records are dumped to."""
+        dump_file = self.get(
+            "ring-buffer-dump-file", DefaultConfiguration.RING_BUFFER_DUMP_FILE
+        )
+        if dump_file and str(dump_file).lower() != "none":
+            return Path(dump_file).expanduser()
+        log_file = self.get_log_file()
+        return log_file.with_name(f"{log_file.stem}.recent.log")
+
+    def get_log_transport(self) -> str:
+        """Get how worker processes ship records to the writer ('socket' or 'shm')."""
+        return (self.get("log-transport") or DefaultConfiguration.LOG_TRANSPORT).lower()
+
+    def get_log_transport_ring_size(self) -> int:
+        """Get the size in bytes of each worker's shared-memory ring."""
+        size = _optional_number(
+            self.get(
+                "log-transport-ring-size", DefaultConfiguration.LOG_TRANSPORT_RING_SIZE
+            ),
+            int,
+        )
+        return size or DefaultConfiguration.LOG_TRANSPORT_RING_SIZE
+
+    def get_metrics_file(self) -> Optional[Path]:
+        """Get the Prometheus textfile path for metrics export (None if disabled)."""
+        metrics_file = self.get("metrics-file", DefaultConfiguration.METRICS_FILE)
+        if not metrics_file or str(metrics_file).lower() == "none":
+            return None
+        return Path(metrics_file).expanduser()
+
+    def get_metrics_interval(self) -> float:
+        """Get the number of seconds between metrics exports."""
+        interval = _optional_number(
+            self.get("metrics-interval", DefaultConfiguration.METRICS_INTERVAL), float
+        )
+        return interval or DefaultConfiguration.METRICS_INTERVAL
+
     def get_all(self) -> dict[str, Any]:
         """
         Get all configuration values.
@@ -259,6 +583,8 @@ class ConfigurationManager:
                 str(self._config_file),
                 "save",
             ) from e
+        finally:
+            invalidate_config_snapshots(self._config_file)
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
@@ -31,6 +31,11 @@ from .interfaces import (
     LoggingHandler,
 )
 
+# ------------------------------------------------
+# CORE METRICS
+# ------------------------------------------------
+from .metrics import Histogram, MetricsExporter, MetricsRegistry
+
 # =============================================================================
 # MODULE EXPORTS
 # =============================================================================
@@ -44,6 +49,12 @@ __all__ = [
     "ConfigurationManager",
     "EzplCore",
     # ------------------------------------------------
+    # METRICS EXPORTS
+    # ------------------------------------------------
+    "MetricsRegistry",
+    "MetricsExporter",
+    "Histogram",
+    # ------------------------------------------------
     # EXCEPTION EXPORTS
     # ------------------------------------------------
     "EzplError",
@@ -0,0 +1,68 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Lazy Exports
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Lazy module exports for Ezpl packages.
+
+This module provides lazy_exports(), which builds the module-level
+__getattr__ and __dir__ of a package whose exports are imported on first
+access, so importing the package does not load its submodules.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the __getattr__ and __dir__ functions of a lazily exporting module.
+
+    Args:
+        module_name: Name of the exporting module (its ``__name__``)
+        exports: Exported name -> (module, attribute); relative module
+            names are resolved against module_name
+
+    Returns:
+        (__getattr__, __dir__) to assign at the module's top level
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+    """
+
+    def __getattr__(name: str) -> Any:
+        """
+        Import lazily exported names on first access.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            The exported object (cached in the module afterwards)
+
+        Raises:
+            AttributeError: If the name is not exported
+        """
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target[0], module_name), target[1])
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        """List module attributes, lazy exports included."""
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
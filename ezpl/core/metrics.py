@@ -0,0 +1,575 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Runtime Metrics
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Runtime metrics for Ezpl logging framework.
+
+This module provides low-overhead counters, gauges and fixed-bucket latency
+histograms describing Ezpl's own cost, plus Prometheus text-format export
+for the node exporter textfile collector.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import atexit
+import contextlib
+import os
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Internal modules
+from .exceptions import FileOperationError
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Observations are counted in the first bucket whose upper bound is
+    greater than or equal to the value, so recording costs one bisect and
+    three additions. Like the rate limiter, updates are not locked: under
+    heavy contention a few observations may be lost, which is acceptable
+    for monitoring.
+    """
+
+    # Upper bounds in seconds (10 µs to 1 s), an implicit +Inf bucket follows
+    BOUNDS: tuple[float, ...] = (
+        0.00001,
+        0.000025,
+        0.00005,
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+    )
+
+    __slots__ = ("_counts", "_sum", "_count")
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts = [0] * (len(self.BOUNDS) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    # ///////////////////////////////////////////////////////////////
+    # RECORDING METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            seconds: Observed duration in seconds
+        """
+        self._counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self._sum += seconds
+        self._count += 1
+
+    def reset(self) -> None:
+        """Forget all observations."""
+        self._counts = [0] * (len(self.BOUNDS) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of observed durations in seconds."""
+        return self._sum
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """
+        Get cumulative bucket counts, Prometheus style.
+
+        Returns:
+            List of (upper_bound, cumulative_count), ending with +Inf
+        """
+        buckets = []
+        total = 0
+        for bound, count in zip(self.BOUNDS + (float("inf"),), self._counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a summary of the histogram.
+
+        Returns:
+            Dictionary with count, sum, mean, p50, p99 and cumulative buckets
+        """
+        return summarize_buckets(self.cumulative_buckets(), self._sum)
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of Ezpl runtime metrics.
+
+    Tracks per-sink record counts by level, bytes written, suppressed,
+    coalesced and dropped records, queue depth gauges and latency
+    histograms keyed by (operation, sink).
+    """
+
+    # Counter families exported to Prometheus: name -> help text
+    COUNTERS = {
+        "records": "Records written per sink and level.",
+        "bytes_written": "Bytes written per sink.",
+        "suppressed": "Records suppressed by rate limiting per sink.",
+        "coalesced": "Repeated records coalesced per sink.",
+        "dropped": "Records dropped per sink (queue overflow).",
+    }
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        # (family, sink, level) -> value
+        self._counters: dict[tuple[str, str, str], int] = {}
+        # (operation, sink) -> Histogram
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        # name -> callable returning the current value
+        self._gauges: dict[str, Callable[[], float]] = {}
+
+    # ///////////////////////////////////////////////////////////////
+    # RECORDING METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def inc(self, family: str, sink: str, amount: int = 1, level: str = "") -> None:
+        """
+        Increment a counter.
+
+        Args:
+            family: Counter family (see COUNTERS)
+            sink: Sink name (e.g., 'console', 'file')
+            amount: Increment
+            level: Log level for per-level counters
+        """
+        key = (family, sink, level)
+        counters = self._counters
+        counters[key] = counters.get(key, 0) + amount
+
+    def record(self, sink: str, level: str, nbytes: int) -> None:
+        """
+        Count one written record and its size.
+
+        Args:
+            sink: Sink name
+            level: Log level of the record
+            nbytes: Size of the written record in bytes
+        """
+        counters = self._counters
+        key = ("records", sink, level)
+        counters[key] = counters.get(key, 0) + 1
+        key = ("bytes_written", sink, "")
+        counters[key] = counters.get(key, 0) + nbytes
+
+    def histogram(self, operation: str, sink: str) -> Histogram:
+        """
+        Get (or create) the latency histogram of an operation.
+
+        Handlers fetch their histograms once and call ``observe`` directly.
+
+        Args:
+            operation: Operation name (e.g., 'print_pattern', 'sink_write')
+            sink: Sink name
+
+        Returns:
+            The Histogram instance for (operation, sink)
+        """
+        key = (operation, sink)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def register_gauge(self, name: str, getter: Callable[[], float]) -> None:
+        """
+        Register a gauge evaluated at snapshot time (e.g., queue depth).
+
+        Args:
+            name: Gauge name
+            getter: Callable returning the current value
+        """
+        with self._lock:
+            self._gauges[name] = getter
+
+    def unregister_gauge(self, name: str) -> None:
+        """
+        Remove a gauge.
+
+        Args:
+            name: Gauge name
+        """
+        with self._lock:
+            self._gauges.pop(name, None)
+
+    def reset(self) -> None:
+        """Reset counters and histograms (gauges are kept)."""
+        with self._lock:
+            self._counters.clear()
+            for histogram in self._histograms.values():
+                histogram.reset()
+
+    # ///////////////////////////////////////////////////////////////
+    # EXPORT METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a point-in-time copy of all metrics.
+
+        Returns:
+            Dictionary with 'records' ({sink: {level: count}}), one
+            {sink: value} dict per other counter family, 'queue_depth'
+            ({name: value}) and 'latency' ({operation: {sink: summary}})
+        """
+        snapshot: dict[str, Any] = {family: {} for family in self.COUNTERS}
+        for (family, sink, level), value in list(self._counters.items()):
+            if family == "records":
+                snapshot["records"].setdefault(sink, {})[level] = value
+            else:
+                snapshot.setdefault(family, {})[sink] = value
+
+        snapshot["queue_depth"] = {}
+        for name, getter in list(self._gauges.items()):
+            # A dead gauge must not break the snapshot
+            with contextlib.suppress(Exception):
+                snapshot["queue_depth"][name] = getter()
+
+        snapshot["latency"] = {}
+        for (operation, sink), histogram in list(self._histograms.items()):
+            if histogram.count:
+                snapshot["latency"].setdefault(operation, {})[
+                    sink
+                ] = histogram.snapshot()
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Prometheus text-format document
+        """
+        lines: list[str] = []
+        counters = list(self._counters.items())
+
+        for family, help_text in self.COUNTERS.items():
+            name = f"ezpl_{family}_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (counter_family, sink, level), value in counters:
+                if counter_family != family:
+                    continue
+                labels = {"sink": sink}
+                if level:
+                    labels["level"] = level
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        lines.append("# HELP ezpl_queue_depth Records waiting in handler queues.")
+        lines.append("# TYPE ezpl_queue_depth gauge")
+        for name, value in self.snapshot()["queue_depth"].items():
+            lines.append(f"ezpl_queue_depth{_format_labels({'queue': name})} {value}")
+
+        lines.append("# HELP ezpl_latency_seconds Handler operation latency.")
+        lines.append("# TYPE ezpl_latency_seconds histogram")
+        for (operation, sink), histogram in list(self._histograms.items()):
+            base = {"operation": operation, "sink": sink}
+            for bound, total in histogram.cumulative_buckets():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels({**base, "le": le})
+                lines.append(f"ezpl_latency_seconds_bucket{labels} {total}")
+            labels = _format_labels(base)
+            lines.append(f"ezpl_latency_seconds_sum{labels} {histogram.sum!r}")
+            lines.append(f"ezpl_latency_seconds_count{labels} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path]) -> Path:
+        """
+        Write metrics to a Prometheus textfile.
+
+        The file is written next to its destination then renamed, so the
+        textfile collector never reads a partial file.
+
+        Args:
+            path: Destination file (conventionally ending in '.prom')
+
+        Returns:
+            Path of the written file
+
+        Raises:
+            FileOperationError: If the file cannot be written
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(self.to_prometheus(), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise FileOperationError(
+                f"Failed to write metrics file: {e}", str(path), "write"
+            ) from e
+        return path
+
+
+class MetricsExporter:
+    """
+    Periodically write a registry to a Prometheus textfile.
+
+    A daemon thread rewrites the file every ``interval`` seconds and a final
+    export is made when the exporter is stopped or the interpreter exits.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        interval: float = 15.0,
+        registry: Optional[MetricsRegistry] = None,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Destination textfile
+            interval: Seconds between exports
+            registry: Registry to export (default: the process-wide registry)
+        """
+        self._path = Path(path)
+        self._interval = max(float(interval), 0.1)
+        self._registry = registry if registry is not None else METRICS
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def path(self) -> Path:
+        """Destination textfile."""
+        return self._path
+
+    # ///////////////////////////////////////////////////////////////
+    # CONTROL METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def start(self) -> None:
+        """Start the export thread (no-op if already running)."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ezpl-metrics-exporter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop the export thread and write a final export."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        atexit.unregister(self.stop)
+        self._export()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _run(self) -> None:
+        """Export loop of the background thread."""
+        while not self._stop_event.wait(self._interval):
+            self._export()
+
+    def _export(self) -> None:
+        """Write the textfile, ignoring I/O errors (retried next interval)."""
+        with contextlib.suppress(FileOperationError):
+            self._registry.write_prometheus(self._path)
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def summarize_buckets(
+    buckets: list[tuple[float, int]], total_sum: float
+) -> dict[str, Any]:
+    """
+    Summarize cumulative histogram buckets.
+
+    Quantiles are estimated by linear interpolation inside the bucket that
+    contains them, as Prometheus' histogram_quantile() does.
+
+    Args:
+        buckets: List of (upper_bound, cumulative_count), ending with +Inf
+        total_sum: Sum of observations in seconds
+
+    Returns:
+        Dictionary with count, sum, mean, p50, p99 and buckets
+    """
+    count = buckets[-1][1] if buckets else 0
+    return {
+        "count": count,
+        "sum": total_sum,
+        "mean": total_sum / count if count else 0.0,
+        "p50": _quantile(buckets, 0.50),
+        "p99": _quantile(buckets, 0.99),
+        "buckets": buckets,
+    }
+
+
+def parse_prometheus(text: str) -> dict[str, Any]:
+    """
+    Parse an Ezpl Prometheus textfile back into a snapshot.
+
+    Used by ``ezpl info --metrics`` to display metrics exported by another
+    process.
+
+    Args:
+        text: Prometheus text-format document written by ``write_prometheus``
+
+    Returns:
+        Dictionary with the same layout as ``MetricsRegistry.snapshot()``
+    """
+    snapshot: dict[str, Any] = {family: {} for family in MetricsRegistry.COUNTERS}
+    snapshot["queue_depth"] = {}
+    histograms: dict[tuple[str, str], dict[str, Any]] = {}
+
+    for line in text.splitlines():
+        match = _SAMPLE_RE.match(line.strip())
+        if not match:
+            continue
+        name, raw_labels, raw_value = match.groups()
+        labels = dict(_LABEL_RE.findall(raw_labels or ""))
+        try:
+            value = float(raw_value)
+        except ValueError:
+            continue
+
+        if name.startswith("ezpl_latency_seconds"):
+            key = (labels.get("operation", ""), labels.get("sink", ""))
+            entry = histograms.setdefault(key, {"buckets": [], "sum": 0.0})
+            if name.endswith("_bucket"):
+                le = labels.get("le", "+Inf")
+                bound = float("inf") if le == "+Inf" else float(le)
+                entry["buckets"].append((bound, int(value)))
+            elif name.endswith("_sum"):
+                entry["sum"] = value
+        elif name == "ezpl_queue_depth":
+            snapshot["queue_depth"][labels.get("queue", "")] = value
+        elif name.startswith("ezpl_") and name.endswith("_total"):
+            family = name[len("ezpl_") : -len("_total")]
+            sink = labels.get("sink", "")
+            if family == "records":
+                snapshot["records"].setdefault(sink, {})[labels.get("level", "")] = int(
+                    value
+                )
+            else:
+                snapshot.setdefault(family, {})[sink] = int(value)
+
+    snapshot["latency"] = {}
+    for (operation, sink), entry in histograms.items():
+        buckets = sorted(entry["buckets"])
+        if buckets and buckets[-1][1]:
+            snapshot["latency"].setdefault(operation, {})[sink] = summarize_buckets(
+                buckets, entry["sum"]
+            )
+    return snapshot
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the process-wide metrics registry.
+
+    Returns:
+        The MetricsRegistry shared by all Ezpl handlers
+    """
+    return METRICS
+
+
+# ------------------------------------------------
+# PRIVATE HELPER FUNCTIONS
+# ------------------------------------------------
+
+
+def _quantile(buckets: list[tuple[float, int]], q: float) -> Optional[float]:
+    """Estimate a quantile from cumulative buckets (None if empty)."""
+    if not buckets or not buckets[-1][1]:
+        return None
+    rank = q * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return lower_bound  # Above the last finite bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (
+                (rank - lower_count) / (count - lower_count)
+            )
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Render a Prometheus label set."""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+_SAMPLE_RE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$")
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+METRICS = MetricsRegistry()
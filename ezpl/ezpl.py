@@ -8,9 +8,10 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
+import os
 import sys
 import threading
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, TypeVar
@@ -21,8 +22,22 @@ from loguru._logger import Logger
 
 # Internal modules
 from .config import ConfigurationManager
-from .handlers import EzLogger, EzPrinter
+from .core.exceptions import LoggingError, ValidationError
+from .core.metrics import METRICS, MetricsExporter
+from .handlers import EzLogger, EzPrinter, RingBufferHandler
 from .handlers.console import ConsolePrinterWrapper
+from .handlers.multiprocess import (
+    WRITER_ENV,
+    LogWriterServer,
+    SocketTransport,
+    transport_from_environment,
+)
+from .handlers.sinks.base import (
+    DEFAULT_SINK_QUEUE_SIZE,
+    Sink,
+    SinkRecord,
+    SinkRegistry,
+)
 
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
@@ -46,6 +61,11 @@ class Ezpl:
     _printer: EzPrinter
     _logger: EzLogger
     _config_manager: ConfigurationManager
+    _metrics_exporter: MetricsExporter | None = None
+    _ring_buffer: RingBufferHandler | None = None
+    _log_writer: LogWriterServer | None = None
+    _sinks: SinkRegistry | None = None
+    _fork_hook_registered: bool = False
 
     # ///////////////////////////////////////////////////////////////
     # INIT
@@ -115,6 +135,9 @@ class Ezpl:
                 # Check again after acquiring lock (double-checked locking)
                 if cls._instance is None:
                     logger.remove()
+                    # Sinks added before the first Ezpl() lost their handler
+                    if cls._sinks is not None:
+                        cls._sinks.reattach()
 
                     # Initialize configuration manager
                     cls._config_manager = ConfigurationManager()
@@ -218,6 +241,7 @@ class Ezpl:
                         indent_step=final_indent_step,
                         indent_symbol=final_indent_symbol,
                         base_indent_symbol=final_base_indent_symbol,
+                        **cls._printer_options(),
                     )
 
                     # Initialize logger with resolved configuration
@@ -227,6 +251,7 @@ class Ezpl:
                         rotation=final_rotation,
                         retention=final_retention,
                         compression=final_compression,
+                        **cls._logger_options(),
                     )
 
                     # Apply global log level if specified, but only if specific levels were not set
@@ -242,8 +267,119 @@ class Ezpl:
                             # Only apply to logger if file_logger_level was not specified
                             cls._instance.set_logger_level(final_log_level)
 
+                    # In-memory flight recorder (opt-in)
+                    cls._start_ring_buffer()
+
+                    # Periodic Prometheus textfile export (opt-in)
+                    cls._start_metrics_exporter()
+
         return cls._instance
 
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    @classmethod
+    def _printer_options(cls) -> dict[str, Any]:
+        """
+        Resolve optional printer settings from the configuration manager.
+
+        Returns:
+            Keyword arguments for EzPrinter beyond level and indentation
+        """
+        return {
+            "rate_limit": cls._config_manager.get_rate_limit(),
+            "rate_limit_burst": cls._config_manager.get_rate_limit_burst(),
+            "rate_limit_key": cls._config_manager.get_rate_limit_key(),
+            "coalesce_window": cls._config_manager.get_coalesce_window(),
+            "mode": cls._config_manager.get_printer_mode(),
+            "async_render": cls._config_manager.get_printer_async(),
+            "queue_size": cls._config_manager.get_printer_queue_size(),
+            "overflow": cls._config_manager.get_printer_overflow(),
+        }
+
+    @classmethod
+    def _logger_options(cls) -> dict[str, Any]:
+        """
+        Resolve optional file logger settings from the configuration manager.
+
+        Returns:
+            Keyword arguments for EzLogger beyond file, level and rotation
+        """
+        return {
+            "rate_limit": cls._config_manager.get_rate_limit(),
+            "rate_limit_burst": cls._config_manager.get_rate_limit_burst(),
+            "rate_limit_key": cls._config_manager.get_rate_limit_key(),
+            "coalesce_window": cls._config_manager.get_coalesce_window(),
+            "enqueue": cls._config_manager.get_file_logger_async(),
+            "transport": cls._worker_transport(),
+        }
+
+    @classmethod
+    def _worker_transport(cls) -> SocketTransport | None:
+        """
+        Transport to the writer process, if this process is a worker.
+
+        Returns:
+            Configured transport built from the inherited environment handle,
+            or None if no writer is advertised or this process is the writer
+        """
+        if cls._log_writer is not None:
+            return None
+        return transport_from_environment(
+            cls._config_manager.get_log_transport(),
+            cls._config_manager.get_log_transport_ring_size(),
+        )
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        """
+        Turn a forked copy of the writer process into a worker.
+
+        The child inherits the writer's file sink but not its threads, so
+        the file logger is rebuilt to ship records to the parent.
+        """
+        if cls._log_writer is None:
+            return
+        cls._log_writer = None  # The listener belongs to the parent
+        instance = cls._instance
+        if instance is None:
+            return
+        previous = instance._logger
+        try:
+            previous.close()
+        except Exception as e:
+            logger.error(f"Error while detaching forked logger: {e}")
+        instance._logger = EzLogger(
+            log_file=instance._log_file,
+            level=previous._level,
+            **cls._logger_options(),
+        )
+
+    @classmethod
+    def _start_ring_buffer(cls) -> None:
+        """Start the flight recorder if a ring buffer size is configured."""
+        capacity = cls._config_manager.get_ring_buffer_size()
+        if not capacity:
+            return
+        cls._ring_buffer = RingBufferHandler(
+            capacity=capacity,
+            level=cls._config_manager.get_ring_buffer_level(),
+            dump_file=cls._config_manager.get_ring_buffer_dump_file(),
+        )
+        cls._ring_buffer.install_excepthook()
+
+    @classmethod
+    def _start_metrics_exporter(cls) -> None:
+        """Start the metrics exporter if a metrics file is configured."""
+        metrics_file = cls._config_manager.get_metrics_file()
+        if metrics_file is None:
+            return
+        cls._metrics_exporter = MetricsExporter(
+            metrics_file, cls._config_manager.get_metrics_interval()
+        )
+        cls._metrics_exporter.start()
+
     # ///////////////////////////////////////////////////////////////
     # GETTER
     # ///////////////////////////////////////////////////////////////
@@ -344,6 +480,9 @@ class Ezpl:
         """
         Context manager to manage indentation level.
 
+        Indentation is tracked per thread and per asyncio task, so concurrent
+        workers can nest it freely without locking.
+
         **Returns:**
 
             * `None`.
@@ -351,6 +490,277 @@ class Ezpl:
         with self._printer.manage_indent():
             yield
 
+    # ///////////////////////////////////////////////////////////////
+    # FLIGHT RECORDER
+    # ///////////////////////////////////////////////////////////////
+
+    @classmethod
+    def get_ring_buffer(cls) -> RingBufferHandler | None:
+        """
+        Get the in-memory flight recorder.
+
+        **Returns:**
+
+            * `RingBufferHandler | None`: The ring buffer, or None if disabled
+              (see EZPL_RING_BUFFER_SIZE).
+        """
+        return cls._ring_buffer
+
+    @classmethod
+    def dump_recent(
+        cls, path: Path | str | None = None, reason: str = "on demand"
+    ) -> Path | None:
+        """
+        Dump the records kept by the flight recorder to a file.
+
+        **Args:**
+
+            * `path` (Path | str, optional): Destination file. Defaults to
+              the configured dump file (EZPL_RING_BUFFER_DUMP_FILE).
+            * `reason` (str): Reason written in the dump header.
+
+        **Returns:**
+
+            * `Path | None`: Path of the written file, or None if the flight
+              recorder is disabled.
+
+        **Raises:**
+
+            * `FileOperationError`: If the file cannot be written.
+        """
+        if cls._ring_buffer is None:
+            return None
+        return cls._ring_buffer.dump(path, reason)
+
+    # ///////////////////////////////////////////////////////////////
+    # SINKS
+    # ///////////////////////////////////////////////////////////////
+
+    @classmethod
+    def add_sink(
+        cls,
+        name: str,
+        sink: Sink,
+        level: str = "DEBUG",
+        format: str | Callable[[SinkRecord], str] | None = None,
+        queue_size: int = DEFAULT_SINK_QUEUE_SIZE,
+        overflow: str = "drop_new",
+    ) -> Sink:
+        """
+        Send the records of the file logger to an additional sink.
+
+        Each sink has its own bounded queue and worker thread: logging
+        calls only append to the queues, and a slow or unreachable sink
+        never delays the other sinks. Records go to sinks whatever the file
+        logger's level, rate limiting and coalescing. Sinks may be added
+        before the first Ezpl() is created.
+
+        **Args:**
+
+            * `name` (str): Unique sink name (used by remove_sink() and in
+              get_sink_stats()).
+            * `sink` (Sink): Sink instance (FileSink, StreamSink,
+              SyslogSink, TCPSink or a Sink subclass).
+            * `level` (str): Minimum level of the records sent to the sink.
+            * `format` (str | Callable, optional): str.format template over
+              the SinkRecord fields, or a callable returning the line.
+              Defaults to the sink's default (FileLogger's format).
+            * `queue_size` (int): Maximum number of records waiting for the
+              sink.
+            * `overflow` (str): Policy when the queue is full: 'drop_new',
+              'drop_old' or 'block'.
+
+        **Returns:**
+
+            * `Sink`: The registered sink.
+
+        **Raises:**
+
+            * `ValidationError`: If an argument is invalid or the name is
+              already used.
+        """
+        with cls._lock:
+            if cls._sinks is None:
+                cls._sinks = SinkRegistry()
+            sinks = cls._sinks
+        return sinks.add(name, sink, level, format, queue_size, overflow)
+
+    @classmethod
+    def remove_sink(cls, name: str, timeout: float = 5.0) -> None:
+        """
+        Flush, close and remove a sink added with add_sink().
+
+        **Args:**
+
+            * `name` (str): Sink name.
+            * `timeout` (float): Maximum time to wait for queued records.
+
+        **Raises:**
+
+            * `ValidationError`: If no sink has this name.
+        """
+        if cls._sinks is None:
+            raise ValidationError(f"No sink named {name!r}", "name", name)
+        cls._sinks.remove(name, timeout)
+
+    @classmethod
+    def get_sink_stats(cls) -> dict[str, dict[str, Any]]:
+        """
+        Get the health and counters of every sink.
+
+        **Returns:**
+
+            * `dict`: {name: stats}, see SinkRegistry.stats().
+        """
+        if cls._sinks is None:
+            return {}
+        return cls._sinks.stats()
+
+    @classmethod
+    def flush_sinks(cls, timeout: float = 5.0) -> bool:
+        """
+        Wait until every sink has written its queued records.
+
+        **Args:**
+
+            * `timeout` (float): Maximum time to wait in seconds.
+
+        **Returns:**
+
+            * `bool`: True if every queue was drained in time.
+        """
+        if cls._sinks is None:
+            return True
+        return cls._sinks.flush(timeout)
+
+    # ///////////////////////////////////////////////////////////////
+    # MULTI-PROCESS LOGGING
+    # ///////////////////////////////////////////////////////////////
+
+    def start_log_writer(self) -> str:
+        """
+        Make this process the writer of the log file for its workers.
+
+        The writer keeps its file sink (rotation, retention, compression) and
+        listens on a local socket. The socket address and auth key are
+        exported as EZPL_LOG_WRITER and EZPL_LOG_WRITER_KEY, so processes
+        started or forked afterwards attach automatically: their file
+        loggers format records locally and ship the lines to the writer.
+
+        **Returns:**
+
+            * `str`: Address of the writer socket.
+
+        **Raises:**
+
+            * `LoggingError`: If this process is itself a worker.
+        """
+        cls = type(self)
+        if cls._log_writer is not None:
+            return cls._log_writer.address
+        if self._logger.is_worker:
+            raise LoggingError(
+                "This process already ships its records to a writer process",
+                "file",
+            )
+
+        cls._log_writer = LogWriterServer(
+            lambda level_no, line: self._logger.write_remote(level_no, line)
+        )
+        os.environ.update(cls._log_writer.environment())
+        if not cls._fork_hook_registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=cls._after_fork_in_child)
+            cls._fork_hook_registered = True
+        return cls._log_writer.address
+
+    @classmethod
+    def stop_log_writer(cls) -> None:
+        """
+        Stop the log writer started by start_log_writer().
+
+        The environment handle is withdrawn; workers still running drop
+        their records.
+        """
+        if cls._log_writer is None:
+            return
+        for name, value in cls._log_writer.environment().items():
+            if os.environ.get(name) == value:
+                del os.environ[name]
+        cls._log_writer.close()
+        cls._log_writer = None
+
+    @classmethod
+    def get_log_writer(cls) -> LogWriterServer | None:
+        """
+        Get the writer server of this process.
+
+        **Returns:**
+
+            * `LogWriterServer | None`: The server, or None if this process
+              is not a writer.
+        """
+        return cls._log_writer
+
+    @classmethod
+    def is_log_worker(cls) -> bool:
+        """
+        Return True if this process ships its records to a writer process.
+        """
+        instance = cls._instance
+        if instance is not None:
+            return instance._logger.is_worker
+        return cls._log_writer is None and bool(os.environ.get(WRITER_ENV))
+
+    # ///////////////////////////////////////////////////////////////
+    # METRICS
+    # ///////////////////////////////////////////////////////////////
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, Any]:
+        """
+        Get Ezpl's runtime metrics.
+
+        Metrics are process-wide and cover every console printer and file
+        logger: per-level record counts, bytes written per sink, suppressed,
+        coalesced and dropped records, queue depths and latency histograms
+        for print_pattern, _format_message and sink writes.
+
+        **Returns:**
+
+            * `dict`: Snapshot of all metrics (see MetricsRegistry.snapshot()).
+        """
+        return METRICS.snapshot()
+
+    @classmethod
+    def export_metrics(cls, path: Path | str | None = None) -> Path:
+        """
+        Write runtime metrics to a Prometheus textfile.
+
+        **Args:**
+
+            * `path` (Path | str, optional): Destination file. Defaults to the
+              configured metrics file (EZPL_METRICS_FILE).
+
+        **Returns:**
+
+            * `Path`: Path of the written file.
+
+        **Raises:**
+
+            * `ValidationError`: If no path is given and none is configured.
+            * `FileOperationError`: If the file cannot be written.
+        """
+        if path is None:
+            config_manager = getattr(cls, "_config_manager", None)
+            if config_manager is None:
+                config_manager = ConfigurationManager()
+            path = config_manager.get_metrics_file()
+            if path is None:
+                raise ValidationError(
+                    "No metrics file given or configured", "metrics-file", None
+                )
+        return METRICS.write_prometheus(path)
+
     # ///////////////////////////////////////////////////////////////
     # ENHANCED METHODS
     # ///////////////////////////////////////////////////////////////
@@ -362,14 +772,37 @@ class Ezpl:
 
         Warning: This will destroy the current instance and all its state.
         """
+        # Stop accepting worker records before closing the file logger
+        cls.stop_log_writer()
         if cls._instance is not None:
             # Close logger handlers to release file handles (important on Windows)
             try:
                 if hasattr(cls._instance, "_logger") and cls._instance._logger:
                     cls._instance._logger.close()
+                # Write queued console output and stop the render thread
+                if hasattr(cls._instance, "_printer") and cls._instance._printer:
+                    cls._instance._printer.close()
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
             cls._instance = None
+        # Stop the flight recorder and restore exception hooks
+        if cls._ring_buffer is not None:
+            try:
+                cls._ring_buffer.close()
+            except Exception as e:
+                logger.error(f"Error while closing ring buffer: {e}")
+            cls._ring_buffer = None
+        # Write queued records and close the sinks
+        if cls._sinks is not None:
+            try:
+                cls._sinks.close()
+            except Exception as e:
+                logger.error(f"Error while closing sinks: {e}")
+            cls._sinks = None
+        # Stop the metrics exporter (writes a final export)
+        if cls._metrics_exporter is not None:
+            cls._metrics_exporter.stop()
+            cls._metrics_exporter = None
         # Also reset configuration lock
         cls._config_locked = False
 
@@ -427,6 +860,7 @@ class Ezpl:
                 rotation=self._config_manager.get_log_rotation(),
                 retention=self._config_manager.get_log_retention(),
                 compression=self._config_manager.get_log_compression(),
+                **self._logger_options(),
             )
 
     def get_log_file(self) -> Path:
@@ -519,6 +953,7 @@ class Ezpl:
             rotation=self._config_manager.get_log_rotation(),
             retention=self._config_manager.get_log_retention(),
             compression=self._config_manager.get_log_compression(),
+            **self._logger_options(),
         )
 
         # Reinitialize printer with new indent settings
@@ -528,11 +963,14 @@ class Ezpl:
             if hasattr(self, "_printer") and self._printer
             else printer_level
         )
+        if hasattr(self, "_printer") and self._printer:
+            self._printer.close()  # Write queued output before replacing it
         self._printer = EzPrinter(
             level=current_printer_level,
             indent_step=self._config_manager.get_indent_step(),
             indent_symbol=self._config_manager.get_indent_symbol(),
             base_indent_symbol=self._config_manager.get_base_indent_symbol(),
+            **self._printer_options(),
         )
 
     def configure(self, config_dict: dict[str, Any] = None, **kwargs) -> None:
@@ -545,6 +983,7 @@ class Ezpl:
                 - log_file or log-file: Path to log file
                 - printer_level or printer-level: Printer log level
                 - logger_level or file-logger-level: File logger level
+                - logger_async or file-logger-async: Write the log file from a background thread
                 - level or log-level: Set both printer and logger level
                 - log_rotation or log-rotation: Rotation setting (e.g., "10 MB", "1 day")
                 - log_retention or log-retention: Retention period (e.g., "7 days")
@@ -552,6 +991,14 @@ class Ezpl:
                 - indent_step or indent-step: Indentation step size
                 - indent_symbol or indent-symbol: Symbol for indentation
                 - base_indent_symbol or base-indent-symbol: Base indentation symbol
+                - printer_mode or printer-mode: Console render mode ("auto", "rich" or "plain")
+                - printer_async or printer-async: Render console output on a background thread
+                - printer_queue_size or printer-queue-size: Render queue capacity
+                - printer_overflow or printer-overflow: Render queue overflow policy ("block", "drop_new" or "drop_old")
+                - rate_limit or rate-limit: Max records per second per call site (None disables)
+                - rate_limit_burst or rate-limit-burst: Rate limit burst capacity
+                - rate_limit_key or rate-limit-key: Rate limit key ("callsite" or "message")
+                - coalesce_window or coalesce-window: Seconds identical consecutive messages are coalesced (None disables)
 
         Note: Changes are persisted to the configuration file.
         """
@@ -573,6 +1020,7 @@ class Ezpl:
             "log_file": "log-file",
             "printer_level": "printer-level",
             "logger_level": "file-logger-level",
+            "logger_async": "file-logger-async",
             "level": "log-level",
             "log_rotation": "log-rotation",
             "log_retention": "log-retention",
@@ -580,6 +1028,14 @@ class Ezpl:
             "indent_step": "indent-step",
             "indent_symbol": "indent-symbol",
             "base_indent_symbol": "base-indent-symbol",
+            "printer_mode": "printer-mode",
+            "printer_async": "printer-async",
+            "printer_queue_size": "printer-queue-size",
+            "printer_overflow": "printer-overflow",
+            "rate_limit": "rate-limit",
+            "rate_limit_burst": "rate-limit-burst",
+            "rate_limit_key": "rate-limit-key",
+            "coalesce_window": "coalesce-window",
         }
 
         for key, value in kwargs.items():
@@ -621,10 +1077,24 @@ class Ezpl:
             # Only global level is provided, apply to both
             self.set_level(normalized_config["log-level"])
 
-        # Reinitialize logger if rotation settings changed
+        suppression_keys = [
+            "rate-limit",
+            "rate-limit-burst",
+            "rate-limit-key",
+            "coalesce-window",
+        ]
+
+        # Reinitialize logger if rotation, threading, rate limit or coalescing
+        # settings changed
         rotation_changed = any(
             key in normalized_config
-            for key in ["log-rotation", "log-retention", "log-compression"]
+            for key in [
+                "log-rotation",
+                "log-retention",
+                "log-compression",
+                "file-logger-async",
+            ]
+            + suppression_keys
         )
         if rotation_changed:
             # Save current level before closing logger
@@ -646,12 +1116,22 @@ class Ezpl:
                 rotation=self._config_manager.get_log_rotation(),
                 retention=self._config_manager.get_log_retention(),
                 compression=self._config_manager.get_log_compression(),
+                **self._logger_options(),
             )
 
-        # Reinitialize printer if indent settings changed
+        # Reinitialize printer if indent, mode, rate limit or coalescing settings changed
         indent_changed = any(
             key in normalized_config
-            for key in ["indent-step", "indent-symbol", "base-indent-symbol"]
+            for key in [
+                "indent-step",
+                "indent-symbol",
+                "base-indent-symbol",
+                "printer-mode",
+                "printer-async",
+                "printer-queue-size",
+                "printer-overflow",
+            ]
+            + suppression_keys
         )
         if indent_changed:
             # Save current level before reinitializing printer
@@ -660,9 +1140,12 @@ class Ezpl:
                 if hasattr(self, "_printer") and self._printer
                 else self._config_manager.get_printer_level()
             )
+            if hasattr(self, "_printer") and self._printer:
+                self._printer.close()  # Write queued output before replacing it
             self._printer = EzPrinter(
                 level=self._config_manager.get_printer_level() or current_printer_level,
                 indent_step=self._config_manager.get_indent_step(),
                 indent_symbol=self._config_manager.get_indent_symbol(),
                 base_indent_symbol=self._config_manager.get_base_indent_symbol(),
+                **self._printer_options(),
             )
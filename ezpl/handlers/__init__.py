@@ -2,24 +2,67 @@
 Handlers module for Ezpl logging framework.
 
 This module contains concrete implementations of logging handlers.
+Handlers are imported on first access, so importing one handler module
+does not load the others (nor Rich's wizard machinery).
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
 
-# ------------------------------------------------
-# HANDLER IMPLEMENTATIONS
-# ------------------------------------------------
-from .console import ConsolePrinter, ConsolePrinterWrapper
-from .file import FileLogger
-from .wizard import RichWizard
+from typing import TYPE_CHECKING
+
+from ..core.lazy import lazy_exports
 
 # ------------------------------------------------
-# BACKWARD COMPATIBILITY ALIASES
+# HANDLER IMPLEMENTATIONS (lazy)
 # ------------------------------------------------
-EzPrinter = ConsolePrinter
-EzLogger = FileLogger
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ConsolePrinter": (".console", "ConsolePrinter"),
+    "ConsolePrinterWrapper": (".console", "ConsolePrinterWrapper"),
+    "FileLogger": (".file", "FileLogger"),
+    "LogWriterServer": (".multiprocess", "LogWriterServer"),
+    "SharedMemoryTransport": (".multiprocess", "SharedMemoryTransport"),
+    "SocketTransport": (".multiprocess", "SocketTransport"),
+    "RingBufferHandler": (".ring_buffer", "RingBufferHandler"),
+    "RichWizard": (".wizard.core", "RichWizard"),
+    "Sink": (".sinks.base", "Sink"),
+    "SinkRegistry": (".sinks.base", "SinkRegistry"),
+    "FileSink": (".sinks.builtin", "FileSink"),
+    "StreamSink": (".sinks.builtin", "StreamSink"),
+    "SyslogSink": (".sinks.builtin", "SyslogSink"),
+    "TCPSink": (".sinks.builtin", "TCPSink"),
+    "ShippingSink": (".sinks.shipping", "ShippingSink"),
+    "SQLiteSink": (".sinks.sqlite", "SQLiteSink"),
+    # Backward compatibility aliases
+    "EzPrinter": (".console", "ConsolePrinter"),
+    "EzLogger": (".file", "FileLogger"),
+}
+
+if TYPE_CHECKING:
+    from .console import ConsolePrinter, ConsolePrinterWrapper
+    from .file import FileLogger
+    from .multiprocess import LogWriterServer, SharedMemoryTransport, SocketTransport
+    from .ring_buffer import RingBufferHandler
+    from .sinks import (
+        FileSink,
+        ShippingSink,
+        Sink,
+        SinkRegistry,
+        SQLiteSink,
+        StreamSink,
+        SyslogSink,
+        TCPSink,
+    )
+    from .wizard import RichWizard
+
+    EzPrinter = ConsolePrinter
+    EzLogger = FileLogger
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 # =============================================================================
 # MODULE EXPORTS
@@ -32,7 +75,19 @@ __all__ = [
     "ConsolePrinter",
     "ConsolePrinterWrapper",
     "FileLogger",
+    "LogWriterServer",
+    "SharedMemoryTransport",
+    "SocketTransport",
+    "RingBufferHandler",
     "RichWizard",
+    "Sink",
+    "SinkRegistry",
+    "FileSink",
+    "StreamSink",
+    "SyslogSink",
+    "TCPSink",
+    "ShippingSink",
+    "SQLiteSink",
     # ------------------------------------------------
     # BACKWARD COMPATIBILITY EXPORTS
     # ------------------------------------------------
@@ -0,0 +1,197 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Message Coalescer
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Repeated-message coalescing for Ezpl logging handlers.
+
+This module provides a "last message repeated N times" coalescer used by
+ConsolePrinter and FileLogger to collapse consecutive identical records.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import contextlib
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+# Internal modules
+from ..core.exceptions import ValidationError
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class MessageCoalescer:
+    """
+    Collapse consecutive identical records into one line with a counter.
+
+    The first record of a run is emitted normally. Identical records that
+    follow are only counted. The run is flushed, as a single
+    "last message repeated N times" line, when a different record arrives
+    or when ``window`` seconds have elapsed since the first repeat.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, window: float, on_timeout: Callable[[Any, int], None]) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            window: Maximum time in seconds a run is held before being flushed
+            on_timeout: Callback receiving (payload, repeat_count) when a run
+                is flushed by the timer rather than by a new record
+
+        Raises:
+            ValidationError: If the window is not a positive number
+        """
+        try:
+            window = float(window)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(
+                f"Invalid coalesce window: {window}", "coalesce_window", str(window)
+            ) from e
+        if window <= 0:
+            raise ValidationError(
+                f"Coalesce window must be positive: {window}",
+                "coalesce_window",
+                str(window),
+            )
+
+        self._window = window
+        self._on_timeout = on_timeout
+        self._lock = threading.Lock()
+        self._last_key: Optional[Hashable] = None
+        self._last_payload: Any = None
+        self._count = 0
+        self._generation = 0
+        self._timer: Optional[threading.Timer] = None
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def window(self) -> float:
+        """Maximum time in seconds a run is held."""
+        return self._window
+
+    # ///////////////////////////////////////////////////////////////
+    # COALESCING METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def submit(
+        self, key: Hashable, payload: Any
+    ) -> tuple[bool, Optional[tuple[Any, int]]]:
+        """
+        Register a record and decide whether it must be emitted.
+
+        Args:
+            key: Identity of the record (records with equal keys coalesce)
+            payload: Data the handler needs to describe the run later
+
+        Returns:
+            (emit, flushed) where ``emit`` tells whether the record must be
+            written and ``flushed`` is (payload, repeat_count) of a previous
+            run to report before it, or None.
+        """
+        with self._lock:
+            if key == self._last_key:
+                self._count += 1
+                if self._count == 1:
+                    self._start_timer()
+                return False, None
+
+            flushed = self._take_run()
+            self._last_key = key
+            self._last_payload = payload
+            return True, flushed
+
+    def flush(self) -> Optional[tuple[Any, int]]:
+        """
+        Close the current run.
+
+        Returns:
+            (payload, repeat_count) if identical records were held, else None
+        """
+        with self._lock:
+            flushed = self._take_run()
+            self._last_key = None
+            self._last_payload = None
+            return flushed
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _take_run(self) -> Optional[tuple[Any, int]]:
+        """Reset the repeat counter and return the pending run (lock held)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._generation += 1
+        if not self._count:
+            return None
+        flushed = (self._last_payload, self._count)
+        self._count = 0
+        return flushed
+
+    def _start_timer(self) -> None:
+        """Schedule the timeout flush of the current run (lock held)."""
+        self._timer = threading.Timer(
+            self._window, self._timeout, args=(self._generation,)
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _timeout(self, generation: int) -> None:
+        """Flush the run if it is still the one the timer was started for."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._timer = None
+            flushed = self._take_run()
+            # Next identical record starts a fresh run and is displayed again
+            self._last_key = None
+            self._last_payload = None
+
+        if flushed is not None:
+            # Never let a summary failure escape the timer thread
+            with contextlib.suppress(Exception):
+                self._on_timeout(*flushed)
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __str__(self) -> str:
+        """String representation of the coalescer."""
+        return f"MessageCoalescer(window={self._window})"
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the coalescer."""
+        return f"MessageCoalescer(window={self._window}, pending={self._count})"
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def format_repeated(count: int) -> str:
+    """
+    Build the summary text for a coalesced run.
+
+    Args:
+        count: Number of repeats held after the first record
+
+    Returns:
+        Summary text, e.g. "last message repeated 3 times"
+    """
+    noun = "time" if count == 1 else "times"
+    return f"last message repeated {count} {noun}"
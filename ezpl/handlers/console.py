@@ -13,26 +13,64 @@ indentation management, and color support using Rich.
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
-from collections.abc import Generator
+import contextlib
+import sys
+import threading
+from collections.abc import Generator, Hashable
 from contextlib import contextmanager
-from typing import Any, Optional, Union
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
 
 # External libraries
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
 # Internal modules
 from ..core.exceptions import ValidationError
 from ..core.interfaces import IndentationManager, LoggingHandler
-from ..types import LogLevel, Pattern, get_pattern_color
+from ..core.metrics import METRICS
+from ..types import (
+    CUSTOM_PATTERNS,
+    LogLevel,
+    Pattern,
+    get_pattern_color,
+    get_pattern_registry_version,
+)
+from .coalesce import MessageCoalescer, format_repeated
+from .rate_limit import RateLimiter, format_suppressed
+from .render_queue import RenderQueue
 from .utils import safe_str_convert, sanitize_for_console
-from .wizard import RichWizard
+
+if TYPE_CHECKING:
+    from .wizard import RichWizard
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Source file of this module, skipped when resolving the caller's call site
+_MODULE_CODE_FILE = (lambda: None).__code__.co_filename
+
+# Render modes: 'rich' styles every line, 'plain' writes preformatted text,
+# 'auto' picks 'plain' when the console is not a terminal
+PRINTER_MODES = ("auto", "rich", "plain")
+
+# Pattern spellings cached per printer (unknown names all fall back to INFO)
+_MAX_CACHED_PATTERN_NAMES = 256
 
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class _PatternPrefix(NamedTuple):
+    """Precomputed "• PATTERN :: " segments of a resolved pattern."""
+
+    pattern: Union[Pattern, str]  # Pattern enum or custom pattern name
+    text: Text  # Styled segment, copied before appending to it
+    plain: str  # Unstyled segment for plain mode
+
+
 class ConsolePrinterWrapper:
     """
     Wrapper pour compatibilité avec l'API existante.
@@ -123,9 +161,15 @@ class ConsolePrinterWrapper:
         title: Optional[str] = None,
         indent: Optional[int] = None,
         highlight: bool = True,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_string: Optional[int] = None,
+        max_size: Optional[int] = None,
     ) -> None:
         """Display JSON data in a formatted and syntax-highlighted way."""
-        self._console_printer.print_json(data, title, indent, highlight)
+        self._console_printer.print_json(
+            data, title, indent, highlight, max_depth, max_items, max_string, max_size
+        )
 
     # ------------------------------------------------
     # WIZARD ACCESS
@@ -172,9 +216,10 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
 
     This handler provides console-based logging with:
     - Color-coded log levels using Rich
-    - Indentation management
+    - Indentation management, per thread and per asyncio task
     - Robust character handling (Rich handles special characters automatically)
     - Context manager support
+    - A plain-text fast path when the output is not a terminal
     """
 
     MAX_INDENT = 10  # Limite maximale d'indentation
@@ -189,6 +234,14 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         indent_step: int = 3,
         indent_symbol: str = ">",
         base_indent_symbol: str = "~",
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limit_key: str = "callsite",
+        coalesce_window: Optional[float] = None,
+        mode: str = "auto",
+        async_render: bool = False,
+        queue_size: int = 10000,
+        overflow: str = "drop_new",
     ) -> None:
         """
         Initialize the console printer handler.
@@ -198,29 +251,94 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
             indent_step: Number of spaces for each indentation level
             indent_symbol: Symbol for indentation levels
             base_indent_symbol: Symbol for the base indentation
+            rate_limit: Max messages per second per key (None disables rate limiting)
+            rate_limit_burst: Burst capacity of each rate limit bucket
+            rate_limit_key: Rate limit key, 'callsite' or 'message'
+            coalesce_window: Max seconds consecutive identical messages are
+                held before "last message repeated N times" (None disables)
+            mode: Render mode, 'rich', 'plain' (preformatted text written
+                straight to the stream) or 'auto' ('plain' when the console
+                is not a terminal)
+            async_render: Render and write on a background thread; calls
+                only queue the message
+            queue_size: Maximum number of messages waiting for the render
+                thread
+            overflow: Policy when the queue is full, 'block', 'drop_new' or
+                'drop_old' (drops are counted in the metrics)
 
         Raises:
-            ValidationError: If the provided level is invalid
+            ValidationError: If the provided level, rate limit, window, mode
+                or queue setting is invalid
         """
         if not LogLevel.is_valid_level(level):
             raise ValidationError(f"Invalid log level: {level}", "level", level)
+        if mode not in PRINTER_MODES:
+            raise ValidationError(f"Invalid printer mode: {mode}", "mode", mode)
 
         self._level = level.upper()
-        self._indent = 0
+        # Indentation level of each thread / asyncio task (new threads start
+        # at 0, tasks start at the level of the code that created them)
+        self._indent_var: ContextVar[int] = ContextVar(
+            f"ezpl_indent_{id(self):x}", default=0
+        )
         self._indent_step = indent_step
         self._indent_symbol = indent_symbol
         self._base_indent_symbol = base_indent_symbol
 
+        # Indent strings per level (up to MAX_INDENT) and prefix segments per
+        # pattern, rebuilt only when indent symbols or pattern colors change
+        self._indent_strings: list[str] = []
+        self._indent_segments: list[str] = []
+        self._build_indent_cache()
+        self._prefixes: dict[Union[Pattern, str], _PatternPrefix] = {}
+        self._prefixes_version = -1
+
+        # Render mode, resolved against the console on first use (and again
+        # whenever the console is replaced)
+        self._mode = mode
+        self._plain = False
+        self._mode_console: Optional[Console] = None
+
+        # Rate limiter (opt-in) to suppress log storms
+        self._rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(rate_limit, rate_limit_burst, rate_limit_key)
+            if rate_limit
+            else None
+        )
+
+        # Serializes console writes: coalescer summaries are written from
+        # its timer thread
+        self._write_lock = threading.Lock()
+
+        # Coalescer (opt-in) for consecutive identical messages
+        self._coalescer: Optional[MessageCoalescer] = (
+            MessageCoalescer(coalesce_window, self._print_repeated)
+            if coalesce_window
+            else None
+        )
+
+        # Latency histograms (shared by all console printers)
+        self._print_latency = METRICS.histogram("print_pattern", "console")
+        self._write_latency = METRICS.histogram("sink_write", "console")
+
         # Initialiser Rich Console
         self._console = Console()
         self._level_numeric = LogLevel.get_no(self._level)
 
-        # Initialiser Rich Wizard pour fonctionnalités avancées
-        self._wizard = RichWizard(self._console)
+        # Rich Wizard (panels, tables, JSON, progress), created on first use
+        self._wizard_instance: Optional[RichWizard] = None
 
         # Wrapper pour compatibilité API
         self._wrapper = ConsolePrinterWrapper(self)
 
+        # Background render thread (opt-in)
+        self._render_queue: Optional[RenderQueue] = None
+        if async_render:
+            self._render_queue = RenderQueue(
+                self._render_batch, queue_size, overflow, sink="console"
+            )
+            METRICS.register_gauge("console", self._render_queue.__len__)
+
     # ///////////////////////////////////////////////////////////////
     # GETTER
     # ///////////////////////////////////////////////////////////////
@@ -234,6 +352,26 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         """
         return self._wrapper
 
+    @property
+    def _wizard(self) -> "RichWizard":
+        """
+        Rich Wizard bound to this printer's console, created on first access.
+
+        Most services only log messages, so the wizard and the Rich modules
+        behind it (tables, panels, JSON, progress) are not imported or built
+        until a rich display method is used.
+        """
+        if self._wizard_instance is None:
+            from .wizard import RichWizard
+
+            self._wizard_instance = RichWizard(self._console)
+        return self._wizard_instance
+
+    @property
+    def mode(self) -> str:
+        """Effective render mode, 'rich' or 'plain'."""
+        return "plain" if self._is_plain() else "rich"
+
     # ///////////////////////////////////////////////////////////////
     # UTILS METHODS
     # ///////////////////////////////////////////////////////////////
@@ -365,51 +503,54 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         Display a message with pattern format: • PATTERN :: message
 
         Args:
-            pattern: Pattern name (string) or Pattern enum
+            pattern: Pattern enum, or pattern name (built-in or registered
+                with register_pattern(), unknown names display as INFO)
             message: Message to display
             level: Log level for filtering (default: INFO)
         """
         try:
-            # Convert pattern to Pattern enum if string
-            if isinstance(pattern, str):
-                try:
-                    pattern_enum = Pattern[pattern.upper()]
-                except KeyError:
-                    # If pattern not found, use INFO as default
-                    pattern_enum = Pattern.INFO
-            else:
-                pattern_enum = pattern
-
             # Check if level should be displayed
             level_numeric = LogLevel.get_no(level)
             if level_numeric < self._level_numeric:
                 return  # Level too low, don't display
 
-            # Convert message to string safely and sanitize for console
-            message = safe_str_convert(message)
-            message = sanitize_for_console(message)
+            start = perf_counter()
+            prefix = self._get_prefix(pattern)
+
+            # Rate limiting (decided before any formatting)
+            suppressed = 0
+            if self._rate_limiter is not None:
+                suppressed = self._rate_limiter.allow(
+                    self._rate_limit_key(prefix.pattern, level, message)
+                )
+                if suppressed is None:
+                    METRICS.inc("suppressed", "console")
+                    return  # Suppressed by rate limiter
 
-            # Get pattern color
-            pattern_color = get_pattern_color(pattern_enum)
-            pattern_name = pattern_enum.value
+            # Convert non-string messages now, they may change before rendering
+            if not isinstance(message, str):
+                message = safe_str_convert(message)
 
-            # Build text with pattern format: • PATTERN :: message
-            text = Text()
-            text.append("• ", style=pattern_color)
-            text.append(pattern_name.ljust(8), style=f"bold {pattern_color}")
-            text.append(":: ", style="dim white")
+            if self._render_queue is not None:
+                self._render_queue.submit(
+                    (prefix, level, message, self._indent, suppressed)
+                )
+                self._print_latency.observe(perf_counter() - start)
+                return
 
-            # Handle indentation - add it just before the message (after ":: ")
-            indent_str = self.get_indent()
-            if indent_str and indent_str != "~":
-                # Add indentation just before the message
-                text.append(indent_str, style="dim")
-                text.append(" ", style="dim")
+            plain = self._is_plain()
+            lines: list[Union[str, Text]] = []
+            self._render(prefix, level, message, self._indent, suppressed, plain, lines)
+            if not lines:
+                return
 
-            # Add the message
-            text.append(str(message), style="white")
+            write_start = perf_counter()
+            for line in lines:
+                self._write_lines([line], plain)
+            end = perf_counter()
 
-            self._console.print(text)
+            self._write_latency.observe(end - write_start)
+            self._print_latency.observe(end - start)
 
         except Exception as e:
             # Robust error handling: never raise exception
@@ -419,6 +560,304 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
             except Exception as e:
                 raise ValueError(f"Failed to print pattern: {e}") from e
 
+    # ------------------------------------------------
+    # RATE LIMITING
+    # ------------------------------------------------
+
+    def _rate_limit_key(
+        self, pattern: Union[Pattern, str], level: str, message: Any
+    ) -> Hashable:
+        """
+        Build the rate limit key for a message.
+
+        Args:
+            pattern: Resolved Pattern enum or custom pattern name
+            level: Log level of the message
+            message: Raw message
+
+        Returns:
+            (file, function, line) of the first caller outside this module
+            in 'callsite' mode, (pattern, level, message) in 'message' mode
+        """
+        if self._rate_limiter is not None and self._rate_limiter.key == "message":
+            if not isinstance(message, str):
+                message = safe_str_convert(message)
+            return (pattern, level, message)
+
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename == _MODULE_CODE_FILE:
+            frame = frame.f_back
+        if frame is None:
+            return (pattern, level)
+        return (frame.f_code.co_filename, frame.f_code.co_name, frame.f_lineno)
+
+    def flush_suppressed(self) -> None:
+        """
+        Display pending "suppressed N similar messages" summaries.
+
+        Storms that stop before another message is allowed for the same key
+        keep their count pending; this prints one summary line per such key.
+        """
+        if self._rate_limiter is None:
+            return
+
+        for key, count in self._rate_limiter.drain_suppressed():
+            if self._rate_limiter.key == "message":
+                origin = f"{key[1]}: {key[2][:60]}"
+            elif len(key) == 3:
+                origin = f"{Path(key[0]).stem}:{key[1]}:{key[2]}"
+            else:
+                origin = "unknown"
+            self._print_summary(Pattern.WARN, f"{format_suppressed(count)} ({origin})")
+
+    # ------------------------------------------------
+    # COALESCING
+    # ------------------------------------------------
+
+    def flush_repeated(self) -> None:
+        """Display the pending "last message repeated N times" line, if any."""
+        if self._coalescer is None:
+            return
+
+        flushed = self._coalescer.flush()
+        if flushed is not None:
+            self._print_repeated(*flushed)
+
+    def _print_repeated(self, pattern: Union[Pattern, str], count: int) -> None:
+        """
+        Display the summary of a coalesced run.
+
+        Args:
+            pattern: Pattern of the repeated message
+            count: Number of repeats after the first message
+        """
+        self._print_summary(pattern, format_repeated(count))
+
+    def _print_summary(self, pattern: Union[Pattern, str], summary: str) -> None:
+        """
+        Display a dimmed summary line with the pattern prefix.
+
+        Args:
+            pattern: Pattern used for the prefix
+            summary: Summary text
+        """
+        try:
+            prefix = self._get_prefix(pattern)
+            if self._render_queue is not None:
+                # A None level marks a summary line for the render thread
+                self._render_queue.submit((prefix, None, summary, 0, 0))
+                return
+            plain = self._is_plain()
+            self._write_lines([_summary_line(prefix, summary, plain)], plain)
+        except Exception as e:
+            raise ValueError(f"Failed to print summary: {e}") from e
+
+    # ------------------------------------------------
+    # PREFIX CACHE
+    # ------------------------------------------------
+
+    def _get_prefix(self, pattern: Union[Pattern, str]) -> _PatternPrefix:
+        """
+        Get the cached prefix segments of a pattern.
+
+        The cache is dropped whenever the pattern registry changes
+        (registration or color change).
+
+        Args:
+            pattern: Pattern enum or pattern name
+
+        Returns:
+            Prefix segments of the resolved pattern
+        """
+        version = get_pattern_registry_version()
+        if version != self._prefixes_version:
+            self._prefixes = {}
+            self._prefixes_version = version
+
+        prefix = self._prefixes.get(pattern)
+        if prefix is None:
+            prefix = _build_prefix(pattern)
+            if len(self._prefixes) < _MAX_CACHED_PATTERN_NAMES:
+                self._prefixes[pattern] = prefix
+        return prefix
+
+    # ------------------------------------------------
+    # RENDERING
+    # ------------------------------------------------
+
+    def _render(
+        self,
+        prefix: _PatternPrefix,
+        level: str,
+        message: str,
+        indent: int,
+        suppressed: int,
+        plain: bool,
+        lines: list[Union[str, Text]],
+    ) -> None:
+        """
+        Render a message, appending its line(s) to ``lines``.
+
+        Args:
+            prefix: Prefix segments of the resolved pattern
+            level: Log level of the message
+            message: Message converted to string
+            indent: Indentation level when the message was logged
+            suppressed: Messages suppressed since the last one for this key
+            plain: Render a plain string instead of a Rich Text
+            lines: Output list (nothing is appended for a coalesced repeat)
+        """
+        message = sanitize_for_console(message)
+
+        # Coalesce consecutive identical messages
+        if self._coalescer is not None:
+            emit, flushed = self._coalescer.submit(
+                (prefix.pattern, level, message), prefix.pattern
+            )
+            if flushed is not None:
+                lines.append(
+                    _summary_line(
+                        self._get_prefix(flushed[0]), format_repeated(flushed[1]), plain
+                    )
+                )
+            if not emit:
+                METRICS.inc("coalesced", "console")
+                return  # Counted, reported when the run is flushed
+
+        # Indentation goes just before the message (after ":: ")
+        indent_segment = self._indent_segments[indent]
+        note = f"  ({format_suppressed(suppressed)})" if suppressed else ""
+
+        if plain:
+            # Fast path: one preformatted string, no Rich rendering
+            line = f"{prefix.plain}{indent_segment}{message}{note}\n"
+            nbytes = len(line) if line.isascii() else len(line.encode())
+            lines.append(line)
+        else:
+            # Build text with pattern format: • PATTERN :: message
+            text = prefix.text.copy()
+            if indent_segment:
+                text.append(indent_segment, style="dim")
+            text.append(message, style="white")
+            if note:
+                text.append(note, style="dim")
+            rendered = text.plain
+            nbytes = (
+                len(rendered) if rendered.isascii() else len(rendered.encode())
+            ) + 1
+            lines.append(text)
+
+        METRICS.record("console", level.upper(), nbytes)
+
+    def _write_lines(self, lines: list[Union[str, Text]], plain: bool) -> None:
+        """
+        Write rendered lines with a single console write (under the
+        write lock, shared with the coalescer's timer thread).
+
+        Args:
+            lines: Plain strings (newline included) or Rich Texts
+            plain: Whether the lines are plain strings
+        """
+        with self._write_lock:
+            if plain:
+                self._write_plain("".join(lines))
+            elif len(lines) == 1:
+                self._console.print(lines[0])
+            else:
+                self._console.print(Text("\n").join(lines))
+
+    def _render_batch(self, items: list[tuple]) -> None:
+        """
+        Render queued messages and write them at once (render thread).
+
+        Args:
+            items: (prefix, level, message, indent, suppressed) tuples, a None
+                level marking a summary line
+        """
+        plain = self._is_plain()
+        lines: list[Union[str, Text]] = []
+        for prefix, level, message, indent, suppressed in items:
+            try:
+                if level is None:
+                    lines.append(_summary_line(prefix, message, plain))
+                else:
+                    self._render(
+                        prefix, level, message, indent, suppressed, plain, lines
+                    )
+            except Exception:
+                lines.append(_summary_line(prefix, "[render error]", plain))
+        if lines:
+            write_start = perf_counter()
+            self._write_lines(lines, plain)
+            self._write_latency.observe(perf_counter() - write_start)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until messages queued for the render thread are written.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if everything was written (always True in synchronous mode)
+        """
+        if self._render_queue is None:
+            return True
+        return self._render_queue.flush(timeout)
+
+    def close(self) -> None:
+        """
+        Write pending messages and stop the render thread, if any.
+
+        Pending coalescing and rate limit summaries are written first, and
+        the coalescing timer is cancelled.
+        """
+        # Summaries are best-effort, never block closing
+        with contextlib.suppress(Exception):
+            self.flush_repeated()
+            self.flush_suppressed()
+
+        if self._render_queue is None:
+            return
+        self._render_queue.close()
+        METRICS.unregister_gauge("console")
+        self._render_queue = None
+
+    # ------------------------------------------------
+    # PLAIN RENDERING
+    # ------------------------------------------------
+
+    def _is_plain(self) -> bool:
+        """
+        Tell whether lines are written in plain mode.
+
+        Returns:
+            True for 'plain', or for 'auto' when the console is not a terminal
+        """
+        console = self._console
+        if console is not self._mode_console:
+            self._mode_console = console
+            self._plain = self._mode == "plain" or (
+                self._mode == "auto" and not console.is_terminal
+            )
+        return self._plain
+
+    def _write_plain(self, line: str) -> None:
+        """
+        Write preformatted lines straight to the console stream.
+
+        Args:
+            line: Line(s) to write, final newline included
+        """
+        stream = self._console.file
+        try:
+            stream.write(line)
+        except UnicodeEncodeError:
+            # Let Rich pick replacement characters the stream can encode
+            self._console.print(Text(line[:-1]))
+            return
+        stream.flush()
+
     # ///////////////////////////////////////////////////////////////
     # INDENTATION MANAGEMENT
     # ///////////////////////////////////////////////////////////////
@@ -431,14 +870,41 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
             The current indentation string
         """
         try:
-            indent_spaces = " " * (self._indent * self._indent_step)
-            if self._indent > 0:
-                return f"{indent_spaces}{self._indent_symbol}"
-            else:
-                return self._base_indent_symbol
+            return self._indent_strings[self._indent]
         except Exception:
             return "~"  # Fallback sécurisé
 
+    def set_indent_style(
+        self,
+        indent_step: Optional[int] = None,
+        indent_symbol: Optional[str] = None,
+        base_indent_symbol: Optional[str] = None,
+    ) -> None:
+        """
+        Change the indentation step or symbols.
+
+        Args:
+            indent_step: Number of spaces for each indentation level
+            indent_symbol: Symbol for indentation levels
+            base_indent_symbol: Symbol for the base indentation
+        """
+        if indent_step is not None:
+            self._indent_step = indent_step
+        if indent_symbol is not None:
+            self._indent_symbol = indent_symbol
+        if base_indent_symbol is not None:
+            self._base_indent_symbol = base_indent_symbol
+        self._build_indent_cache()
+
+    @property
+    def _indent(self) -> int:
+        """Indentation level of the current thread or asyncio task."""
+        return self._indent_var.get()
+
+    @_indent.setter
+    def _indent(self, level: int) -> None:
+        self._indent_var.set(level)
+
     def add_indent(self) -> None:
         """Increase the indentation level by one (with maximum limit)."""
         self._indent = min(self._indent + 1, self.MAX_INDENT)
@@ -456,14 +922,33 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         """
         Context manager for temporary indentation.
 
+        Only the current thread or asyncio task is indented, so concurrent
+        workers never see each other's indentation.
+
         Yields:
             None
         """
+        token = self._indent_var.set(min(self._indent + 1, self.MAX_INDENT))
         try:
-            self.add_indent()
             yield
         finally:
-            self.del_indent()
+            try:
+                self._indent_var.reset(token)
+            except ValueError:
+                # Exited in another context than it was entered in
+                self.del_indent()
+
+    def _build_indent_cache(self) -> None:
+        """Precompute the indent string and message segment of every level."""
+        self._indent_strings = [self._base_indent_symbol] + [
+            f"{' ' * (level * self._indent_step)}{self._indent_symbol}"
+            for level in range(1, self.MAX_INDENT + 1)
+        ]
+        # The "~" base symbol means "no indentation" in displayed lines
+        self._indent_segments = [
+            f"{indent} " if indent and indent != "~" else ""
+            for indent in self._indent_strings
+        ]
 
     # ///////////////////////////////////////////////////////////////
     # ENHANCED METHODS (Rich features)
@@ -501,6 +986,8 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         Note: This is a placeholder. For full progress functionality,
         users should use Rich's Progress context manager directly.
         """
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         try:
             with Progress(
                 SpinnerColumn(),
@@ -522,22 +1009,43 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
         title: Optional[str] = None,
         indent: Optional[int] = None,
         highlight: bool = True,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_string: Optional[int] = None,
+        max_size: Optional[int] = None,
     ) -> None:
         """
         Display JSON data in a formatted and syntax-highlighted way using Rich (delegates to RichWizard).
 
+        Large payloads are written without highlighting (see RichWizard.json).
+
         Args:
             data: JSON data to display (dict, list, or JSON string)
             title: Optional title for the JSON display
             indent: Number of spaces for indentation (default: 2)
             highlight: Whether to enable syntax highlighting (default: True)
+            max_depth: Nesting depth below which containers are elided
+            max_items: Maximum items shown per list or dict
+            max_string: Maximum characters shown per string
+            max_size: Largest payload highlighted and pretty-printed
+                (default: RichWizard's threshold)
 
         Examples:
             >>> printer.print_json({"name": "Alice", "age": 30})
             >>> printer.print_json('{"key": "value"}', title="Config")
             >>> printer.print_json([1, 2, 3], indent=4)
+            >>> printer.print_json(events, max_items=20)
         """
-        self._wizard.json(data, title=title, indent=indent, highlight=highlight)
+        self._wizard.json(
+            data,
+            title=title,
+            indent=indent,
+            highlight=highlight,
+            max_depth=max_depth,
+            max_items=max_items,
+            max_string=max_string,
+            max_size=max_size,
+        )
 
     # ///////////////////////////////////////////////////////////////
     # REPRESENTATION METHODS
@@ -550,3 +1058,59 @@ class ConsolePrinter(LoggingHandler, IndentationManager):
     def __repr__(self) -> str:
         """Detailed string representation of the console printer."""
         return f"ConsolePrinter(level={self._level}, indent={self._indent}, indent_step={self._indent_step})"
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _build_prefix(pattern: Union[Pattern, str]) -> _PatternPrefix:
+    """
+    Resolve a pattern and build its "• PATTERN :: " segments.
+
+    Args:
+        pattern: Pattern enum or pattern name (unknown names resolve to INFO)
+
+    Returns:
+        Prefix segments of the resolved pattern
+    """
+    resolved: Union[Pattern, str]
+    if isinstance(pattern, Pattern):
+        resolved = pattern
+    else:
+        name = str(pattern).upper()
+        if name in Pattern.__members__:
+            resolved = Pattern[name]
+        elif name in CUSTOM_PATTERNS:
+            resolved = name
+        else:
+            resolved = Pattern.INFO
+
+    name = resolved.value if isinstance(resolved, Pattern) else resolved
+    color = get_pattern_color(resolved)
+    text = Text()
+    text.append("• ", style=color)
+    text.append(name.ljust(8), style=f"bold {color}")
+    text.append(":: ", style="dim white")
+    return _PatternPrefix(resolved, text, f"• {name.ljust(8)}:: ")
+
+
+def _summary_line(
+    prefix: _PatternPrefix, summary: str, plain: bool
+) -> Union[str, Text]:
+    """
+    Build a dimmed summary line with the pattern prefix.
+
+    Args:
+        prefix: Prefix segments of the pattern
+        summary: Summary text
+        plain: Build a plain string (newline included) instead of a Rich Text
+
+    Returns:
+        The summary line
+    """
+    if plain:
+        return f"{prefix.plain}{summary}\n"
+    text = prefix.text.copy()
+    text.append(summary, style="dim")
+    return text
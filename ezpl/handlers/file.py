@@ -7,15 +7,20 @@
 File logger handler for Ezpl logging framework.
 
 This module provides a file-based logging handler with advanced formatting,
-session separation, and structured output.
+session separation, and structured output. In multi-process mode, worker
+file loggers ship formatted lines to the writer process instead of opening
+the file themselves.
 """
 
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
+import contextlib
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Optional
 
 # External libraries
 from loguru import logger
@@ -24,8 +29,20 @@ from loguru._logger import Logger
 # Internal modules
 from ..core.exceptions import FileOperationError, LoggingError, ValidationError
 from ..core.interfaces import LoggingHandler
+from ..core.metrics import METRICS
 from ..types import LogLevel
-from .utils import safe_str_convert, sanitize_for_file
+from .coalesce import MessageCoalescer, format_repeated
+from .multiprocess import encode_frame
+from .rate_limit import RateLimiter, format_suppressed
+from .utils import (
+    format_error_line,
+    format_log_line,
+    safe_str_convert,
+    sanitize_for_file,
+)
+
+if TYPE_CHECKING:
+    from .multiprocess import SocketTransport
 
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -40,8 +57,20 @@ class FileLogger(LoggingHandler):
     - Session separators
     - HTML tag sanitization
     - Automatic file creation
+    - Optional per-call-site rate limiting
+    - Optional shipping of records to a writer process
     """
 
+    # Extra key holding the formatted line and the matching loguru template
+    FORMATTED_KEY = "_ezpl_formatted"
+    _FORMAT_TEMPLATE = "{extra[" + FORMATTED_KEY + "]}"
+
+    # Extra key holding a line formatted by a worker process
+    REMOTE_KEY = "ezpl_remote"
+
+    # Loguru level names by number, for records received from workers
+    _LEVEL_NAMES = {level.no: level.name for level in LogLevel}
+
     # ///////////////////////////////////////////////////////////////
     # INIT
     # ///////////////////////////////////////////////////////////////
@@ -53,6 +82,12 @@ class FileLogger(LoggingHandler):
         rotation: Optional[str] = None,
         retention: Optional[str] = None,
         compression: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limit_key: str = "callsite",
+        coalesce_window: Optional[float] = None,
+        enqueue: bool = False,
+        transport: Optional["SocketTransport"] = None,
     ) -> None:
         """
         Initialize the file logger handler.
@@ -63,9 +98,18 @@ class FileLogger(LoggingHandler):
             rotation: Rotation size (e.g., "10 MB") or time (e.g., "1 day")
             retention: Retention period (e.g., "7 days")
             compression: Compression format (e.g., "zip", "gz")
+            rate_limit: Max records per second per key (None disables rate limiting)
+            rate_limit_burst: Burst capacity of each rate limit bucket
+            rate_limit_key: Rate limit key, 'callsite' or 'message'
+            coalesce_window: Max seconds consecutive identical records are
+                held before "last message repeated N times" (None disables)
+            enqueue: Write records from a background thread (loguru enqueue)
+                instead of the calling thread
+            transport: Ship formatted records to a writer process instead of
+                writing the file (multi-process worker mode)
 
         Raises:
-            ValidationError: If the provided level is invalid
+            ValidationError: If the provided level, rate limit or window is invalid
             FileOperationError: If file operations fail
         """
         if not LogLevel.is_valid_level(level):
@@ -78,6 +122,35 @@ class FileLogger(LoggingHandler):
         self._rotation = rotation
         self._retention = retention
         self._compression = compression
+        self._enqueue = enqueue
+        self._transport = transport
+
+        # Rate limiter (opt-in) to suppress log storms
+        self._rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(rate_limit, rate_limit_burst, rate_limit_key)
+            if rate_limit
+            else None
+        )
+
+        # Coalescer (opt-in) for consecutive identical records
+        self._coalescer: Optional[MessageCoalescer] = (
+            MessageCoalescer(coalesce_window, self._write_repeated)
+            if coalesce_window
+            else None
+        )
+
+        # Latency histograms (shared by all file loggers)
+        self._format_latency = METRICS.histogram("format_message", "file")
+        self._write_latency = METRICS.histogram("sink_write", "file")
+
+        # Records formatted but not written yet by loguru's background thread
+        self._queued = 0
+        self._queued_lock = threading.Lock()
+
+        # Le processus writer possède le fichier, pas les workers
+        if self._transport is not None:
+            self._initialize_logger()
+            return
 
         # Valider et créer le répertoire parent
         try:
@@ -118,13 +191,25 @@ class FileLogger(LoggingHandler):
             if self._logger_id is not None:
                 self._logger.remove(self._logger_id)
 
+            if self._transport is not None:
+                self._logger_id = self._logger.add(
+                    self._ship_record,
+                    level=self._level,
+                    format=self._custom_formatter,
+                    filter=self._filter_record,
+                    enqueue=self._enqueue,
+                )
+                self._register_queue_gauge()
+                return
+
             # Préparer les paramètres pour loguru.add()
             add_kwargs = {
                 "sink": self._log_file,
                 "level": self._level,
                 "format": self._custom_formatter,
-                "filter": lambda record: record["extra"]["task"] == "logger",
+                "filter": self._filter_record,
                 "encoding": "utf-8",
+                "enqueue": self._enqueue,
             }
 
             # Ajouter rotation si spécifiée
@@ -140,9 +225,118 @@ class FileLogger(LoggingHandler):
                 add_kwargs["compression"] = self._compression
 
             self._logger_id = self._logger.add(**add_kwargs)
+            self._instrument_sink()
+            self._register_queue_gauge()
         except Exception as e:
             raise LoggingError(f"Failed to initialize file logger: {e}", "file") from e
 
+    def _instrument_sink(self) -> None:
+        """
+        Measure write latency and bytes written by the loguru file sink.
+
+        Loguru does not expose its file sink, so the write method is wrapped
+        through the handler registry. Metrics are best-effort: if loguru's
+        internals change, the sink is left untouched.
+        """
+        try:
+            sink = self._logger._core.handlers[self._logger_id]._sink
+            write = sink.write
+        except Exception:
+            return
+
+        histogram = self._write_latency
+        dequeue = self._dequeue if self._enqueue else None
+
+        def timed_write(message: str) -> None:
+            start = perf_counter()
+            write(message)
+            histogram.observe(perf_counter() - start)
+            nbytes = len(message) if message.isascii() else len(message.encode())
+            METRICS.inc("bytes_written", "file", nbytes)
+            if dequeue is not None:
+                dequeue()
+
+        sink.write = timed_write
+
+    def _register_queue_gauge(self) -> None:
+        """Export the depth of loguru's background queue as the 'file' gauge."""
+        if self._enqueue:
+            METRICS.register_gauge("file", lambda: self._queued)
+
+    def _dequeue(self) -> None:
+        """Count a record written by loguru's background thread."""
+        with self._queued_lock:
+            self._queued -= 1
+
+    def _ship_record(self, message: Any) -> None:
+        """
+        Loguru sink of worker loggers: send the formatted line to the writer.
+
+        Args:
+            message: Loguru message (its record holds the formatted line)
+        """
+        record = message.record
+        frame = encode_frame(record["level"].no, record["extra"][self.FORMATTED_KEY])
+        start = perf_counter()
+        self._transport.send(frame)
+        self._write_latency.observe(perf_counter() - start)
+        if self._enqueue:
+            self._dequeue()
+
+    def _filter_record(self, record: dict[str, Any]) -> bool:
+        """
+        Loguru filter: keep records bound to this logger, apply rate limiting
+        and coalesce consecutive identical records.
+
+        Runs before any formatting, so suppressed records cost a dict lookup.
+
+        Args:
+            record: Loguru record
+
+        Returns:
+            True if the record must be written
+        """
+        extra = record["extra"]
+        if extra.get("task") != "logger":
+            return False
+        if self.REMOTE_KEY in extra:
+            return self._transport is None  # Never ship a worker's line back
+        if "ezpl_summary" in extra:
+            return True
+
+        if self._rate_limiter is not None:
+            if self._rate_limiter.key == "message":
+                key = (record["level"].no, record["message"])
+            else:
+                key = (record["name"], record["function"], record["line"])
+
+            suppressed = self._rate_limiter.allow(key)
+            if suppressed is None:
+                METRICS.inc("suppressed", "file")
+                return False
+            if suppressed:
+                extra["ezpl_suppressed"] = suppressed
+
+        if self._coalescer is not None:
+            level = record["level"]
+            emit, flushed = self._coalescer.submit(
+                (
+                    record["name"],
+                    record["function"],
+                    record["line"],
+                    level.no,
+                    record["message"],
+                ),
+                (level.name, record["module"], record["function"], record["line"]),
+            )
+            if flushed is not None:
+                extra["ezpl_repeated"] = flushed
+            if not emit:
+                METRICS.inc("coalesced", "file")
+            return emit
+
+        return True
+
     # ///////////////////////////////////////////////////////////////
     # UTILS METHODS
     # ///////////////////////////////////////////////////////////////
@@ -186,8 +380,8 @@ class FileLogger(LoggingHandler):
         message = safe_str_convert(message)
 
         try:
-            log_method = getattr(self._logger, level.lower())
-            log_method(message)
+            # depth=1: attribute the record to the caller, not to this method
+            self._logger.opt(depth=1).log(level.upper(), message)
         except Exception as e:
             raise LoggingError(f"Failed to log message: {e}", "file") from e
 
@@ -195,6 +389,20 @@ class FileLogger(LoggingHandler):
     # GETTER
     # ///////////////////////////////////////////////////////////////
 
+    def write_remote(self, level_no: int, line: str) -> None:
+        """
+        Write a line formatted by a worker process (writer mode).
+
+        The line goes through this logger's file sink, so rotation,
+        retention and compression apply to every process's records.
+
+        Args:
+            level_no: Numeric log level of the record
+            line: Formatted log line
+        """
+        level = self._LEVEL_NAMES.get(level_no, level_no)
+        self._logger.bind(**{self.REMOTE_KEY: line}).log(level, "")
+
     def get_logger(self) -> Logger:
         """
         Get the underlying Loguru logger instance.
@@ -218,6 +426,16 @@ class FileLogger(LoggingHandler):
         """
         return self._log_file
 
+    @property
+    def is_worker(self) -> bool:
+        """True if records are shipped to a writer process."""
+        return self._transport is not None
+
+    @property
+    def queued(self) -> int:
+        """Records waiting for loguru's background thread (enqueue only)."""
+        return self._queued
+
     def get_file_size(self) -> int:
         """
         Get the current log file size in bytes.
@@ -232,18 +450,67 @@ class FileLogger(LoggingHandler):
         except Exception:
             return 0
 
+    def flush_suppressed(self) -> None:
+        """
+        Write pending "suppressed N similar messages" summaries.
+
+        Storms that stop before another record is allowed for the same key
+        keep their count pending; this writes one summary record per key.
+        """
+        if self._rate_limiter is None or self._logger_id is None:
+            return
+
+        summary_logger = self._logger.bind(ezpl_summary=True)
+        for key, count in self._rate_limiter.drain_suppressed():
+            if self._rate_limiter.key == "message":
+                origin = str(key[1])[:60]
+            else:
+                origin = ":".join(str(part) for part in key)
+            summary_logger.warning(f"{format_suppressed(count)} ({origin})")
+
+    def flush_repeated(self) -> None:
+        """Write the pending "last message repeated N times" record, if any."""
+        if self._coalescer is None or self._logger_id is None:
+            return
+
+        flushed = self._coalescer.flush()
+        if flushed is not None:
+            self._write_repeated(*flushed)
+
+    def _write_repeated(self, origin: tuple, count: int) -> None:
+        """
+        Write the summary record of a coalesced run.
+
+        Args:
+            origin: (level name, module, function, line) of the repeated record
+            count: Number of repeats after the first record
+        """
+        if self._logger_id is None:
+            return
+        self._logger.bind(ezpl_summary=True, ezpl_origin=origin).log(
+            origin[0], format_repeated(count)
+        )
+
     def close(self) -> None:
         """
         Close the logger handler and release file handles.
 
         This method removes the loguru handler to release file handles,
         which is especially important on Windows where files can remain locked.
+        Pending coalescing and rate limit summaries are written first.
         """
+        # Summaries are best-effort, never block closing
+        with contextlib.suppress(Exception):
+            self.flush_repeated()
+            self.flush_suppressed()
+
         try:
             if self._logger_id is not None:
-                # Remove the specific handler
+                # Remove the specific handler (waits for queued records)
                 self._logger.remove(self._logger_id)
                 self._logger_id = None
+                if self._enqueue:
+                    METRICS.unregister_gauge("file")
 
                 # Force flush and close on Windows
                 import sys
@@ -258,6 +525,9 @@ class FileLogger(LoggingHandler):
                     time.sleep(0.1)
         except Exception as e:
             raise LoggingError("Failed to close logger", "file") from e
+        finally:
+            if self._transport is not None:
+                self._transport.close()
 
     # ///////////////////////////////////////////////////////////////
     # FILE OPERATIONS
@@ -267,9 +537,14 @@ class FileLogger(LoggingHandler):
         """
         Add a separator line to the log file for session distinction.
 
+        Worker loggers leave separators to the writer process, which owns
+        the file.
+
         Raises:
             FileOperationError: If writing to the log file fails
         """
+        if self._transport is not None:
+            return
         try:
             current_time = datetime.now().strftime("%Y-%m-%d - %H:%M")
             separator = f"\n\n## ==> {current_time}\n## /////////////////////////////////////////////////////////////////\n"
@@ -293,9 +568,26 @@ class FileLogger(LoggingHandler):
         Args:
             record: Loguru record to format
 
+        The formatted line is stored in the record's extra dict and a constant
+        template referencing it is returned. Loguru treats the formatter's
+        return value as a format template, so returning the line itself would
+        break on braces or angle brackets in messages and re-parse a new
+        template for every distinct message.
+
         Returns:
-            Formatted log message (toujours retourne une string, ne lève jamais d'exception)
+            Format template (toujours retourne une string, ne lève jamais d'exception)
         """
+        if self._enqueue:
+            # Runs in the calling thread, just before loguru queues the record
+            with self._queued_lock:
+                self._queued += 1
+
+        remote = record["extra"].get(self.REMOTE_KEY)
+        if remote is not None:
+            METRICS.inc("records", "file", level=record["level"].name)
+            record["extra"][self.FORMATTED_KEY] = remote
+            return self._FORMAT_TEMPLATE
+
         try:
             level = (
                 record.get("level", {}).name
@@ -303,13 +595,22 @@ class FileLogger(LoggingHandler):
                 else "INFO"
             )
             log_level = LogLevel[level]
-            return self._format_message(record, log_level)
+            start = perf_counter()
+            formatted = self._format_message(record, log_level)
+            self._format_latency.observe(perf_counter() - start)
+            METRICS.inc("records", "file", level=level)
         except Exception as e:
             # Ne jamais lever d'exception dans un formatter - retourner un message d'erreur sécurisé
             try:
-                return f"????-??-?? ??:??:?? | FORMAT_ERR | unknown:unknown:? - [FORMAT ERROR: {type(e).__name__}]\n"
+                formatted = format_error_line(e)
             except Exception:
-                return "????-??-?? ??:??:?? | FORMAT_ERR | unknown:unknown:? - [FORMAT ERROR]\n"
+                formatted = format_error_line()
+
+        try:
+            record["extra"][self.FORMATTED_KEY] = formatted
+            return self._FORMAT_TEMPLATE
+        except Exception:
+            return format_error_line()
 
     def _format_message(self, record: dict[str, Any], log_level: LogLevel) -> str:
         """
@@ -338,26 +639,49 @@ class FileLogger(LoggingHandler):
             # Sanitizer pour fichier (supprime caractères problématiques)
             message = sanitize_for_file(message)
 
-            # Nettoyer le nom de fonction
-            fn = str(record.get("function", "unknown"))
-            fn = fn.replace("<", "").replace(">", "")
+            extra = record.get("extra", {})
+
+            # Résumé du coalescer : attribuer la ligne au message répété
+            origin = extra.get("ezpl_origin")
+            if origin:
+                _, module, fn, line = origin
+            else:
+                module = record.get("module", "unknown")
+                fn = record.get("function", "unknown")
+                line = record.get("line", "?")
 
-            # Sécuriser module et line
-            module = str(record.get("module", "unknown"))
-            line = str(record.get("line", "?"))
+            # Résumé du rate limiter
+            suppressed = extra.get("ezpl_suppressed")
+            if suppressed:
+                message = f"{message} ({format_suppressed(suppressed)})"
 
-            return (
-                f"{timestamp} | "
-                f"{log_level.label:<10} | "
-                f"{module}:{fn}:{line} - "
-                f"{message}\n"
+            formatted = format_log_line(
+                timestamp, log_level.name, module, fn, line, message
             )
+
+            # Run précédent interrompu par ce message : écrire son résumé avant
+            repeated = extra.get("ezpl_repeated")
+            if repeated:
+                (level_name, r_module, r_fn, r_line), count = repeated
+                formatted = (
+                    format_log_line(
+                        timestamp,
+                        level_name,
+                        r_module,
+                        r_fn,
+                        r_line,
+                        format_repeated(count),
+                    )
+                    + formatted
+                )
+
+            return formatted
         except Exception as e:
             # Fallback sécurisé
             try:
-                return f"????-??-?? ??:??:?? | FORMAT_ERR | unknown:unknown:? - [FORMAT ERROR: {type(e).__name__}]\n"
+                return format_error_line(e)
             except Exception:
-                return "????-??-?? ??:??:?? | FORMAT_ERR | unknown:unknown:? - [FORMAT ERROR]\n"
+                return format_error_line()
 
     # ///////////////////////////////////////////////////////////////
     # REPRESENTATION METHODS
@@ -0,0 +1,826 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Multi-process Logging
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Multi-process logging for Ezpl.
+
+One process, the writer, owns the file sinks (rotation, retention and
+compression included). Worker processes format their records locally and
+ship each formatted line as a compact byte frame over a local socket
+(a Unix domain socket, or a named pipe on Windows). The writer exports the
+socket address and its auth key through environment variables, so workers
+forked or spawned from it attach automatically.
+
+With the shared-memory transport, each worker instead writes its frames
+into its own single-producer ring in a shared memory segment, announced
+once over the socket, and a collector thread in the writer drains every
+ring. Sending a record then costs no pickling and no system call.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import atexit
+import contextlib
+import os
+import platform
+import struct
+import sys
+import threading
+import time
+import warnings
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Optional
+
+# Internal modules
+from ..core.exceptions import ValidationError
+from ..core.metrics import METRICS
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.shared_memory import SharedMemory
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Environment handle inherited by worker processes
+WRITER_ENV = "EZPL_LOG_WRITER"
+WRITER_KEY_ENV = "EZPL_LOG_WRITER_KEY"
+
+# Seconds a worker waits before reconnecting to a writer that went away
+RECONNECT_DELAY = 1.0
+
+# Level byte of the frame announcing a worker's shared-memory ring (no log
+# level uses 0); the rest of the frame is the segment name
+RING_ATTACH = 0
+
+# Default size in bytes of a worker's shared-memory ring
+DEFAULT_RING_SIZE = 1048576
+
+# Seconds the writer's collector sleeps when every ring is empty
+COLLECT_INTERVAL = 0.005
+
+# Machines whose store ordering the shared-memory ring relies on
+_SHM_MACHINES = frozenset({"x86_64", "amd64", "i386", "i686", "x86"})
+
+# Ring layout: head and tail byte counters, then the data area
+_RING_HEADER_SIZE = 64
+_FRAME_LENGTH = struct.Struct("<I")
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def encode_frame(level_no: int, line: str) -> bytes:
+    """
+    Encode a formatted record as a byte frame.
+
+    A frame is the level number on one byte followed by the UTF-8 line.
+
+    Args:
+        level_no: Numeric log level (0-255)
+        line: Formatted log line
+
+    Returns:
+        Encoded frame
+    """
+    return bytes((level_no & 0xFF,)) + line.encode("utf-8", "replace")
+
+
+def decode_frame(frame: bytes) -> tuple[int, str]:
+    """
+    Decode a byte frame produced by encode_frame().
+
+    Args:
+        frame: Encoded frame
+
+    Returns:
+        (level number, formatted line)
+    """
+    return frame[0], frame[1:].decode("utf-8", "replace")
+
+
+def shared_memory_supported() -> bool:
+    """
+    Tell whether the shared-memory ring is safe on this interpreter.
+
+    The ring publishes its counters without memory barriers (see
+    SharedMemoryRing), which needs x86/x86-64 store ordering and the GIL.
+
+    Returns:
+        True on x86/x86-64 with the GIL enabled
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is not None and not is_gil_enabled():
+        return False
+    return platform.machine().lower() in _SHM_MACHINES
+
+
+def transport_from_environment(
+    kind: str = "socket", ring_size: int = DEFAULT_RING_SIZE
+) -> Optional["SocketTransport"]:
+    """
+    Build the configured transport from the inherited environment handle.
+
+    Where shared_memory_supported() is False, 'shm' falls back to the
+    socket transport with a RuntimeWarning.
+
+    Args:
+        kind: 'socket' or 'shm'
+        ring_size: Bytes per shared-memory ring (shm only)
+
+    Returns:
+        Transport, or None if no writer is advertised
+
+    Raises:
+        ValidationError: If the transport kind or the auth key is invalid
+    """
+    if kind == "shm" and not shared_memory_supported():
+        warnings.warn(
+            "The shm log transport needs x86/x86-64 with the GIL; "
+            "using the socket transport instead",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        kind = "socket"
+    if kind == "socket":
+        return SocketTransport.from_environment()
+    if kind == "shm":
+        return SharedMemoryTransport.from_environment(ring_size=ring_size)
+    raise ValidationError(
+        f"Unknown log transport '{kind}' (expected 'socket' or 'shm')",
+        "log-transport",
+        kind,
+    )
+
+
+def _open_segment(name: Optional[str] = None, size: int = 0) -> "SharedMemory":
+    """
+    Create (name is None) or attach to a shared memory segment.
+
+    Segments are left out of the resource tracker: the writer unlinks each
+    segment as soon as it has mapped it, and the memory is freed once both
+    processes have unmapped it, whichever exits first.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    create = name is None
+    try:
+        return SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        # Python < 3.13 tracks every mapping: keep only the writer's
+        # registration, which its unlink() releases
+        segment = SharedMemory(name, create=create, size=size)
+        if create and os.name == "posix":
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(f"/{segment.name}", "shared_memory")
+        return segment
+
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class SharedMemoryRing:
+    """
+    Single-producer, single-consumer byte ring in shared memory.
+
+    The header holds two ever-growing byte counters: the head, only written
+    by the producer once a frame is complete, and the tail, only written by
+    the consumer once frames are read. Both are aligned 8-byte words, so no
+    lock is shared between the processes. Each frame is stored as a 4-byte
+    length followed by its bytes, wrapping around the data area.
+
+    The counters are published through a memoryview, with no explicit
+    memory barrier. This relies on the interpreter (GIL) and on the
+    strong store ordering of x86/x86-64: on weakly ordered CPUs (e.g.,
+    ARM) or free-threaded builds, the consumer could see a head before
+    the frame bytes it covers, so transport_from_environment() falls back
+    to the socket transport there (see shared_memory_supported()).
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, segment: "SharedMemory") -> None:
+        """
+        Wrap a shared memory segment.
+
+        Args:
+            segment: Segment holding the ring
+        """
+        self._segment = segment
+        self._counters = segment.buf[:16].cast("Q")
+        self._data = segment.buf[_RING_HEADER_SIZE:]
+        self._capacity = len(self._data)
+
+    @classmethod
+    def create(cls, size: int) -> "SharedMemoryRing":
+        """
+        Create an empty ring (producer side).
+
+        Args:
+            size: Segment size in bytes, header included
+
+        Returns:
+            New ring
+        """
+        import mmap
+
+        # Whole pages, so both processes see the same data area size
+        pages = -(-max(size, _RING_HEADER_SIZE + 1) // mmap.PAGESIZE)
+        return cls(_open_segment(size=pages * mmap.PAGESIZE))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        """
+        Attach to a worker's ring (consumer side) and unlink its name.
+
+        Args:
+            name: Segment name (see name)
+
+        Returns:
+            Attached ring
+        """
+        ring = cls(_open_segment(name))
+        with contextlib.suppress(FileNotFoundError):
+            ring._segment.unlink()
+        return ring
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def name(self) -> str:
+        """Segment name."""
+        return self._segment.name
+
+    @property
+    def capacity(self) -> int:
+        """Size of the data area in bytes."""
+        return self._capacity
+
+    @property
+    def pending(self) -> int:
+        """Bytes written and not read yet."""
+        counters = self._counters
+        return counters[0] - counters[1]
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def write(self, frame: bytes) -> bool:
+        """
+        Append a frame (producer only).
+
+        Args:
+            frame: Frame bytes
+
+        Returns:
+            False if the ring lacks room for the frame
+        """
+        counters = self._counters
+        head = counters[0]
+        size = _FRAME_LENGTH.size + len(frame)
+        if size > self._capacity - (head - counters[1]):
+            return False
+        self._put(head, _FRAME_LENGTH.pack(len(frame)) + frame)
+        counters[0] = head + size  # Publish the frame
+        return True
+
+    def read(self) -> list[bytes]:
+        """
+        Take every complete frame (consumer only).
+
+        Returns:
+            Frames in write order
+        """
+        counters = self._counters
+        tail = counters[1]
+        head = counters[0]
+        if head == tail:
+            return []
+        chunk = self._get(tail, head - tail)
+        frames = []
+        offset = 0
+        while offset < len(chunk):
+            (length,) = _FRAME_LENGTH.unpack_from(chunk, offset)
+            offset += _FRAME_LENGTH.size
+            frames.append(chunk[offset : offset + length])
+            offset += length
+        counters[1] = head  # Release the space
+        return frames
+
+    def close(self) -> None:
+        """Unmap the ring in this process."""
+        self._counters.release()
+        self._data.release()
+        self._segment.close()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _put(self, position: int, payload: bytes) -> None:
+        """Copy bytes into the data area at a counter position."""
+        start = position % self._capacity
+        end = start + len(payload)
+        if end <= self._capacity:
+            self._data[start:end] = payload
+        else:
+            split = self._capacity - start
+            self._data[start:] = payload[:split]
+            self._data[: end - self._capacity] = payload[split:]
+
+    def _get(self, position: int, size: int) -> bytes:
+        """Copy bytes out of the data area from a counter position."""
+        start = position % self._capacity
+        end = start + size
+        if end <= self._capacity:
+            return bytes(self._data[start:end])
+        return bytes(self._data[start:]) + bytes(self._data[: end - self._capacity])
+
+
+class LogWriterServer:
+    """
+    Receiving end of multi-process logging, run by the writer process.
+
+    A daemon thread accepts worker connections and one daemon thread per
+    worker reads its frames and hands them to ``on_frame``. Workers using
+    the shared-memory transport only announce their ring over the socket;
+    a collector thread, started with the first ring, drains the rings and
+    hands their frames to ``on_frame`` as well.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        on_frame: Callable[[int, str], None],
+        address: Optional[str] = None,
+    ) -> None:
+        """
+        Start listening for workers.
+
+        Args:
+            on_frame: Callback receiving (level number, formatted line)
+            address: Socket path or pipe name (default: a new temporary one)
+        """
+        from multiprocessing.connection import Listener
+
+        self._on_frame = on_frame
+        self._authkey = os.urandom(32)
+        self._listener = Listener(address, authkey=self._authkey)
+        self._connections: list[Connection] = []
+        self._lock = threading.Lock()
+        self._received = 0
+        self._closed = False
+        self._rings: dict[Connection, SharedMemoryRing] = {}
+        self._detached: set[Connection] = set()
+        self._collector: Optional[threading.Thread] = None
+
+        self._thread = threading.Thread(
+            target=self._accept, name="ezpl-log-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)  # Drain and unmap the rings at exit
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def address(self) -> str:
+        """Address workers connect to."""
+        return str(self._listener.address)
+
+    @property
+    def received(self) -> int:
+        """Number of frames received from all workers."""
+        return self._received
+
+    @property
+    def pending(self) -> int:
+        """Bytes waiting in the workers' shared-memory rings."""
+        with self._lock:
+            rings = list(self._rings.values())
+        return sum(ring.pending for ring in rings)
+
+    def environment(self) -> dict[str, str]:
+        """
+        Environment variables attaching a process to this writer.
+
+        Returns:
+            Mapping of WRITER_ENV and WRITER_KEY_ENV to their values
+        """
+        return {WRITER_ENV: self.address, WRITER_KEY_ENV: self._authkey.hex()}
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def close(self) -> None:
+        """Stop accepting workers and close every connection."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        with contextlib.suppress(OSError):
+            self._listener.close()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            with contextlib.suppress(OSError):
+                connection.close()
+        if self._collector is not None:
+            self._collector.join(timeout=5.0)
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _accept(self) -> None:
+        """Accept thread: start a reader thread per worker connection."""
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except Exception:
+                if self._closed:
+                    return
+                continue  # Failed handshake (wrong key, worker gone)
+            with self._lock:
+                self._connections.append(connection)
+            threading.Thread(
+                target=self._read,
+                args=(connection,),
+                name="ezpl-log-writer-reader",
+                daemon=True,
+            ).start()
+
+    def _read(self, connection: "Connection") -> None:
+        """Reader thread: hand frames to the callback until the worker leaves."""
+        on_frame = self._on_frame
+        try:
+            while True:
+                level_no, line = decode_frame(connection.recv_bytes())
+                if level_no == RING_ATTACH:
+                    self._add_ring(connection, line)
+                    continue
+                with self._lock:
+                    self._received += 1
+                # A bad record must not disconnect the worker
+                with contextlib.suppress(Exception):
+                    on_frame(level_no, line)
+        except (EOFError, OSError):
+            pass  # Worker exited or writer closed
+        finally:
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+                if connection in self._rings:
+                    self._detached.add(connection)  # Drained once more, then freed
+            with contextlib.suppress(OSError):
+                connection.close()
+
+    def _add_ring(self, connection: "Connection", name: str) -> None:
+        """Attach to a worker's ring and make sure the collector runs."""
+        try:
+            ring = SharedMemoryRing.attach(name)
+        except (OSError, ValueError):
+            return  # Worker already gone
+        with self._lock:
+            if self._closed:
+                ring.close()
+                return
+            self._rings[connection] = ring
+            if self._collector is None:
+                self._collector = threading.Thread(
+                    target=self._collect, name="ezpl-log-collector", daemon=True
+                )
+                self._collector.start()
+
+    def _collect(self) -> None:
+        """Collector thread: drain every ring, sleep while all are empty."""
+        while True:
+            # Flags are read before draining, so the frames a worker wrote
+            # before exiting (or before close()) are drained once more
+            closed = self._closed
+            with self._lock:
+                rings = list(self._rings.items())
+                detached = self._detached & self._rings.keys()
+            busy = False
+            for connection, ring in rings:
+                busy = self._drain(ring) or busy
+                if closed or connection in detached:
+                    with self._lock:
+                        del self._rings[connection]
+                        self._detached.discard(connection)
+                    ring.close()
+            if closed:
+                return
+            if not busy:
+                time.sleep(COLLECT_INTERVAL)
+
+    def _drain(self, ring: SharedMemoryRing) -> bool:
+        """Hand the frames of one ring to the callback."""
+        frames = ring.read()
+        if not frames:
+            return False
+        with self._lock:
+            self._received += len(frames)
+        on_frame = self._on_frame
+        for frame in frames:
+            # A bad record must not stop the collector
+            with contextlib.suppress(Exception):
+                on_frame(*decode_frame(frame))
+        return True
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the writer server."""
+        return (
+            f"LogWriterServer(address={self.address}, "
+            f"workers={len(self._connections)}, received={self._received})"
+        )
+
+
+class SocketTransport:
+    """
+    Sending end of multi-process logging, used by worker file loggers.
+
+    Frames are sent synchronously, one message per record; a send blocks
+    while the writer is behind and the socket buffer is full. The connection
+    is opened lazily and again after a fork, so every process has its own.
+    If the writer is unreachable, records are dropped (and counted) and the
+    connection is retried after RECONNECT_DELAY.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, address: str, authkey: bytes) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            address: Writer address (see LogWriterServer.address)
+            authkey: Writer auth key
+        """
+        self._address = address
+        self._authkey = authkey
+        self._connection: Optional[Connection] = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._retry_at = 0.0
+
+    @classmethod
+    def from_environment(cls, **options: Any) -> Optional["SocketTransport"]:
+        """
+        Build a transport from the inherited environment handle.
+
+        Args:
+            **options: Extra constructor arguments of the transport class
+
+        Returns:
+            SocketTransport, or None if no writer is advertised
+
+        Raises:
+            ValidationError: If the auth key is missing or malformed
+        """
+        address = os.environ.get(WRITER_ENV)
+        if not address:
+            return None
+        key = os.environ.get(WRITER_KEY_ENV, "")
+        try:
+            authkey = bytes.fromhex(key)
+        except ValueError:
+            authkey = b""
+        if not authkey:
+            raise ValidationError(
+                f"{WRITER_KEY_ENV} must hold the writer's hexadecimal key",
+                "log-writer-key",
+                key,
+            )
+        return cls(address, authkey, **options)
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def send(self, frame: bytes) -> bool:
+        """
+        Send a frame to the writer.
+
+        Args:
+            frame: Encoded frame (see encode_frame())
+
+        Returns:
+            False if the frame was dropped
+        """
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        with self._lock:
+            connection = self._connection or self._connect()
+            if connection is None:
+                METRICS.inc("dropped", "transport")
+                return False
+            try:
+                connection.send_bytes(frame)
+            except OSError:
+                self._disconnect()
+                METRICS.inc("dropped", "transport")
+                return False
+        METRICS.inc("bytes_written", "transport", len(frame))
+        return True
+
+    def close(self) -> None:
+        """Close the connection to the writer."""
+        with self._lock:
+            self._disconnect()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _after_fork(self) -> None:
+        """Forget the parent's connection: every process needs its own."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._retry_at = 0.0
+
+    def _connect(self) -> Optional["Connection"]:
+        """Connect to the writer, unless a recent attempt failed."""
+        from multiprocessing.connection import Client
+
+        if time.monotonic() < self._retry_at:
+            return None
+        try:
+            self._connection = Client(self._address, authkey=self._authkey)
+        except Exception:
+            self._retry_at = time.monotonic() + RECONNECT_DELAY
+            return None
+        return self._connection
+
+    def _disconnect(self) -> None:
+        """Drop the current connection and delay the next attempt."""
+        if self._connection is not None:
+            with contextlib.suppress(OSError):
+                self._connection.close()
+            self._connection = None
+        self._retry_at = time.monotonic() + RECONNECT_DELAY
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the transport."""
+        return (
+            f"SocketTransport(address={self._address}, "
+            f"connected={self._connection is not None})"
+        )
+
+
+class SharedMemoryTransport(SocketTransport):
+    """
+    Sending end of multi-process logging through a shared-memory ring.
+
+    On first use (and again after a fork), the worker creates its ring,
+    connects to the writer and announces the ring's name; the connection
+    then stays idle and tells the writer when the worker exits. Each frame
+    is copied into the ring: no pickling and no system call per record.
+
+    When the ring is full because the writer falls behind, records are
+    dropped at once rather than blocking the worker (the socket transport
+    blocks instead until the writer reads). Drops are counted under
+    METRICS dropped/shm and by ``dropped``, and the bytes waiting in the
+    ring are exported as the 'shm_ring_bytes' gauge.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self, address: str, authkey: bytes, ring_size: int = DEFAULT_RING_SIZE
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            address: Writer address (see LogWriterServer.address)
+            authkey: Writer auth key
+            ring_size: Ring size in bytes
+        """
+        super().__init__(address, authkey)
+        self._ring_size = ring_size
+        self._ring: Optional[SharedMemoryRing] = None
+        self._dropped = 0
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped by this process."""
+        return self._dropped
+
+    @property
+    def pending(self) -> int:
+        """Bytes waiting in this process's ring."""
+        ring = self._ring
+        return ring.pending if ring is not None else 0
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def send(self, frame: bytes) -> bool:
+        """
+        Copy a frame into the ring.
+
+        Args:
+            frame: Encoded frame (see encode_frame())
+
+        Returns:
+            False if the frame was dropped
+        """
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        with self._lock:  # Threads of this process share one producer slot
+            ring = self._ring or self._open_ring()
+            if ring is None or not ring.write(frame):
+                self._dropped += 1
+                METRICS.inc("dropped", "shm")
+                return False
+        METRICS.inc("bytes_written", "shm", len(frame))
+        return True
+
+    def close(self) -> None:
+        """Unmap the ring and disconnect, letting the writer drain it."""
+        with self._lock:
+            self._close_ring()
+            self._disconnect()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _after_fork(self) -> None:
+        """Leave the parent's ring to the parent and start a new one."""
+        super()._after_fork()
+        self._ring = None
+
+    def _open_ring(self) -> Optional[SharedMemoryRing]:
+        """Create the ring and announce it, unless a recent attempt failed."""
+        connection = self._connect()
+        if connection is None:
+            return None
+        ring = SharedMemoryRing.create(self._ring_size)
+        try:
+            connection.send_bytes(encode_frame(RING_ATTACH, ring.name))
+        except OSError:
+            self._disconnect()
+            SharedMemoryRing.attach(ring.name).close()  # Unlinks the name
+            ring.close()
+            return None
+        self._ring = ring
+        METRICS.register_gauge("shm_ring_bytes", lambda: self.pending)
+        atexit.register(self.close)  # Unmap before the segment is collected
+        return ring
+
+    def _close_ring(self) -> None:
+        """Unmap this process's ring."""
+        if self._ring is None:
+            return
+        atexit.unregister(self.close)
+        METRICS.unregister_gauge("shm_ring_bytes")
+        self._ring.close()
+        self._ring = None
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the transport."""
+        return (
+            f"SharedMemoryTransport(address={self._address}, "
+            f"pending={self.pending}, dropped={self._dropped})"
+        )
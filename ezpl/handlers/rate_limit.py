@@ -0,0 +1,228 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Rate Limiter
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Rate limiter for Ezpl logging handlers.
+
+This module provides a token-bucket rate limiter keyed by call site or by
+message, used by ConsolePrinter and FileLogger to suppress log storms.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import time
+from collections.abc import Hashable
+from typing import Optional
+
+# Internal modules
+from ..core.exceptions import ValidationError
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by call site or message.
+
+    Each key owns a bucket holding up to ``burst`` tokens, refilled at
+    ``rate`` tokens per second. A record consumes one token; when the bucket
+    is empty the record is suppressed and counted. The next record allowed
+    for that key reports how many similar records were suppressed in the
+    meantime, which handlers turn into a "suppressed N similar messages"
+    summary.
+
+    The decision is a dict lookup plus a few float operations. Buckets are
+    not locked: concurrent records on the same key may at worst be
+    miscounted by one, which is acceptable for storm suppression.
+    """
+
+    KEY_MODES = ("callsite", "message")
+    MAX_KEYS = 10000  # Bound on tracked keys (idle buckets are evicted beyond it)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self, rate: float, burst: Optional[int] = None, key: str = "callsite"
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Allowed records per second for each key
+            burst: Bucket capacity (default: max(1, rate))
+            key: Keying mode, 'callsite' (module, function, line) or 'message'
+
+        Raises:
+            ValidationError: If rate, burst or key is invalid
+        """
+        try:
+            rate = float(rate)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(
+                f"Invalid rate limit: {rate}", "rate_limit", str(rate)
+            ) from e
+        if rate <= 0:
+            raise ValidationError(
+                f"Rate limit must be positive: {rate}", "rate_limit", str(rate)
+            )
+        if burst is not None and int(burst) < 1:
+            raise ValidationError(
+                f"Rate limit burst must be >= 1: {burst}",
+                "rate_limit_burst",
+                str(burst),
+            )
+        if key not in self.KEY_MODES:
+            raise ValidationError(
+                f"Invalid rate limit key: {key} (expected one of {self.KEY_MODES})",
+                "rate_limit_key",
+                key,
+            )
+
+        self._rate = rate
+        self._burst = float(burst) if burst is not None else max(1.0, rate)
+        self._key = key
+        # key -> [tokens, last_refill, suppressed]
+        self._buckets: dict[Hashable, list] = {}
+        # Pending counts of evicted buckets, reported by drain_suppressed()
+        self._evicted: dict[Hashable, int] = {}
+        self._clock = time.monotonic
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def rate(self) -> float:
+        """Allowed records per second for each key."""
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        """Bucket capacity."""
+        return self._burst
+
+    @property
+    def key(self) -> str:
+        """Keying mode ('callsite' or 'message')."""
+        return self._key
+
+    # ///////////////////////////////////////////////////////////////
+    # RATE LIMITING METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def allow(self, key: Hashable) -> Optional[int]:
+        """
+        Decide whether a record for ``key`` may be emitted.
+
+        Args:
+            key: Bucket key (call site tuple or message tuple)
+
+        Returns:
+            None if the record must be suppressed, otherwise the number of
+            records suppressed for this key since the last allowed one.
+        """
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_KEYS:
+                self._evict()
+            self._buckets[key] = [self._burst - 1.0, now, 0]
+            return self._evicted.pop(key, 0) if self._evicted else 0
+
+        tokens = bucket[0] + (now - bucket[1]) * self._rate
+        if tokens > self._burst:
+            tokens = self._burst
+        bucket[1] = now
+
+        if tokens < 1.0:
+            bucket[0] = tokens
+            bucket[2] += 1
+            return None
+
+        bucket[0] = tokens - 1.0
+        suppressed = bucket[2]
+        bucket[2] = 0
+        return suppressed
+
+    def drain_suppressed(self) -> list[tuple[Hashable, int]]:
+        """
+        Collect and reset pending suppression counts.
+
+        Used by handlers to emit final summaries for storms that ended
+        before another record was allowed for the same key.
+
+        Returns:
+            List of (key, suppressed_count) for keys with pending counts
+        """
+        pending = list(self._evicted.items())
+        self._evicted.clear()
+        for key, bucket in list(self._buckets.items()):
+            if bucket[2]:
+                pending.append((key, bucket[2]))
+                bucket[2] = 0
+        return pending
+
+    def reset(self) -> None:
+        """Forget all buckets and pending counts."""
+        self._buckets.clear()
+        self._evicted.clear()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _evict(self) -> None:
+        """
+        Make room for a new key once MAX_KEYS buckets are tracked.
+
+        Buckets without a pending suppressed count are dropped. If every
+        bucket has one, all are dropped and their counts are kept until the
+        key is allowed again or drain_suppressed() reports them.
+        """
+        idle = [key for key, bucket in self._buckets.items() if not bucket[2]]
+        if idle:
+            for key in idle:
+                del self._buckets[key]
+            return
+        for key, bucket in self._buckets.items():
+            self._evicted[key] = self._evicted.get(key, 0) + bucket[2]
+        self._buckets.clear()
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __str__(self) -> str:
+        """String representation of the rate limiter."""
+        return f"RateLimiter(rate={self._rate}, key={self._key})"
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the rate limiter."""
+        return (
+            f"RateLimiter(rate={self._rate}, burst={self._burst}, "
+            f"key={self._key}, keys={len(self._buckets)})"
+        )
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def format_suppressed(count: int) -> str:
+    """
+    Build the summary text for suppressed records.
+
+    Args:
+        count: Number of suppressed records
+
+    Returns:
+        Summary text, e.g. "suppressed 42 similar messages"
+    """
+    noun = "message" if count == 1 else "messages"
+    return f"suppressed {count} similar {noun}"
@@ -0,0 +1,243 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Render Queue
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Background rendering for Ezpl console output.
+
+This module provides a bounded queue drained by a single render thread,
+used by ConsolePrinter's asynchronous mode so that slow terminals or
+blocked pipes never stall the threads that log.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import atexit
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# Internal modules
+from ..core.exceptions import ValidationError
+from ..core.metrics import METRICS
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Overflow policies: 'block' waits for room, 'drop_new' discards the incoming
+# item, 'drop_old' discards the oldest queued item
+OVERFLOW_POLICIES = ("block", "drop_new", "drop_old")
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class RenderQueue:
+    """
+    Bounded queue drained in batches by a single daemon thread.
+
+    Submitting an item is a deque append (plus a wake-up when the render
+    thread is idle). The thread takes every queued item at once and hands
+    the batch to ``render_batch``, so output under load is written in one
+    call per frame instead of one per message. Pending items are flushed
+    at interpreter exit. Items discarded by the overflow policy are counted
+    in ``dropped``.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        render_batch: Callable[[list[Any]], None],
+        maxsize: int = 10000,
+        overflow: str = "drop_new",
+        sink: str = "console",
+    ) -> None:
+        """
+        Initialize the queue and start its render thread.
+
+        Args:
+            render_batch: Callback receiving each batch of items, in order
+            maxsize: Maximum number of queued items
+            overflow: Policy when the queue is full ('block', 'drop_new'
+                or 'drop_old')
+            sink: Sink name used for the dropped counter
+
+        Raises:
+            ValidationError: If maxsize or overflow is invalid
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValidationError(
+                f"Queue size must be a positive integer: {maxsize}",
+                "queue_size",
+                str(maxsize),
+            )
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValidationError(
+                f"Invalid overflow policy: {overflow}", "overflow", overflow
+            )
+
+        self._render_batch = render_batch
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._sink = sink
+        self._items: deque[Any] = deque()
+        self._pending = threading.Event()
+        self._room = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self.dropped = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"ezpl-{sink}-render", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def overflow(self) -> str:
+        """Policy applied when the queue is full."""
+        return self._overflow
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of queued items."""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        """Number of queued items."""
+        return len(self._items)
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def submit(self, item: Any) -> bool:
+        """
+        Queue an item for rendering.
+
+        Args:
+            item: Item passed to ``render_batch``
+
+        Returns:
+            False if the item was dropped (queue full or closed)
+        """
+        if self._closed:
+            self._drop()
+            return False
+
+        if len(self._items) >= self._maxsize:
+            if self._overflow == "drop_new":
+                self._drop()
+                return False
+            if self._overflow == "drop_old":
+                try:
+                    self._items.popleft()
+                    self._drop()
+                except IndexError:
+                    pass  # Drained concurrently, there is room now
+            else:
+                while len(self._items) >= self._maxsize and not self._closed:
+                    self._room.clear()
+                    self._pending.set()
+                    self._room.wait(0.05)
+                if self._closed:
+                    self._drop()  # Closed while waiting for room
+                    return False
+
+        self._items.append(item)
+        if not self._pending.is_set():
+            self._pending.set()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every queued item has been rendered.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the queue was drained in time
+        """
+        if threading.current_thread() is self._thread:
+            return not self._items
+        deadline = time.monotonic() + timeout
+        while self._items or not self._idle.is_set():
+            self._pending.set()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._thread.is_alive():
+                return False
+            self._idle.wait(min(remaining, 0.01))
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush pending items and stop the render thread.
+
+        Args:
+            timeout: Maximum time to wait for pending items
+        """
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._pending.set()
+        self._room.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _drop(self) -> None:
+        """Count a dropped item."""
+        self.dropped += 1
+        METRICS.inc("dropped", self._sink)
+
+    def _run(self) -> None:
+        """Render thread: drain the queue in batches until closed."""
+        items = self._items
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            while items:
+                self._idle.clear()
+                batch = []
+                try:
+                    while True:
+                        batch.append(items.popleft())
+                except IndexError:
+                    pass  # Queue drained
+                self._room.set()
+                # Rendering errors must not kill the render thread
+                with contextlib.suppress(Exception):
+                    self._render_batch(batch)
+            self._idle.set()
+            if self._closed:
+                return
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the render queue."""
+        return (
+            f"RenderQueue(sink={self._sink}, size={len(self)}, "
+            f"maxsize={self._maxsize}, overflow={self._overflow})"
+        )
@@ -0,0 +1,394 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Ring Buffer Handler
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+In-memory flight-recorder handler for Ezpl logging framework.
+
+This module provides a handler keeping the last N records (DEBUG included)
+in a preallocated ring, dumped to a file on errors, on unhandled
+exceptions, or on demand.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import contextlib
+import itertools
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# External libraries
+from loguru import logger
+
+# Internal modules
+from ..core.exceptions import FileOperationError, LoggingError, ValidationError
+from ..core.interfaces import LoggingHandler
+from ..types import LogLevel
+from .utils import (
+    format_error_line,
+    format_log_line,
+    format_traceback,
+    safe_str_convert,
+    sanitize_for_file,
+)
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class RingBufferHandler(LoggingHandler):
+    """
+    Flight recorder keeping the last N records in memory.
+
+    Records are captured in the loguru filter, which runs before any
+    formatting, and never reach a sink: keeping a record costs one counter
+    increment and one slot assignment in a preallocated list. Each slot
+    holds (sequence number, record), so snapshots can order records and
+    ignore slots overwritten concurrently without any lock. Records are
+    only formatted when the ring is dumped, which happens:
+    - when a record at or above ``dump_level`` is captured
+    - on an unhandled exception, once ``install_excepthook()`` was called
+    - on demand through ``dump()``
+
+    Dumps are appended to the dump file in FileLogger's format, under a
+    ``## ==>`` header, so ``ezpl logs`` commands can read them.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        level: str = "DEBUG",
+        dump_file: Optional[Union[str, Path]] = None,
+        dump_level: Optional[str] = "ERROR",
+        min_dump_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the ring buffer handler.
+
+        Args:
+            capacity: Number of records kept
+            level: Minimum level of captured records
+            dump_file: File dumps are appended to (required for automatic
+                dumps, optional for ``dump(path)``)
+            dump_level: Level triggering an automatic dump (None disables)
+            min_dump_interval: Minimum seconds between automatic dumps, so an
+                error storm does not rewrite the same context repeatedly
+
+        Raises:
+            ValidationError: If the capacity or a level is invalid
+            LoggingError: If the handler cannot be registered
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValidationError(
+                f"Ring buffer capacity must be a positive integer: {capacity}",
+                "capacity",
+                str(capacity),
+            )
+        for name, value in (("level", level), ("dump_level", dump_level)):
+            if value is not None and not LogLevel.is_valid_level(value):
+                raise ValidationError(f"Invalid log level: {value}", name, value)
+
+        self._capacity = capacity
+        self._slots: list[Optional[tuple[int, dict[str, Any]]]] = [None] * capacity
+        self._counter = itertools.count()
+        self._level = level.upper()
+        self._dump_file = Path(dump_file) if dump_file else None
+        self._dump_level_no = LogLevel.get_no(dump_level) if dump_level else None
+        self._min_dump_interval = min_dump_interval
+        self._last_auto_dump = float("-inf")
+        self._dump_lock = threading.Lock()
+        self._previous_excepthook: Any = None
+        self._previous_thread_excepthook: Any = None
+        self._logger = logger.bind(task="logger")
+        self._logger_id: Optional[int] = None
+
+        self._initialize_logger()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _initialize_logger(self) -> None:
+        """
+        Register the capturing filter with loguru.
+
+        Raises:
+            LoggingError: If registration fails
+        """
+        try:
+            if self._logger_id is not None:
+                logger.remove(self._logger_id)
+            self._logger_id = logger.add(
+                _discard, level=self._level, filter=self._capture, format="{message}"
+            )
+        except Exception as e:
+            raise LoggingError(
+                f"Failed to initialize ring buffer: {e}", "ring_buffer"
+            ) from e
+
+    def _capture(self, record: dict[str, Any]) -> bool:
+        """
+        Loguru filter: store Ezpl records in the ring, never emit them.
+
+        Args:
+            record: Loguru record
+
+        Returns:
+            Always False (the sink is never called)
+        """
+        if record["extra"].get("task") != "logger":
+            return False
+
+        index = next(self._counter)
+        self._slots[index % self._capacity] = (index, record)
+
+        if (
+            self._dump_level_no is not None
+            and record["level"].no >= self._dump_level_no
+            and self._dump_file is not None
+        ):
+            now = time.monotonic()
+            if now - self._last_auto_dump >= self._min_dump_interval:
+                self._last_auto_dump = now
+                # Never let a dump failure break the logging call
+                with contextlib.suppress(FileOperationError):
+                    self.dump(reason=f"{record['level'].name} record")
+        return False
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def capacity(self) -> int:
+        """Number of records kept."""
+        return self._capacity
+
+    @property
+    def dump_file(self) -> Optional[Path]:
+        """File dumps are appended to."""
+        return self._dump_file
+
+    def get_records(self) -> list[str]:
+        """
+        Get the recorded records, oldest first, formatted like FileLogger.
+
+        Returns:
+            List of formatted lines (with trailing newlines)
+        """
+        return [_format_record(record) for record in self._snapshot()]
+
+    def __len__(self) -> int:
+        """Number of records currently held."""
+        return len(self._snapshot())
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def log(self, level: str, message: Any) -> None:
+        """
+        Log a message through the Ezpl logger (captured by the ring).
+
+        Args:
+            level: Log level
+            message: Message to record
+
+        Raises:
+            ValidationError: If the level is invalid
+        """
+        if not LogLevel.is_valid_level(level):
+            raise ValidationError(f"Invalid log level: {level}", "level", level)
+        self._logger.log(level.upper(), safe_str_convert(message))
+
+    def set_level(self, level: str) -> None:
+        """
+        Set the minimum level of captured records.
+
+        Args:
+            level: New level
+
+        Raises:
+            ValidationError: If the level is invalid
+        """
+        if not LogLevel.is_valid_level(level):
+            raise ValidationError(f"Invalid log level: {level}", "level", level)
+        self._level = level.upper()
+        self._initialize_logger()
+
+    def clear(self) -> None:
+        """Forget all recorded records."""
+        self._slots = [None] * self._capacity
+        self._counter = itertools.count()
+
+    # ///////////////////////////////////////////////////////////////
+    # DUMP METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def dump(
+        self, path: Optional[Union[str, Path]] = None, reason: str = "on demand"
+    ) -> Path:
+        """
+        Append the recorded records to a file.
+
+        Args:
+            path: Destination file (default: the configured dump file)
+            reason: Reason written in the dump header
+
+        Returns:
+            Path of the written file
+
+        Raises:
+            ValidationError: If no path is given and no dump file is configured
+            FileOperationError: If writing fails
+        """
+        target = Path(path) if path else self._dump_file
+        if target is None:
+            raise ValidationError("No dump file given or configured", "dump_file", None)
+
+        records = self.get_records()
+        current_time = datetime.now().strftime("%Y-%m-%d - %H:%M:%S")
+        header = (
+            f"\n\n## ==> RECENT RECORDS ({reason}) - {current_time} "
+            f"- {len(records)} record(s)\n"
+            "## /////////////////////////////////////////////////////////////////\n"
+        )
+        try:
+            with self._dump_lock:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, "a", encoding="utf-8") as dump_file:
+                    dump_file.write(header)
+                    dump_file.writelines(records)
+        except OSError as e:
+            raise FileOperationError(
+                f"Failed to dump recent records: {e}", str(target), "write"
+            ) from e
+        return target
+
+    def install_excepthook(self) -> None:
+        """
+        Dump the ring on unhandled exceptions (main and other threads).
+
+        The previous hooks are chained and restored by ``close()``.
+        """
+        if self._previous_excepthook is not None:
+            return
+
+        self._previous_excepthook = sys.excepthook
+        self._previous_thread_excepthook = threading.excepthook
+
+        def excepthook(exc_type, exc_value, exc_traceback) -> None:
+            self._dump_unhandled(exc_type, exc_value, exc_traceback)
+            self._previous_excepthook(exc_type, exc_value, exc_traceback)
+
+        def thread_excepthook(args) -> None:
+            self._dump_unhandled(args.exc_type, args.exc_value, args.exc_traceback)
+            self._previous_thread_excepthook(args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = thread_excepthook
+
+    def uninstall_excepthook(self) -> None:
+        """Restore the exception hooks replaced by ``install_excepthook()``."""
+        if self._previous_excepthook is None:
+            return
+        sys.excepthook = self._previous_excepthook
+        threading.excepthook = self._previous_thread_excepthook
+        self._previous_excepthook = None
+        self._previous_thread_excepthook = None
+
+    def close(self) -> None:
+        """
+        Unregister the handler and restore exception hooks.
+
+        Raises:
+            LoggingError: If the handler cannot be removed
+        """
+        self.uninstall_excepthook()
+        try:
+            if self._logger_id is not None:
+                logger.remove(self._logger_id)
+                self._logger_id = None
+        except Exception as e:
+            raise LoggingError("Failed to close ring buffer", "ring_buffer") from e
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _snapshot(self) -> list[dict[str, Any]]:
+        """Copy the ring in chronological order."""
+        # Reading the counter consumes a sequence number that is never stored
+        end = next(self._counter)
+        start = end - self._capacity
+        entries = [
+            entry
+            for entry in list(self._slots)
+            if entry is not None and start <= entry[0] < end
+        ]
+        entries.sort(key=lambda entry: entry[0])
+        return [record for _, record in entries]
+
+    def _dump_unhandled(self, exc_type, exc_value, exc_traceback) -> None:
+        """Dump the ring, followed by the unhandled exception."""
+        if self._dump_file is None or issubclass(exc_type, KeyboardInterrupt):
+            return
+        try:
+            path = self.dump(reason=f"unhandled {exc_type.__name__}")
+            with open(path, "a", encoding="utf-8") as dump_file:
+                dump_file.writelines(
+                    traceback.format_exception(exc_type, exc_value, exc_traceback)
+                )
+        except (FileOperationError, OSError):
+            pass  # The original hook still reports the exception
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __str__(self) -> str:
+        """String representation of the ring buffer handler."""
+        return f"RingBufferHandler(capacity={self._capacity}, level={self._level})"
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the ring buffer handler."""
+        return (
+            f"RingBufferHandler(capacity={self._capacity}, level={self._level}, "
+            f"dump_file={self._dump_file})"
+        )
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _discard(message: Any) -> None:
+    """Sink of the ring buffer handler (never called, the filter rejects all)."""
+
+
+def _format_record(record: dict[str, Any]) -> str:
+    """Format a captured record like FileLogger, with its traceback if any."""
+    try:
+        message = sanitize_for_file(safe_str_convert(record["message"]))
+        line = format_log_line(
+            record["time"].strftime("%Y-%m-%d %H:%M:%S"),
+            record["level"].name,
+            record["module"],
+            record["function"],
+            record["line"],
+            message,
+        )
+        return line + format_traceback(record.get("exception"))
+    except Exception as e:
+        return format_error_line(e)
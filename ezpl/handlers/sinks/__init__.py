@@ -0,0 +1,67 @@
+"""
+Sinks module for Ezpl logging framework.
+
+This module contains the sink registry (fan-out of Ezpl records to
+independent sinks, each with its own queue and worker) and the built-in
+sinks. Modules are imported on first access.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from typing import TYPE_CHECKING
+
+from ...core.lazy import lazy_exports
+
+# ------------------------------------------------
+# SINK IMPLEMENTATIONS (lazy)
+# ------------------------------------------------
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "Sink": (".base", "Sink"),
+    "SinkRecord": (".base", "SinkRecord"),
+    "SinkRegistry": (".base", "SinkRegistry"),
+    "format_record": (".base", "format_record"),
+    "FileSink": (".builtin", "FileSink"),
+    "StreamSink": (".builtin", "StreamSink"),
+    "SyslogSink": (".builtin", "SyslogSink"),
+    "TCPSink": (".builtin", "TCPSink"),
+    "ShippingSink": (".shipping", "ShippingSink"),
+    "SQLiteSink": (".sqlite", "SQLiteSink"),
+    "LogDatabase": (".sqlite", "LogDatabase"),
+}
+
+if TYPE_CHECKING:
+    from .base import Sink, SinkRecord, SinkRegistry, format_record
+    from .builtin import FileSink, StreamSink, SyslogSink, TCPSink
+    from .shipping import ShippingSink
+    from .sqlite import LogDatabase, SQLiteSink
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    # ------------------------------------------------
+    # REGISTRY EXPORTS
+    # ------------------------------------------------
+    "Sink",
+    "SinkRecord",
+    "SinkRegistry",
+    "format_record",
+    # ------------------------------------------------
+    # BUILT-IN SINK EXPORTS
+    # ------------------------------------------------
+    "FileSink",
+    "StreamSink",
+    "SyslogSink",
+    "TCPSink",
+    "ShippingSink",
+    "SQLiteSink",
+    "LogDatabase",
+]
@@ -0,0 +1,617 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Sink Registry
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Fan-out of Ezpl records to pluggable sinks.
+
+This module provides the Sink base class and the SinkRegistry, which
+captures the records of the Ezpl file logger once and hands them to any
+number of sinks. Each sink has its own bounded queue and worker thread, so
+a slow or unreachable sink never blocks the other sinks nor the caller.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Union
+
+# External libraries
+from loguru import logger
+
+# Internal modules
+from ...core.exceptions import LoggingError, ValidationError
+from ...core.metrics import METRICS
+from ...types import LogLevel
+from ..render_queue import RenderQueue
+from ..utils import (
+    format_error_line,
+    format_log_line,
+    format_traceback,
+    safe_str_convert,
+    sanitize_for_file,
+)
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+DEFAULT_SINK_QUEUE_SIZE = 10000
+
+# Extra key of the lines shipped by worker processes (FileLogger.REMOTE_KEY)
+REMOTE_KEY = "ezpl_remote"
+
+# Prefix of the sink label in METRICS, so that a sink named 'file' does not
+# add to the file logger's counters
+METRICS_PREFIX = "sink:"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class SinkRecord(NamedTuple):
+    """
+    Record handed to sinks, captured once and shared by every sink.
+
+    ``remote`` holds the line preformatted by a worker process when this
+    process is the log writer (see Ezpl.start_log_writer()); ``message`` is
+    empty for such records.
+    """
+
+    time: datetime
+    level: str
+    level_no: int
+    name: Optional[str]
+    module: str
+    function: str
+    line: int
+    message: str
+    exception: Any = None
+    remote: Optional[str] = None
+
+
+class Sink:
+    """
+    Destination of records fanned out by a SinkRegistry.
+
+    Sinks are only called from their own worker thread, one batch at a
+    time, so implementations need no locking. Text sinks implement
+    ``write()``; sinks storing structured records override
+    ``write_batch()``. SinkRegistry.add() rejects sinks overriding neither.
+    An exception raised by a sink discards the batch and marks the sink
+    unhealthy until a batch succeeds again.
+    """
+
+    # Formatter used when add_sink() is not given one (None: format_record)
+    default_format: Optional[Union[str, Callable[[SinkRecord], str]]] = None
+
+    def write(self, data: str) -> None:
+        """
+        Write formatted lines.
+
+        Args:
+            data: Concatenated lines, each ending with a newline
+        """
+        raise NotImplementedError
+
+    def write_batch(
+        self, records: list[SinkRecord], lines: list[str]  # noqa: ARG002
+    ) -> None:
+        """
+        Write a batch of records.
+
+        Args:
+            records: Captured records, oldest first
+            lines: The records formatted with the sink's formatter
+        """
+        self.write("".join(lines))
+
+    def flush(self, timeout: float = 5.0) -> bool:  # noqa: ARG002
+        """
+        Write records the sink buffers itself (called from any thread).
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if nothing is left buffered
+        """
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get sink-specific counters, reported under 'sink' by the registry.
+
+        Returns:
+            Dictionary of counters (empty by default)
+        """
+        return {}
+
+    def close(self) -> None:
+        """Release the sink's resources (called once, from any thread)."""
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the sink."""
+        return f"{type(self).__name__}()"
+
+
+class SinkRegistry:
+    """
+    Named sinks fed from a single loguru handler.
+
+    The handler's filter builds one SinkRecord per Ezpl record, only if
+    some sink accepts its level, and appends it to the queue of each
+    accepting sink; formatting and I/O happen in the sinks' workers. The
+    filter always returns False, so the handler itself never writes.
+
+    Rate limiting and coalescing are file logger features and do not apply
+    to sinks, which receive every record.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self) -> None:
+        """Initialize an empty registry (the handler is added with the first sink)."""
+        self._workers: dict[str, _SinkWorker] = {}
+        # Read without locking by the filter, replaced on every change
+        self._active: tuple[_SinkWorker, ...] = ()
+        self._min_level_no = 0
+        self._lock = threading.Lock()
+        self._logger_id: Optional[int] = None
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    def get(self, name: str) -> Sink:
+        """
+        Get a registered sink.
+
+        Args:
+            name: Sink name
+
+        Returns:
+            The sink
+
+        Raises:
+            ValidationError: If no sink has this name
+        """
+        return self._worker(name).sink
+
+    def names(self) -> list[str]:
+        """Names of the registered sinks, in registration order."""
+        return list(self._workers)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the health and counters of every sink.
+
+        Returns:
+            {name: stats} where stats holds 'level', 'healthy', 'queued',
+            'written', 'dropped' (queue overflow), 'failed' (records lost
+            to sink errors), 'errors', 'consecutive_errors', 'last_error',
+            'last_error_time' (epoch seconds) and 'sink' (Sink.stats())
+        """
+        return {name: worker.stats() for name, worker in list(self._workers.items())}
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if a sink has this name."""
+        return name in self._workers
+
+    def __len__(self) -> int:
+        """Number of registered sinks."""
+        return len(self._workers)
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def add(
+        self,
+        name: str,
+        sink: Sink,
+        level: str = "DEBUG",
+        format: Optional[Union[str, Callable[[SinkRecord], str]]] = None,
+        queue_size: int = DEFAULT_SINK_QUEUE_SIZE,
+        overflow: str = "drop_new",
+    ) -> Sink:
+        """
+        Register a sink and start its worker.
+
+        Args:
+            name: Unique sink name
+            sink: Sink instance
+            level: Minimum level of the records sent to the sink
+            format: Line formatter: a str.format template over the
+                SinkRecord fields (a newline is appended), a callable
+                returning the line, or None for the sink's default format
+            queue_size: Maximum number of records waiting for the sink
+            overflow: Policy when the queue is full ('drop_new', 'drop_old'
+                or 'block', which makes callers wait for the sink)
+
+        Returns:
+            The registered sink
+
+        Raises:
+            ValidationError: If an argument is invalid or the name is taken
+            LoggingError: If the loguru handler cannot be registered
+        """
+        if not isinstance(name, str) or not name:
+            raise ValidationError(f"Invalid sink name: {name!r}", "name", str(name))
+        if not isinstance(sink, Sink):
+            raise ValidationError(
+                f"Sinks must derive from Sink: {type(sink).__name__}",
+                "sink",
+                repr(sink),
+            )
+        if (
+            type(sink).write is Sink.write
+            and type(sink).write_batch is Sink.write_batch
+        ):
+            raise ValidationError(
+                f"Sinks must implement write() or write_batch(): "
+                f"{type(sink).__name__}",
+                "sink",
+                repr(sink),
+            )
+        if not LogLevel.is_valid_level(level):
+            raise ValidationError(f"Invalid log level: {level}", "level", level)
+        if format is None:
+            format = sink.default_format
+        formatter = _make_formatter(format)
+
+        with self._lock:
+            if name in self._workers:
+                raise ValidationError(
+                    f"A sink named {name!r} already exists", "name", name
+                )
+            worker = _SinkWorker(
+                name, sink, level.upper(), formatter, queue_size, overflow
+            )
+            self._workers[name] = worker
+            self._refresh()
+            if self._logger_id is None:
+                try:
+                    self._add_handler()
+                except Exception as e:
+                    del self._workers[name]
+                    self._refresh()
+                    worker.close(0)
+                    raise LoggingError(
+                        f"Failed to register sink {name!r}: {e}", "sinks"
+                    ) from e
+        return sink
+
+    def reattach(self) -> None:
+        """
+        Register the loguru handler again after logger.remove().
+
+        Ezpl() removes every loguru handler when it is created, including
+        the handler of sinks added before it.
+
+        Raises:
+            LoggingError: If the loguru handler cannot be registered
+        """
+        with self._lock:
+            self._remove_handler()
+            if not self._workers:
+                return
+            try:
+                self._add_handler()
+            except Exception as e:
+                raise LoggingError(f"Failed to reattach sinks: {e}", "sinks") from e
+
+    def remove(self, name: str, timeout: float = 5.0) -> None:
+        """
+        Flush and close a sink, then unregister it.
+
+        Args:
+            name: Sink name
+            timeout: Maximum time to wait for queued records
+
+        Raises:
+            ValidationError: If no sink has this name
+        """
+        with self._lock:
+            worker = self._worker(name)
+            del self._workers[name]
+            self._refresh()
+            if not self._workers:
+                self._remove_handler()
+        worker.close(timeout)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every sink has written its queued records.
+
+        Args:
+            timeout: Maximum total time to wait in seconds
+
+        Returns:
+            True if every queue was drained in time
+        """
+        deadline = time.monotonic() + timeout
+        drained = True
+        for worker in list(self._workers.values()):
+            drained = worker.flush(deadline) and drained
+        return drained
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush, close and unregister every sink.
+
+        Args:
+            timeout: Maximum time to wait for each sink's queued records
+        """
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+            self._refresh()
+            self._remove_handler()
+        for worker in workers:
+            worker.close(timeout)
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _worker(self, name: str) -> "_SinkWorker":
+        """Get a worker by sink name, or raise ValidationError."""
+        worker = self._workers.get(name)
+        if worker is None:
+            raise ValidationError(f"No sink named {name!r}", "name", name)
+        return worker
+
+    def _refresh(self) -> None:
+        """Publish the current workers to the filter (lock held)."""
+        self._active = tuple(self._workers.values())
+        self._min_level_no = min(
+            (worker.level_no for worker in self._active), default=0
+        )
+
+    def _add_handler(self) -> None:
+        """Add the loguru handler (lock held)."""
+        self._logger_id = logger.add(
+            _discard, level=0, filter=self._dispatch, format="{message}"
+        )
+
+    def _remove_handler(self) -> None:
+        """Remove the loguru handler (lock held)."""
+        if self._logger_id is None:
+            return
+        # Already removed (e.g., by logger.remove())
+        with contextlib.suppress(ValueError):
+            logger.remove(self._logger_id)
+        self._logger_id = None
+
+    def _dispatch(self, record: dict[str, Any]) -> bool:
+        """
+        Loguru filter: queue Ezpl records for the sinks, never emit them.
+
+        Args:
+            record: Loguru record
+
+        Returns:
+            Always False (the handler's sink is never called)
+        """
+        if record["extra"].get("task") != "logger":
+            return False
+        level_no = record["level"].no
+        if level_no < self._min_level_no:
+            return False
+
+        captured = _capture(record)
+        for worker in self._active:
+            if level_no >= worker.level_no:
+                worker.queue.submit(captured)
+        return False
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the registry."""
+        return f"SinkRegistry(sinks={self.names()})"
+
+
+class _SinkWorker:
+    """Queue, worker thread and counters of one registered sink."""
+
+    def __init__(
+        self,
+        name: str,
+        sink: Sink,
+        level: str,
+        formatter: Callable[[SinkRecord], str],
+        queue_size: int,
+        overflow: str,
+    ) -> None:
+        self.name = name
+        self.sink = sink
+        self.level = level
+        self.level_no = LogLevel.get_no(level)
+        self.formatter = formatter
+        self.written = 0
+        self.failed = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_error: Optional[str] = None
+        self.last_error_time: Optional[float] = None
+        self.metrics_name = METRICS_PREFIX + name
+        self._latency = METRICS.histogram("sink_write", self.metrics_name)
+        self.queue = RenderQueue(
+            self._write_batch, queue_size, overflow, sink=self.metrics_name
+        )
+        METRICS.register_gauge(self.metrics_name, self.queue.__len__)
+
+    def stats(self) -> dict[str, Any]:
+        """Health and counters of the sink."""
+        return {
+            "level": self.level,
+            "healthy": self.consecutive_errors == 0,
+            "queued": len(self.queue),
+            "written": self.written,
+            "dropped": self.queue.dropped,
+            "failed": self.failed,
+            "errors": self.errors,
+            "consecutive_errors": self.consecutive_errors,
+            "last_error": self.last_error,
+            "last_error_time": self.last_error_time,
+            "sink": self.sink.stats(),
+        }
+
+    def flush(self, deadline: float) -> bool:
+        """Write queued records, then the sink's own buffer, before deadline."""
+        drained = self.queue.flush(max(0.0, deadline - time.monotonic()))
+        try:
+            flushed = self.sink.flush(max(0.0, deadline - time.monotonic()))
+        except Exception as e:
+            self._fail(e, 0)
+            return False
+        return drained and flushed
+
+    def close(self, timeout: float) -> None:
+        """Flush the queue, stop the worker and close the sink."""
+        self.queue.close(timeout)
+        METRICS.unregister_gauge(self.metrics_name)
+        try:
+            self.sink.close()
+        except Exception as e:
+            self._fail(e, 0)
+
+    def _write_batch(self, batch: list[SinkRecord]) -> None:
+        """Worker thread: format a batch and hand it to the sink."""
+        formatter = self.formatter
+        lines = []
+        for record in batch:
+            try:
+                lines.append(formatter(record))
+            except Exception as e:
+                lines.append(_format_error(record, e))
+
+        start = time.perf_counter()
+        try:
+            self.sink.write_batch(batch, lines)
+        except Exception as e:
+            self._fail(e, len(batch))
+            METRICS.inc("dropped", self.metrics_name, len(batch))
+            return
+        self._latency.observe(time.perf_counter() - start)
+
+        self.written += len(batch)
+        self.consecutive_errors = 0
+        for record in batch:
+            METRICS.inc("records", self.metrics_name, level=record.level)
+        METRICS.inc("bytes_written", self.metrics_name, sum(map(len, lines)))
+
+    def _fail(self, error: Exception, lost: int) -> None:
+        """Record a sink error."""
+        self.failed += lost
+        self.errors += 1
+        self.consecutive_errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.last_error_time = time.time()
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def format_record(record: SinkRecord) -> str:
+    """
+    Format a record like FileLogger, with its traceback if any.
+
+    Args:
+        record: Captured record
+
+    Returns:
+        The formatted line (ending with a newline)
+    """
+    if record.remote is not None:
+        return record.remote
+    message = sanitize_for_file(safe_str_convert(record.message))
+    line = format_log_line(
+        record.time.strftime("%Y-%m-%d %H:%M:%S"),
+        record.level,
+        record.module,
+        record.function,
+        record.line,
+        message,
+    )
+    return line + format_exception(record)
+
+
+def format_exception(record: SinkRecord) -> str:
+    """
+    Format the traceback attached to a record.
+
+    Args:
+        record: Captured record
+
+    Returns:
+        The traceback text, or an empty string
+    """
+    return format_traceback(record.exception)
+
+
+def _make_formatter(
+    format: Optional[Union[str, Callable[[SinkRecord], str]]],
+) -> Callable[[SinkRecord], str]:
+    """Build the line formatter of a sink from add()'s format argument."""
+    if format is None:
+        return format_record
+    if callable(format):
+        return format
+    if isinstance(format, str):
+        template = format
+
+        def formatter(record: SinkRecord) -> str:
+            if record.remote is not None:
+                return record.remote
+            return template.format(**record._asdict()) + "\n"
+
+        return formatter
+    raise ValidationError(
+        f"Sink format must be a string or a callable: {format!r}",
+        "format",
+        repr(format),
+    )
+
+
+def _capture(record: dict[str, Any]) -> SinkRecord:
+    """Copy the fields sinks use out of a loguru record."""
+    return SinkRecord(
+        record["time"],
+        record["level"].name,
+        record["level"].no,
+        record["name"],
+        record["module"],
+        record["function"],
+        record["line"],
+        record["message"],
+        record["exception"],
+        record["extra"].get(REMOTE_KEY),
+    )
+
+
+def _format_error(record: SinkRecord, error: Exception) -> str:
+    """Fallback line for a record the sink's formatter failed on."""
+    return format_error_line(
+        error,
+        f"{record.time:%Y-%m-%d %H:%M:%S}",
+        record.module,
+        record.function,
+        record.line,
+    )
+
+
+def _discard(message: Any) -> None:
+    """Sink of the registry's handler (never called, the filter rejects all)."""
@@ -0,0 +1,272 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Built-in Sinks
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Built-in sinks for the Ezpl sink registry.
+
+This module provides sinks writing plain lines to a file, to a text stream
+(stdout by default), to the local syslog daemon over its Unix socket, and
+to a TCP endpoint.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+# Internal modules
+from ...core.exceptions import ValidationError
+from .base import Sink, SinkRecord
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Syslog facility codes (RFC 5424)
+SYSLOG_FACILITIES = {
+    "kern": 0,
+    "user": 1,
+    "mail": 2,
+    "daemon": 3,
+    "auth": 4,
+    "syslog": 5,
+    "lpr": 6,
+    "news": 7,
+    "uucp": 8,
+    "cron": 9,
+    "authpriv": 10,
+    "ftp": 11,
+    **{f"local{index}": 16 + index for index in range(8)},
+}
+
+# Syslog severity of each Ezpl level
+SYSLOG_SEVERITIES = {
+    "DEBUG": 7,
+    "INFO": 6,
+    "SUCCESS": 5,
+    "WARNING": 4,
+    "ERROR": 3,
+    "CRITICAL": 2,
+}
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class FileSink(Sink):
+    """
+    Append formatted lines to a file.
+
+    The file is opened on the first batch (parent directories are created)
+    and flushed after each batch. Unlike FileLogger, it does not rotate.
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8") -> None:
+        """
+        Initialize the file sink.
+
+        Args:
+            path: Destination file
+            encoding: File encoding
+        """
+        self._path = Path(path)
+        self._encoding = encoding
+        self._file: Optional[TextIO] = None
+
+    @property
+    def path(self) -> Path:
+        """Destination file."""
+        return self._path
+
+    def write(self, data: str) -> None:
+        """Append lines to the file."""
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Kept open across batches, closed by close()
+            self._file = open(self._path, "a", encoding=self._encoding)  # noqa: SIM115
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the file sink."""
+        return f"FileSink(path={self._path})"
+
+
+class StreamSink(Sink):
+    """
+    Write plain formatted lines (no colors, no markup) to a text stream.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Initialize the stream sink.
+
+        Args:
+            stream: Destination stream (default: sys.stdout at write time,
+                so redirections made later are honoured)
+        """
+        self._stream = stream
+
+    def write(self, data: str) -> None:
+        """Write lines to the stream and flush it."""
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(data)
+        stream.flush()
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the stream sink."""
+        stream = self._stream if self._stream is not None else "stdout"
+        return f"StreamSink(stream={stream})"
+
+
+class SyslogSink(Sink):
+    """
+    Send records to the local syslog daemon over its Unix socket.
+
+    Each record becomes one ``<PRI>ident[pid]: line`` message (the daemon
+    adds the timestamp and host name), with the priority computed from
+    the facility and the record level. Datagram sockets are tried first,
+    then stream sockets (messages separated by newlines). The socket is
+    reopened on the next batch after an error.
+    """
+
+    # The daemon timestamps messages itself
+    default_format = "{module}:{function}:{line} - {message}"
+
+    def __init__(
+        self,
+        address: Union[str, Path] = "/dev/log",
+        facility: str = "user",
+        ident: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the syslog sink.
+
+        Args:
+            address: Path of the syslog Unix socket
+            facility: Syslog facility name (see SYSLOG_FACILITIES)
+            ident: Program name in messages (default: the script name)
+
+        Raises:
+            ValidationError: If the facility is unknown
+        """
+        if facility not in SYSLOG_FACILITIES:
+            raise ValidationError(
+                f"Unknown syslog facility: {facility}", "facility", facility
+            )
+        self._address = str(address)
+        self._facility = SYSLOG_FACILITIES[facility]
+        self._ident = ident or Path(sys.argv[0] or "python").name
+        self._socket: Optional[socket.socket] = None
+        self._stream = False
+
+    def write_batch(self, records: list[SinkRecord], lines: list[str]) -> None:
+        """Send one syslog message per record."""
+        sock = self._socket or self._connect()
+        header = f"{self._ident}[{os.getpid()}]: "
+        try:
+            for record, line in zip(records, lines):
+                priority = self._facility * 8 + SYSLOG_SEVERITIES.get(record.level, 6)
+                message = f"<{priority}>{header}{line.rstrip()}"
+                if self._stream:
+                    sock.sendall(message.encode("utf-8") + b"\n")
+                else:
+                    sock.send(message.encode("utf-8"))
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the socket."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _connect(self) -> socket.socket:
+        """Open the syslog socket (datagram, else stream)."""
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.connect(self._address)
+                self._stream = False
+            except OSError:
+                sock.close()
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.connect(self._address)
+                except OSError:
+                    sock.close()
+                    raise
+                self._stream = True
+        except AttributeError as e:
+            raise OSError("Unix sockets are not available on this platform") from e
+        self._socket = sock
+        return sock
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the syslog sink."""
+        return f"SyslogSink(address={self._address}, ident={self._ident})"
+
+
+class TCPSink(Sink):
+    """
+    Send formatted lines to a TCP endpoint.
+
+    The connection is opened on the first batch and reopened on the next
+    batch after an error; the failed batch is discarded (and counted as
+    failed by the registry).
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 5.0) -> None:
+        """
+        Initialize the TCP sink.
+
+        Args:
+            host: Endpoint host
+            port: Endpoint port
+            timeout: Connection and send timeout in seconds
+        """
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._socket: Optional[socket.socket] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Endpoint (host, port)."""
+        return (self._host, self._port)
+
+    def write(self, data: str) -> None:
+        """Send lines to the endpoint."""
+        if self._socket is None:
+            self._socket = socket.create_connection(self.address, self._timeout)
+        try:
+            self._socket.sendall(data.encode("utf-8"))
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the TCP sink."""
+        return f"TCPSink(host={self._host}, port={self._port})"
@@ -0,0 +1,517 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Shipping Sink
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Batched log shipping to a remote collector.
+
+This module provides ShippingSink, which groups formatted records into
+compressed batches and sends them over TCP or HTTP. Batches that cannot be
+sent (endpoint down, slow or backlogged) are spooled to an on-disk segment
+queue, bounded by a disk quota, and replayed in order once the endpoint
+answers again.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import contextlib
+import gzip
+import http.client
+import itertools
+import os
+import socket
+import struct
+import threading
+import time
+import urllib.request
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
+
+# Internal modules
+from ...config.defaults import DefaultConfiguration
+from ...core.exceptions import ValidationError
+from .base import Sink, SinkRecord
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Spool directories default to <app data>/spool/<host>_<port>
+DEFAULT_SPOOL_DIR = DefaultConfiguration.LOG_DIR.parent / "spool"
+DEFAULT_SPOOL_MAX_BYTES = 100 * 1024 * 1024
+
+COMPRESSIONS = ("gzip", "zlib", "none")
+
+# Longest wait between two attempts to reach a failing endpoint
+MAX_RETRY_INTERVAL = 30.0
+
+# TCP frames: big-endian payload length, then the payload
+_FRAME = struct.Struct(">I")
+
+_SEGMENT_SUFFIX = ".seg"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ShippingSink(Sink):
+    """
+    Ship batches of formatted records to a TCP or HTTP collector.
+
+    Lines handed by the sink's registry worker are buffered in memory. A
+    sender thread cuts them into batches of ``batch_size`` lines, or
+    whatever arrived within ``batch_interval`` seconds, compresses each
+    batch and sends it:
+    - ``tcp://host:port``: one frame per batch, a 4-byte big-endian length
+      followed by the payload, over a persistent connection
+    - ``http(s)://...``: one POST per batch, with ``Content-Encoding`` set
+      to the compression and ``X-Ezpl-Records`` to the number of lines
+
+    A batch that fails to send is written to the spool directory as one
+    segment file, and the endpoint is retried with exponential backoff.
+    While segments are pending, new batches are spooled behind them, and
+    segments are replayed oldest first, so the collector receives batches
+    in order. Segments left by a previous run are replayed too. When the
+    spool exceeds ``spool_max_bytes``, the oldest segments are deleted.
+
+    If the endpoint is slow, lines beyond ``max_pending`` are spooled by
+    the registry worker instead of piling up in memory.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        endpoint: str,
+        spool_dir: Optional[Union[str, Path]] = None,
+        batch_size: int = 500,
+        batch_interval: float = 1.0,
+        compression: str = "gzip",
+        timeout: float = 5.0,
+        spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        max_pending: Optional[int] = None,
+        retry_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the sink and start its sender thread.
+
+        Args:
+            endpoint: Collector URL (``tcp://host:port``, ``http://...`` or
+                ``https://...``)
+            spool_dir: Directory of the spool segments, dedicated to this
+                sink (default: ``<app data>/spool/<host>_<port>``)
+            batch_size: Maximum number of lines per batch
+            batch_interval: Maximum seconds a line waits for its batch
+            compression: Batch compression ('gzip', 'zlib' or 'none')
+            timeout: Connection and send timeout in seconds
+            spool_max_bytes: Disk quota of the spool directory
+            max_pending: Maximum number of lines buffered in memory while
+                the sender is busy (default: 10 batches)
+            retry_interval: First delay before retrying a failed endpoint,
+                doubled on each failure up to MAX_RETRY_INTERVAL
+
+        Raises:
+            ValidationError: If an argument is invalid
+        """
+        self._scheme, self._address = _parse_endpoint(endpoint)
+        for name, value in (
+            ("batch_size", batch_size),
+            ("spool_max_bytes", spool_max_bytes),
+        ):
+            if not isinstance(value, int) or value < 1:
+                raise ValidationError(
+                    f"{name} must be a positive integer: {value}", name, str(value)
+                )
+        for name, value in (
+            ("batch_interval", batch_interval),
+            ("timeout", timeout),
+            ("retry_interval", retry_interval),
+        ):
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ValidationError(
+                    f"{name} must be a positive number: {value}", name, str(value)
+                )
+        if compression not in COMPRESSIONS:
+            raise ValidationError(
+                f"Invalid compression: {compression}", "compression", compression
+            )
+
+        self._endpoint = endpoint
+        self._batch_size = batch_size
+        self._batch_interval = float(batch_interval)
+        self._compression = compression
+        self._timeout = float(timeout)
+        self._spool_max_bytes = spool_max_bytes
+        self._max_pending = max_pending or batch_size * 10
+        self._retry_interval = float(retry_interval)
+
+        if spool_dir is None:
+            parts = urlsplit(endpoint)
+            spool_dir = DEFAULT_SPOOL_DIR / f"{parts.hostname}_{parts.port or 0}"
+        self._spool_dir = Path(spool_dir)
+
+        # Counters (records)
+        self.shipped = 0
+        self.spooled = 0
+        self.replayed = 0
+        self.spool_dropped = 0
+        self.last_error: Optional[str] = None
+
+        self._pending: list[str] = []
+        self._first_pending = 0.0
+        self._cond = threading.Condition()
+        self._closing = False
+        self._sending = False
+        self._retry_at = 0.0
+        self._retry_delay = self._retry_interval
+        self._socket: Optional[socket.socket] = None
+
+        # Spool index: (path, records, bytes), oldest first
+        self._segments: deque[tuple[Path, int, int]] = deque()
+        self._spool_bytes = 0
+        self._spool_lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._load_spool()
+
+        self._thread = threading.Thread(
+            target=self._run, name="ezpl-shipping", daemon=True
+        )
+        self._thread.start()
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def endpoint(self) -> str:
+        """Collector URL."""
+        return self._endpoint
+
+    @property
+    def spool_dir(self) -> Path:
+        """Directory of the spool segments."""
+        return self._spool_dir
+
+    @property
+    def spool_bytes(self) -> int:
+        """Size of the spooled segments in bytes."""
+        return self._spool_bytes
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the shipping counters.
+
+        Returns:
+            Dictionary with 'endpoint_up', 'pending', 'shipped', 'spooled',
+            'replayed', 'spool_dropped' (records), 'spool_segments',
+            'spool_bytes' and 'last_error'
+        """
+        return {
+            "endpoint_up": self._retry_at == 0.0,
+            "pending": len(self._pending),
+            "shipped": self.shipped,
+            "spooled": self.spooled,
+            "replayed": self.replayed,
+            "spool_dropped": self.spool_dropped,
+            "spool_segments": len(self._segments),
+            "spool_bytes": self._spool_bytes,
+            "last_error": self.last_error,
+        }
+
+    # ///////////////////////////////////////////////////////////////
+    # SINK METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def write_batch(
+        self, records: list[SinkRecord], lines: list[str]  # noqa: ARG002
+    ) -> None:
+        """Buffer lines for the sender (spool the excess if it lags behind)."""
+        overflow: list[str] = []
+        with self._cond:
+            if not self._pending:
+                # Arm the sender's batch_interval timer
+                self._first_pending = time.monotonic()
+                self._cond.notify()
+            self._pending.extend(lines)
+            if len(self._pending) > self._max_pending:
+                overflow = self._pending[: -self._batch_size]
+                del self._pending[: -self._batch_size]
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify()
+        for start in range(0, len(overflow), self._batch_size):
+            chunk = overflow[start : start + self._batch_size]
+            self._spool(self._compress(chunk), len(chunk))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Send the buffered lines now, without waiting for a full batch.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if no line is left in memory (lines may have been spooled)
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._first_pending = float("-inf")
+            self._cond.notify()
+            while self._pending or self._sending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(remaining, 0.05))
+        return True
+
+    def close(self) -> None:
+        """Ship or spool the buffered lines and stop the sender thread."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(self._timeout * 2 + 1)
+        self._disconnect()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _run(self) -> None:
+        """Sender thread: cut batches, send them and replay the spool."""
+        while True:
+            with self._cond:
+                while not self._closing:
+                    now = time.monotonic()
+                    deadlines = []
+                    if self._pending:
+                        if len(self._pending) >= self._batch_size:
+                            break
+                        deadlines.append(self._first_pending + self._batch_interval)
+                    if self._segments:
+                        deadlines.append(self._retry_at)
+                    if deadlines and min(deadlines) <= now:
+                        break
+                    self._cond.wait(min(deadlines) - now if deadlines else None)
+                closing = self._closing
+                if (
+                    closing
+                    or time.monotonic() >= self._first_pending + self._batch_interval
+                ):
+                    lines, self._pending = self._pending, []
+                else:
+                    # Full batches only, the rest waits for its interval
+                    full = len(self._pending) // self._batch_size * self._batch_size
+                    lines = self._pending[:full]
+                    del self._pending[:full]
+                    if self._pending:
+                        self._first_pending = time.monotonic()
+                self._sending = True
+
+            try:
+                for start in range(0, len(lines), self._batch_size):
+                    chunk = lines[start : start + self._batch_size]
+                    self._ship(self._compress(chunk), len(chunk))
+                if not closing:
+                    self._replay()
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+            if closing:
+                return
+
+    def _ship(self, payload: bytes, records: int) -> None:
+        """Send a batch, or spool it behind pending segments / on failure."""
+        if self._segments or time.monotonic() < self._retry_at:
+            self._spool(payload, records)
+            return
+        try:
+            self._send(payload, records)
+        except (OSError, http.client.HTTPException) as e:
+            self._failed(e)
+            self._spool(payload, records)
+            return
+        self._succeeded()
+        self.shipped += records
+
+    def _replay(self) -> None:
+        """Send spooled segments, oldest first, while the endpoint answers."""
+        while self._segments and time.monotonic() >= self._retry_at:
+            with self._spool_lock:
+                if not self._segments:
+                    return
+                path, records, size = self._segments[0]
+            try:
+                payload = path.read_bytes()
+            except OSError:
+                payload = None  # Deleted behind our back: skip it
+            if payload is not None:
+                try:
+                    self._send(payload, records)
+                except (OSError, http.client.HTTPException) as e:
+                    self._failed(e)
+                    return
+                self._succeeded()
+                self.replayed += records
+            with self._spool_lock:
+                # The quota may have evicted the segment meanwhile
+                if self._segments and self._segments[0][0] == path:
+                    self._segments.popleft()
+                    self._spool_bytes -= size
+            _unlink(path)
+
+    def _send(self, payload: bytes, records: int) -> None:
+        """Send one compressed batch to the endpoint."""
+        if self._scheme == "tcp":
+            if self._socket is None:
+                self._socket = socket.create_connection(self._address, self._timeout)
+            try:
+                self._socket.sendall(_FRAME.pack(len(payload)) + payload)
+            except OSError:
+                self._disconnect()
+                raise
+            return
+
+        headers = {
+            "Content-Type": "text/plain; charset=utf-8",
+            "X-Ezpl-Records": str(records),
+        }
+        if self._compression != "none":
+            headers["Content-Encoding"] = (
+                "gzip" if self._compression == "gzip" else "deflate"
+            )
+        # The scheme was checked by _parse_endpoint (http or https only)
+        request = urllib.request.Request(  # noqa: S310
+            self._endpoint, data=payload, headers=headers, method="POST"
+        )
+        with urllib.request.urlopen(  # noqa: S310
+            request, timeout=self._timeout
+        ) as response:
+            response.read()
+
+    def _compress(self, lines: list[str]) -> bytes:
+        """Encode and compress a batch."""
+        data = "".join(lines).encode("utf-8")
+        if self._compression == "gzip":
+            return gzip.compress(data, compresslevel=6)
+        if self._compression == "zlib":
+            return zlib.compress(data, 6)
+        return data
+
+    def _spool(self, payload: bytes, records: int) -> None:
+        """Append a batch to the spool, evicting the oldest segments over quota."""
+        with self._spool_lock:
+            if len(payload) > self._spool_max_bytes:
+                self.spool_dropped += records
+                return
+            while (
+                self._segments
+                and self._spool_bytes + len(payload) > self._spool_max_bytes
+            ):
+                path, dropped, size = self._segments.popleft()
+                self._spool_bytes -= size
+                self.spool_dropped += dropped
+                _unlink(path)
+
+            name = f"{time.time_ns():020d}-{next(self._sequence):06d}-{records}"
+            path = self._spool_dir / (name + _SEGMENT_SUFFIX)
+            temporary = path.with_suffix(".tmp")
+            try:
+                self._spool_dir.mkdir(parents=True, exist_ok=True)
+                temporary.write_bytes(payload)
+                os.replace(temporary, path)
+            except OSError as e:
+                self.last_error = f"Spool write failed: {type(e).__name__}: {e}"
+                self.spool_dropped += records
+                _unlink(temporary)
+                return
+            self._segments.append((path, records, len(payload)))
+            self._spool_bytes += len(payload)
+            self.spooled += records
+
+    def _load_spool(self) -> None:
+        """Index the segments left by a previous run."""
+        if not self._spool_dir.is_dir():
+            return
+        for path in sorted(self._spool_dir.iterdir()):
+            if path.suffix == ".tmp":
+                _unlink(path)  # Interrupted write
+            elif path.suffix == _SEGMENT_SUFFIX:
+                try:
+                    records = int(path.stem.rsplit("-", 1)[1])
+                    size = path.stat().st_size
+                except (IndexError, ValueError, OSError):
+                    continue
+                self._segments.append((path, records, size))
+                self._spool_bytes += size
+
+    def _failed(self, error: Exception) -> None:
+        """Back off after a failed send."""
+        self.last_error = f"{type(error).__name__}: {error}"
+        self._retry_at = time.monotonic() + self._retry_delay
+        self._retry_delay = min(self._retry_delay * 2, MAX_RETRY_INTERVAL)
+
+    def _succeeded(self) -> None:
+        """Reset the backoff after a successful send."""
+        self._retry_at = 0.0
+        self._retry_delay = self._retry_interval
+
+    def _disconnect(self) -> None:
+        """Close the TCP connection, if any."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the shipping sink."""
+        return (
+            f"ShippingSink(endpoint={self._endpoint}, "
+            f"spool_dir={self._spool_dir}, compression={self._compression})"
+        )
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _parse_endpoint(endpoint: str) -> tuple[str, Any]:
+    """
+    Split a collector URL into (scheme, address).
+
+    Raises:
+        ValidationError: If the URL is not tcp://host:port or http(s)://...
+    """
+    try:
+        parts = urlsplit(endpoint)
+        port = parts.port
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValidationError(
+            f"Invalid endpoint: {endpoint!r}", "endpoint", str(endpoint)
+        ) from e
+    if parts.scheme == "tcp" and parts.hostname and port:
+        return "tcp", (parts.hostname, port)
+    if parts.scheme in ("http", "https") and parts.hostname:
+        return parts.scheme, endpoint
+    raise ValidationError(
+        f"Endpoint must be tcp://host:port or an http(s) URL: {endpoint!r}",
+        "endpoint",
+        str(endpoint),
+    )
+
+
+def _unlink(path: Path) -> None:
+    """Delete a file, ignoring a missing one."""
+    # Already gone
+    with contextlib.suppress(OSError):
+        path.unlink()
@@ -0,0 +1,458 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - SQLite Sink
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Queryable log storage in a local SQLite database.
+
+This module provides LogDatabase, which stores records in an indexed
+SQLite table (WAL journal, one transaction per batch) and answers level,
+module and time-window queries, and SQLiteSink, which feeds a LogDatabase
+from the sink registry. LogDatabase can also import FileLogger text logs.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+# Internal modules
+from ...core.exceptions import FileOperationError, ValidationError
+from .base import Sink, SinkRecord, format_exception
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Timestamps are stored as local time text, which sorts chronologically
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+IMPORT_BATCH_SIZE = 5000
+
+# Accepted values of PRAGMA synchronous
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    level TEXT NOT NULL,
+    module TEXT NOT NULL,
+    function TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    exception TEXT
+);
+CREATE INDEX IF NOT EXISTS records_timestamp ON records (timestamp);
+CREATE INDEX IF NOT EXISTS records_level ON records (level, timestamp);
+CREATE INDEX IF NOT EXISTS records_module ON records (module, timestamp);
+"""
+
+_INSERT = (
+    "INSERT INTO records (timestamp, level, module, function, line, message, "
+    "exception) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_COLUMNS = "id, timestamp, level, module, function, line, message, exception"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class LogRow(NamedTuple):
+    """Record stored in a LogDatabase."""
+
+    id: int
+    timestamp: str
+    level: str
+    module: str
+    function: str
+    line: int
+    message: str
+    exception: Optional[str]
+
+    def format(self) -> str:
+        """Format the row like a FileLogger line (traceback included)."""
+        line = (
+            f"{self.timestamp[:19]} | {self.level:<10} | "
+            f"{self.module}:{self.function}:{self.line} - {self.message}"
+        )
+        if self.exception:
+            line += "\n" + self.exception.rstrip("\n")
+        return line
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the row to a dictionary."""
+        return self._asdict()
+
+
+class LogDatabase:
+    """
+    SQLite database of log records.
+
+    The database runs in WAL mode, so queries never wait for the writer,
+    and every ``insert()`` is one transaction. ``timestamp``, ``level`` and
+    ``module`` are indexed (the latter two together with the timestamp),
+    so level, module and time-window queries read only matching rows.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, path: Union[str, Path], synchronous: str = "NORMAL") -> None:
+        """
+        Open (or create) a log database.
+
+        Args:
+            path: Database file
+            synchronous: SQLite synchronous mode ('OFF', 'NORMAL', 'FULL' or
+                'EXTRA'); NORMAL is durable across application crashes in
+                WAL mode
+
+        Raises:
+            ValidationError: If the synchronous mode is invalid
+            FileOperationError: If the database cannot be opened
+        """
+        mode = str(synchronous).upper()
+        if mode not in SYNCHRONOUS_MODES:
+            raise ValidationError(
+                f"Invalid synchronous mode: {synchronous} "
+                f"(expected one of {SYNCHRONOUS_MODES})",
+                "synchronous",
+                str(synchronous),
+            )
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Used by the sink's worker and closed from any thread
+            self._connection = sqlite3.connect(
+                self._path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(f"PRAGMA synchronous={mode}")
+            self._connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise FileOperationError(
+                f"Failed to open log database: {e}", str(self._path), "open"
+            ) from e
+
+    # ///////////////////////////////////////////////////////////////
+    # GETTER
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def path(self) -> Path:
+        """Database file."""
+        return self._path
+
+    def __len__(self) -> int:
+        """Number of stored records."""
+        return self.count()
+
+    # ///////////////////////////////////////////////////////////////
+    # WRITE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def insert(self, rows: Iterable[tuple]) -> None:
+        """
+        Insert records in one transaction.
+
+        Args:
+            rows: (timestamp, level, module, function, line, message,
+                exception) tuples
+        """
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(_INSERT, rows)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def import_log_file(
+        self, log_file: Union[str, Path], batch_size: int = IMPORT_BATCH_SIZE
+    ) -> int:
+        """
+        Import a FileLogger text log.
+
+        Lines that are not log entries (tracebacks, continuation lines)
+        are attached to the preceding entry as its exception text;
+        separators and blank lines are skipped.
+
+        Args:
+            log_file: Log file to import
+            batch_size: Records per transaction
+
+        Returns:
+            Number of imported records
+
+        Raises:
+            FileOperationError: If the log file cannot be read
+        """
+        from ...cli.utils.log_parser import LogParser
+
+        path = Path(log_file)
+        imported = 0
+        batch: list[list[Any]] = []
+        current: Optional[list[Any]] = None
+        try:
+            parser = LogParser(path)
+            with open(path, encoding="utf-8", errors="replace") as source:
+                for number, text in enumerate(source, start=1):
+                    entry = parser.parse_line(text, number)
+                    if entry is not None:
+                        if len(batch) >= batch_size:
+                            self.insert(batch)
+                            imported += len(batch)
+                            batch = []
+                        current = [
+                            entry.timestamp.strftime(TIMESTAMP_FORMAT),
+                            entry.level.upper(),
+                            entry.module,
+                            entry.function,
+                            _line_number(entry.line),
+                            entry.message,
+                            None,
+                        ]
+                        batch.append(current)
+                    elif current is not None and text.strip():
+                        if text.startswith("##"):
+                            current = None  # Session separator or dump header
+                        else:
+                            current[6] = (current[6] or "") + text
+        except OSError as e:
+            raise FileOperationError(
+                f"Failed to read log file: {e}", str(path), "read"
+            ) from e
+        if batch:
+            self.insert(batch)
+            imported += len(batch)
+        return imported
+
+    # ///////////////////////////////////////////////////////////////
+    # QUERY METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def query(
+        self,
+        level: Optional[Union[str, Iterable[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        module: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> Iterator[LogRow]:
+        """
+        Iterate over the records matching all given filters.
+
+        Rows are fetched lazily, in chronological order unless
+        ``newest_first`` is set.
+
+        Args:
+            level: Level name, or several level names
+            since: Oldest timestamp (inclusive)
+            until: Newest timestamp (inclusive)
+            module: Module name
+            limit: Maximum number of rows
+            newest_first: Return the newest rows first
+
+        Yields:
+            Matching LogRow objects
+        """
+        where, params = _where(level, since, until, module)
+        order = "DESC" if newest_first else "ASC"
+        # Only constant clauses are interpolated, values are parameters
+        sql = (
+            f"SELECT {_COLUMNS} FROM records{where} "  # noqa: S608
+            f"ORDER BY timestamp {order}, id {order}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = self._connection.execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(500)
+                if not rows:
+                    return
+                for row in rows:
+                    yield LogRow(*row)
+        finally:
+            cursor.close()
+
+    def count(
+        self,
+        level: Optional[Union[str, Iterable[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        module: Optional[str] = None,
+    ) -> int:
+        """
+        Count the records matching all given filters (see query()).
+
+        Returns:
+            Number of matching records
+        """
+        where, params = _where(level, since, until, module)
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM records{where}", params  # noqa: S608
+        ).fetchone()[0]
+
+    def explain(self, **filters: Any) -> list[str]:
+        """
+        Get SQLite's plan for a query, to check which index answers it.
+
+        Args:
+            **filters: Filters accepted by count()
+
+        Returns:
+            Plan steps (e.g., 'SEARCH records USING INDEX records_level ...')
+        """
+        where, params = _where(**filters)
+        rows = self._connection.execute(
+            f"EXPLAIN QUERY PLAN SELECT {_COLUMNS} FROM records{where} "  # noqa: S608
+            "ORDER BY timestamp, id",
+            params,
+        ).fetchall()
+        return [row[-1] for row in rows]
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "LogDatabase":
+        """Enter the context (the database is already open)."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the database."""
+        self.close()
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the log database."""
+        return f"LogDatabase(path={self._path})"
+
+
+class SQLiteSink(Sink):
+    """
+    Store records in a LogDatabase, one transaction per batch.
+
+    The registry hands the sink everything queued since its last write,
+    so a burst of records costs one ``executemany`` and one commit.
+    """
+
+    def __init__(self, path: Union[str, Path], synchronous: str = "NORMAL") -> None:
+        """
+        Initialize the SQLite sink.
+
+        Args:
+            path: Database file (created if missing)
+            synchronous: SQLite synchronous mode (see LogDatabase)
+
+        Raises:
+            ValidationError: If the synchronous mode is invalid
+            FileOperationError: If the database cannot be opened
+        """
+        self._database = LogDatabase(path, synchronous)
+
+    @property
+    def database(self) -> LogDatabase:
+        """Underlying log database."""
+        return self._database
+
+    def write_batch(
+        self, records: list[SinkRecord], lines: list[str]  # noqa: ARG002
+    ) -> None:
+        """Insert the batch in one transaction."""
+        self._database.insert([_to_row(record) for record in records])
+
+    def close(self) -> None:
+        """Close the database."""
+        self._database.close()
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the SQLite sink."""
+        return f"SQLiteSink(path={self._database.path})"
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _to_row(record: SinkRecord) -> tuple:
+    """Convert a captured record to a database row."""
+    if record.remote is not None:
+        # Line formatted by a worker process: recover its fields
+        from ...cli.utils.log_parser import LogParser
+
+        first, _, rest = record.remote.partition("\n")
+        match = LogParser.LOG_PATTERN.match(first)
+        if match:
+            timestamp, level, module, function, line, message = match.groups()
+            return (
+                timestamp,
+                level.upper(),
+                module,
+                function,
+                _line_number(line),
+                message,
+                rest or None,
+            )
+    return (
+        record.time.strftime(TIMESTAMP_FORMAT + ".%f")[:-3],
+        record.level,
+        record.module,
+        record.function,
+        record.line,
+        record.message or (record.remote or "").rstrip("\n"),
+        format_exception(record) or None,
+    )
+
+
+def _where(
+    level: Optional[Union[str, Iterable[str]]] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    module: Optional[str] = None,
+) -> tuple[str, list[Any]]:
+    """Build the WHERE clause and parameters of a query."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if level:
+        levels = [level] if isinstance(level, str) else list(level)
+        clauses.append(f"level IN ({', '.join('?' * len(levels))})")
+        params.extend(name.upper() for name in levels)
+    if module:
+        clauses.append("module = ?")
+        params.append(module)
+    if since is not None:
+        clauses.append("timestamp >= ?")
+        params.append(since.strftime(TIMESTAMP_FORMAT))
+    if until is not None:
+        # Include records logged during the last second (fractional part)
+        clauses.append("timestamp < ?")
+        params.append(until.strftime(TIMESTAMP_FORMAT) + "~")
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _line_number(value: str) -> int:
+    """Parse a source line number (0 if not a number)."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
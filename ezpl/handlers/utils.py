@@ -6,14 +6,25 @@
 """
 Utility functions for message handling in handlers.
 
-This module provides robust message conversion and sanitization functions.
+This module provides robust message conversion and sanitization functions,
+and the line format shared by FileLogger, the ring buffer and the sinks.
 """
 
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
 import re
-from typing import Any
+import traceback
+from typing import Any, Optional
+
+# Internal modules
+from ..types import LogLevel
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Placeholders of a line whose record could not be read
+_UNKNOWN_TIME = "????-??-?? ??:??:??"
 
 ## ==> FUNCTIONS
 # ///////////////////////////////////////////////////////////////
@@ -108,3 +119,68 @@ def sanitize_for_console(message: str) -> str:
     message = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F]", "", message)
 
     return message
+
+
+def format_log_line(
+    timestamp: str, level: str, module: Any, function: Any, line: Any, message: str
+) -> str:
+    """
+    Format a line in FileLogger's layout.
+
+    Args:
+        timestamp: Formatted timestamp ('%Y-%m-%d %H:%M:%S')
+        level: Level name (LogLevel members use their label)
+        module: Module name
+        function: Function name ('<' and '>' are removed)
+        line: Line number
+        message: Message, already sanitized
+
+    Returns:
+        The formatted line (ending with a newline)
+    """
+    label = LogLevel[level].label if level in LogLevel.__members__ else level
+    fn = str(function).replace("<", "").replace(">", "")
+    return f"{timestamp} | {label:<10} | {module}:{fn}:{line} - {message}\n"
+
+
+def format_traceback(exception: Any) -> str:
+    """
+    Format the traceback of a loguru record exception.
+
+    Args:
+        exception: record["exception"] (type, value, traceback) or None
+
+    Returns:
+        The traceback text, or an empty string
+    """
+    if exception is None or exception.type is None:
+        return ""
+    return "".join(
+        traceback.format_exception(exception.type, exception.value, exception.traceback)
+    )
+
+
+def format_error_line(
+    error: Optional[Exception] = None,
+    timestamp: str = _UNKNOWN_TIME,
+    module: Any = "unknown",
+    function: Any = "unknown",
+    line: Any = "?",
+) -> str:
+    """
+    Format the line written in place of a record that failed to format.
+
+    Args:
+        error: Formatting error (its type is named in the line)
+        timestamp: Formatted timestamp of the record, if known
+        module: Module of the record, if known
+        function: Function of the record, if known
+        line: Line number of the record, if known
+
+    Returns:
+        The FORMAT_ERR line (ending with a newline)
+    """
+    reason = (
+        "FORMAT ERROR" if error is None else f"FORMAT ERROR: {type(error).__name__}"
+    )
+    return f"{timestamp} | FORMAT_ERR | {module}:{function}:{line} - [{reason}]\n"
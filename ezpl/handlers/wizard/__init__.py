@@ -2,17 +2,32 @@
 Wizard module for Ezpl logging framework.
 
 This module provides the RichWizard class for advanced Rich-based display
-capabilities including panels, tables, JSON, and progress bars.
+capabilities including panels, tables, JSON, and progress bars. RichWizard
+and the Rich modules behind its mixins are imported on first access.
 """
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
 
+from typing import TYPE_CHECKING
+
+from ...core.lazy import lazy_exports
+
 # ------------------------------------------------
-# WIZARD IMPLEMENTATION
+# WIZARD IMPLEMENTATION (lazy)
 # ------------------------------------------------
-from .core import RichWizard
+# name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "RichWizard": (".core", "RichWizard"),
+}
+
+if TYPE_CHECKING:
+    from .core import RichWizard
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 # =============================================================================
 # MODULE EXPORTS
@@ -20,6 +20,7 @@ from rich.console import Console
 # Internal modules
 from ...types import Pattern, get_pattern_color
 from .dynamic import DynamicProgressMixin
+from .hub import ProgressHubMixin
 from .json import JsonMixin
 from .panels import PanelMixin
 from .progress import ProgressMixin
@@ -30,7 +31,12 @@ from .tables import TableMixin
 
 
 class RichWizard(
-    PanelMixin, TableMixin, JsonMixin, ProgressMixin, DynamicProgressMixin
+    PanelMixin,
+    TableMixin,
+    JsonMixin,
+    ProgressMixin,
+    DynamicProgressMixin,
+    ProgressHubMixin,
 ):
     """
     Rich Wizard for advanced console display capabilities.
@@ -45,6 +51,7 @@ class RichWizard(
     - JsonMixin: JSON display methods
     - ProgressMixin: Progress bar methods
     - DynamicProgressMixin: Dynamic layered progress bar methods
+    - ProgressHubMixin: Progress display fed by parallel workers
     """
 
     # ///////////////////////////////////////////////////////////////
@@ -8,17 +8,27 @@ Dynamic progress methods mixin for Rich Wizard.
 
 This module provides dynamic layered progress bar functionality with
 layers that can appear, progress, and disappear automatically.
+
+Success and failure animations never sleep on the caller's thread: their
+steps are scheduled and applied by Rich's refresh timer, so completing a
+layer returns immediately. Layer updates are coalesced the same way: they
+only set plain counters, pushed to Rich at most once per refresh.
 """
 
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
+import heapq
+import itertools
+import threading
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager
+from functools import partial
 from typing import Any, Optional
 
 # External libraries
+from rich.console import RenderableType
 from rich.progress import (
     BarColumn,
     DownloadColumn,
@@ -62,6 +72,41 @@ class ConditionalDetailsColumn(TextColumn):
         return Text("")
 
 
+class AnimatedProgress(Progress):
+    """Rich Progress running a callback before each refresh renders."""
+
+    def __init__(self, *columns: Any, on_refresh: Callable[[], None], **kwargs: Any):
+        self._on_refresh = on_refresh  # Progress renders while initializing
+        super().__init__(*columns, **kwargs)
+
+    def get_renderables(self) -> Iterable[RenderableType]:
+        self._on_refresh()
+        yield from super().get_renderables()
+
+
+class _LayerState:
+    """Latest progress of a layer, waiting to be pushed to Rich."""
+
+    __slots__ = (
+        "task_id",
+        "type",
+        "description",
+        "steps",
+        "completed",
+        "details",
+        "dirty",
+    )
+
+    def __init__(self, task_id: int, layer_type: str, description: Any, steps: list):
+        self.task_id = task_id
+        self.type = layer_type
+        self.description = description  # Base description of step layers
+        self.steps = steps
+        self.completed = 0
+        self.details: Any = ""
+        self.dirty = False
+
+
 class DynamicLayeredProgress:
     """
     Manages a dynamic layered progress bar with disappearing layers.
@@ -70,12 +115,18 @@ class DynamicLayeredProgress:
     progress, and disappear based on the current state of operations.
     """
 
+    # Animation timings in seconds
+    SUCCESS_FLASH_INTERVAL = 0.1
+    SUCCESS_FADE_DURATION = 0.3
+    FAILURE_FLASH_INTERVAL = 0.15
+
     def __init__(
         self,
         console,
         progress_prefix: str,
         stages: list[dict],
         show_time: bool = True,
+        fast: Optional[bool] = None,
     ) -> None:
         """
         Initialize the dynamic layered progress bar.
@@ -85,11 +136,13 @@ class DynamicLayeredProgress:
             progress_prefix: Prefix string for progress bars
             stages: List of stage configurations
             show_time: Whether to show elapsed and remaining time
+            fast: Skip animations (default: when the console is not a terminal)
         """
         self._console = console
         self._progress_prefix = progress_prefix
         self.stages = stages
         self.show_time = show_time
+        self.fast = not console.is_terminal if fast is None else fast
         self.progress = None
         self.task_ids = {}
         self.active_layers = []
@@ -97,6 +150,16 @@ class DynamicLayeredProgress:
         self.layer_metadata = {}  # Store additional layer info
         self._emergency_stopped = False
         self._emergency_message = None
+        self._emergency_timer: Optional[threading.Timer] = None
+
+        # Pending animation steps: (due time, sequence, step)
+        self._animations: list[tuple[float, int, Callable[[], None]]] = []
+        self._animation_order = itertools.count()
+        self._animation_lock = threading.RLock()
+
+        # Coalesced layer updates, by layer name
+        self._layer_states: dict[str, _LayerState] = {}
+        self._advance_lock = threading.Lock()
 
         # Detect main layer and setup hierarchy
         self._setup_hierarchy()
@@ -158,7 +221,9 @@ class DynamicLayeredProgress:
                 ]
             )
 
-        return Progress(*columns, console=self._console)
+        return AnimatedProgress(
+            *columns, console=self._console, on_refresh=self._on_refresh
+        )
 
     def _create_layer(self, layer_config: dict) -> int:
         """Create a new layer in the progress bar.
@@ -243,59 +308,88 @@ class DynamicLayeredProgress:
 
         self.active_layers.append(task_id)
         self.task_ids[layer_name] = task_id
+        self._layer_states[layer_name] = _LayerState(
+            task_id,
+            layer_type,
+            self.progress._tasks[task_id].description,
+            layer_config.get("steps", []),
+        )
         return task_id
 
     def update_layer(self, layer_name: str, progress: int, details: str = "") -> None:
         """Update a specific layer's progress.
 
+        The update is recorded and pushed to the display on its next refresh,
+        so calling this per item costs the same whatever the terminal speed.
+
         Args:
             layer_name: Name of the layer to update
             progress: Progress value (0-100 or step index)
             details: Additional details to display
         """
-        if not self.progress:
+        state = self._layer_states.get(layer_name)
+        if state is None:
             return
+        state.completed = progress
+        state.details = details
+        state.dirty = True
 
-        task_id = self.task_ids.get(layer_name)
-        if task_id is None:
-            return
-
-        metadata = self.layer_metadata.get(task_id)
-        if metadata is None:
-            return
-
-        # Update the layer based on its type
-        if metadata["type"] == "steps":
-            # Handle step-based layer
-            task = self.progress._tasks[task_id]
-            steps = getattr(task, "fields", {}).get(
-                "steps", metadata["config"].get("steps", [])
-            )
+    def advance_layer(
+        self, layer_name: str, n: int = 1, details: Optional[str] = None
+    ) -> None:
+        """Advance a layer's progress, e.g. once per processed item.
 
-            if steps and progress < len(steps):
-                current_step = steps[progress]
-                step_progress = f"Step {progress + 1}/{len(steps)}: {current_step}"
+        Safe to call from several threads; like update_layer(), the display
+        is updated on its next refresh.
 
+        Args:
+            layer_name: Name of the layer to advance
+            n: Amount to advance by
+            details: Additional details to display (unchanged if None)
+        """
+        state = self._layer_states.get(layer_name)
+        if state is None:
+            return
+        with self._advance_lock:
+            state.completed += n
+        if details is not None:
+            state.details = details
+        state.dirty = True
+
+    def _on_refresh(self) -> None:
+        """Push coalesced updates and apply due animation steps."""
+        self._flush_updates()
+        self._run_animations()
+
+    def _flush_updates(self) -> None:
+        """Push the layers updated since the last refresh to Rich."""
+        for state in list(self._layer_states.values()):
+            if not state.dirty:
+                continue
+            state.dirty = False  # Before reading, so no update is missed
+            completed, details = state.completed, state.details
+
+            # Update the layer based on its type
+            if state.type == "spinner":
+                # Handle spinner layer - update details message
+                self.progress.update(state.task_id, details=details)
+            elif state.type == "steps" and 0 <= completed < len(state.steps):
+                # Handle step-based layer
+                step_progress = (
+                    f"Step {completed + 1}/{len(state.steps)}: "
+                    f"{state.steps[completed]}"
+                )
                 self.progress.update(
-                    task_id,
-                    completed=progress,
-                    description=f"{task.description} - {step_progress}",
+                    state.task_id,
+                    completed=completed,
+                    description=f"{state.description} - {step_progress}",
                     details=details,
                 )
             else:
-                self.progress.update(task_id, completed=progress, details=details)
-        elif metadata["type"] == "spinner":
-            # Handle spinner layer - update details message
-            self.progress.update(
-                task_id,
-                details=details,  # Use details consistently
-            )
-        elif metadata["type"] == "download":
-            # Handle download layer - update progress and details
-            self.progress.update(task_id, completed=progress, details=details)
-        else:
-            # Handle regular progress layer
-            self.progress.update(task_id, completed=progress, details=details)
+                # Handle regular, download and finished step layers
+                self.progress.update(
+                    state.task_id, completed=completed, details=details
+                )
 
     def complete_layer(self, layer_name: str) -> None:
         """Mark a layer as completed and animate its success.
@@ -309,6 +403,8 @@ class DynamicLayeredProgress:
         task_id = self.task_ids.get(layer_name)
         if task_id is None:
             return
+        self._flush_updates()
+        self._layer_states.pop(layer_name, None)  # Ignore late updates
 
         # Mark as completed based on layer type
         metadata = self.layer_metadata[task_id]
@@ -332,8 +428,11 @@ class DynamicLayeredProgress:
         self.completed_layers.append(layer_name)
         metadata["state"] = "completed"
 
-        # Animate success for this specific layer
-        self._animate_layer_success(task_id, metadata)
+        # Animate success for this specific layer, then remove it
+        if self.fast:
+            self._remove_layer(task_id)
+        else:
+            self._animate_layer_success(task_id, metadata)
 
         # Update main layer progress if it exists
         if self.has_main_layer:
@@ -344,53 +443,32 @@ class DynamicLayeredProgress:
         task_id: int,
         metadata: dict,  # noqa: ARG002
     ) -> None:
-        """Animate success for a specific layer and then remove it.
+        """Schedule the success animation of a layer and its removal.
 
         Args:
             task_id: Task ID to animate
             metadata: Layer metadata
         """
+        flash = self.SUCCESS_FLASH_INTERVAL
         # Flash green 2 times
-        for flash in range(2):
-            if task_id in self.progress._tasks:
-                task = self.progress._tasks[task_id]
-
-                # Clean description (remove all icons)
-                clean_description = (
-                    str(task.description)
-                    .replace("❌ ", "")
-                    .replace("⚠️ ", "")
-                    .replace("✅ ", "")
-                )
-
-                if flash % 2 == 0:  # Green flash
-                    success_description = Text(
-                        clean_description, style="bold green on green"
-                    )
-                else:  # Normal green
-                    success_description = Text(clean_description, style="bold green")
-
-                self.progress.update(
-                    task_id,
-                    description=success_description,
-                )
-
-            time.sleep(0.1)  # Quick flash
-
+        self._schedule(
+            0.0, partial(self._restyle_layer, task_id, "bold green on green")
+        )
+        self._schedule(flash, partial(self._restyle_layer, task_id, "bold green"))
         # Fade out by updating with dim style
-        if task_id in self.progress._tasks:
-            task = self.progress._tasks[task_id]
-            clean_description = (
-                str(task.description)
-                .replace("❌ ", "")
-                .replace("⚠️ ", "")
-                .replace("✅ ", "")
-            )
-            faded_description = Text(clean_description, style="dim")
-            self.progress.update(task_id, description=faded_description)
-            time.sleep(0.3)  # Brief fade out
-
+        self._schedule(2 * flash, partial(self._restyle_layer, task_id, "dim"))
         # Remove the layer after animation
+        self._schedule(
+            2 * flash + self.SUCCESS_FADE_DURATION,
+            partial(self._remove_layer, task_id),
+        )
+
+    def _remove_layer(self, task_id: int) -> None:
+        """Remove a layer and forget its metadata.
+
+        Args:
+            task_id: Task ID to remove
+        """
         if task_id in self.progress._tasks:
             self.progress.remove_task(task_id)
             if task_id in self.active_layers:
@@ -402,8 +480,65 @@ class DynamicLayeredProgress:
                 for name, tid in list(self.task_ids.items()):
                     if tid == task_id:
                         del self.task_ids[name]
+                        self._layer_states.pop(name, None)
                         break
 
+    def _restyle_layer(
+        self, task_id: int, style: str, details: Optional[Text] = None
+    ) -> None:
+        """Show a layer's description, without status icons, in a style.
+
+        Args:
+            task_id: Task ID to restyle
+            style: Rich style of the description
+            details: New details (unchanged if None)
+        """
+        task = self.progress._tasks.get(task_id)
+        if task is None:
+            return
+        # Clean description (remove all icons)
+        clean_description = (
+            str(task.description)
+            .replace("❌ ", "")
+            .replace("⚠️ ", "")
+            .replace("✅ ", "")
+        )
+        fields = {} if details is None else {"details": details}
+        self.progress.update(
+            task_id, description=Text(clean_description, style=style), **fields
+        )
+
+    # ------------------------------------------------
+    # ANIMATION SCHEDULING
+    # ------------------------------------------------
+
+    def _schedule(self, delay: float, step: Callable[[], None]) -> None:
+        """Schedule an animation step.
+
+        Args:
+            delay: Seconds from now
+            step: Callable applying the step
+        """
+        with self._animation_lock:
+            heapq.heappush(
+                self._animations,
+                (time.monotonic() + delay, next(self._animation_order), step),
+            )
+
+    def _run_animations(self, flush: bool = False) -> None:
+        """Apply due animation steps (called on every refresh).
+
+        Args:
+            flush: Apply every pending step now, in order
+        """
+        if not self._animations:
+            return
+        with self._animation_lock:
+            now = time.monotonic()
+            while self._animations and (flush or self._animations[0][0] <= now):
+                _, _, step = heapq.heappop(self._animations)
+                step()
+
     def _update_main_layer_progress(self) -> None:
         """Update main layer progress based on completed sub-layers."""
         if not self.has_main_layer or not self.main_layer_name:
@@ -411,7 +546,7 @@ class DynamicLayeredProgress:
 
         # Find main layer task
         main_task_id = None
-        for tid, metadata in self.layer_metadata.items():
+        for tid, metadata in list(self.layer_metadata.items()):
             if metadata.get("is_main", False):
                 main_task_id = tid
                 break
@@ -444,6 +579,7 @@ class DynamicLayeredProgress:
         task_id = self.task_ids.get(layer_name)
         if task_id is None:
             return
+        self._flush_updates()
 
         # Update with error styling using Rich Text objects
         if task_id in self.progress._tasks:
@@ -460,75 +596,61 @@ class DynamicLayeredProgress:
     def emergency_stop(self, error_message: str = "Critical error occurred") -> None:
         """Emergency stop all layers with animated failure effects.
 
+        Returns immediately: the display flashes red, then freezes on the
+        error state once the animation ends (at once in fast mode).
+
         Args:
             error_message: The error message to display
         """
-        if not self.progress:
+        if not self.progress or self._emergency_stopped:
+            return
+
+        self._flush_updates()
+
+        # Mark as emergency stopped
+        self._emergency_stopped = True
+        self._emergency_message = error_message
+
+        if self.fast:
+            self._freeze_on_error()
             return
 
         # Create failure animation sequence: flash red 3 times
+        details = (
+            Text(f"Stopped: {error_message}", style="red on red"),
+            Text(f"Stopped: {error_message}", style="red"),
+        )
         for flash in range(3):
-            # Apply flash effect to all active layers
             for task_id in list(self.active_layers):
-                # Check if task still exists before updating
-                if task_id in self.progress._tasks:
-                    task = self.progress._tasks[task_id]
-
-                    # Clean description (remove all icons)
-                    clean_description = (
-                        str(task.description)
-                        .replace("❌ ", "")
-                        .replace("⚠️ ", "")
-                        .replace("✅ ", "")
-                    )
-
-                    if flash % 2 == 0:  # Red flash
-                        error_description = Text(
-                            clean_description, style="bold red on red"
-                        )
-                        error_details = Text(
-                            f"Stopped: {error_message}", style="red on red"
-                        )
-                    else:  # Normal red
-                        error_description = Text(clean_description, style="bold red")
-                        error_details = Text(f"Stopped: {error_message}", style="red")
-
-                    self.progress.update(
-                        task_id,
-                        description=error_description,
-                        details=error_details,
+                if flash % 2 == 0:  # Red flash
+                    step = partial(
+                        self._restyle_layer, task_id, "bold red on red", details[0]
                     )
+                else:  # Normal red
+                    step = partial(self._restyle_layer, task_id, "bold red", details[1])
+                self._schedule(flash * self.FAILURE_FLASH_INTERVAL, step)
 
-            # Brief pause for flash effect
-            time.sleep(0.15)
+        # Final state, off the refresh thread which cannot stop its display
+        self._emergency_timer = threading.Timer(
+            3 * self.FAILURE_FLASH_INTERVAL, self._freeze_on_error
+        )
+        self._emergency_timer.start()
 
-        # Final state: settle on clean error display
+    def _freeze_on_error(self) -> None:
+        """Settle on a clean error display and stop the progress bar."""
+        self._run_animations(flush=True)
+        error_details = Text(f"Stopped: {self._emergency_message}", style="red")
         for task_id in list(self.active_layers):
-            if task_id in self.progress._tasks:
-                task = self.progress._tasks[task_id]
-
-                # Final error state (clean, no symbols)
-                clean_description = (
-                    str(task.description)
-                    .replace("❌ ", "")
-                    .replace("⚠️ ", "")
-                    .replace("✅ ", "")
-                )
-                error_description = Text(f"{clean_description}", style="bold red")
-                error_details = Text(f"Stopped: {error_message}", style="red")
-
-                self.progress.update(
-                    task_id,
-                    description=error_description,
-                    details=error_details,
-                )
+            # Final error state (clean, no symbols)
+            self._restyle_layer(task_id, "bold red", error_details)
 
         # Stop the progress bar to freeze the display
         self.progress.stop()
 
-        # Mark as emergency stopped
-        self._emergency_stopped = True
-        self._emergency_message = error_message
+    def wait_for_animations(self) -> None:
+        """Block until a pending emergency stop animation has ended."""
+        if self._emergency_timer is not None:
+            self._emergency_timer.join()
 
     def is_emergency_stopped(self) -> bool:
         """Check if the progress bar was emergency stopped.
@@ -549,9 +671,9 @@ class DynamicLayeredProgress:
     def start(self) -> None:
         """Start the progress bar and create initial layers."""
         self.progress = self._create_progress_bar()
-        self.progress.start()
 
         # Create layers in order: main layer first, then sub-layers
+        # (before starting, as Rich renders every layer on each add_task)
         if self.has_main_layer:
             # Create main layer first
             main_stage = next(
@@ -569,37 +691,38 @@ class DynamicLayeredProgress:
             for stage in self.stages:
                 self._create_layer(stage)
 
-    def stop(self, success: bool = True, show_success_animation: bool = True) -> None:
+        self.progress.start()
+
+    def stop(
+        self,
+        success: bool = True,
+        show_success_animation: bool = True,  # noqa: ARG002
+    ) -> None:
         """Stop the progress bar with appropriate animations.
 
+        Returns immediately: animations still running are fast-forwarded to
+        their final state. After an emergency stop, waits for its animation.
+
         Args:
             success: Whether this stop represents a successful completion
-            show_success_animation: Whether to show success animations
+            show_success_animation: Kept for compatibility (success
+                animations run while layers complete, not when stopping)
         """
         if not self.progress:
             return
 
-        if success and show_success_animation:
-            # SUCCESS CASE: Final cleanup for any remaining layers
-            time.sleep(0.5)
-        elif not success:
+        if self._emergency_stopped:
+            # The display freezes itself once the failure animation ends
+            self.wait_for_animations()
+            return
+
+        # SUCCESS CASE: Final cleanup for any remaining layers
+        self._flush_updates()
+        self._run_animations(flush=True)
+        if not success:
             # ERROR/WARNING CASE: Freeze current state
             for task_id in list(self.active_layers):
-                if task_id in self.progress._tasks:
-                    task = self.progress._tasks[task_id]
-                    # Clean description (remove all icons)
-                    clean_description = (
-                        str(task.description)
-                        .replace("❌ ", "")
-                        .replace("⚠️ ", "")
-                        .replace("✅ ", "")
-                    )
-                    error_description = Text(clean_description, style="bold orange")
-
-                    self.progress.update(
-                        task_id,
-                        description=error_description,
-                    )
+                self._restyle_layer(task_id, "bold orange")
 
         # Stop the underlying Rich progress
         self.progress.stop()
@@ -622,6 +745,7 @@ class DynamicProgressMixin:
         self,
         stages: list[dict[str, Any]],
         show_time: bool = True,
+        fast: Optional[bool] = None,
     ) -> Generator[DynamicLayeredProgress, None, None]:
         """
         Create a dynamic layered progress bar context manager.
@@ -637,6 +761,8 @@ class DynamicProgressMixin:
                 - 'total_size': Total size in bytes (for 'download' type)
                 - 'filename': Filename (for 'download' type)
             show_time: Whether to show elapsed and remaining time
+            fast: Skip success and failure animations (default: when the
+                console is not a terminal)
 
         Yields:
             DynamicLayeredProgress instance with methods:
@@ -658,7 +784,7 @@ class DynamicProgressMixin:
             ...     progress.complete_layer("step2")
         """
         progress_bar = DynamicLayeredProgress(
-            self._console, self._progress_prefix, stages, show_time
+            self._console, self._progress_prefix, stages, show_time, fast
         )
 
         try:
@@ -671,8 +797,9 @@ class DynamicProgressMixin:
                 is_success = True
                 progress_bar.stop(success=is_success, show_success_animation=is_success)
             else:
-                # If emergency stopped, the progress bar is already stopped
-                # Just display the emergency message
+                # Wait for the display to freeze on the error state, then
+                # display the emergency message below it
+                progress_bar.wait_for_animations()
                 emergency_msg = progress_bar.get_emergency_message()
                 if emergency_msg:
                     self._console.print(
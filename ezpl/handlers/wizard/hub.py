@@ -0,0 +1,672 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Wizard Progress Hub
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Progress hub for Rich Wizard.
+
+This module lets worker threads, asyncio tasks and worker processes report
+progress to one Rich display. Workers only update plain counters through a
+ProgressHandle; the hub, which owns the Rich Progress, pushes them to the
+display once per refresh. Worker processes (e.g., ProcessPoolExecutor
+workers) use a picklable RemoteProgressHandle, which batches its updates
+and sends them to the hub over a local socket.
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import atexit
+import contextlib
+import os
+import struct
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Optional
+
+# External libraries
+from rich.progress import (
+    BarColumn,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+
+# Internal modules
+from .dynamic import AnimatedProgress
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection, Listener
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Seconds a remote handle buffers advances before sending them
+REMOTE_FLUSH_INTERVAL = 0.1
+
+# Connections of this process to progress hubs, by (hub address, pid):
+# a forked process never reuses its parent's connection
+_CHANNELS: dict[tuple[str, int], "_RemoteChannel"] = {}
+_CHANNELS_LOCK = threading.Lock()
+_exit_hook_pid: Optional[int] = None
+
+# Remote message: task id, operation and value, then the description text
+_MESSAGE = struct.Struct("<IBd")
+_ADVANCE, _COMPLETED, _TOTAL, _DESCRIPTION = range(4)
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ProgressHandle:
+    """
+    Handle on one task of a ProgressHub.
+
+    Updates only set plain attributes (advance() takes a short lock), so
+    handles can be shared by threads and called from asyncio tasks.
+    """
+
+    __slots__ = (
+        "_hub",
+        "_lock",
+        "task_id",
+        "completed",
+        "total",
+        "description",
+        "dirty",
+    )
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        hub: "ProgressHub",
+        task_id: int,
+        description: str,
+        total: Optional[float],
+    ) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            hub: Hub owning the task
+            task_id: Rich task ID
+            description: Task description
+            total: Total amount of work (None for indeterminate)
+        """
+        self._hub = hub
+        self._lock = threading.Lock()
+        self.task_id = task_id
+        self.completed = 0.0
+        self.total = total
+        self.description = description
+        self.dirty = False
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def advance(self, n: float = 1) -> None:
+        """
+        Advance the task.
+
+        Args:
+            n: Amount of work done
+        """
+        with self._lock:
+            self.completed += n
+        self.dirty = True
+
+    def update(
+        self,
+        completed: Optional[float] = None,
+        total: Optional[float] = None,
+        description: Optional[str] = None,
+    ) -> None:
+        """
+        Set the task's progress, total or description.
+
+        Args:
+            completed: Amount of work done
+            total: Total amount of work
+            description: Task description
+        """
+        if completed is not None:
+            with self._lock:
+                self.completed = completed
+        if total is not None:
+            self.total = total
+        if description is not None:
+            self.description = description
+        self.dirty = True
+
+    def remote(self) -> "RemoteProgressHandle":
+        """
+        Get a handle usable from worker processes.
+
+        Returns:
+            Picklable RemoteProgressHandle on the same task
+        """
+        return self._hub._remote_handle(self.task_id)
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the handle."""
+        return (
+            f"ProgressHandle(task_id={self.task_id}, "
+            f"completed={self.completed}, total={self.total})"
+        )
+
+
+class RemoteProgressHandle:
+    """
+    Handle on a ProgressHub task for worker processes.
+
+    The handle pickles to the hub's address, auth key and task ID. All the
+    handles of a process share one connection to the hub, opened on first
+    use. Advances are added up locally and sent at most every
+    REMOTE_FLUSH_INTERVAL seconds; what is still buffered is sent by
+    flush(), close() (also called when leaving a ``with`` block) and when
+    the process exits. If the hub is unreachable, updates are dropped.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, address: str, authkey: bytes, task_id: int) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            address: Hub address
+            authkey: Hub auth key
+            task_id: Rich task ID
+        """
+        self._address = address
+        self._authkey = authkey
+        self.task_id = task_id
+
+    def __getstate__(self) -> tuple[str, bytes, int]:
+        """Pickle the hub address only (not the connection)."""
+        return self._address, self._authkey, self.task_id
+
+    def __setstate__(self, state: tuple[str, bytes, int]) -> None:
+        """Rebuild the handle in the receiving process."""
+        self.__init__(*state)
+
+    # ///////////////////////////////////////////////////////////////
+    # UTILS METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def advance(self, n: float = 1) -> None:
+        """
+        Advance the task (sent with the next batch).
+
+        Args:
+            n: Amount of work done
+        """
+        _channel(self._address, self._authkey).advance(self.task_id, n)
+
+    def update(
+        self,
+        completed: Optional[float] = None,
+        total: Optional[float] = None,
+        description: Optional[str] = None,
+    ) -> None:
+        """
+        Set the task's progress, total or description (sent at once).
+
+        Args:
+            completed: Amount of work done
+            total: Total amount of work
+            description: Task description
+        """
+        _channel(self._address, self._authkey).update(
+            self.task_id, completed, total, description
+        )
+
+    def flush(self) -> None:
+        """Send the advances not sent yet."""
+        _channel(self._address, self._authkey).flush()
+
+    def close(self) -> None:
+        """
+        Send the advances not sent yet.
+
+        The process's connection to the hub stays open for its other
+        handles; it is closed when the process exits.
+        """
+        self.flush()
+
+    # ///////////////////////////////////////////////////////////////
+    # SPECIAL METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __enter__(self) -> "RemoteProgressHandle":
+        """Use the handle for a unit of work."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Send what is still buffered."""
+        self.close()
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the handle."""
+        return f"RemoteProgressHandle(address={self._address}, task_id={self.task_id})"
+
+
+class _RemoteChannel:
+    """
+    Connection of one process to a ProgressHub.
+
+    Shared by the process's remote handles on that hub: one connection
+    (so one reader thread in the hub) per process, and one batch of
+    pending advances per task.
+    """
+
+    def __init__(self, address: str, authkey: bytes) -> None:
+        """
+        Initialize the channel (connected on first send).
+
+        Args:
+            address: Hub address
+            authkey: Hub auth key
+        """
+        self.address = address
+        self.authkey = authkey
+        self.connection: Optional[Connection] = None
+        self.lock = threading.Lock()
+        self.pending: dict[int, float] = {}
+        # The first advance is sent at once, later ones in batches
+        self.sent_at = 0.0
+
+    def advance(self, task_id: int, n: float) -> None:
+        """Add an advance to the task's batch, sending due batches."""
+        with self.lock:
+            self.pending[task_id] = self.pending.get(task_id, 0.0) + n
+            if time.monotonic() - self.sent_at >= REMOTE_FLUSH_INTERVAL:
+                self._flush()
+
+    def update(
+        self,
+        task_id: int,
+        completed: Optional[float],
+        total: Optional[float],
+        description: Optional[str],
+    ) -> None:
+        """Send a task update, after the task's pending advances."""
+        with self.lock:
+            if completed is not None:
+                self.pending.pop(task_id, None)  # Superseded
+                self._send(task_id, _COMPLETED, completed)
+            else:
+                self._flush()
+            if total is not None:
+                self._send(task_id, _TOTAL, total)
+            if description is not None:
+                self._send(task_id, _DESCRIPTION, 0.0, description)
+
+    def flush(self) -> None:
+        """Send the pending advances of every task."""
+        with self.lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Flush and disconnect from the hub."""
+        with self.lock:
+            self._flush()
+            if self.connection is not None:
+                with contextlib.suppress(OSError):
+                    self.connection.close()
+                self.connection = None
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _flush(self) -> None:
+        """Send pending advances (lock held)."""
+        self.sent_at = time.monotonic()
+        pending, self.pending = self.pending, {}
+        for task_id, value in pending.items():
+            if value:
+                self._send(task_id, _ADVANCE, value)
+
+    def _send(self, task_id: int, operation: int, value: float, text: str = "") -> None:
+        """Send one message, connecting first if needed (lock held)."""
+        from multiprocessing.connection import Client
+
+        message = _MESSAGE.pack(task_id, operation, value) + text.encode("utf-8")
+        try:
+            if self.connection is None:
+                connection = Client(self.address, authkey=self.authkey)
+                connection.recv_bytes()  # Wait until the hub reads this worker
+                self.connection = connection
+            self.connection.send_bytes(message)
+        except Exception:
+            self.connection = None  # Hub gone: drop the update
+
+
+class ProgressHub:
+    """
+    Single Rich progress display fed by many workers.
+
+    The hub owns the Rich Progress and its refresh thread. Tasks are added
+    with add_task(), which returns a ProgressHandle; on every refresh, the
+    hub pushes the handles updated since the previous one to Rich.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        console,
+        progress_prefix: str = "",
+        show_time: bool = True,
+        transient: bool = False,
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            console: Rich Console instance
+            progress_prefix: Prefix string for progress bars
+            show_time: Whether to show elapsed and remaining time
+            transient: Whether to clear the display when stopped
+        """
+        # Set before the Progress, which may refresh while built
+        self._handles: dict[int, ProgressHandle] = {}
+        self._lock = threading.Lock()
+
+        # Remote handles (created on first use)
+        self._listener: Optional[Listener] = None
+        self._authkey = b""
+        self._readers: list[threading.Thread] = []
+        self._closing = False
+
+        columns = [
+            TextColumn(progress_prefix),
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+        ]
+        if show_time:
+            columns.extend([TimeElapsedColumn(), TimeRemainingColumn()])
+        self.progress = AnimatedProgress(
+            *columns, console=console, transient=transient, on_refresh=self.sync
+        )
+
+    # ///////////////////////////////////////////////////////////////
+    # TASK METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def add_task(
+        self, description: str, total: Optional[float] = None
+    ) -> ProgressHandle:
+        """
+        Add a task to the display.
+
+        Args:
+            description: Task description
+            total: Total amount of work (None for indeterminate)
+
+        Returns:
+            ProgressHandle workers report to
+        """
+        task_id = self.progress.add_task(description, total=total)
+        handle = ProgressHandle(self, task_id, description, total)
+        with self._lock:
+            self._handles[task_id] = handle
+        return handle
+
+    def sync(self) -> None:
+        """Push the handles updated since the last refresh to Rich."""
+        for handle in list(self._handles.values()):
+            if not handle.dirty:
+                continue
+            handle.dirty = False  # Before reading, so no update is missed
+            self.progress.update(
+                handle.task_id,
+                completed=handle.completed,
+                total=handle.total,
+                description=handle.description,
+            )
+
+    # ///////////////////////////////////////////////////////////////
+    # LIFECYCLE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def start(self) -> None:
+        """Start the display."""
+        self.progress.start()
+
+    def stop(self) -> None:
+        """Apply every update received so far and stop the display."""
+        if self._listener is not None:
+            # Remote handles used by this process send their last advances
+            _close_channels(str(self._listener.address))
+            with self._lock:
+                self._closing = True
+            with contextlib.suppress(OSError):
+                self._listener.close()
+            for reader in self._readers:
+                reader.join()  # Readers drain their connection, then exit
+        self.sync()
+        self.progress.stop()
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _remote_handle(self, task_id: int) -> RemoteProgressHandle:
+        """Get a remote handle, listening for workers on first use."""
+        with self._lock:
+            if self._listener is None:
+                from multiprocessing.connection import Listener
+
+                self._authkey = os.urandom(32)
+                self._listener = Listener(authkey=self._authkey)
+                threading.Thread(
+                    target=self._accept, name="ezpl-progress-hub", daemon=True
+                ).start()
+        return RemoteProgressHandle(str(self._listener.address), self._authkey, task_id)
+
+    def _accept(self) -> None:
+        """Accept thread: start a reader thread per worker process."""
+        listener = self._listener
+        while not self._closing:
+            try:
+                connection = listener.accept()
+            except Exception:
+                if self._closing:
+                    return
+                continue  # Failed handshake (wrong key, worker gone)
+            with self._lock:
+                if self._closing:
+                    connection.close()
+                    return
+                reader = threading.Thread(
+                    target=self._read,
+                    args=(connection,),
+                    name="ezpl-progress-hub-reader",
+                    daemon=True,
+                )
+                self._readers.append(reader)
+                reader.start()
+            # Acknowledge once registered: stop() drains what follows
+            with contextlib.suppress(OSError):
+                connection.send_bytes(b"")
+
+    def _read(self, connection: "Connection") -> None:
+        """Reader thread: apply remote updates until the worker leaves."""
+        try:
+            while True:
+                if not connection.poll(0.05):
+                    if self._closing:
+                        return  # Nothing left in the socket
+                    continue
+                message = connection.recv_bytes()
+                task_id, operation, value = _MESSAGE.unpack_from(message)
+                handle = self._handles.get(task_id)
+                if handle is None:
+                    continue
+                if operation == _ADVANCE:
+                    handle.advance(value)
+                elif operation == _COMPLETED:
+                    handle.update(completed=value)
+                elif operation == _TOTAL:
+                    handle.update(total=value)
+                elif operation == _DESCRIPTION:
+                    text = message[_MESSAGE.size :].decode("utf-8", "replace")
+                    handle.update(description=text)
+        except (EOFError, OSError):
+            pass  # Worker exited
+        finally:
+            with contextlib.suppress(OSError):
+                connection.close()
+
+    # ///////////////////////////////////////////////////////////////
+    # SPECIAL METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __enter__(self) -> "ProgressHub":
+        """Start the display."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the display."""
+        self.stop()
+
+    # ///////////////////////////////////////////////////////////////
+    # REPRESENTATION METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the hub."""
+        return f"ProgressHub(tasks={len(self._handles)})"
+
+
+class ProgressHubMixin:
+    """
+    Mixin providing the progress hub method for RichWizard.
+
+    This mixin adds a progress display that worker threads, asyncio tasks
+    and worker processes report to through handles.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # PROGRESS HUB METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    @contextmanager
+    def progress_hub(
+        self,
+        show_time: bool = True,
+        transient: bool = False,
+    ) -> Generator[ProgressHub, None, None]:
+        """
+        Create a progress display fed by parallel workers.
+
+        Args:
+            show_time: Whether to show elapsed and remaining time
+            transient: Whether to clear the display on exit
+
+        Yields:
+            ProgressHub instance; add_task(description, total) returns a
+            ProgressHandle for threads and asyncio tasks, and
+            handle.remote() a picklable handle for worker processes
+
+        Example:
+            >>> with printer.wizard.progress_hub() as hub:
+            ...     files = hub.add_task("Hashing", total=len(paths))
+            ...     with ThreadPoolExecutor() as pool:
+            ...         for path in paths:
+            ...             pool.submit(hash_file, path, files)  # files.advance()
+            ...     remote = hub.add_task("Encoding", total=len(chunks)).remote()
+            ...     with ProcessPoolExecutor() as pool:
+            ...         list(pool.map(encode, chunks, repeat(remote)))
+
+            where each worker reports through the handle it received:
+
+            >>> def encode(chunk, remote):
+            ...     with remote:  # Sends the buffered advances on exit
+            ...         for block in chunk:
+            ...             ...
+            ...             remote.advance()
+        """
+        hub = ProgressHub(self._console, self._progress_prefix, show_time, transient)
+        with hub:
+            yield hub
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _channel(address: str, authkey: bytes) -> _RemoteChannel:
+    """
+    Get this process's channel to a hub, creating it on first use.
+
+    Args:
+        address: Hub address
+        authkey: Hub auth key
+
+    Returns:
+        The channel shared by the process's handles on this hub
+    """
+    global _exit_hook_pid
+
+    pid = os.getpid()
+    channel = _CHANNELS.get((address, pid))
+    if channel is not None:
+        return channel
+    with _CHANNELS_LOCK:
+        channel = _CHANNELS.get((address, pid))
+        if channel is None:
+            channel = _CHANNELS[(address, pid)] = _RemoteChannel(address, authkey)
+        if _exit_hook_pid != pid:
+            _exit_hook_pid = pid
+            # atexit does not run in multiprocessing children, their
+            # finalizers do
+            from multiprocessing.util import Finalize
+
+            atexit.register(_close_channels)
+            Finalize(None, _close_channels, exitpriority=0)
+    return channel
+
+
+def _close_channels(address: Optional[str] = None) -> None:
+    """
+    Flush and close this process's channels.
+
+    Args:
+        address: Only close the channel to this hub (default: all)
+    """
+    pid = os.getpid()
+    with _CHANNELS_LOCK:
+        channels = [
+            _CHANNELS.pop(key)
+            for key in list(_CHANNELS)
+            if key[1] == pid and address in (None, key[0])
+        ]
+    for channel in channels:
+        channel.close()
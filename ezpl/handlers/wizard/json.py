@@ -13,7 +13,8 @@ This module provides JSON display functionality for the RichWizard class.
 # ///////////////////////////////////////////////////////////////
 # Base imports
 import json
-from typing import Optional, Union
+from itertools import islice
+from typing import Any, Optional, Union
 
 # External libraries
 from rich.json import JSON
@@ -22,6 +23,16 @@ from rich.panel import Panel
 # Internal modules
 from ..utils import safe_str_convert
 
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Largest payload (compact JSON characters) highlighted and pretty-printed;
+# Rich's highlighter costs about 10 µs per character
+JSON_HIGHLIGHT_MAX_SIZE = 50_000
+
+# Characters written at a time when streaming large payloads
+_STREAM_CHUNK_SIZE = 65_536
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
@@ -31,7 +42,8 @@ class JsonMixin:
     Mixin providing JSON display methods for RichWizard.
 
     This mixin adds JSON display functionality with syntax highlighting
-    and optional panel wrapping.
+    and optional panel wrapping. Payloads above a size threshold are
+    written without highlighting, so display time stays bounded.
     """
 
     # ///////////////////////////////////////////////////////////////
@@ -44,41 +56,68 @@ class JsonMixin:
         title: Optional[str] = None,
         indent: Optional[int] = None,
         highlight: bool = True,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_string: Optional[int] = None,
+        max_size: Optional[int] = None,
     ) -> None:
         """
         Display JSON data in a formatted and syntax-highlighted way using Rich.
 
+        Payloads larger than max_size characters (as compact JSON) are not
+        highlighted: lists are streamed one compact item per line, and
+        other values are written as compact JSON.
+
         Args:
             data: JSON data to display (dict, list, or JSON string)
             title: Optional title for the JSON display
             indent: Number of spaces for indentation (default: 2)
             highlight: Whether to enable syntax highlighting (default: True)
+            max_depth: Nesting depth below which containers are elided
+            max_items: Maximum items shown per list or dict
+            max_string: Maximum characters shown per string
+            max_size: Largest payload highlighted and pretty-printed
+                (default: JSON_HIGHLIGHT_MAX_SIZE)
 
         Examples:
             >>> wizard.json({"name": "Alice", "age": 30})
             >>> wizard.json('{"key": "value"}', title="Config")
             >>> wizard.json([1, 2, 3], indent=4)
+            >>> wizard.json(events, max_items=20, max_string=200)
         """
+        if max_size is None:
+            max_size = JSON_HIGHLIGHT_MAX_SIZE
         try:
-            # Convert data to JSON string if needed
+            limited = any(
+                limit is not None for limit in (max_depth, max_items, max_string)
+            )
             if isinstance(data, str):
-                # Try to parse and re-format for consistency
-                try:
-                    parsed = json.loads(data)
-                    json_str = json.dumps(
-                        parsed, indent=indent or 2, ensure_ascii=False
-                    )
-                except json.JSONDecodeError:
-                    # If invalid JSON, use as-is
-                    json_str = data
+                if len(data) > max_size and not limited:
+                    # Already serialized: write it as-is rather than parse it
+                    self._json_title(title)
+                    self._console.out(data, highlight=False)
+                    return
+                # Invalid JSON is shown raw by the fallback below
+                data = json.loads(data)
+
+            if limited:
+                data = _elide(data, max_depth, max_items, max_string)
+
+            if isinstance(data, list):
+                encoded = _encode_items(data, max_size)
+                if encoded is not None:
+                    self._json_title(title)
+                    self._json_stream_list(data, encoded, indent or 2)
+                    return
             else:
-                # Convert dict/list to JSON string
-                json_str = json.dumps(data, indent=indent or 2, ensure_ascii=False)
+                compact = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+                if len(compact) > max_size:
+                    self._json_title(title)
+                    self._console.out(compact, highlight=False)
+                    return
 
-            # Create Rich JSON object
-            rich_json = JSON(
-                json_str, indent_guides=indent is not None, highlight=highlight
-            )
+            # Small payload: pretty-print and highlight, without re-parsing
+            rich_json = JSON.from_data(data, indent=indent or 2, highlight=highlight)
 
             # Display with optional title
             if title:
@@ -103,3 +142,117 @@ class JsonMixin:
                 self._console.print(f"[dim]Raw data:[/dim] {safe_str_convert(data)}")
             except Exception as e:
                 raise ValueError(f"Failed to display JSON: {e}") from e
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _json_title(self, title: Optional[str]) -> None:
+        """Print the title of an unhighlighted payload (no panel)."""
+        if title:
+            self._console.print(f"[bold blue]{title}[/bold blue]")
+
+    def _json_stream_list(self, items: list, encoded: list[str], indent: int) -> None:
+        """
+        Write a large list one compact item per line, chunk by chunk.
+
+        Args:
+            items: List to write
+            encoded: Compact JSON of the first items (already computed)
+            indent: Number of spaces before each item
+        """
+        pad = " " * indent
+        last = len(items) - 1
+        chunk = ["["]
+        size = 1
+        for index, item in enumerate(items):
+            if index < len(encoded):
+                text = encoded[index]
+            else:
+                text = json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+            line = pad + text + ("," if index < last else "")
+            chunk.append(line)
+            size += len(line) + 1
+            if size >= _STREAM_CHUNK_SIZE:
+                self._console.out("\n".join(chunk), highlight=False)
+                chunk, size = [], 0
+        chunk.append("]")
+        self._console.out("\n".join(chunk), highlight=False)
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _encode_items(items: list, max_size: int) -> Optional[list[str]]:
+    """
+    Encode list items until their size exceeds max_size.
+
+    Args:
+        items: List to measure
+        max_size: Size threshold, in characters
+
+    Returns:
+        Compact JSON of the items encoded so far if the list is larger
+        than max_size, else None
+    """
+    encoded = []
+    size = 2
+    for item in items:
+        text = json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+        encoded.append(text)
+        size += len(text) + 1
+        if size > max_size:
+            return encoded
+    return None
+
+
+def _elide(
+    value: Any,
+    max_depth: Optional[int],
+    max_items: Optional[int],
+    max_string: Optional[int],
+    depth: int = 0,
+) -> Any:
+    """
+    Copy a JSON value, replacing what exceeds the limits with markers.
+
+    Only the parts kept are visited, so the cost depends on the limits,
+    not on the size of the value.
+
+    Args:
+        value: JSON value
+        max_depth: Nesting depth below which containers are elided
+        max_items: Maximum items kept per list or dict
+        max_string: Maximum characters kept per string
+        depth: Depth of the value
+
+    Returns:
+        The elided copy
+    """
+    if isinstance(value, dict):
+        if max_depth is not None and depth >= max_depth and value:
+            return f"{{… {len(value)} keys}}"
+        items = value.items()
+        if max_items is not None:
+            items = islice(items, max_items)
+        result = {
+            key: _elide(item, max_depth, max_items, max_string, depth + 1)
+            for key, item in items
+        }
+        if max_items is not None and len(value) > max_items:
+            result["…"] = f"{len(value) - max_items} more keys"
+        return result
+    if isinstance(value, (list, tuple)):
+        if max_depth is not None and depth >= max_depth and value:
+            return f"[… {len(value)} items]"
+        kept = value if max_items is None else value[:max_items]
+        result = [
+            _elide(item, max_depth, max_items, max_string, depth + 1) for item in kept
+        ]
+        if max_items is not None and len(value) > max_items:
+            result.append(f"… {len(value) - max_items} more items")
+        return result
+    if isinstance(value, str) and max_string is not None and len(value) > max_string:
+        return f"{value[:max_string]}… ({len(value) - max_string} more characters)"
+    return value
@@ -13,7 +13,8 @@ This module provides all progress bar-related methods for the RichWizard class.
 # ///////////////////////////////////////////////////////////////
 # Base imports
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from typing import Any, Optional
 
@@ -32,6 +33,12 @@ from rich.progress import (
 
 # Internal modules
 
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Seconds each item takes with simulate=True (demo behavior)
+SIMULATED_STEP_DELAY = 0.1
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
@@ -212,24 +219,42 @@ class ProgressMixin:
 
     @contextmanager
     def dependency_progress(
-        self, dependencies: list[str], description: str = "Installing dependencies..."
-    ) -> Generator[tuple[Progress, int, str], None, None]:
+        self,
+        dependencies: Iterable[str],
+        description: str = "Installing dependencies...",
+        *,
+        action: Optional[Callable[[str], Any]] = None,
+        max_workers: int = 1,
+        simulate: bool = False,
+    ) -> Generator[tuple[Progress, int, Any], None, None]:
         """
         Create a progress bar for dependency installation.
 
         Args:
-            dependencies: list of dependency names
+            dependencies: Dependency names
             description: Main description
+            action: Called as action(dependency) for each dependency; the bar
+                advances as each call returns
+            max_workers: Number of threads running actions concurrently
+            simulate: Pause SIMULATED_STEP_DELAY after each dependency (demo)
 
         Yields:
-            tuple of (Progress, task_id, dependency_name) for each dependency
+            tuple of (Progress, task_id, results) with action results in
+            dependency order when an action is given, else (Progress,
+            task_id, dependencies) where iterating dependencies shows each
+            one and advances the bar once the loop body is done with it
 
         Example:
             >>> deps = ["package1", "package2", "package3"]
-            >>> with printer.wizard.dependency_progress(deps) as (progress, task, dep):
-            ...     # Install dependency
-            ...     progress.advance(task)
+            >>> with printer.wizard.dependency_progress(
+            ...     deps, action=pip_install, max_workers=4
+            ... ) as (progress, task, results):
+            ...     pass
+            >>> with printer.wizard.dependency_progress(deps) as (progress, task, items):
+            ...     for dependency in items:
+            ...         pip_install(dependency)
         """
+        dependencies = list(dependencies)
         progress = Progress(
             TextColumn(self._progress_prefix),
             SpinnerColumn(),
@@ -253,38 +278,55 @@ class ProgressMixin:
                 dependency="",
             )
 
-            for i, dependency in enumerate(dependencies):
-                progress.update(
-                    task,
-                    description=f"[bold green]Installing {dependency}",
-                    current=i + 1,
-                    dependency=dependency,
+            def fields(index: int, dependency: str) -> dict[str, Any]:
+                return {
+                    "description": f"[bold green]Installing {dependency}",
+                    "current": index + 1,
+                    "dependency": dependency,
+                }
+
+            if action is not None:
+                yield progress, task, self._run_actions(
+                    progress, task, dependencies, action, fields, max_workers
                 )
-                yield progress, task, dependency
-                progress.advance(task)
-                time.sleep(0.1)
+                return
+
+            yield progress, task, self._track_items(
+                progress, task, dependencies, fields, simulate
+            )
 
     @contextmanager
     def package_install_progress(
         self,
-        packages: list[tuple[str, str]],
+        packages: Iterable[tuple[str, str]],
         description: str = "Installing packages...",
-    ) -> Generator[tuple[Progress, int, str, str], None, None]:
+        *,
+        action: Optional[Callable[[str, str], Any]] = None,
+        max_workers: int = 1,
+        simulate: bool = False,
+    ) -> Generator[tuple[Progress, int, Any], None, None]:
         """
         Create a progress bar for package installation with version info.
 
         Args:
-            packages: list of tuples (package_name, version)
+            packages: Tuples (package_name, version)
             description: Main description
+            action: Called as action(package_name, version) for each package;
+                the bar advances as each call returns
+            max_workers: Number of threads running actions concurrently
+            simulate: Pause SIMULATED_STEP_DELAY after each package (demo)
 
         Yields:
-            tuple of (Progress, task_id, package_name, version) for each package
+            tuple of (Progress, task_id, results) with action results in
+            package order when an action is given, else (Progress, task_id,
+            packages) where iterating packages shows each (package_name,
+            version) and advances the bar once the loop body is done with it
 
         Example:
             >>> packages = [("requests", "2.31.0"), ("click", "8.1.0")]
-            >>> with printer.wizard.package_install_progress(packages) as (progress, task, pkg, ver):
-            ...     # Install package
-            ...     progress.advance(task)
+            >>> with printer.wizard.package_install_progress(packages) as (progress, task, items):
+            ...     for package_name, version in items:
+            ...         pip_install(f"{package_name}=={version}")
         """
         progress = Progress(
             TextColumn(self._progress_prefix),
@@ -301,6 +343,7 @@ class ProgressMixin:
             console=self._console,
         )
 
+        packages = list(packages)
         with progress:
             task = progress.add_task(
                 description,
@@ -311,17 +354,28 @@ class ProgressMixin:
                 version="",
             )
 
-            for i, (package_name, version) in enumerate(packages):
-                progress.update(
+            def fields(index: int, package: tuple[str, str]) -> dict[str, Any]:
+                return {
+                    "description": f"[bold cyan]Installing {package[0]}",
+                    "current": index + 1,
+                    "package": package[0],
+                    "version": package[1],
+                }
+
+            if action is not None:
+                yield progress, task, self._run_actions(
+                    progress,
                     task,
-                    description=f"[bold cyan]Installing {package_name}",
-                    current=i + 1,
-                    package=package_name,
-                    version=version,
+                    packages,
+                    lambda package: action(*package),
+                    fields,
+                    max_workers,
                 )
-                yield progress, task, package_name, version
-                progress.advance(task)
-                time.sleep(0.1)
+                return
+
+            yield progress, task, self._track_items(
+                progress, task, packages, fields, simulate
+            )
 
     @contextmanager
     def step_progress(
@@ -429,24 +483,35 @@ class ProgressMixin:
     @contextmanager
     def installation_progress(
         self,
-        steps: list[tuple[str, str]],
+        steps: Iterable[tuple[str, str]],
         description: str = "Installation in progress...",
-    ) -> Generator[tuple[Progress, int, str, str], None, None]:
+        *,
+        action: Optional[Callable[[str, str], Any]] = None,
+        max_workers: int = 1,
+        simulate: bool = False,
+    ) -> Generator[tuple[Progress, int, Any], None, None]:
         """
         Create a progress bar for installation processes with step details.
 
         Args:
-            steps: list of tuples (step_name, step_description)
+            steps: Tuples (step_name, step_description)
             description: Main description
+            action: Called as action(step_name, step_description) for each
+                step; the bar advances as each call returns
+            max_workers: Number of threads running actions concurrently
+            simulate: Pause SIMULATED_STEP_DELAY after each step (demo)
 
         Yields:
-            tuple of (Progress, task_id, step_name, step_description) for each step
+            tuple of (Progress, task_id, results) with action results in step
+            order when an action is given, else (Progress, task_id, steps)
+            where iterating steps shows each (step_name, step_description)
+            and advances the bar once the loop body is done with it
 
         Example:
             >>> steps = [("Init", "Initializing..."), ("Install", "Installing...")]
-            >>> with printer.wizard.installation_progress(steps) as (progress, task, name, desc):
-            ...     # Process step
-            ...     progress.advance(task)
+            >>> with printer.wizard.installation_progress(steps) as (progress, task, items):
+            ...     for name, detail in items:
+            ...         run_step(name)
         """
         progress = Progress(
             TextColumn(self._progress_prefix),
@@ -460,6 +525,7 @@ class ProgressMixin:
             console=self._console,
         )
 
+        steps = list(steps)
         with progress:
             task = progress.add_task(
                 description,
@@ -469,21 +535,32 @@ class ProgressMixin:
                 step_detail="",
             )
 
-            for i, (step_name, step_detail) in enumerate(steps):
-                progress.update(
+            def fields(index: int, step: tuple[str, str]) -> dict[str, Any]:
+                return {
+                    "description": f"[bold green]{step[0]}",
+                    "step": index + 1,
+                    "step_detail": step[1],
+                }
+
+            if action is not None:
+                yield progress, task, self._run_actions(
+                    progress,
                     task,
-                    description=f"[bold green]{step_name}",
-                    step=i + 1,
-                    step_detail=step_detail,
+                    steps,
+                    lambda step: action(*step),
+                    fields,
+                    max_workers,
                 )
-                yield progress, task, step_name, step_detail
-                progress.advance(task)
-                time.sleep(0.1)
+                return
+
+            yield progress, task, self._track_items(
+                progress, task, steps, fields, simulate
+            )
 
     @contextmanager
     def build_progress(
         self, phases: list[tuple[str, int]], description: str = "Building project..."
-    ) -> Generator[tuple[Progress, int, str, int], None, None]:
+    ) -> Generator[tuple[Progress, int, Iterator[tuple[str, int]]], None, None]:
         """
         Create a progress bar for build processes with weighted phases.
 
@@ -492,13 +569,15 @@ class ProgressMixin:
             description: Main description
 
         Yields:
-            tuple of (Progress, task_id, phase_name, weight) for each phase
+            tuple of (Progress, task_id, phases) where iterating phases shows
+            each (phase_name, weight) and adds its weight to the bar once the
+            loop body is done with it
 
         Example:
             >>> phases = [("Compile", 40), ("Test", 30), ("Package", 30)]
-            >>> with printer.wizard.build_progress(phases) as (progress, task, phase, weight):
-            ...     # Process phase
-            ...     progress.update(task, advance=weight)
+            >>> with printer.wizard.build_progress(phases) as (progress, task, items):
+            ...     for phase, weight in items:
+            ...         run_phase(phase)
         """
         progress = Progress(
             TextColumn(self._progress_prefix),
@@ -515,32 +594,48 @@ class ProgressMixin:
         with progress:
             task = progress.add_task(description, total=100, current_phase="")
 
-            current_progress = 0
-            for phase_name, weight in phases:
-                progress.update(task, current_phase=phase_name)
-                yield progress, task, phase_name, weight
-                current_progress += weight
-                progress.update(task, completed=current_progress)
+            def track() -> Iterator[tuple[str, int]]:
+                current_progress = 0
+                for phase_name, weight in phases:
+                    progress.update(task, current_phase=phase_name)
+                    yield phase_name, weight
+                    current_progress += weight
+                    progress.update(task, completed=current_progress)
+
+            yield progress, task, track()
 
     @contextmanager
     def deployment_progress(
-        self, stages: list[str], description: str = "Deploying..."
-    ) -> Generator[tuple[Progress, int, str], None, None]:
+        self,
+        stages: Iterable[str],
+        description: str = "Deploying...",
+        *,
+        action: Optional[Callable[[str], Any]] = None,
+        max_workers: int = 1,
+        simulate: bool = False,
+    ) -> Generator[tuple[Progress, int, Any], None, None]:
         """
         Create a progress bar for deployment processes.
 
         Args:
-            stages: list of deployment stage names
+            stages: Deployment stage names
             description: Main description
+            action: Called as action(stage) for each stage; the bar advances
+                as each call returns
+            max_workers: Number of threads running actions concurrently
+            simulate: Pause SIMULATED_STEP_DELAY after each stage (demo)
 
         Yields:
-            tuple of (Progress, task_id, stage_name) for each stage
+            tuple of (Progress, task_id, results) with action results in stage
+            order when an action is given, else (Progress, task_id, stages)
+            where iterating stages shows each one and advances the bar once
+            the loop body is done with it
 
         Example:
             >>> stages = ["Build", "Test", "Deploy"]
-            >>> with printer.wizard.deployment_progress(stages) as (progress, task, stage):
-            ...     # Process stage
-            ...     progress.advance(task)
+            >>> with printer.wizard.deployment_progress(stages) as (progress, task, items):
+            ...     for stage in items:
+            ...         run_stage(stage)
         """
         progress = Progress(
             TextColumn(self._progress_prefix),
@@ -555,6 +650,7 @@ class ProgressMixin:
             console=self._console,
         )
 
+        stages = list(stages)
         with progress:
             task = progress.add_task(
                 description,
@@ -564,16 +660,22 @@ class ProgressMixin:
                 current_stage="",
             )
 
-            for i, stage in enumerate(stages):
-                progress.update(
-                    task,
-                    description=f"[bold magenta]{stage}",
-                    stage=i + 1,
-                    current_stage=stage,
+            def fields(index: int, stage: str) -> dict[str, Any]:
+                return {
+                    "description": f"[bold magenta]{stage}",
+                    "stage": index + 1,
+                    "current_stage": stage,
+                }
+
+            if action is not None:
+                yield progress, task, self._run_actions(
+                    progress, task, stages, action, fields, max_workers
                 )
-                yield progress, task, stage
-                progress.advance(task)
-                time.sleep(0.1)
+                return
+
+            yield progress, task, self._track_items(
+                progress, task, stages, fields, simulate
+            )
 
     @contextmanager
     def layered_progress(
@@ -657,3 +759,86 @@ class ProgressMixin:
                 task_ids[layer_name] = task_id
 
             yield progress, task_ids
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    @staticmethod
+    def _track_items(
+        progress: Progress,
+        task: int,
+        items: list[Any],
+        fields: Callable[[int, Any], dict[str, Any]],
+        simulate: bool,
+    ) -> Iterator[Any]:
+        """
+        Yield every item, advancing the task once the caller is done with it.
+
+        Args:
+            progress: Progress displaying the task
+            task: Task ID
+            items: Items to yield
+            fields: Builds the task fields shown for (position, item)
+            simulate: Pause SIMULATED_STEP_DELAY after each item (demo)
+
+        Yields:
+            Each item, after the task shows it
+        """
+        for index, item in enumerate(items):
+            progress.update(task, **fields(index, item))
+            yield item
+            progress.advance(task)
+            if simulate:
+                time.sleep(SIMULATED_STEP_DELAY)
+
+    @staticmethod
+    def _run_actions(
+        progress: Progress,
+        task: int,
+        items: list[Any],
+        action: Callable[[Any], Any],
+        fields: Callable[[int, Any], dict[str, Any]],
+        max_workers: int,
+    ) -> list[Any]:
+        """
+        Run an action on every item, advancing the task as each call returns.
+
+        Args:
+            progress: Progress displaying the task
+            task: Task ID
+            items: Items to run the action on
+            action: Callable run on each item
+            fields: Builds the task fields shown for (position, item)
+            max_workers: Number of threads running actions concurrently
+
+        Returns:
+            Action results, in item order
+
+        Raises:
+            Exception: The first exception raised by an action (items not
+                started yet are cancelled)
+        """
+        if max_workers <= 1:
+            results = []
+            for index, item in enumerate(items):
+                progress.update(task, **fields(index, item))
+                results.append(action(item))
+                progress.advance(task)
+            return results
+
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = {
+                executor.submit(action, item): index for index, item in enumerate(items)
+            }
+            try:
+                # Show the item that completed last
+                for done, future in enumerate(as_completed(futures)):
+                    index = futures[future]
+                    results[index] = future.result()
+                    progress.update(task, advance=1, **fields(done, items[index]))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        return results
@@ -12,13 +12,28 @@ This module provides all table-related methods for the RichWizard class.
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Base imports
-from typing import Any, Optional
+from collections.abc import Iterable, Sequence, Sized
+from itertools import chain, islice
+from typing import Any, Optional, Union
 
 # External libraries
+from rich.cells import cell_len, set_cell_size
 from rich.table import Table
 
 # Internal modules
 
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Rows rendered per Table by stream_table()
+DEFAULT_PAGE_SIZE = 500
+
+# Rows sampled by stream_table() to size the columns
+DEFAULT_SAMPLE_SIZE = 200
+
+# Widest column stream_table() sizes from its sample (longer cells are cut)
+MAX_SAMPLED_WIDTH = 60
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
@@ -110,6 +125,122 @@ class TableMixin:
             except Exception as e:
                 raise ValueError(f"Failed to display table: {e}") from e
 
+    def stream_table(
+        self,
+        rows: Iterable[Union[dict[str, Any], Sequence[Any]]],
+        columns: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        show_header: bool = True,
+        max_rows: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        style: str = "cyan",
+    ) -> int:
+        """
+        Display a large table from any iterable, one page at a time.
+
+        Column widths are computed from the first sample_size rows (and
+        narrowed to fit the console), then rows are formatted to those
+        widths and printed page_size rows at a time, so memory use depends
+        on the page size, not on the row count. Cells wider than their
+        column are cut with an ellipsis.
+
+        Args:
+            rows: Dictionaries or sequences of cells (e.g., a generator)
+            columns: Column names (default: keys of the first dictionary)
+            title: Optional table title
+            show_header: Whether to show column headers
+            max_rows: Maximum number of rows to display; the rest are
+                counted in a "... N more rows" footer
+            page_size: Number of rows printed at a time
+            sample_size: Number of rows used to compute column widths
+            style: Style of the table cells
+
+        Returns:
+            Number of rows displayed
+        """
+        try:
+            total = len(rows) if isinstance(rows, Sized) else None
+            iterator = iter(rows)
+            limit = sample_size if max_rows is None else min(sample_size, max_rows)
+            sample = list(islice(iterator, max(1, limit)))
+            if not sample:
+                return 0
+
+            if columns is None:
+                if isinstance(sample[0], dict):
+                    columns = [str(column) for column in sample[0]]
+                else:
+                    columns = [str(index) for index in range(1, len(sample[0]) + 1)]
+
+            def cells(row: Union[dict[str, Any], Sequence[Any]]) -> list[str]:
+                if isinstance(row, dict):
+                    values = [row.get(column, "") for column in columns]
+                else:
+                    values = list(row[: len(columns)])
+                    values += [""] * (len(columns) - len(values))
+                return [str(value).replace("\n", " ") for value in values]
+
+            widths = self._stream_widths(
+                columns, [cells(row) for row in sample], show_header
+            )
+
+            def line(values: list[str]) -> str:
+                return " " + "  ".join(
+                    _fit_cell(value, width) for value, width in zip(values, widths)
+                )
+
+            table_width = sum(widths) + 2 * len(widths) - 1
+            if title:
+                self._console.print(
+                    title, style="table.title", justify="center", width=table_width
+                )
+            if show_header:
+                self._console.print(
+                    line(columns), style="table.header", markup=False, highlight=False
+                )
+                self._console.print(" " + "─" * (table_width - 1), style="table.header")
+
+            def render(page: list[str]) -> None:
+                self._console.print(
+                    "\n".join(page),
+                    style=style,
+                    markup=False,
+                    highlight=False,
+                    no_wrap=True,
+                    overflow="ignore",
+                    crop=False,
+                )
+
+            stream = chain(sample, iterator)
+            page: list[str] = []
+            shown = 0
+            remaining = 0
+            for row in stream:
+                if max_rows is not None and shown == max_rows:
+                    # Count what is left without keeping it
+                    if total is not None:
+                        remaining = total - shown
+                    else:
+                        remaining = 1 + sum(1 for _ in stream)
+                    break
+                page.append(line(cells(row)))
+                shown += 1
+                if len(page) >= page_size:
+                    render(page)
+                    page = []
+            if page:
+                render(page)
+            if remaining:
+                self._console.print(f"[dim]... {remaining} more rows[/dim]")
+            return shown
+        except Exception as e:
+            try:
+                self._console.print(f"[red]Table error:[/red] {type(e).__name__}")
+            except Exception as e:
+                raise ValueError(f"Failed to display table: {e}") from e
+            return 0
+
     def status_table(
         self,
         title: str,
@@ -227,3 +358,59 @@ class TableMixin:
                 )
             except Exception as e:
                 raise ValueError(f"Failed to display command table: {e}") from e
+
+    # ------------------------------------------------
+    # PRIVATE HELPER METHODS
+    # ------------------------------------------------
+
+    def _stream_widths(
+        self, columns: list[str], sample: list[list[str]], show_header: bool
+    ) -> list[int]:
+        """
+        Compute stream_table() column widths from sampled rows.
+
+        Args:
+            columns: Column names
+            sample: Sampled rows, as cell strings
+            show_header: Whether headers are shown (and must fit)
+
+        Returns:
+            Column widths fitting the console
+        """
+        widths = [
+            min(
+                MAX_SAMPLED_WIDTH,
+                max(
+                    [cell_len(column) if show_header else 1]
+                    + [cell_len(row[index]) for row in sample]
+                ),
+            )
+            for index, column in enumerate(columns)
+        ]
+        # Narrow the widest column until the table fits
+        available = self._console.width - 2 * len(widths)
+        while sum(widths) > available and max(widths) > 1:
+            widest = widths.index(max(widths))
+            widths[widest] -= 1
+        return widths
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _fit_cell(value: str, width: int) -> str:
+    """
+    Pad or cut a cell to exactly width terminal cells.
+
+    Args:
+        value: Cell text
+        width: Column width
+
+    Returns:
+        The cell, padded with spaces or cut with an ellipsis
+    """
+    length = cell_len(value)
+    if length <= width:
+        return value + " " * (width - length)
+    return set_cell_size(value, width - 1) + "…"
@@ -13,10 +13,15 @@ This module contains type definitions and enumerations.
 # ------------------------------------------------
 from .log_level import LogLevel
 from .patterns import (
+    CUSTOM_PATTERNS,
     PATTERN_COLORS,
     Pattern,
     get_pattern_color,
     get_pattern_color_by_name,
+    get_pattern_registry_version,
+    register_pattern,
+    set_pattern_color,
+    unregister_pattern,
 )
 
 # =============================================================================
@@ -35,4 +40,9 @@ __all__ = [
     "PATTERN_COLORS",
     "get_pattern_color",
     "get_pattern_color_by_name",
+    "CUSTOM_PATTERNS",
+    "register_pattern",
+    "unregister_pattern",
+    "set_pattern_color",
+    "get_pattern_registry_version",
 ]
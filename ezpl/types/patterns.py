@@ -14,6 +14,10 @@ This module defines contextual patterns for enhanced console output with the for
 # ///////////////////////////////////////////////////////////////
 # Base imports
 from enum import Enum
+from typing import Union
+
+# Internal modules
+from ..core.exceptions import ValidationError
 
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -63,20 +67,29 @@ PATTERN_COLORS: dict[Pattern, str] = {
     Pattern.DEPS: "bright_cyan",  # 🔵 Dependencies
 }
 
+# Custom patterns registered at runtime (upper-case name -> Rich color)
+CUSTOM_PATTERNS: dict[str, str] = {}
+
+# Bumped on every registration or color change, so renderers caching
+# pattern prefixes know when to rebuild them
+_registry_version = 0
+
 ## ==> FUNCTIONS
 # ///////////////////////////////////////////////////////////////
 
 
-def get_pattern_color(pattern: Pattern) -> str:
+def get_pattern_color(pattern: Union[Pattern, str]) -> str:
     """
     Get the Rich color style for a pattern.
 
     Args:
-        pattern: The pattern to get the color for
+        pattern: The pattern to get the color for (or a custom pattern name)
 
     Returns:
         Rich color style string
     """
+    if isinstance(pattern, str):
+        return CUSTOM_PATTERNS.get(pattern.upper(), "white")
     return PATTERN_COLORS.get(pattern, "white")
 
 
@@ -94,4 +107,79 @@ def get_pattern_color_by_name(pattern_name: str) -> str:
         pattern = Pattern[pattern_name.upper()]
         return get_pattern_color(pattern)
     except KeyError:
-        return "white"
+        return CUSTOM_PATTERNS.get(pattern_name.upper(), "white")
+
+
+def register_pattern(name: str, color: str = "white") -> str:
+    """
+    Register a custom pattern usable by name with print_pattern.
+
+    Args:
+        name: Pattern name (case-insensitive, displayed upper-case)
+        color: Rich color style of the pattern
+
+    Returns:
+        The registered (upper-case) pattern name
+
+    Raises:
+        ValidationError: If the name is empty or is a built-in pattern
+    """
+    key = name.strip().upper() if isinstance(name, str) else ""
+    if not key:
+        raise ValidationError(f"Invalid pattern name: {name!r}", "name", str(name))
+    if key in Pattern.__members__:
+        raise ValidationError(
+            f"Pattern '{key}' is built-in, use set_pattern_color()", "name", key
+        )
+    CUSTOM_PATTERNS[key] = color
+    _bump_registry_version()
+    return key
+
+
+def unregister_pattern(name: str) -> None:
+    """
+    Remove a custom pattern (unknown names are ignored).
+
+    Args:
+        name: Pattern name (case-insensitive)
+    """
+    if CUSTOM_PATTERNS.pop(name.upper(), None) is not None:
+        _bump_registry_version()
+
+
+def set_pattern_color(pattern: Union[Pattern, str], color: str) -> None:
+    """
+    Change the color of a built-in or custom pattern.
+
+    Args:
+        pattern: Pattern enum, built-in pattern name or custom pattern name
+        color: New Rich color style
+
+    Raises:
+        ValidationError: If the pattern is unknown
+    """
+    if isinstance(pattern, Pattern):
+        PATTERN_COLORS[pattern] = color
+    elif pattern.upper() in Pattern.__members__:
+        PATTERN_COLORS[Pattern[pattern.upper()]] = color
+    elif pattern.upper() in CUSTOM_PATTERNS:
+        CUSTOM_PATTERNS[pattern.upper()] = color
+    else:
+        raise ValidationError(f"Unknown pattern: {pattern}", "pattern", pattern)
+    _bump_registry_version()
+
+
+def get_pattern_registry_version() -> int:
+    """
+    Get the pattern registry version.
+
+    Returns:
+        Counter changed by every registration or color change
+    """
+    return _registry_version
+
+
+def _bump_registry_version() -> None:
+    """Invalidate caches built from the pattern registry."""
+    global _registry_version
+    _registry_version += 1
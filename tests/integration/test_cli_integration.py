@@ -70,6 +70,18 @@ class TestCLIWithEzpl:
         # Should not crash, may or may not find logs
         assert result.exit_code in [0, 1]
 
+    def test_logs_list_limit(self, cli_runner: CliRunner, temp_dir: Path) -> None:
+        """Test logs list --limit."""
+        for index in range(5):
+            (temp_dir / f"app{index}.log").write_text("line\n", encoding="utf-8")
+
+        result = cli_runner.invoke(
+            cli, ["logs", "list", "--dir", str(temp_dir), "--limit", "2"]
+        )
+        assert result.exit_code == 0
+        assert result.output.count(".log") == 2
+        assert "... 3 more rows" in result.output
+
     def test_config_get_command(self, cli_runner: CliRunner) -> None:
         """Test config get command."""
         result = cli_runner.invoke(cli, ["config", "get", "log-level"])
@@ -138,6 +150,113 @@ class TestCLILogParsing:
         # Should show statistics or error
         assert result.exit_code in [0, 1, 2]
 
+    def test_logs_import_and_query(self, cli_runner: CliRunner, temp_dir: Path) -> None:
+        """Test importing a text log and querying the database."""
+        log_file = temp_dir / "app.log"
+        log_file.write_text(
+            "2024-01-15 10:00:00 | INFO       | app:main:1 - started\n"
+            "2024-01-15 10:30:00 | ERROR      | db:query:2 - failed\n"
+            "2024-01-15 11:00:00 | ERROR      | app:main:3 - crashed\n",
+            encoding="utf-8",
+        )
+        db = temp_dir / "logs.db"
+
+        result = cli_runner.invoke(
+            cli, ["logs", "import", "--db", str(db), str(log_file)]
+        )
+        assert result.exit_code == 0
+        assert "Imported 3 entries" in result.output
+
+        result = cli_runner.invoke(
+            cli,
+            [
+                "logs",
+                "query",
+                "--db",
+                str(db),
+                "--level",
+                "error",
+                "--until",
+                "2024-01-15 10:45",
+            ],
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == (
+            "2024-01-15 10:30:00 | ERROR      | db:query:2 - failed"
+        )
+
+        result = cli_runner.invoke(
+            cli, ["logs", "query", "--db", str(db), "--module", "app", "--count"]
+        )
+        assert result.output.strip() == "2"
+
+        result = cli_runner.invoke(
+            cli, ["logs", "query", "--db", str(db), "--since", "not a date"]
+        )
+        assert result.exit_code == 2
+
+    def test_logs_export_formats(self, cli_runner: CliRunner, temp_dir: Path) -> None:
+        """Test streamed exports, gzip output and export filters."""
+        import csv
+        import gzip
+        import json
+
+        from ezpl.cli.utils import LogParser
+
+        log_file = temp_dir / "app.log"
+        log_file.write_text(
+            "2024-01-15 10:00:00 | INFO       | app:main:1 - started, ok\n"
+            "2024-01-15 10:30:00 | ERROR      | db:query:2 - failed\n"
+            "2024-01-15 11:00:00 | ERROR      | app:main:3 - crashed\n",
+            encoding="utf-8",
+        )
+        entries = [entry.to_dict() for entry in LogParser(log_file).parse()]
+
+        # JSON is written incrementally but matches a one-shot json.dumps
+        result = cli_runner.invoke(cli, ["logs", "export", "-f", str(log_file)])
+        assert result.exit_code == 0
+        assert result.output == json.dumps(entries, indent=2, default=str) + "\n"
+
+        output = temp_dir / "export.ndjson.gz"
+        result = cli_runner.invoke(
+            cli,
+            ["logs", "export", "-f", str(log_file), "-F", "ndjson", "-o", str(output)],
+        )
+        assert "Exported 3 entries" in result.output
+        with gzip.open(output, "rt", encoding="utf-8") as stream:
+            assert [json.loads(line) for line in stream] == entries
+
+        output = temp_dir / "export.csv"
+        result = cli_runner.invoke(
+            cli,
+            [
+                "logs",
+                "export",
+                "-f",
+                str(log_file),
+                "-F",
+                "csv",
+                "-o",
+                str(output),
+                "--level",
+                "error",
+                "--until",
+                "2024-01-15 10:45",
+            ],
+        )
+        assert "Exported 1 entries" in result.output
+        with open(output, encoding="utf-8", newline="") as stream:
+            rows = list(csv.DictReader(stream))
+        assert [row["message"] for row in rows] == ["failed"]
+
+        result = cli_runner.invoke(
+            cli,
+            ["logs", "export", "-f", str(log_file), "-F", "txt", "-z", "-l", "INFO"],
+        )
+        assert gzip.decompress(result.stdout_bytes).decode("utf-8") == (
+            "2024-01-15 10:00:00 | INFO       | app:main:1 - started, ok\n"
+        )
+
 
 class TestCLIConfigManagement:
     """Tests for CLI config management."""
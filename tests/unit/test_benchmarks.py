@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires Benchmarks
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the benchmark suite.
+
+Tests cover:
+- Timing helpers and percentiles
+- Generated log files
+- JSON results and baseline comparison
+- Running benchmarks and the ezpl bench command
+"""
+
+import json
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+from click.testing import CliRunner
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl.benchmarks import (
+    BenchmarkResult,
+    compare_results,
+    generate_log_file,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from ezpl.benchmarks.runner import time_calls
+from ezpl.cli.main import cli
+from ezpl.cli.utils import LogParser
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers import FileLogger
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestBenchmarkRunner:
+    """Tests for timing helpers and result handling."""
+
+    def test_time_calls(self) -> None:
+        """Test that every call is counted and timed."""
+        calls = []
+        result = time_calls("case", lambda: calls.append(1), 100)
+        assert len(calls) == 100
+        assert result.ops == 100
+        assert 0 <= result.p50 <= result.p99
+        assert result.rate > 0
+
+    def test_generated_file_is_parseable(self, temp_dir: Path) -> None:
+        """Test that generated lines use FileLogger's format."""
+        path = generate_log_file(temp_dir / "gen.log", 500)
+        entries = list(LogParser(path).parse())
+        assert len(entries) == 500
+        assert {entry.level for entry in entries} >= {"INFO", "ERROR", "WARNING"}
+
+    def test_save_and_load(self, temp_dir: Path) -> None:
+        """Test the JSON results round trip."""
+        result = BenchmarkResult("case", 1000, 0.5, 0.0001, 0.0003)
+        path = save_results([result], temp_dir / "results.json")
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["results"][0]["rate"] == 2000
+        assert "ezpl_version" in document
+        loaded = load_results(path)
+        assert loaded[0].name == "case"
+        assert loaded[0].rate == 2000
+
+    def test_compare_results(self) -> None:
+        """Test regression detection against a baseline."""
+        baseline = [
+            BenchmarkResult("slow", 1000, 1.0, 0, 0),
+            BenchmarkResult("fast", 1000, 1.0, 0, 0),
+            BenchmarkResult("same", 1000, 1.0, 0, 0),
+            BenchmarkResult("gone", 1000, 1.0, 0, 0),
+        ]
+        current = [
+            BenchmarkResult("slow", 1000, 2.0, 0, 0),
+            BenchmarkResult("fast", 1000, 0.5, 0, 0),
+            BenchmarkResult("same", 1000, 1.05, 0, 0),
+            BenchmarkResult("added", 1000, 1.0, 0, 0),
+        ]
+        statuses = {
+            c["name"]: c["status"] for c in compare_results(current, baseline, 0.1)
+        }
+        assert statuses == {
+            "slow": "regression",
+            "fast": "improvement",
+            "same": "ok",
+            "added": "new",
+            "gone": "missing",
+        }
+
+    def test_run_selected_benchmarks(self) -> None:
+        """Test running benchmarks with small parameters."""
+        results = run_benchmarks(
+            only=["parser", "file_logger"], iterations=50, sizes=[200], repeats=1
+        )
+        names = {result.name for result in results}
+        assert names == {
+            "parser.parse[200]",
+            "parser.search[200]",
+            "file_logger.log[sync]",
+            "file_logger.log[async]",
+        }
+
+    def test_unknown_benchmark(self) -> None:
+        """Test that unknown names are rejected."""
+        with pytest.raises(ValidationError):
+            run_benchmarks(only=["nope"])
+
+
+class TestFileLoggerEnqueue:
+    """Tests for asynchronous file writes used by the benchmarks."""
+
+    def test_enqueue_writes_on_close(self, temp_log_file: Path) -> None:
+        """Test that queued records are written when the handler closes."""
+        handler = FileLogger(temp_log_file, level="DEBUG", enqueue=True)
+        for index in range(20):
+            handler.log("INFO", f"queued {index}")
+        handler.close()
+        assert temp_log_file.read_text(encoding="utf-8").count("queued") == 20
+
+
+class TestBenchCommand:
+    """Tests for ezpl bench."""
+
+    def test_bench_with_baseline(self, temp_dir: Path) -> None:
+        """Test saving results and comparing against them."""
+        runner = CliRunner()
+        output = temp_dir / "bench.json"
+        args = ["bench", "-k", "printer", "-n", "50"]
+        result = runner.invoke(cli, args + ["-o", str(output)])
+        assert result.exit_code == 0, result.output
+        assert output.exists()
+
+        result = runner.invoke(cli, args + ["-b", str(output)])
+        assert result.exit_code == 0, result.output
+        assert "Comparison" in result.output
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires MessageCoalescer
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for MessageCoalescer and repeated-message coalescing in handlers.
+
+Tests cover:
+- Run detection and flushing
+- Timer-based flushing
+- ConsolePrinter and FileLogger integration
+- Configuration from environment variables
+"""
+
+import os
+import time
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl.config import ConfigurationManager
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers import ConsolePrinter, FileLogger
+from ezpl.handlers.coalesce import MessageCoalescer, format_repeated
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestMessageCoalescer:
+    """Tests for the coalescer state machine."""
+
+    def test_repeats_are_held(self) -> None:
+        """Test that identical records after the first are not emitted."""
+        coalescer = MessageCoalescer(60, lambda *_: None)
+        assert coalescer.submit("a", "p") == (True, None)
+        assert coalescer.submit("a", "p") == (False, None)
+        assert coalescer.submit("a", "p") == (False, None)
+        assert coalescer.submit("b", "q") == (True, ("p", 2))
+        assert coalescer.flush() is None
+
+    def test_flush_pending_run(self) -> None:
+        """Test flushing a pending run."""
+        coalescer = MessageCoalescer(60, lambda *_: None)
+        coalescer.submit("a", "p")
+        coalescer.submit("a", "p")
+        assert coalescer.flush() == ("p", 1)
+        assert coalescer.submit("a", "p") == (True, None)
+
+    def test_timeout_flush(self) -> None:
+        """Test that the window timer reports the run."""
+        flushed = []
+        coalescer = MessageCoalescer(0.05, lambda *run: flushed.append(run))
+        coalescer.submit("a", "p")
+        coalescer.submit("a", "p")
+        coalescer.submit("a", "p")
+        deadline = time.monotonic() + 2
+        while not flushed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert flushed == [("p", 2)]
+        # After a timeout the next identical record starts a new run
+        assert coalescer.submit("a", "p") == (True, None)
+
+    def test_invalid_window(self) -> None:
+        """Test validation of the window."""
+        with pytest.raises(ValidationError):
+            MessageCoalescer(0, lambda *_: None)
+        with pytest.raises(ValidationError):
+            MessageCoalescer("soon", lambda *_: None)
+
+    def test_format_repeated(self) -> None:
+        """Test summary text."""
+        assert format_repeated(1) == "last message repeated 1 time"
+        assert format_repeated(4) == "last message repeated 4 times"
+
+
+class TestConsolePrinterCoalescing:
+    """Tests for coalescing in ConsolePrinter."""
+
+    def test_repeated_messages_collapsed(self, mock_console) -> None:
+        """Test that repeats print one summary line before the next message."""
+        printer = ConsolePrinter(level="DEBUG", coalesce_window=60)
+        printer._console = mock_console
+        for _ in range(5):
+            printer.info("polling")
+        printer.info("done")
+        assert mock_console.print.call_count == 3
+        summary = mock_console.print.call_args_list[1][0][0]
+        assert "last message repeated 4 times" in summary.plain
+
+    def test_different_levels_not_collapsed(self, mock_console) -> None:
+        """Test that the same text at another level is a new record."""
+        printer = ConsolePrinter(level="DEBUG", coalesce_window=60)
+        printer._console = mock_console
+        printer.info("state")
+        printer.warning("state")
+        assert mock_console.print.call_count == 2
+
+    def test_flush_repeated(self, mock_console) -> None:
+        """Test flushing the pending run."""
+        printer = ConsolePrinter(level="DEBUG", coalesce_window=60)
+        printer._console = mock_console
+        for _ in range(3):
+            printer.info("tick")
+        printer.flush_repeated()
+        text = mock_console.print.call_args[0][0]
+        assert "last message repeated 2 times" in text.plain
+
+    def test_timeout_summary_uses_write_lock(self, mock_console) -> None:
+        """Test that the timer thread's summary waits for the write lock."""
+        printer = ConsolePrinter(level="DEBUG", coalesce_window=0.05)
+        printer._console = mock_console
+        printer.info("tick")
+        printer.info("tick")
+        with printer._write_lock:
+            time.sleep(0.2)  # The window elapses while a write is in progress
+            assert mock_console.print.call_count == 1
+        deadline = time.monotonic() + 2
+        while mock_console.print.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        text = mock_console.print.call_args[0][0]
+        assert "last message repeated 1 time" in text.plain
+
+    def test_close_flushes_pending_summaries(self, mock_console) -> None:
+        """Test that close() writes pending summaries and cancels the timer."""
+        printer = ConsolePrinter(
+            level="DEBUG", coalesce_window=60, rate_limit=1, rate_limit_burst=3
+        )
+        printer._console = mock_console
+        for _ in range(5):
+            printer.info("same")
+        assert mock_console.print.call_count == 1
+        printer.close()
+        texts = [call[0][0].plain for call in mock_console.print.call_args_list]
+        assert any("last message repeated 2 times" in text for text in texts)
+        assert any("suppressed 2 similar messages" in text for text in texts)
+        assert printer._coalescer._timer is None
+
+
+class TestFileLoggerCoalescing:
+    """Tests for coalescing in FileLogger."""
+
+    def test_file_repeats_collapsed(self, temp_log_file: Path) -> None:
+        """Test that repeats are written as one summary line."""
+        handler = FileLogger(temp_log_file, level="DEBUG", coalesce_window=60)
+        logger = handler.get_logger()
+        for _ in range(10):
+            logger.info("heartbeat")
+        logger.info("shutdown")
+        handler.close()
+        lines = temp_log_file.read_text(encoding="utf-8").splitlines()
+        assert sum("heartbeat" in line for line in lines) == 1
+        summary = [line for line in lines if "last message repeated" in line]
+        assert len(summary) == 1
+        assert "repeated 9 times" in summary[0]
+        assert lines.index(summary[0]) < next(
+            i for i, line in enumerate(lines) if "shutdown" in line
+        )
+
+    def test_close_flushes_pending_run(self, temp_log_file: Path) -> None:
+        """Test that close() writes the pending summary."""
+        handler = FileLogger(temp_log_file, level="DEBUG", coalesce_window=60)
+        for _ in range(3):
+            handler.get_logger().warning("disk almost full")
+        handler.close()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert "last message repeated 2 times" in content
+
+
+class TestCoalesceConfiguration:
+    """Tests for coalescing configuration."""
+
+    @pytest.mark.usefixtures("clean_env")
+    def test_env_variable(self, temp_config_file: Path) -> None:
+        """Test loading the window from the environment."""
+        os.environ["EZPL_COALESCE_WINDOW"] = "2.5"
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_coalesce_window() == 2.5
+
+    @pytest.mark.usefixtures("clean_env")
+    def test_disabled_by_default(self, temp_config_file: Path) -> None:
+        """Test that coalescing is disabled by default."""
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_coalesce_window() is None
@@ -16,6 +16,7 @@ Tests cover:
 - Reset to defaults
 - Export to script
 - Error handling
+- Shared configuration snapshots
 """
 
 import json
@@ -29,7 +30,11 @@ import pytest
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from ezpl.config import ConfigurationManager
+from ezpl.config import (
+    ConfigurationManager,
+    get_config_snapshot,
+    invalidate_config_snapshots,
+)
 from ezpl.core.exceptions import FileOperationError
 
 # IMPORT SPECS
@@ -181,6 +186,17 @@ class TestGetters:
         # Can be None or a string
         assert compression is None or isinstance(compression, str)
 
+    def test_get_log_transport(
+        self, config_manager: ConfigurationManager, monkeypatch
+    ) -> None:
+        """Test get_log_transport() and get_log_transport_ring_size()."""
+        assert config_manager.get_log_transport() in ("socket", "shm")
+        monkeypatch.setenv("EZPL_LOG_TRANSPORT", "SHM")
+        monkeypatch.setenv("EZPL_LOG_TRANSPORT_RING_SIZE", "65536")
+        config_manager.reload()
+        assert config_manager.get_log_transport() == "shm"
+        assert config_manager.get_log_transport_ring_size() == 65536
+
 
 class TestFileOperations:
     """Tests for file operations."""
@@ -267,6 +283,72 @@ class TestPriorityOrder:
         assert config.get("log-level") == "WARNING"
 
 
+@pytest.mark.usefixtures("clean_env")
+class TestConfigSnapshot:
+    """Tests for the shared configuration snapshot."""
+
+    def _write(self, path: Path, data: dict) -> None:
+        """Write a JSON config file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_snapshot_is_shared_and_immutable(self, temp_config_file: Path) -> None:
+        """Test that callers share one read-only mapping."""
+        self._write(temp_config_file, {"log-level": "WARNING"})
+        snapshot = get_config_snapshot(temp_config_file)
+        assert snapshot["log-level"] == "WARNING"
+        assert get_config_snapshot(temp_config_file) is snapshot
+        with pytest.raises(TypeError):
+            snapshot["log-level"] = "DEBUG"  # type: ignore[index]
+
+    def test_unchanged_file_is_not_parsed_again(self, temp_config_file: Path) -> None:
+        """Test that managers reuse the snapshot while nothing changes."""
+        self._write(temp_config_file, {"log-level": "WARNING"})
+        ConfigurationManager(config_file=temp_config_file)
+        with patch("ezpl.config.manager._read_configuration") as read:
+            config = ConfigurationManager(config_file=temp_config_file)
+            config.reload()
+        read.assert_not_called()
+        assert config.get("log-level") == "WARNING"
+
+    def test_file_change_reloads(self, temp_config_file: Path) -> None:
+        """Test that a new mtime or size triggers a reload."""
+        self._write(temp_config_file, {"log-level": "WARNING"})
+        config = ConfigurationManager(config_file=temp_config_file)
+        self._write(temp_config_file, {"log-level": "CRITICAL"})
+        config.reload()
+        assert config.get("log-level") == "CRITICAL"
+
+    def test_env_change_reloads(self, temp_config_file: Path) -> None:
+        """Test that EZPL_* changes are seen without waiting."""
+        snapshot = get_config_snapshot(temp_config_file, max_age=60)
+        os.environ["EZPL_LOG_LEVEL"] = "ERROR"
+        assert get_config_snapshot(temp_config_file, max_age=60) is not snapshot
+        assert get_config_snapshot(temp_config_file)["log-level"] == "ERROR"
+
+    def test_max_age_skips_file_checks(self, temp_config_file: Path) -> None:
+        """Test that readers within max_age do not stat the file."""
+        self._write(temp_config_file, {"log-level": "WARNING"})
+        get_config_snapshot(temp_config_file, max_age=60)
+        with patch("ezpl.config.manager._file_signature") as signature:
+            assert (
+                get_config_snapshot(temp_config_file, max_age=60)["log-level"]
+                == "WARNING"
+            )
+        signature.assert_not_called()
+
+    def test_save_and_invalidate(self, temp_config_file: Path) -> None:
+        """Test that save() and invalidate_config_snapshots() drop the cache."""
+        config = ConfigurationManager(config_file=temp_config_file)
+        config.set("log-level", "DEBUG")
+        config.save()
+        assert get_config_snapshot(temp_config_file)["log-level"] == "DEBUG"
+
+        snapshot = get_config_snapshot(temp_config_file)
+        invalidate_config_snapshots()
+        assert get_config_snapshot(temp_config_file) is not snapshot
+
+
 class TestExport:
     """Tests for export operations."""
 
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires Imports
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Import-time regression tests for Ezpl.
+
+Tests cover:
+- Lazy exports of ezpl, ezpl.handlers, ezpl.handlers.wizard and ezpl.cli
+- Lazy CLI subcommand loading
+- `python -X importtime` budget for `import ezpl`
+- Time budget for `Ezpl()` construction in a fresh interpreter
+- Deferred RichWizard construction
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+import ezpl
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Generous budgets (eager loguru and Rich imports alone exceed the import one)
+IMPORT_BUDGET_US = 100_000
+CONSTRUCTION_BUDGET_S = 1.0
+
+# Modules `import ezpl` must not load
+HEAVY_MODULES = ("loguru", "rich", "click", "ezpl.handlers", "ezpl.cli")
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _run_python(code: str, tmp_path: Path, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with an isolated home directory."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("EZPL_")}
+    env.update(
+        HOME=str(tmp_path),
+        USERPROFILE=str(tmp_path),
+        PYTHONPATH=os.pathsep.join(
+            [str(Path(ezpl.__file__).parent.parent), env.get("PYTHONPATH", "")]
+        ),
+    )
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *flags, "-c", code],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestLazyExports:
+    """Tests for module-level lazy exports."""
+
+    def test_import_does_not_load_heavy_modules(self, tmp_path) -> None:
+        """Test that `import ezpl` loads neither loguru, Rich nor handlers."""
+        result = _run_python(
+            "import sys, ezpl\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+            tmp_path,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_names_resolve(self) -> None:
+        """Test that every exported name resolves."""
+        for name in ezpl.__all__:
+            assert getattr(ezpl, name) is not None
+        assert ezpl.Printer is ezpl.EzPrinter is ezpl.ConsolePrinter
+        assert ezpl.Logger is ezpl.EzLogger is ezpl.FileLogger
+        assert "Ezpl" in dir(ezpl)
+
+    def test_unknown_name(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = ezpl.DoesNotExist
+        from ezpl import handlers
+
+        with pytest.raises(AttributeError):
+            _ = handlers.DoesNotExist
+
+    def test_cli_is_lazy(self) -> None:
+        """Test that the CLI entry point resolves through ezpl.cli."""
+        from ezpl.cli import cli
+        from ezpl.cli.main import cli as main_cli
+
+        assert cli is main_cli
+
+    def test_cli_lists_lazy_subcommands(self) -> None:
+        """Test that every subcommand is listed and resolves to its command."""
+        import click
+
+        from ezpl.cli.commands import version_command
+        from ezpl.cli.main import LAZY_SUBCOMMANDS, cli
+
+        ctx = click.Context(cli)
+        assert cli.list_commands(ctx) == sorted(LAZY_SUBCOMMANDS)
+        assert cli.get_command(ctx, "version") is version_command
+        assert cli.get_command(ctx, "missing") is None
+
+    def test_subcommand_imports_only_its_module(self, tmp_path) -> None:
+        """Test that running `ezpl version` does not load other subcommands."""
+        result = _run_python(
+            "import sys\n"
+            "from ezpl.cli.main import cli\n"
+            "try:\n"
+            "    cli(['version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('ezpl.cli.')))",
+            tmp_path,
+        )
+        assert result.stdout.strip().splitlines()[-1] == str(
+            ["ezpl.cli.commands", "ezpl.cli.commands.version", "ezpl.cli.main"]
+        )
+
+
+class TestImportBudget:
+    """Startup time budgets measured in a fresh interpreter."""
+
+    def test_import_time_budget(self, tmp_path) -> None:
+        """Test `import ezpl` cumulative time reported by -X importtime."""
+        result = _run_python("import ezpl", tmp_path, "-X", "importtime")
+        cumulative = None
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "ezpl":
+                cumulative = int(parts[1])
+        assert cumulative is not None, result.stderr[-500:]
+        assert cumulative < IMPORT_BUDGET_US
+
+    def test_construction_budget(self, tmp_path) -> None:
+        """Test `Ezpl()` construction time, imports included."""
+        result = _run_python(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "from ezpl import Ezpl\n"
+            "Ezpl()\n"
+            "print(time.perf_counter() - start)",
+            tmp_path,
+        )
+        assert float(result.stdout.strip().splitlines()[-1]) < CONSTRUCTION_BUDGET_S
+
+    def test_construction_defers_wizard(self, tmp_path) -> None:
+        """Test that `Ezpl()` neither builds the wizard nor imports it."""
+        result = _run_python(
+            "import sys\n"
+            "from ezpl import Ezpl\n"
+            "Ezpl().get_printer().info('message')\n"
+            "print('ezpl.handlers.wizard' in sys.modules, 'rich.table' in sys.modules)",
+            tmp_path,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "False False"
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires Metrics
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for runtime metrics.
+
+Tests cover:
+- Fixed-bucket histograms and quantile estimates
+- Registry counters, gauges and snapshots
+- Prometheus export and parsing
+- Handler instrumentation and Ezpl.get_metrics()
+- ezpl info --metrics
+"""
+
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+from click.testing import CliRunner
+from loguru import logger
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl import Ezpl
+from ezpl.cli.main import cli
+from ezpl.core.exceptions import ValidationError
+from ezpl.core.metrics import (
+    METRICS,
+    Histogram,
+    MetricsExporter,
+    MetricsRegistry,
+    parse_prometheus,
+)
+from ezpl.handlers import ConsolePrinter, FileLogger
+
+## ==> FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty process-wide metrics."""
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestHistogram:
+    """Tests for fixed-bucket histograms."""
+
+    def test_observe_and_buckets(self) -> None:
+        """Test cumulative bucket counts."""
+        histogram = Histogram()
+        histogram.observe(0.000005)
+        histogram.observe(0.0003)
+        histogram.observe(5.0)
+        buckets = dict(histogram.cumulative_buckets())
+        assert buckets[0.00001] == 1
+        assert buckets[0.0005] == 2
+        assert buckets[1.0] == 2
+        assert buckets[float("inf")] == 3
+        assert histogram.count == 3
+
+    def test_quantiles(self) -> None:
+        """Test that quantiles fall in the expected bucket."""
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.observe(0.00002)
+        histogram.observe(0.2)
+        snapshot = histogram.snapshot()
+        assert 0.00001 <= snapshot["p50"] <= 0.000025
+        assert snapshot["p99"] <= 0.000025
+        assert snapshot["count"] == 100
+
+
+class TestMetricsRegistry:
+    """Tests for the metrics registry."""
+
+    def test_counters_and_snapshot(self) -> None:
+        """Test record counters and per-sink families."""
+        registry = MetricsRegistry()
+        registry.record("console", "INFO", 10)
+        registry.record("console", "INFO", 5)
+        registry.inc("suppressed", "file", 3)
+        snapshot = registry.snapshot()
+        assert snapshot["records"] == {"console": {"INFO": 2}}
+        assert snapshot["bytes_written"] == {"console": 15}
+        assert snapshot["suppressed"] == {"file": 3}
+
+    def test_gauges(self) -> None:
+        """Test gauges evaluated at snapshot time."""
+        registry = MetricsRegistry()
+        depth = [4]
+        registry.register_gauge("console", lambda: depth[0])
+        assert registry.snapshot()["queue_depth"] == {"console": 4}
+        registry.unregister_gauge("console")
+        assert registry.snapshot()["queue_depth"] == {}
+
+    def test_prometheus_round_trip(self, temp_dir: Path) -> None:
+        """Test writing and parsing a Prometheus textfile."""
+        registry = MetricsRegistry()
+        registry.record("file", "ERROR", 42)
+        registry.inc("dropped", "console", 7)
+        registry.histogram("sink_write", "file").observe(0.0002)
+        path = registry.write_prometheus(temp_dir / "ezpl.prom")
+
+        text = path.read_text(encoding="utf-8")
+        assert 'ezpl_records_total{sink="file",level="ERROR"} 1' in text
+        assert "# TYPE ezpl_latency_seconds histogram" in text
+        assert 'le="+Inf"' in text
+
+        snapshot = parse_prometheus(text)
+        assert snapshot["records"] == {"file": {"ERROR": 1}}
+        assert snapshot["bytes_written"] == {"file": 42}
+        assert snapshot["dropped"] == {"console": 7}
+        assert snapshot["latency"]["sink_write"]["file"]["count"] == 1
+
+    def test_exporter_writes_on_stop(self, temp_dir: Path) -> None:
+        """Test that stopping the exporter writes a final export."""
+        registry = MetricsRegistry()
+        registry.record("console", "INFO", 1)
+        exporter = MetricsExporter(temp_dir / "ezpl.prom", 60, registry)
+        exporter.start()
+        exporter.stop()
+        assert "ezpl_records_total" in exporter.path.read_text(encoding="utf-8")
+
+
+class TestHandlerMetrics:
+    """Tests for handler instrumentation."""
+
+    def test_console_metrics(self, mock_console) -> None:
+        """Test console records, bytes, suppression and latency."""
+        printer = ConsolePrinter(level="DEBUG", rate_limit=1, rate_limit_burst=1)
+        printer._console = mock_console
+        for _ in range(2):
+            printer.info("hello")
+        snapshot = Ezpl.get_metrics()
+        assert snapshot["records"]["console"] == {"INFO": 1}
+        assert snapshot["bytes_written"]["console"] > 0
+        assert snapshot["suppressed"]["console"] == 1
+        assert snapshot["latency"]["print_pattern"]["console"]["count"] == 1
+
+    def test_file_metrics(self, temp_log_file: Path) -> None:
+        """Test file records, bytes and latencies."""
+        logger.remove()  # Drop file loggers left by other tests
+        handler = FileLogger(temp_log_file, level="DEBUG")
+        handler.get_logger().warning("disk almost full")
+        handler.close()
+        snapshot = Ezpl.get_metrics()
+        assert snapshot["records"]["file"] == {"WARNING": 1}
+        assert snapshot["bytes_written"]["file"] == temp_log_file.stat().st_size
+        assert snapshot["latency"]["format_message"]["file"]["count"] == 1
+        assert snapshot["latency"]["sink_write"]["file"]["count"] == 1
+
+    def test_console_bytes_non_ascii(self, mock_console) -> None:
+        """Test that bytes count the UTF-8 size of non-ASCII messages."""
+        printer = ConsolePrinter(level="DEBUG", mode="plain")
+        printer._console = mock_console
+        printer.info("ascii")
+        ascii_bytes = Ezpl.get_metrics()["bytes_written"]["console"]
+        printer.info("ascïï")
+        total = Ezpl.get_metrics()["bytes_written"]["console"]
+        assert total == 2 * ascii_bytes + 2
+
+    def test_file_queue_gauge(self, temp_log_file: Path) -> None:
+        """Test the depth gauge of the enqueue=True background queue."""
+        logger.remove()  # Drop file loggers left by other tests
+        handler = FileLogger(temp_log_file, level="DEBUG", enqueue=True)
+        for index in range(50):
+            handler.get_logger().info(f"record {index}")
+        assert 0 <= Ezpl.get_metrics()["queue_depth"]["file"] <= 50
+        logger.complete()
+        assert Ezpl.get_metrics()["queue_depth"]["file"] == 0
+        assert handler.queued == 0
+        handler.close()
+        assert "file" not in Ezpl.get_metrics()["queue_depth"]
+
+    @pytest.mark.usefixtures("clean_env")
+    def test_file_logger_async_config(self, temp_log_file: Path, monkeypatch) -> None:
+        """Test enabling the background file writer through the environment."""
+        monkeypatch.setenv("EZPL_FILE_LOGGER_ASYNC", "true")
+        Ezpl(log_file=temp_log_file)
+        assert "file" in Ezpl.get_metrics()["queue_depth"]
+
+    @pytest.mark.usefixtures("clean_env")
+    def test_export_without_path_raises(self) -> None:
+        """Test export_metrics() without a configured file."""
+        with pytest.raises(ValidationError):
+            Ezpl.export_metrics()
+
+
+class TestInfoMetricsCommand:
+    """Tests for ezpl info --metrics."""
+
+    def test_display_metrics_file(self, temp_dir: Path) -> None:
+        """Test displaying an exported metrics file."""
+        METRICS.record("file", "INFO", 100)
+        METRICS.histogram("sink_write", "file").observe(0.00003)
+        path = Ezpl.export_metrics(temp_dir / "ezpl.prom")
+        result = CliRunner().invoke(cli, ["info", "--metrics-file", str(path)])
+        assert result.exit_code == 0
+        assert "Records" in result.output
+        assert "sink_write" in result.output
+
+    def test_missing_metrics_file(self, temp_dir: Path) -> None:
+        """Test the message shown for a missing file."""
+        result = CliRunner().invoke(
+            cli, ["info", "--metrics-file", str(temp_dir / "missing.prom")]
+        )
+        assert result.exit_code == 0
+        assert "not found" in result.output
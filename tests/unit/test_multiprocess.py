@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires Multi-process
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for multi-process logging.
+
+Tests cover:
+- Frame encoding
+- Shared-memory rings and transport
+- Worker file loggers shipping records to a writer
+- Dropped records when the writer is unreachable
+- Ezpl writer mode, environment handle and forked workers
+"""
+
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl import Ezpl
+from ezpl.core.exceptions import ValidationError
+from ezpl.core.metrics import METRICS
+from ezpl.handlers import (
+    FileLogger,
+    LogWriterServer,
+    SharedMemoryTransport,
+    SocketTransport,
+)
+from ezpl.handlers.multiprocess import (
+    WRITER_ENV,
+    WRITER_KEY_ENV,
+    SharedMemoryRing,
+    decode_frame,
+    encode_frame,
+    shared_memory_supported,
+    transport_from_environment,
+)
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _fork_worker(count: int, transport: type = SocketTransport) -> None:
+    """Log from a forked copy of the writer process."""
+    ezpl = Ezpl()
+    assert type(ezpl._logger._transport) is transport
+    for index in range(count):
+        ezpl.get_logger().info(f"forked {index}")
+    ezpl.get_logger().complete()
+
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestFrames:
+    """Tests for byte frames."""
+
+    def test_round_trip(self) -> None:
+        """Test that a frame decodes to its level and line."""
+        frame = encode_frame(30, "line é {braces} <tags>\n")
+        assert frame[0] == 30
+        assert decode_frame(frame) == (30, "line é {braces} <tags>\n")
+
+
+class TestSocketTransport:
+    """Tests for the worker side of multi-process logging."""
+
+    def test_worker_ships_formatted_lines(self, temp_dir: Path) -> None:
+        """Test that worker records reach the writer as formatted lines."""
+        frames: list[tuple[int, str]] = []
+        server = LogWriterServer(lambda level_no, line: frames.append((level_no, line)))
+        env = server.environment()
+        transport = SocketTransport(env[WRITER_ENV], bytes.fromhex(env[WRITER_KEY_ENV]))
+        worker = FileLogger(temp_dir / "app.log", level="DEBUG", transport=transport)
+        try:
+            assert worker.is_worker
+            worker.log("WARNING", "from worker {0}")
+            worker.log("DEBUG", "debug from worker")
+            assert _wait_for(lambda: server.received == 2)
+        finally:
+            worker.close()
+            server.close()
+
+        assert [level_no for level_no, _ in frames] == [30, 10]
+        assert "WARNING" in frames[0][1]
+        assert frames[0][1].endswith("from worker {0}\n")
+        assert not (temp_dir / "app.log").exists()
+
+    def test_write_remote(self, temp_log_file: Path) -> None:
+        """Test that the writer writes received lines verbatim."""
+        writer = FileLogger(temp_log_file, level="INFO")
+        try:
+            writer.write_remote(30, "remote line {braces} <b>\n")
+        finally:
+            writer.close()
+        assert temp_log_file.read_text(encoding="utf-8") == "remote line {braces} <b>\n"
+
+    def test_unreachable_writer_drops(self, temp_dir: Path) -> None:
+        """Test that records are dropped and counted without a writer."""
+        METRICS.reset()
+        transport = SocketTransport(str(temp_dir / "missing.sock"), b"key")
+        worker = FileLogger(temp_dir / "app.log", transport=transport)
+        try:
+            worker.log("INFO", "lost")
+            worker.log("INFO", "lost again")
+        finally:
+            worker.close()
+        assert METRICS.snapshot()["dropped"]["transport"] == 2
+
+    def test_from_environment(self, monkeypatch, tmp_path: Path) -> None:
+        """Test the inherited environment handle."""
+        monkeypatch.delenv(WRITER_ENV, raising=False)
+        assert SocketTransport.from_environment() is None
+
+        monkeypatch.setenv(WRITER_ENV, str(tmp_path / "ezpl.sock"))
+        monkeypatch.setenv(WRITER_KEY_ENV, "not hex")
+        with pytest.raises(ValidationError):
+            SocketTransport.from_environment()
+
+        monkeypatch.setenv(WRITER_KEY_ENV, "00ff")
+        assert SocketTransport.from_environment() is not None
+
+
+class TestSharedMemoryRing:
+    """Tests for the single-producer ring."""
+
+    def test_frames_wrap_around(self) -> None:
+        """Test that frames survive wrapping around the data area."""
+        ring = SharedMemoryRing.create(4096)
+        try:
+            frame = b"x" * 1000
+            for _ in range(20):  # Several times the capacity
+                assert ring.write(frame)
+                assert ring.write(b"short")
+                assert ring.read() == [frame, b"short"]
+            assert ring.pending == 0
+        finally:
+            ring.close()
+
+    def test_full_ring_refuses_frames(self) -> None:
+        """Test back-pressure when the consumer falls behind."""
+        ring = SharedMemoryRing.create(4096)
+        try:
+            written = 0
+            while ring.write(b"y" * 100):
+                written += 1
+            assert written == ring.capacity // 104
+            assert len(ring.read()) == written
+            assert ring.write(b"y" * 100)
+        finally:
+            ring.close()
+
+
+class TestSharedMemoryTransport:
+    """Tests for the shared-memory transport."""
+
+    def test_frames_reach_writer(self) -> None:
+        """Test that the collector drains a worker's ring."""
+        frames: list[tuple[int, str]] = []
+        server = LogWriterServer(lambda level_no, line: frames.append((level_no, line)))
+        env = server.environment()
+        transport = SharedMemoryTransport(
+            env[WRITER_ENV], bytes.fromhex(env[WRITER_KEY_ENV]), ring_size=8192
+        )
+        try:
+            for index in range(500):
+                transport.send(encode_frame(20, f"line {index}\n"))
+                if index % 50 == 0:
+                    assert _wait_for(lambda: transport.pending == 0)
+            assert transport.dropped == 0
+            assert _wait_for(lambda: server.received == 500)
+        finally:
+            transport.close()
+            server.close()
+        assert frames[0] == (20, "line 0\n")
+        assert frames[-1] == (20, "line 499\n")
+
+    def test_unreachable_writer_drops(self, temp_dir: Path) -> None:
+        """Test that drops are counted when no ring can be announced."""
+        METRICS.reset()
+        transport = SharedMemoryTransport(str(temp_dir / "missing.sock"), b"key")
+        assert not transport.send(encode_frame(20, "lost"))
+        assert transport.dropped == 1
+        assert METRICS.snapshot()["dropped"]["shm"] == 1
+
+    def test_transport_from_environment(self, monkeypatch, tmp_path: Path) -> None:
+        """Test selecting the transport by name."""
+        monkeypatch.setenv(WRITER_ENV, str(tmp_path / "ezpl.sock"))
+        monkeypatch.setenv(WRITER_KEY_ENV, "00ff")
+        monkeypatch.setattr(platform, "machine", lambda: "x86_64")
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert type(transport_from_environment("socket")) is SocketTransport
+        assert isinstance(transport_from_environment("shm"), SharedMemoryTransport)
+        with pytest.raises(ValidationError):
+            transport_from_environment("carrier-pigeon")
+
+    @pytest.mark.parametrize(
+        ("machine", "gil"), [("aarch64", True), ("arm64", True), ("x86_64", False)]
+    )
+    def test_unsupported_platform_falls_back(
+        self, monkeypatch, tmp_path: Path, machine: str, gil: bool
+    ) -> None:
+        """Test that shm falls back to the socket transport where unsafe."""
+        monkeypatch.setenv(WRITER_ENV, str(tmp_path / "ezpl.sock"))
+        monkeypatch.setenv(WRITER_KEY_ENV, "00ff")
+        monkeypatch.setattr(platform, "machine", lambda: machine)
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil, raising=False)
+        assert not shared_memory_supported()
+        with pytest.warns(RuntimeWarning, match="socket transport"):
+            transport = transport_from_environment("shm")
+        assert type(transport) is SocketTransport
+
+
+class TestEzplWriter:
+    """Tests for Ezpl's multi-process mode."""
+
+    def test_start_and_stop(self, temp_log_file: Path) -> None:
+        """Test that the writer exports and withdraws its environment handle."""
+        ezpl = Ezpl(log_file=temp_log_file)
+        address = ezpl.start_log_writer()
+        assert os.environ[WRITER_ENV] == address
+        assert ezpl.start_log_writer() == address
+        assert not Ezpl.is_log_worker()
+
+        Ezpl.stop_log_writer()
+        assert WRITER_ENV not in os.environ
+        assert Ezpl.get_log_writer() is None
+
+    def test_spawned_worker_attaches(self, temp_log_file: Path) -> None:
+        """Test that a process started by the writer ships its records."""
+        ezpl = Ezpl(log_file=temp_log_file, file_logger_level="INFO")
+        ezpl.start_log_writer()
+        code = (
+            "from ezpl import Ezpl\n"
+            f"ezpl = Ezpl(log_file={str(temp_log_file)!r}, file_logger_level='INFO')\n"
+            "assert Ezpl.is_log_worker()\n"
+            "ezpl.get_logger().info('from spawned worker')\n"
+        )
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            env={
+                **os.environ,
+                "PYTHONPATH": str(Path(__file__).resolve().parents[2]),
+            },
+            check=True,
+            timeout=60,
+        )
+        writer = Ezpl.get_log_writer()
+        assert _wait_for(lambda: writer.received == 1), writer
+        Ezpl.reset()
+        assert "from spawned worker" in temp_log_file.read_text(encoding="utf-8")
+
+    @pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.fork")
+    def test_forked_worker_attaches(self, temp_log_file: Path) -> None:
+        """Test that a forked copy of the writer becomes a worker."""
+        ezpl = Ezpl(log_file=temp_log_file, file_logger_level="INFO")
+        ezpl.start_log_writer()
+        process = multiprocessing.get_context("fork").Process(
+            target=_fork_worker, args=(20,)
+        )
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+
+        writer = Ezpl.get_log_writer()
+        assert _wait_for(lambda: writer.received == 20), writer
+        assert not ezpl._logger.is_worker
+        Ezpl.reset()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert content.count("forked ") == 20
+
+    @pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires os.fork")
+    def test_forked_worker_uses_configured_transport(
+        self, temp_log_file: Path, monkeypatch
+    ) -> None:
+        """Test that forked workers use the shared-memory transport from config."""
+        monkeypatch.setenv("EZPL_LOG_TRANSPORT", "shm")
+        ezpl = Ezpl(log_file=temp_log_file, file_logger_level="INFO")
+        ezpl.start_log_writer()
+        processes = [
+            multiprocessing.get_context("fork").Process(
+                target=_fork_worker, args=(20, SharedMemoryTransport)
+            )
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0
+
+        writer = Ezpl.get_log_writer()
+        assert _wait_for(lambda: writer.received == 60), writer
+        Ezpl.reset()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert content.count("forked ") == 60
@@ -15,18 +15,33 @@ Tests cover:
 - Special character handling
 - Type conversion
 - Error handling
+- Plain render mode
+- Prefix and indent caches
+- Per-thread and per-task indentation
 """
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
+import asyncio
+import io
+import threading
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
+import pytest
+from rich.console import Console
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
 from ezpl import Ezpl
-from ezpl.types import Pattern
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers import ConsolePrinter
+from ezpl.types import (
+    Pattern,
+    register_pattern,
+    set_pattern_color,
+    unregister_pattern,
+)
 
 ## ==> TESTS
 # ///////////////////////////////////////////////////////////////
@@ -351,6 +366,16 @@ class TestRichFeatures:
         assert hasattr(wizard, "table")
         assert hasattr(wizard, "json")
 
+    def test_wizard_created_on_first_use(self) -> None:
+        """Test that the wizard is only built when first needed."""
+        printer = ConsolePrinter()
+        assert printer._wizard_instance is None
+        printer.info("message")
+        assert printer._wizard_instance is None
+        wizard = printer.get_printer().wizard
+        assert printer._wizard_instance is wizard
+        assert printer._wizard is wizard
+
 
 class TestSpecialCharacters:
     """Tests for special character handling."""
@@ -437,3 +462,184 @@ class TestTypeConversion:
 
         printer.info(CustomObject())
         # Verify no exception raised
+
+
+class TestPlainMode:
+    """Tests for the plain-text render mode."""
+
+    @staticmethod
+    def _printer(
+        mode: str, terminal: bool = False, width: int = 40
+    ) -> tuple[ConsolePrinter, io.StringIO]:
+        printer = ConsolePrinter(level="DEBUG", mode=mode)
+        stream = io.StringIO()
+        printer._console = Console(file=stream, force_terminal=terminal, width=width)
+        return printer, stream
+
+    def test_auto_is_plain_when_not_a_terminal(self) -> None:
+        """Test auto mode resolves to plain for a non-terminal console."""
+        printer, _ = self._printer("auto")
+        assert printer.mode == "plain"
+
+    def test_auto_is_rich_on_a_terminal(self) -> None:
+        """Test auto mode keeps Rich rendering on a terminal."""
+        printer, _ = self._printer("auto", terminal=True)
+        assert printer.mode == "rich"
+
+    def test_plain_line_format(self) -> None:
+        """Test plain lines match the Rich layout, unwrapped and unstyled."""
+        printer, stream = self._printer("plain", terminal=True)
+        message = "x" * 60
+        printer.print_pattern(Pattern.SUCCESS, message, "INFO")
+        assert stream.getvalue() == f"• SUCCESS :: {message}\n"
+
+    def test_plain_matches_rich_output(self) -> None:
+        """Test plain and Rich renderings produce the same text."""
+        plain, plain_stream = self._printer("plain", width=120)
+        rich, rich_stream = self._printer("rich", width=120)
+        for printer in (plain, rich):
+            printer.info("first")
+            with printer.manage_indent():
+                printer.warning("nested [bold]markup[/bold]")
+        assert plain_stream.getvalue() == rich_stream.getvalue()
+
+    def test_plain_summary_lines(self) -> None:
+        """Test coalescing summaries use the plain prefix."""
+        printer = ConsolePrinter(level="DEBUG", mode="plain", coalesce_window=60)
+        stream = io.StringIO()
+        printer._console = Console(file=stream)
+        for _ in range(3):
+            printer.info("same")
+        printer.flush_repeated()
+        assert stream.getvalue().splitlines() == [
+            "• INFO    :: same",
+            "• INFO    :: last message repeated 2 times",
+        ]
+
+    def test_invalid_mode(self) -> None:
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValidationError):
+            ConsolePrinter(mode="fancy")
+
+
+class TestPrefixCache:
+    """Tests for cached pattern prefixes and indent strings."""
+
+    @staticmethod
+    def _printer() -> tuple[ConsolePrinter, io.StringIO]:
+        printer = ConsolePrinter(level="DEBUG", mode="rich")
+        stream = io.StringIO()
+        printer._console = Console(
+            file=stream, force_terminal=True, color_system="truecolor", width=120
+        )
+        return printer, stream
+
+    def test_string_and_enum_share_resolution(self) -> None:
+        """Test string names resolve like enums, unknown names like INFO."""
+        printer, _ = self._printer()
+        assert printer._get_prefix("warn").pattern is Pattern.WARN
+        assert printer._get_prefix("nope").pattern is Pattern.INFO
+        assert printer._get_prefix(Pattern.WARN) is printer._get_prefix(Pattern.WARN)
+
+    def test_custom_pattern(self) -> None:
+        """Test registered patterns are displayed with their own prefix."""
+        printer, stream = self._printer()
+        register_pattern("deploy", "bright_cyan")
+        try:
+            printer._console = Console(file=stream, width=120)
+            printer.print_pattern("deploy", "shipping")
+        finally:
+            unregister_pattern("deploy")
+        assert stream.getvalue() == "• DEPLOY  :: shipping\n"
+
+    def test_color_change_invalidates_cache(self) -> None:
+        """Test prefixes are rebuilt after a color change."""
+        printer, stream = self._printer()
+        printer.tip("before")
+        try:
+            set_pattern_color(Pattern.TIP, "#010203")
+            printer.tip("after")
+        finally:
+            set_pattern_color(Pattern.TIP, "bright_magenta")
+        before, after = stream.getvalue().splitlines()
+        assert "1;2;3" not in before
+        assert "1;2;3" in after
+
+    def test_indent_strings(self) -> None:
+        """Test cached indent strings match the indentation settings."""
+        printer = ConsolePrinter(indent_step=2, indent_symbol="-")
+        assert printer.get_indent() == "~"
+        printer.add_indent()
+        printer.add_indent()
+        assert printer.get_indent() == "    -"
+        printer.set_indent_style(indent_step=1, indent_symbol="*")
+        assert printer.get_indent() == "  *"
+
+
+class TestIndentationContext:
+    """Tests for indentation isolated per thread and per asyncio task."""
+
+    def test_threads_do_not_share_indentation(self) -> None:
+        """Test that indentation in one thread is invisible to others."""
+        printer = ConsolePrinter()
+        inside = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def worker() -> None:
+            with printer.manage_indent(), printer.manage_indent():
+                seen.append(printer._indent)
+                inside.set()
+                release.wait(2)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inside.wait(2)
+        assert printer._indent == 0
+        release.set()
+        thread.join()
+        assert seen == [2]
+
+    def test_tasks_do_not_share_indentation(self) -> None:
+        """Test that concurrent asyncio tasks keep their own level."""
+        printer = ConsolePrinter()
+
+        async def task(depth: int) -> list[int]:
+            levels = []
+            for _ in range(depth):
+                printer.add_indent()
+                await asyncio.sleep(0)
+                levels.append(printer._indent)
+            return levels
+
+        async def main() -> list[list[int]]:
+            with printer.manage_indent():
+                return await asyncio.gather(task(1), task(3))
+
+        assert asyncio.run(main()) == [[2], [2, 3, 4]]
+        assert printer._indent == 0
+
+    def test_thread_pool_output(self) -> None:
+        """Test that lines logged from a pool carry their own indentation."""
+        printer = ConsolePrinter(mode="plain")
+        stream = io.StringIO()
+        printer._console = Console(file=stream, width=120)
+
+        def worker(depth: int) -> None:
+            for _ in range(depth):
+                printer.add_indent()
+            for _ in range(50):
+                printer.info(f"depth {depth}")
+
+        threads = [threading.Thread(target=worker, args=(d,)) for d in (0, 1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = {
+            "• INFO    :: depth 0",
+            "• INFO    ::    > depth 1",
+            "• INFO    ::       > depth 2",
+        }
+        assert set(stream.getvalue().splitlines()) == expected
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires RateLimiter
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for RateLimiter and rate limiting in handlers.
+
+Tests cover:
+- Token bucket decisions and refill
+- Suppression counts and summaries
+- ConsolePrinter and FileLogger integration
+- Configuration from environment variables
+"""
+
+import os
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl import Ezpl
+from ezpl.config import ConfigurationManager
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers import ConsolePrinter, FileLogger
+from ezpl.handlers.rate_limit import RateLimiter, format_suppressed
+
+## ==> HELPER FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+class FakeClock:
+    """Controllable monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestRateLimiter:
+    """Tests for the token bucket."""
+
+    def test_burst_then_suppress(self) -> None:
+        """Test that records beyond the burst are suppressed."""
+        limiter = RateLimiter(rate=1, burst=3)
+        limiter._clock = FakeClock()
+        results = [limiter.allow("key") for _ in range(5)]
+        assert results == [0, 0, 0, None, None]
+
+    def test_refill_reports_suppressed_count(self) -> None:
+        """Test that the next allowed record reports suppressed records."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2, burst=1)
+        limiter._clock = clock
+        assert limiter.allow("key") == 0
+        assert limiter.allow("key") is None
+        assert limiter.allow("key") is None
+        clock.now += 0.5
+        assert limiter.allow("key") == 2
+        assert limiter.allow("key") is None
+
+    def test_keys_are_independent(self) -> None:
+        """Test that each key has its own bucket."""
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter._clock = FakeClock()
+        assert limiter.allow("a") == 0
+        assert limiter.allow("b") == 0
+        assert limiter.allow("a") is None
+
+    def test_drain_suppressed(self) -> None:
+        """Test draining pending suppression counts."""
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter._clock = FakeClock()
+        limiter.allow("a")
+        limiter.allow("a")
+        limiter.allow("a")
+        assert limiter.drain_suppressed() == [("a", 2)]
+        assert limiter.drain_suppressed() == []
+
+    def test_max_keys_keeps_pending_counts(self, monkeypatch) -> None:
+        """Test that reaching MAX_KEYS does not lose suppressed counts."""
+        monkeypatch.setattr(RateLimiter, "MAX_KEYS", 3)
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter._clock = FakeClock()
+        limiter.allow("storm")
+        limiter.allow("storm")
+        limiter.allow("idle")
+        limiter.allow("other")
+        limiter.allow("new")  # Evicts the idle buckets only
+        assert "storm" in limiter._buckets
+        assert limiter.drain_suppressed() == [("storm", 1)]
+
+    def test_max_keys_carries_over_counts(self, monkeypatch) -> None:
+        """Test that counts of evicted buckets are still reported."""
+        monkeypatch.setattr(RateLimiter, "MAX_KEYS", 2)
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter._clock = clock
+        for key in ("a", "a", "b", "b", "b"):
+            limiter.allow(key)
+        limiter.allow("c")  # Every bucket has a pending count
+        assert limiter.allow("a") == 1  # Reported when "a" is allowed again
+        assert limiter.drain_suppressed() == [("b", 2)]
+
+    def test_invalid_parameters(self) -> None:
+        """Test validation of rate, burst and key."""
+        with pytest.raises(ValidationError):
+            RateLimiter(rate=0)
+        with pytest.raises(ValidationError):
+            RateLimiter(rate=1, burst=0)
+        with pytest.raises(ValidationError):
+            RateLimiter(rate=1, key="thread")
+
+    def test_format_suppressed(self) -> None:
+        """Test summary text."""
+        assert format_suppressed(1) == "suppressed 1 similar message"
+        assert format_suppressed(5) == "suppressed 5 similar messages"
+
+
+class TestConsolePrinterRateLimit:
+    """Tests for rate limiting in ConsolePrinter."""
+
+    def test_callsite_suppression(self, mock_console) -> None:
+        """Test that a storm from one call site is suppressed."""
+        printer = ConsolePrinter(level="DEBUG", rate_limit=1, rate_limit_burst=2)
+        printer._console = mock_console
+        for _ in range(10):
+            printer.error("dependency down")
+        assert mock_console.print.call_count == 2
+
+    def test_different_callsites_not_shared(self, mock_console) -> None:
+        """Test that distinct call sites have distinct buckets."""
+        printer = ConsolePrinter(level="DEBUG", rate_limit=1, rate_limit_burst=1)
+        printer._console = mock_console
+        printer.error("first")
+        printer.error("second")
+        assert mock_console.print.call_count == 2
+
+    def test_message_key_mode(self, mock_console) -> None:
+        """Test keying by message instead of call site."""
+        printer = ConsolePrinter(
+            level="DEBUG", rate_limit=1, rate_limit_burst=1, rate_limit_key="message"
+        )
+        printer._console = mock_console
+        printer.error("same")
+        printer.error("same")
+        printer.error("other")
+        assert mock_console.print.call_count == 2
+
+    def test_summary_appended(self, mock_console) -> None:
+        """Test that the next allowed message carries the summary."""
+        printer = ConsolePrinter(level="DEBUG", rate_limit=1, rate_limit_burst=1)
+        printer._console = mock_console
+        clock = FakeClock()
+        printer._rate_limiter._clock = clock
+        for attempt in range(5):
+            if attempt == 4:
+                clock.now += 1.0
+            printer.warning("retrying")
+        text = mock_console.print.call_args[0][0]
+        assert "suppressed 3 similar messages" in text.plain
+
+    def test_flush_suppressed(self, mock_console) -> None:
+        """Test flushing pending summaries."""
+        printer = ConsolePrinter(level="DEBUG", rate_limit=1, rate_limit_burst=1)
+        printer._console = mock_console
+        for _ in range(3):
+            printer.info("storm")
+        printer.flush_suppressed()
+        text = mock_console.print.call_args[0][0]
+        assert "suppressed 2 similar messages" in text.plain
+
+    def test_disabled_by_default(self, mock_console) -> None:
+        """Test that rate limiting is opt-in."""
+        printer = ConsolePrinter(level="DEBUG")
+        printer._console = mock_console
+        for _ in range(20):
+            printer.info("no limit")
+        assert mock_console.print.call_count == 20
+
+
+class TestFileLoggerRateLimit:
+    """Tests for rate limiting in FileLogger."""
+
+    def test_file_storm_suppressed(self, temp_log_file: Path) -> None:
+        """Test that a storm is suppressed and summarized on close."""
+        handler = FileLogger(
+            temp_log_file, level="DEBUG", rate_limit=1, rate_limit_burst=2
+        )
+        logger = handler.get_logger()
+        for _ in range(50):
+            logger.error("connection refused")
+        handler.close()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert content.count("connection refused") == 2
+        assert "suppressed 48 similar messages" in content
+
+    def test_log_callsites_not_shared(self, temp_log_file: Path) -> None:
+        """Test that FileLogger.log() keys records by the caller's call site."""
+        handler = FileLogger(
+            temp_log_file, level="DEBUG", rate_limit=1, rate_limit_burst=1
+        )
+        for _ in range(5):
+            handler.log("ERROR", "busy call site")
+        handler.log("ERROR", "quiet call site")
+        handler.close()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert content.count("busy call site") == 1
+        assert "quiet call site" in content
+        assert "test_rate_limit:test_log_callsites_not_shared:" in content
+
+    def test_messages_with_braces_and_tags(self, temp_log_file: Path) -> None:
+        """Test that braces and angle brackets do not break formatting."""
+        handler = FileLogger(temp_log_file, level="DEBUG")
+        handler.get_logger().info("payload {id} <tag>")
+        handler.log("INFO", "dict {'a': 1}")
+        handler.close()
+        content = temp_log_file.read_text(encoding="utf-8")
+        assert "payload {id}" in content
+        assert "dict {'a': 1}" in content
+
+
+@pytest.mark.usefixtures("clean_env")
+class TestRateLimitConfiguration:
+    """Tests for rate limit configuration."""
+
+    def test_env_variables(self, temp_config_file: Path) -> None:
+        """Test loading rate limit settings from the environment."""
+        os.environ["EZPL_RATE_LIMIT"] = "5"
+        os.environ["EZPL_RATE_LIMIT_BURST"] = "10"
+        os.environ["EZPL_RATE_LIMIT_KEY"] = "message"
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_rate_limit() == 5.0
+        assert manager.get_rate_limit_burst() == 10
+        assert manager.get_rate_limit_key() == "message"
+
+    def test_disabled_by_default(self, temp_config_file: Path) -> None:
+        """Test that rate limiting is disabled by default."""
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_rate_limit() is None
+        assert manager.get_rate_limit_key() == "callsite"
+
+    def test_env_none_disables(
+        self, temp_config_file: Path, temp_log_file: Path
+    ) -> None:
+        """Test that EZPL_RATE_LIMIT=none disables rate limiting."""
+        os.environ["EZPL_RATE_LIMIT"] = "none"
+        os.environ["EZPL_COALESCE_WINDOW"] = ""
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_rate_limit() is None
+        assert manager.get_coalesce_window() is None
+        Ezpl(log_file=temp_log_file)
+
+    def test_env_invalid_number_ignored(self, temp_config_file: Path, capsys) -> None:
+        """Test that a non-numeric value is ignored with a warning."""
+        os.environ["EZPL_RATE_LIMIT"] = "fast"
+        manager = ConfigurationManager(config_file=temp_config_file)
+        assert manager.get_rate_limit() is None
+        assert "EZPL_RATE_LIMIT" in capsys.readouterr().out
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires RenderQueue
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for RenderQueue and ConsolePrinter's asynchronous mode.
+
+Tests cover:
+- Batched rendering and flushing
+- Overflow policies and dropped counters
+- ConsolePrinter async output and queue depth gauge
+- Configuration from environment variables
+"""
+
+import io
+import threading
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+from rich.console import Console
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl.config import ConfigurationManager
+from ezpl.core.exceptions import ValidationError
+from ezpl.core.metrics import METRICS
+from ezpl.handlers import ConsolePrinter
+from ezpl.handlers.render_queue import RenderQueue
+
+## ==> FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty counters."""
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestRenderQueue:
+    """Tests for the bounded render queue."""
+
+    def test_items_rendered_in_order(self) -> None:
+        """Test that every item reaches the callback, in order."""
+        rendered = []
+        queue = RenderQueue(rendered.extend, sink="test")
+        for i in range(1000):
+            queue.submit(i)
+        assert queue.flush()
+        queue.close()
+        assert rendered == list(range(1000))
+
+    def test_batches_while_render_blocked(self) -> None:
+        """Test that items queued during a slow render form one batch."""
+        release = threading.Event()
+        batches = []
+
+        def render(batch):
+            batches.append(list(batch))
+            release.wait(2)
+
+        queue = RenderQueue(render, sink="test")
+        queue.submit("first")
+        while not batches:
+            pass
+        for i in range(10):
+            queue.submit(i)
+        release.set()
+        queue.close()
+        assert batches == [["first"], list(range(10))]
+
+    def test_drop_new(self) -> None:
+        """Test that a full queue drops incoming items and counts them."""
+        release = threading.Event()
+        rendered = []
+        queue = RenderQueue(
+            lambda batch: (release.wait(2), rendered.extend(batch)),
+            maxsize=2,
+            sink="test",
+        )
+        queue.submit("blocking")
+        while len(queue):
+            pass  # Render thread holds "blocking"
+        assert queue.submit("a") and queue.submit("b")
+        assert queue.submit("c") is False
+        release.set()
+        queue.close()
+        assert rendered == ["blocking", "a", "b"]
+        assert queue.dropped == 1
+        assert METRICS.snapshot()["dropped"]["test"] == 1
+
+    def test_drop_old(self) -> None:
+        """Test that a full queue drops the oldest items."""
+        release = threading.Event()
+        rendered = []
+        queue = RenderQueue(
+            lambda batch: (release.wait(2), rendered.extend(batch)),
+            maxsize=2,
+            overflow="drop_old",
+            sink="test",
+        )
+        queue.submit("blocking")
+        while len(queue):
+            pass
+        for item in ("a", "b", "c"):
+            queue.submit(item)
+        release.set()
+        queue.close()
+        assert rendered == ["blocking", "b", "c"]
+        assert queue.dropped == 1
+        assert METRICS.snapshot()["dropped"]["test"] == 1
+
+    def test_block_waits_for_room(self) -> None:
+        """Test that the block policy loses nothing."""
+        rendered = []
+        queue = RenderQueue(rendered.extend, maxsize=1, overflow="block", sink="test")
+        for i in range(200):
+            queue.submit(i)
+        queue.close()
+        assert rendered == list(range(200))
+
+    def test_closed_queue_rejects_items(self) -> None:
+        """Test that submitting after close drops the item."""
+        queue = RenderQueue(lambda _batch: None, sink="test")
+        queue.close()
+        assert queue.submit("late") is False
+        assert queue.dropped == 1
+        assert METRICS.snapshot()["dropped"]["test"] == 1
+
+    def test_invalid_settings(self) -> None:
+        """Test validation of the size and the overflow policy."""
+        with pytest.raises(ValidationError):
+            RenderQueue(lambda _batch: None, maxsize=0)
+        with pytest.raises(ValidationError):
+            RenderQueue(lambda _batch: None, overflow="spill")
+
+
+class TestConsolePrinterAsync:
+    """Tests for ConsolePrinter's asynchronous mode."""
+
+    def test_output_matches_sync_mode(self) -> None:
+        """Test that async output is the same as sync output."""
+        outputs = []
+        for async_render in (False, True):
+            printer = ConsolePrinter(
+                level="DEBUG", mode="plain", async_render=async_render
+            )
+            stream = io.StringIO()
+            printer._console = Console(file=stream, width=120)
+            printer.info("start")
+            with printer.manage_indent():
+                printer.warning("nested")
+            printer.error("done")
+            printer.close()
+            outputs.append(stream.getvalue())
+        assert outputs[0] == outputs[1]
+        assert outputs[1].splitlines()[1] == "• WARN    ::    > nested"
+
+    def test_queue_depth_gauge(self) -> None:
+        """Test that the queue depth gauge exists while the printer is open."""
+        printer = ConsolePrinter(async_render=True)
+        printer._console = Console(file=io.StringIO())
+        assert "console" in METRICS.snapshot()["queue_depth"]
+        printer.close()
+        assert "console" not in METRICS.snapshot()["queue_depth"]
+
+    def test_summary_lines_keep_order(self) -> None:
+        """Test that coalescing summaries are written in sequence."""
+        printer = ConsolePrinter(
+            level="DEBUG", mode="plain", async_render=True, coalesce_window=60
+        )
+        stream = io.StringIO()
+        printer._console = Console(file=stream)
+        for _ in range(3):
+            printer.info("same")
+        printer.info("other")
+        printer.close()
+        assert stream.getvalue().splitlines() == [
+            "• INFO    :: same",
+            "• INFO    :: last message repeated 2 times",
+            "• INFO    :: other",
+        ]
+
+    def test_config_from_environment(self, monkeypatch) -> None:
+        """Test that async settings are read from the environment."""
+        monkeypatch.setenv("EZPL_PRINTER_ASYNC", "true")
+        monkeypatch.setenv("EZPL_PRINTER_QUEUE_SIZE", "500")
+        monkeypatch.setenv("EZPL_PRINTER_OVERFLOW", "drop_old")
+        manager = ConfigurationManager()
+        assert manager.get_printer_async() is True
+        assert manager.get_printer_queue_size() == 500
+        assert manager.get_printer_overflow() == "drop_old"
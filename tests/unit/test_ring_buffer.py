@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EZPL - Tests unitaires RingBufferHandler
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the RingBufferHandler flight recorder.
+
+Tests cover:
+- Capture of the last N records, DEBUG included
+- Dumps on demand and on ERROR
+- Unhandled exception hook
+- Ezpl integration and configuration
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import pytest
+from loguru import logger
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ezpl import Ezpl
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers import FileLogger, RingBufferHandler
+
+## ==> TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestRingBufferHandler:
+    """Tests for the ring buffer handler."""
+
+    def test_keeps_last_records(self) -> None:
+        """Test that only the last N records are kept, oldest first."""
+        ring = RingBufferHandler(capacity=5, dump_level=None)
+        try:
+            bound = logger.bind(task="logger")
+            for index in range(12):
+                bound.debug(f"step {index}")
+            records = ring.get_records()
+            assert len(records) == 5
+            assert "step 7" in records[0]
+            assert "step 11" in records[-1]
+            assert "DEBUG" in records[0]
+        finally:
+            ring.close()
+
+    def test_ignores_foreign_records(self) -> None:
+        """Test that records not bound to Ezpl are ignored."""
+        ring = RingBufferHandler(capacity=5, dump_level=None)
+        try:
+            logger.info("not ezpl")
+            assert len(ring) == 0
+        finally:
+            ring.close()
+
+    def test_debug_kept_while_file_is_info(self, temp_dir: Path) -> None:
+        """Test that DEBUG records reach the ring but not the file."""
+        log_file = temp_dir / "app.log"
+        handler = FileLogger(log_file, level="INFO")
+        ring = RingBufferHandler(capacity=10, dump_level=None)
+        try:
+            handler.get_logger().debug("hidden detail")
+            assert "hidden detail" in "".join(ring.get_records())
+        finally:
+            ring.close()
+            handler.close()
+        assert "hidden detail" not in log_file.read_text(encoding="utf-8")
+
+    def test_dump_on_error(self, temp_dir: Path) -> None:
+        """Test that an ERROR record dumps the context."""
+        dump_file = temp_dir / "recent.log"
+        ring = RingBufferHandler(capacity=10, dump_file=dump_file)
+        try:
+            bound = logger.bind(task="logger")
+            bound.debug("connecting to db")
+            bound.error("query failed")
+        finally:
+            ring.close()
+        content = dump_file.read_text(encoding="utf-8")
+        assert "## ==> RECENT RECORDS (ERROR record)" in content
+        assert content.index("connecting to db") < content.index("query failed")
+
+    def test_dump_on_demand(self, temp_dir: Path) -> None:
+        """Test dumping to an explicit path."""
+        ring = RingBufferHandler(capacity=10)
+        try:
+            ring.log("INFO", "checkpoint")
+            path = ring.dump(temp_dir / "dump.log", reason="manual")
+        finally:
+            ring.close()
+        assert "checkpoint" in path.read_text(encoding="utf-8")
+
+    def test_dump_without_file_raises(self) -> None:
+        """Test that dump() needs a path when none is configured."""
+        ring = RingBufferHandler(capacity=2)
+        try:
+            with pytest.raises(ValidationError):
+                ring.dump()
+        finally:
+            ring.close()
+
+    def test_excepthook(self, temp_dir: Path) -> None:
+        """Test that unhandled exceptions dump the ring and chain the hook."""
+        dump_file = temp_dir / "recent.log"
+        ring = RingBufferHandler(capacity=10, dump_file=dump_file)
+        previous = sys.excepthook
+        calls = []
+
+        def test_hook(*args) -> None:
+            calls.append(args)
+
+        sys.excepthook = test_hook
+        try:
+            ring.install_excepthook()
+            logger.bind(task="logger").debug("last step")
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                sys.excepthook(*sys.exc_info())
+            ring.close()
+            assert len(calls) == 1
+            assert sys.excepthook is test_hook
+        finally:
+            sys.excepthook = previous
+        content = dump_file.read_text(encoding="utf-8")
+        assert "unhandled RuntimeError" in content
+        assert "last step" in content
+        assert "RuntimeError: boom" in content
+
+    def test_invalid_capacity(self) -> None:
+        """Test capacity validation."""
+        with pytest.raises(ValidationError):
+            RingBufferHandler(capacity=0)
+
+
+@pytest.mark.usefixtures("clean_env")
+class TestEzplRingBuffer:
+    """Tests for the flight recorder in Ezpl."""
+
+    def test_disabled_by_default(self, temp_log_file: Path) -> None:
+        """Test that dump_recent() returns None without a ring buffer."""
+        Ezpl(log_file=temp_log_file)
+        assert Ezpl.get_ring_buffer() is None
+        assert Ezpl.dump_recent() is None
+
+    def test_enabled_from_env(self, temp_log_file: Path) -> None:
+        """Test enabling the ring buffer with environment variables."""
+        os.environ["EZPL_RING_BUFFER_SIZE"] = "50"
+        os.environ["EZPL_LOG_FILE"] = str(temp_log_file)
+        ezpl = Ezpl(log_file=temp_log_file)
+        ezpl.get_logger().debug("debug context")
+        path = Ezpl.dump_recent()
+        assert path == temp_log_file.with_name("test.recent.log")
+        assert "debug context" in path.read_text(encoding="utf-8")
@@ -0,0 +1,337 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Shipping Sink Tests
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for ShippingSink.
+
+Tests cover:
+- Batching by count and by time, compression and TCP framing
+- HTTP shipping
+- Spooling while the endpoint is down, replay in order on recovery
+- Replay of segments left by a previous run
+- Disk quota and in-memory backpressure
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import gzip
+import socket
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ezpl.core.exceptions import ValidationError
+from ezpl.handlers.sinks import ShippingSink, SinkRecord, SinkRegistry
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class Collector:
+    """TCP collector stand-in decoding length-prefixed frames."""
+
+    def __init__(self, port: int = 0, decompress=gzip.decompress) -> None:
+        self.server = socket.create_server(("127.0.0.1", port))
+        self.server.settimeout(0.1)
+        self.port = self.server.getsockname()[1]
+        self.decompress = decompress
+        self.batches: list[list[str]] = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def lines(self) -> list[str]:
+        return [line for batch in self.batches for line in batch]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> list[str]:
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.lines
+
+    def close(self) -> None:
+        self._closed = True
+        self._thread.join(2)
+        self.server.close()
+
+    def _serve(self) -> None:
+        while not self._closed:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                continue
+            with connection:
+                connection.settimeout(0.1)
+                buffer = b""
+                while not self._closed:
+                    try:
+                        data = connection.recv(65536)
+                    except TimeoutError:
+                        continue
+                    except OSError:
+                        break
+                    if not data:
+                        break
+                    buffer += data
+                    while len(buffer) >= 4:
+                        (size,) = struct.unpack(">I", buffer[:4])
+                        if len(buffer) < 4 + size:
+                            break
+                        payload, buffer = buffer[4 : 4 + size], buffer[4 + size :]
+                        text = self.decompress(payload).decode("utf-8")
+                        self.batches.append(text.splitlines())
+
+
+def _free_port() -> int:
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[1]
+
+
+def _record(message: str) -> SinkRecord:
+    return SinkRecord(datetime.now(), "INFO", 20, "tests", "tests", "test", 1, message)
+
+
+def _write(sink: ShippingSink, *messages: str) -> None:
+    sink.write_batch(
+        [_record(message) for message in messages],
+        [f"{message}\n" for message in messages],
+    )
+
+
+@pytest.fixture
+def collector():
+    """Running TCP collector."""
+    server = Collector()
+    yield server
+    server.close()
+
+
+# ///////////////////////////////////////////////////////////////
+# TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestShippingSink:
+    """Tests for ShippingSink."""
+
+    def test_batches_by_count(self, collector, temp_dir: Path) -> None:
+        """Test that full batches are sent at once, gzip-compressed."""
+        sink = ShippingSink(
+            f"tcp://127.0.0.1:{collector.port}",
+            spool_dir=temp_dir,
+            batch_size=3,
+            batch_interval=60,
+        )
+        try:
+            _write(sink, "a", "b", "c", "d", "e", "f", "g")
+            assert collector.wait_for(6) == ["a", "b", "c", "d", "e", "f"]
+            assert collector.batches == [["a", "b", "c"], ["d", "e", "f"]]
+            assert sink.stats()["pending"] == 1
+        finally:
+            sink.close()
+        assert collector.wait_for(7)[-1] == "g"
+        assert sink.shipped == 7
+
+    def test_batches_by_time(self, collector, temp_dir: Path) -> None:
+        """Test that a partial batch is sent after batch_interval."""
+        sink = ShippingSink(
+            f"tcp://127.0.0.1:{collector.port}",
+            spool_dir=temp_dir,
+            batch_interval=0.05,
+            compression="zlib",
+        )
+        collector.decompress = zlib.decompress
+        try:
+            _write(sink, "alone")
+            assert collector.wait_for(1) == ["alone"]
+        finally:
+            sink.close()
+
+    def test_http(self, temp_dir: Path) -> None:
+        """Test shipping batches as HTTP POST requests."""
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received.append(
+                    (
+                        self.headers["Content-Encoding"],
+                        self.headers["X-Ezpl-Records"],
+                        gzip.decompress(body).decode("utf-8"),
+                    )
+                )
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            sink = ShippingSink(
+                f"http://127.0.0.1:{server.server_port}/ingest", spool_dir=temp_dir
+            )
+            _write(sink, "one", "two")
+            assert sink.flush()
+            sink.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert received == [("gzip", "2", "one\ntwo\n")]
+
+    def test_spool_and_replay(self, temp_dir: Path) -> None:
+        """Test spooling while down and in-order replay on recovery."""
+        port = _free_port()
+        sink = ShippingSink(
+            f"tcp://127.0.0.1:{port}",
+            spool_dir=temp_dir,
+            batch_size=2,
+            retry_interval=0.05,
+            timeout=1,
+        )
+        try:
+            _write(sink, "1", "2", "3", "4")
+            sink.flush()
+            stats = sink.stats()
+            assert stats["endpoint_up"] is False
+            assert stats["spooled"] == 4
+            assert stats["spool_segments"] == 2
+            assert len(list(temp_dir.glob("*.seg"))) == 2
+            assert stats["last_error"]
+
+            collector = Collector(port)
+            try:
+                _write(sink, "5")
+                sink.flush()
+                assert collector.wait_for(5) == ["1", "2", "3", "4", "5"]
+            finally:
+                collector.close()
+        finally:
+            sink.close()
+
+        assert sink.replayed == 5
+        assert sink.stats()["spool_segments"] == 0
+        assert list(temp_dir.glob("*.seg")) == []
+
+    def test_replay_previous_run(self, collector, temp_dir: Path) -> None:
+        """Test that segments left by a previous run are replayed."""
+        down = ShippingSink(
+            f"tcp://127.0.0.1:{_free_port()}", spool_dir=temp_dir, timeout=1
+        )
+        _write(down, "left", "behind")
+        down.close()
+        assert down.spooled == 2
+
+        sink = ShippingSink(f"tcp://127.0.0.1:{collector.port}", spool_dir=temp_dir)
+        try:
+            assert collector.wait_for(2) == ["left", "behind"]
+        finally:
+            sink.close()
+
+    def test_disk_quota(self, temp_dir: Path) -> None:
+        """Test that the oldest segments are evicted over the quota."""
+        sink = ShippingSink(
+            f"tcp://127.0.0.1:{_free_port()}",
+            spool_dir=temp_dir,
+            batch_size=1,
+            compression="none",
+            spool_max_bytes=25,
+            retry_interval=60,
+            timeout=1,
+        )
+        try:
+            for index in range(6):
+                _write(sink, f"record-{index}")
+            sink.flush()
+            stats = sink.stats()
+        finally:
+            sink.close()
+
+        assert stats["spool_bytes"] <= 25
+        assert stats["spool_segments"] == 2
+        assert stats["spool_dropped"] == 4
+        contents = sorted(path.read_text() for path in temp_dir.glob("*.seg"))
+        assert contents == ["record-4\n", "record-5\n"]
+
+    def test_backpressure_spools_excess(self, temp_dir: Path, monkeypatch) -> None:
+        """Test that lines beyond max_pending go to disk while sends stall."""
+        release = threading.Event()
+        sent = []
+
+        def slow_send(payload: bytes, _records: int) -> None:
+            release.wait(5)
+            sent.append(gzip.decompress(payload).decode("utf-8"))
+
+        sink = ShippingSink(
+            "tcp://127.0.0.1:9", spool_dir=temp_dir, batch_size=2, max_pending=4
+        )
+        monkeypatch.setattr(sink, "_send", slow_send)
+        try:
+            _write(sink, "0", "1")
+            while not sink._sending:
+                time.sleep(0.005)  # The sender is stuck on the first batch
+            for index in range(2, 12, 2):
+                _write(sink, str(index), str(index + 1))
+            stats = sink.stats()
+            assert stats["pending"] <= 4
+            assert stats["spooled"] > 0
+
+            release.set()
+            assert sink.flush()
+            deadline = time.monotonic() + 5
+            while sink.stats()["spool_segments"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sink.close()
+
+        assert "".join(sent) == "".join(f"{index}\n" for index in range(12))
+        assert sink.shipped + sink.replayed == 12
+
+    def test_registry_integration(self, collector, temp_dir: Path) -> None:
+        """Test ShippingSink behind the sink registry."""
+        from loguru import logger
+
+        registry = SinkRegistry()
+        try:
+            registry.add(
+                "collector",
+                ShippingSink(
+                    f"tcp://127.0.0.1:{collector.port}",
+                    spool_dir=temp_dir,
+                    batch_interval=60,
+                ),
+                format="{level} {message}",
+            )
+            logger.bind(task="logger").warning("shipped")
+            assert registry.flush()
+            assert collector.wait_for(1) == ["WARNING shipped"]
+            assert registry.stats()["collector"]["sink"]["shipped"] == 1
+        finally:
+            registry.close()
+
+    def test_validation(self, temp_dir: Path) -> None:
+        """Test argument validation."""
+        for endpoint in ("udp://host:1", "tcp://host", "collector:9000"):
+            with pytest.raises(ValidationError):
+                ShippingSink(endpoint, spool_dir=temp_dir)
+        with pytest.raises(ValidationError):
+            ShippingSink("tcp://h:1", spool_dir=temp_dir, compression="lz4")
+        with pytest.raises(ValidationError):
+            ShippingSink("tcp://h:1", spool_dir=temp_dir, batch_size=0)
@@ -0,0 +1,364 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - Sinks Tests
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the sink registry and the built-in sinks.
+
+Tests cover:
+- Fan-out with per-sink levels and formats
+- Isolation of slow and failing sinks (queues, drops, health)
+- File, stream, syslog (local Unix socket) and TCP sinks
+- Ezpl.add_sink() integration
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import io
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Third-party imports
+import pytest
+from loguru import logger
+
+# Local imports
+from ezpl import Ezpl
+from ezpl.core.exceptions import ValidationError
+from ezpl.core.metrics import METRICS
+from ezpl.handlers.sinks import (
+    FileSink,
+    Sink,
+    SinkRegistry,
+    StreamSink,
+    SyslogSink,
+    TCPSink,
+)
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class CollectingSink(Sink):
+    """Sink keeping every line, optionally waiting on an event."""
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.lines: list[str] = []
+        self.records = []
+        self.gate = gate
+        self.closed = False
+
+    def write_batch(self, records, lines) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.records.extend(records)
+        self.lines.extend(lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FailingSink(Sink):
+    """Sink failing while ``fail`` is set."""
+
+    def __init__(self) -> None:
+        self.fail = True
+        self.data = ""
+
+    def write(self, data: str) -> None:
+        if self.fail:
+            raise OSError("endpoint down")
+        self.data += data
+
+
+@pytest.fixture
+def registry():
+    """Sink registry closed after the test."""
+    sinks = SinkRegistry()
+    yield sinks
+    sinks.close()
+
+
+def _log(level: str, message: str) -> None:
+    logger.bind(task="logger").log(level, message)
+
+
+# ///////////////////////////////////////////////////////////////
+# TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestSinkRegistry:
+    """Tests for SinkRegistry."""
+
+    def test_fan_out_with_levels(self, registry) -> None:
+        """Test that each sink receives the records at or above its level."""
+        everything = registry.add("all", CollectingSink())
+        errors = registry.add("errors", CollectingSink(), level="ERROR")
+
+        _log("INFO", "info")
+        _log("ERROR", "error")
+        logger.info("not an Ezpl record")
+        assert registry.flush()
+
+        assert [record.message for record in everything.records] == ["info", "error"]
+        assert [record.message for record in errors.records] == ["error"]
+        assert "| ERROR" in errors.lines[0]
+        assert errors.lines[0].endswith("- error\n")
+
+    def test_formats(self, registry) -> None:
+        """Test template and callable formats."""
+        template = registry.add(
+            "template", CollectingSink(), format="{level}:{message}"
+        )
+        function = registry.add(
+            "function", CollectingSink(), format=lambda record: record.message.upper()
+        )
+
+        _log("WARNING", "hello")
+        registry.flush()
+
+        assert template.lines == ["WARNING:hello\n"]
+        assert function.lines == ["HELLO"]
+
+    def test_broken_format_does_not_lose_record(self, registry) -> None:
+        """Test that a failing formatter yields a FORMAT_ERR line."""
+        sink = registry.add("broken", CollectingSink(), format="{missing}")
+        _log("INFO", "hello")
+        registry.flush()
+        assert "FORMAT_ERR" in sink.lines[0]
+
+    def test_validation(self, registry) -> None:
+        """Test argument validation."""
+        registry.add("one", CollectingSink())
+        with pytest.raises(ValidationError):
+            registry.add("one", CollectingSink())
+        with pytest.raises(ValidationError):
+            registry.add("two", object())
+        with pytest.raises(ValidationError, match="write"):
+            registry.add("two", Sink())
+        with pytest.raises(ValidationError):
+            registry.add("two", CollectingSink(), level="LOUD")
+        with pytest.raises(ValidationError):
+            registry.add("two", CollectingSink(), format=42)
+        with pytest.raises(ValidationError):
+            registry.add("two", CollectingSink(), queue_size=0)
+        with pytest.raises(ValidationError):
+            registry.remove("missing")
+        assert registry.names() == ["one"]
+
+    def test_slow_sink_does_not_block(self, registry) -> None:
+        """Test that a stuck sink neither blocks callers nor other sinks."""
+        gate = threading.Event()
+        slow = registry.add("slow", CollectingSink(gate), queue_size=10)
+        fast = registry.add("fast", CollectingSink())
+
+        start = time.perf_counter()
+        for index in range(200):
+            _log("INFO", f"message {index}")
+        elapsed = time.perf_counter() - start
+        assert registry.get("fast").records is fast.records
+        assert registry.flush(0.1) is False
+
+        stats = registry.stats()
+        assert len(fast.records) == 200
+        assert stats["fast"]["written"] == 200
+        assert stats["slow"]["dropped"] > 0
+        assert stats["slow"]["queued"] <= 10
+        assert elapsed < 2.0
+
+        gate.set()
+        assert registry.flush()
+        stats = registry.stats()["slow"]
+        assert stats["written"] + stats["dropped"] == 200
+        assert len(slow.records) == stats["written"]
+
+    def test_failing_sink_health(self, registry) -> None:
+        """Test error counters and recovery of a failing sink."""
+        failing = registry.add("failing", FailingSink())
+        healthy = registry.add("healthy", CollectingSink())
+
+        _log("INFO", "lost")
+        registry.flush()
+        stats = registry.stats()
+        assert stats["failing"]["healthy"] is False
+        assert stats["failing"]["failed"] == 1
+        assert stats["failing"]["last_error"] == "OSError: endpoint down"
+        assert stats["healthy"]["healthy"] is True
+        assert len(healthy.records) == 1
+
+        failing.fail = False
+        _log("INFO", "kept")
+        registry.flush()
+        stats = registry.stats()["failing"]
+        assert stats["healthy"] is True
+        assert stats["errors"] == 1
+        assert "kept" in failing.data
+
+    def test_metrics(self, registry) -> None:
+        """Test per-sink counters and queue gauge in METRICS."""
+        METRICS.reset()
+        registry.add("metered", CollectingSink())
+        _log("ERROR", "boom")
+        registry.flush()
+
+        snapshot = METRICS.snapshot()
+        assert snapshot["records"]["sink:metered"] == {"ERROR": 1}
+        assert snapshot["bytes_written"]["sink:metered"] > 0
+        assert snapshot["queue_depth"]["sink:metered"] == 0
+
+    def test_remove_and_close(self, registry) -> None:
+        """Test that removing a sink flushes and closes it."""
+        sink = registry.add("gone", CollectingSink())
+        _log("INFO", "last")
+        registry.remove("gone")
+
+        assert sink.closed
+        assert len(sink.records) == 1
+        assert "gone" not in registry
+        assert registry._logger_id is None
+
+
+class TestBuiltinSinks:
+    """Tests for the built-in sinks."""
+
+    def test_file_sink(self, registry, temp_dir: Path) -> None:
+        """Test that FileSink appends lines, creating directories."""
+        path = temp_dir / "nested" / "sink.log"
+        registry.add("file", FileSink(path), format="{message}")
+        _log("INFO", "first")
+        _log("INFO", "second")
+        registry.close()
+
+        assert path.read_text(encoding="utf-8") == "first\nsecond\n"
+
+    def test_stream_sink(self, registry, monkeypatch) -> None:
+        """Test StreamSink on an explicit stream and on stdout."""
+        stream = io.StringIO()
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        registry.add("stream", StreamSink(stream), format="{message}")
+        registry.add("stdout", StreamSink(), format="{message}")
+        _log("INFO", "plain [bold]text[/bold]")
+        registry.flush()
+
+        assert stream.getvalue() == "plain [bold]text[/bold]\n"
+        assert stdout.getvalue() == stream.getvalue()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+    def test_syslog_sink(self, registry) -> None:
+        """Test SyslogSink against a local datagram socket."""
+        with tempfile.TemporaryDirectory() as directory:
+            address = str(Path(directory) / "log")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            server.bind(address)
+            server.settimeout(5)
+            try:
+                registry.add(
+                    "syslog", SyslogSink(address, facility="local0", ident="app")
+                )
+                _log("ERROR", "disk full")
+                registry.flush()
+                message = server.recv(4096).decode("utf-8")
+            finally:
+                server.close()
+
+        # local0 (16) * 8 + error (3)
+        assert message.startswith("<131>app[")
+        assert message.endswith("- disk full")
+
+    def test_syslog_sink_unreachable(self, registry, temp_dir: Path) -> None:
+        """Test that a missing syslog socket marks the sink unhealthy."""
+        with pytest.raises(ValidationError):
+            SyslogSink(facility="nope")
+        registry.add("syslog", SyslogSink(temp_dir / "missing"))
+        _log("INFO", "lost")
+        registry.flush()
+        assert registry.stats()["syslog"]["healthy"] is False
+
+    def test_tcp_sink(self, registry) -> None:
+        """Test TCPSink against a local server, including a reconnection."""
+        server = socket.create_server(("127.0.0.1", 0))
+        server.settimeout(5)
+        port = server.getsockname()[1]
+        received: list[bytes] = []
+
+        def serve() -> None:
+            for _ in range(2):
+                connection, _ = server.accept()
+                with connection:
+                    received.append(connection.recv(4096))
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            sink = registry.add("tcp", TCPSink("127.0.0.1", port), format="{message}")
+            _log("INFO", "one")
+            registry.flush()
+            # Simulate a dropped connection: the next batch reconnects
+            sink.close()
+            _log("INFO", "two")
+            registry.flush()
+            thread.join(5)
+        finally:
+            server.close()
+
+        assert received == [b"one\n", b"two\n"]
+
+
+class TestEzplSinks:
+    """Tests for the Ezpl sink API."""
+
+    def test_add_sink(self, temp_log_file: Path) -> None:
+        """Test that Ezpl records reach sinks regardless of the file level."""
+        ezpl = Ezpl(log_file=temp_log_file, log_level="INFO")
+        ezpl.set_level("ERROR")
+        sink = Ezpl.add_sink("collect", CollectingSink(), level="INFO")
+
+        ezpl.get_logger().info("to the sink only")
+        assert Ezpl.flush_sinks()
+
+        assert [record.message for record in sink.records] == ["to the sink only"]
+        assert Ezpl.get_sink_stats()["collect"]["written"] == 1
+
+        Ezpl.remove_sink("collect")
+        assert Ezpl.get_sink_stats() == {}
+        with pytest.raises(ValidationError):
+            Ezpl.remove_sink("collect")
+
+    def test_add_sink_without_write(self, temp_log_file: Path) -> None:
+        """Test that add_sink() rejects a sink overriding no write method."""
+
+        class SilentSink(Sink):
+            def close(self) -> None:
+                pass
+
+        Ezpl(log_file=temp_log_file)
+        with pytest.raises(ValidationError):
+            Ezpl.add_sink("silent", SilentSink())
+        assert Ezpl.get_sink_stats() == {}
+
+    def test_add_sink_before_ezpl(self, temp_log_file: Path) -> None:
+        """Test that sinks added before Ezpl() survive its logger.remove()."""
+        sink = Ezpl.add_sink("collect", CollectingSink())
+        Ezpl(log_file=temp_log_file).get_logger().info("hello")
+        assert Ezpl.flush_sinks()
+
+        assert [record.message for record in sink.records] == ["hello"]
+
+    def test_reset_closes_sinks(self, temp_log_file: Path) -> None:
+        """Test that Ezpl.reset() flushes and closes sinks."""
+        Ezpl(log_file=temp_log_file)
+        sink = Ezpl.add_sink("collect", CollectingSink())
+        Ezpl.reset()
+
+        assert sink.closed
+        assert Ezpl.get_sink_stats() == {}
+        assert Ezpl.flush_sinks() is True
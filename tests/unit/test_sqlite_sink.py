@@ -0,0 +1,190 @@
+# ///////////////////////////////////////////////////////////////
+# EZPL - SQLite Sink Tests
+# Project: ezpl
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for SQLiteSink and LogDatabase.
+
+Tests cover:
+- WAL mode, schema and indexes
+- Batched inserts from the sink registry
+- Level, module and time-window queries (and their query plans)
+- Import of FileLogger text logs
+"""
+
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Base imports
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Third-party imports
+import pytest
+from loguru import logger
+
+# Local imports
+from ezpl import Ezpl
+from ezpl.core.exceptions import FileOperationError, ValidationError
+from ezpl.handlers.sinks import LogDatabase, SinkRegistry, SQLiteSink
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+ROWS = [
+    ("2024-01-15 10:00:00", "INFO", "app", "start", 10, "started", None),
+    ("2024-01-15 10:05:00", "WARNING", "db", "query", 20, "slow query", None),
+    ("2024-01-15 10:10:00", "ERROR", "db", "query", 30, "failed", "Traceback\n"),
+    ("2024-01-15 11:00:00", "INFO", "app", "stop", 40, "stopped", None),
+]
+
+
+@pytest.fixture
+def database(temp_dir: Path):
+    """Log database filled with ROWS."""
+    db = LogDatabase(temp_dir / "logs.db")
+    db.insert(ROWS)
+    yield db
+    db.close()
+
+
+# ///////////////////////////////////////////////////////////////
+# TESTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestLogDatabase:
+    """Tests for LogDatabase."""
+
+    def test_wal_and_indexes(self, database: LogDatabase) -> None:
+        """Test that the database uses WAL and indexes the filter columns."""
+        connection = sqlite3.connect(database.path)
+        try:
+            mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        finally:
+            connection.close()
+        assert mode == "wal"
+        assert {"records_timestamp", "records_level", "records_module"} <= indexes
+
+    def test_queries(self, database: LogDatabase) -> None:
+        """Test level, module and time-window filters."""
+        assert len(database) == 4
+        assert [row.message for row in database.query(level="error")] == ["failed"]
+        assert database.count(level=["WARNING", "ERROR"]) == 2
+        assert [row.function for row in database.query(module="app")] == [
+            "start",
+            "stop",
+        ]
+        window = database.query(
+            since=datetime(2024, 1, 15, 10, 5), until=datetime(2024, 1, 15, 10, 10)
+        )
+        assert [row.message for row in window] == ["slow query", "failed"]
+        newest = database.query(limit=1, newest_first=True)
+        assert [row.message for row in newest] == ["stopped"]
+
+    def test_queries_use_indexes(self, database: LogDatabase) -> None:
+        """Test that filters are answered from the indexes."""
+        assert "records_level" in " ".join(database.explain(level="ERROR"))
+        assert "records_module" in " ".join(database.explain(module="db"))
+        plan = " ".join(database.explain(since=datetime(2024, 1, 15, 10, 30)))
+        assert "records_timestamp" in plan
+
+    def test_row_format(self, database: LogDatabase) -> None:
+        """Test that rows format like FileLogger lines."""
+        row = next(database.query(level="ERROR"))
+        assert row.format() == (
+            "2024-01-15 10:10:00 | ERROR      | db:query:30 - failed\nTraceback"
+        )
+        assert row.to_dict()["module"] == "db"
+
+    def test_import_log_file(self, temp_dir: Path) -> None:
+        """Test importing a text log with a traceback and separators."""
+        log_file = temp_dir / "app.log"
+        log_file.write_text(
+            "## ==> SESSION START\n"
+            "## /////////////////\n"
+            "2024-01-15 10:00:00 | INFO       | app:main:1 - hello\n"
+            "2024-01-15 10:00:01 | ERROR      | app:main:2 - boom\n"
+            "Traceback (most recent call last):\n"
+            "ValueError: bad\n"
+            "\n"
+            "## ==> RECENT RECORDS\n"
+            "## /////////////////\n"
+            "2024-01-15 10:00:02 | SUCCESS    | app:main:3 - done\n",
+            encoding="utf-8",
+        )
+        with LogDatabase(temp_dir / "import.db") as database:
+            assert database.import_log_file(log_file, batch_size=2) == 3
+            rows = list(database.query())
+
+        assert [row.level for row in rows] == ["INFO", "ERROR", "SUCCESS"]
+        assert rows[0].exception is None
+        assert rows[1].exception == (
+            "Traceback (most recent call last):\nValueError: bad\n"
+        )
+        assert rows[2].exception is None
+
+    def test_import_missing_file(self, database: LogDatabase, temp_dir) -> None:
+        """Test that a missing log file raises FileOperationError."""
+        with pytest.raises(FileOperationError):
+            database.import_log_file(temp_dir / "missing.log")
+
+    def test_synchronous_mode(self, temp_dir: Path) -> None:
+        """Test that the synchronous mode is validated before use."""
+        with pytest.raises(ValidationError):
+            LogDatabase(temp_dir / "bogus.db", "BOGUS")
+        with pytest.raises(ValidationError):
+            SQLiteSink(temp_dir / "bogus.db", "FULL; DROP TABLE records")
+        database = LogDatabase(temp_dir / "full.db", "full")
+        try:
+            mode = database._connection.execute("PRAGMA synchronous").fetchone()
+            assert mode == (2,)
+        finally:
+            database.close()
+
+
+class TestSQLiteSink:
+    """Tests for SQLiteSink."""
+
+    def test_records_batched(self, temp_dir: Path) -> None:
+        """Test that registry batches land in the database."""
+        registry = SinkRegistry()
+        sink = registry.add("db", SQLiteSink(temp_dir / "sink.db"))
+        try:
+            bound = logger.bind(task="logger")
+            for index in range(100):
+                bound.info(f"message {index}")
+            try:
+                raise ValueError("bad value")
+            except ValueError:
+                bound.exception("failed")
+            assert registry.flush()
+
+            database = sink.database
+            assert database.count() == 101
+            error = next(database.query(level="ERROR"))
+            assert error.message == "failed"
+            assert "ValueError: bad value" in error.exception
+            assert error.module == "test_sqlite_sink"
+            assert error.function == "test_records_batched"
+        finally:
+            registry.close()
+
+    def test_with_ezpl(self, temp_dir: Path, temp_log_file: Path) -> None:
+        """Test SQLiteSink behind Ezpl.add_sink()."""
+        ezpl = Ezpl(log_file=temp_log_file)
+        Ezpl.add_sink("db", SQLiteSink(temp_dir / "ezpl.db"), level="WARNING")
+        ezpl.get_logger().info("not stored")
+        ezpl.get_logger().warning("stored")
+        Ezpl.reset()
+
+        with LogDatabase(temp_dir / "ezpl.db") as database:
+            assert [row.message for row in database.query()] == ["stored"]
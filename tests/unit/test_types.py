@@ -12,6 +12,7 @@ Tests cover:
 - Pattern enumeration
 - Validation methods
 - Color functions
+- Custom pattern registry
 - Edge cases
 """
 
@@ -29,6 +30,10 @@ from ezpl.types import (
     Pattern,
     get_pattern_color,
     get_pattern_color_by_name,
+    get_pattern_registry_version,
+    register_pattern,
+    set_pattern_color,
+    unregister_pattern,
 )
 
 # IMPORT SPECS
@@ -275,3 +280,40 @@ class TestValidation:
         """Test accessing pattern with invalid name."""
         with pytest.raises(KeyError):
             _ = Pattern["INVALID_PATTERN"]
+
+
+class TestPatternRegistry:
+    """Tests for runtime pattern registration."""
+
+    def test_register_pattern(self) -> None:
+        """Test a registered pattern gets its color by name."""
+        try:
+            assert register_pattern("deploy", "bright_cyan") == "DEPLOY"
+            assert get_pattern_color("deploy") == "bright_cyan"
+            assert get_pattern_color_by_name("Deploy") == "bright_cyan"
+        finally:
+            unregister_pattern("deploy")
+        assert get_pattern_color_by_name("DEPLOY") == "white"
+
+    def test_register_builtin_or_empty_rejected(self) -> None:
+        """Test built-in and empty names cannot be registered."""
+        with pytest.raises(ValidationError):
+            register_pattern("success")
+        with pytest.raises(ValidationError):
+            register_pattern("  ")
+
+    def test_set_pattern_color(self) -> None:
+        """Test changing a built-in color bumps the registry version."""
+        original = get_pattern_color(Pattern.TIP)
+        version = get_pattern_registry_version()
+        try:
+            set_pattern_color("tip", "red")
+            assert get_pattern_color(Pattern.TIP) == "red"
+            assert get_pattern_registry_version() > version
+        finally:
+            set_pattern_color(Pattern.TIP, original)
+
+    def test_set_unknown_pattern_color(self) -> None:
+        """Test changing the color of an unknown pattern fails."""
+        with pytest.raises(ValidationError):
+            set_pattern_color("NOT_A_PATTERN", "red")
@@ -11,6 +11,7 @@ Tests cover:
 - safe_str_convert() with various types
 - sanitize_for_file() with special characters
 - sanitize_for_console() with special characters
+- format_log_line() and format_error_line()
 - Edge cases and error handling
 """
 
@@ -23,6 +24,8 @@ Tests cover:
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
 from ezpl.handlers.utils import (
+    format_error_line,
+    format_log_line,
     safe_str_convert,
     sanitize_for_console,
     sanitize_for_file,
@@ -233,6 +236,26 @@ class TestSanitizeForConsole:
         assert "Path" in result
 
 
+class TestFormatLogLine:
+    """Tests for the shared FileLogger line format."""
+
+    def test_format_log_line(self) -> None:
+        """Test the layout, the level label and the function cleanup."""
+        line = format_log_line(
+            "2024-01-15 10:00:00", "INFO", "app", "<module>", 3, "hi"
+        )
+        assert line == "2024-01-15 10:00:00 | INFO       | app:module:3 - hi\n"
+        assert "| CUSTOM     |" in format_log_line("t", "CUSTOM", "m", "f", 1, "x")
+
+    def test_format_error_line(self) -> None:
+        """Test the FORMAT_ERR fallback line."""
+        assert format_error_line(ValueError()) == (
+            "????-??-?? ??:??:?? | FORMAT_ERR | unknown:unknown:? - "
+            "[FORMAT ERROR: ValueError]\n"
+        )
+        assert format_error_line().endswith("[FORMAT ERROR]\n")
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
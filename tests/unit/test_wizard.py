@@ -13,23 +13,52 @@ Tests cover:
 - JSON display
 - Progress bars (all types)
 - Dynamic layered progress
+- Progress hub
 - Error handling
 """
 
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
 import pytest
+from rich.console import Console
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
 from ezpl import Ezpl
+from ezpl.handlers.wizard.dynamic import DynamicLayeredProgress
+from ezpl.handlers.wizard.hub import ProgressHub, RemoteProgressHandle
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
 
 
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _remote_work(handle: RemoteProgressHandle, count: int) -> int:
+    """Report progress from a worker process."""
+    with handle:
+        for _ in range(count):
+            handle.advance()
+    return os.getpid()
+
+
+def _remote_advance_once(handle: RemoteProgressHandle) -> int:
+    """Advance once and return without flushing."""
+    handle.advance()
+    return os.getpid()
+
+
 ## ==> TESTS
 # ///////////////////////////////////////////////////////////////
 
@@ -155,6 +184,48 @@ class TestTables:
         # Should not raise error, just return early
         # Verify no exception raised
 
+    @staticmethod
+    def _stream_wizard(width: int = 80):
+        from ezpl.handlers.wizard import RichWizard
+
+        console = Console(file=StringIO(), width=width, color_system=None)
+        return RichWizard(console), console
+
+    def test_stream_table_from_generator(self) -> None:
+        """Test stream_table() over a generator, across several pages."""
+        wizard, console = self._stream_wizard()
+        rows = ({"Name": f"user{i}", "Id": i} for i in range(25))
+        assert wizard.stream_table(rows, title="Users", page_size=10) == 25
+        lines = console.file.getvalue().splitlines()
+        assert "Users" in lines[0]
+        assert lines[1].split() == ["Name", "Id"]
+        body = lines[3:]
+        assert len(body) == 25
+        assert body[0].split() == ["user0", "0"]
+        assert body[-1].split() == ["user24", "24"]
+        # Pages share the widths sampled up front
+        assert len({line.index(line.split()[1]) for line in body}) == 1
+
+    def test_stream_table_max_rows(self) -> None:
+        """Test the row cap and its footer, for sized and unsized rows."""
+        wizard, console = self._stream_wizard()
+        rows = [("a", 1)] * 10
+        assert wizard.stream_table(iter(rows), columns=["K", "V"], max_rows=3) == 3
+        assert wizard.stream_table(rows, columns=["K", "V"], max_rows=4) == 4
+        output = console.file.getvalue()
+        assert "... 7 more rows" in output
+        assert "... 6 more rows" in output
+
+    def test_stream_table_fits_console(self) -> None:
+        """Test that long cells are cut and markup is not interpreted."""
+        wizard, console = self._stream_wizard(width=40)
+        rows = [{"Message": "[bold]" + "x" * 200, "Level": "INFO"}]
+        wizard.stream_table(rows, show_header=False)
+        line = console.file.getvalue().splitlines()[0]
+        assert len(line.rstrip()) <= 40
+        assert line.startswith(" [bold]xxx")
+        assert "…" in line
+
 
 class TestJSON:
     """Tests for JSON display."""
@@ -195,6 +266,61 @@ class TestJSON:
         # Should handle gracefully
         # Verify no exception raised
 
+    @staticmethod
+    def _json_output(*args, **kwargs) -> str:
+        from ezpl.handlers.wizard import RichWizard
+
+        console = Console(file=StringIO(), width=80, color_system=None)
+        RichWizard(console).json(*args, **kwargs)
+        return console.file.getvalue()
+
+    def test_json_renders_data(self) -> None:
+        """Test that dict data is pretty-printed with the requested indent."""
+        output = self._json_output({"key": [1, 2]}, indent=4)
+        assert json.loads(output) == {"key": [1, 2]}
+        assert '\n    "key"' in output
+        assert "Error" not in output
+
+    def test_json_elision(self) -> None:
+        """Test depth, length and string limits."""
+        data = {"items": list(range(10)), "deep": {"a": {"b": 1}}, "text": "x" * 50}
+        output = json.loads(
+            self._json_output(data, max_depth=2, max_items=3, max_string=5)
+        )
+        assert output["items"] == [0, 1, 2, "… 7 more items"]
+        assert output["deep"] == {"a": "{… 1 keys}"}
+        assert output["text"] == "xxxxx… (45 more characters)"
+
+    def test_json_large_list_streamed(self) -> None:
+        """Test that lists above max_size are written one item per line."""
+        data = [{"id": index} for index in range(100)]
+        output = self._json_output(data, max_size=200)
+        lines = output.splitlines()
+        assert lines[0] == "["
+        assert lines[1] == '  {"id":0},'
+        assert lines[-1] == "]"
+        assert json.loads(output) == data
+
+    def test_json_large_payload_compact(self) -> None:
+        """Test that other values above max_size are written compact."""
+        data = {"key": "v" * 100}
+        output = self._json_output(json.dumps(data), title="Big", max_size=50)
+        assert output.splitlines() == ["Big", json.dumps(data)]
+        output = self._json_output(data, max_size=50)
+        assert output.strip() == '{"key":"' + "v" * 100 + '"}'
+
+    def test_print_json_max_size(self) -> None:
+        """Test that the printer passes max_size through to the wizard."""
+        from ezpl.handlers import ConsolePrinter
+
+        printer = ConsolePrinter(level="DEBUG")
+        printer._console = Console(file=StringIO(), width=80, color_system=None)
+        data = {"key": "v" * 100}
+        printer.print_json(data, max_size=50)
+        printer.get_printer().print_json(data, max_size=50)
+        output = printer._console.file.getvalue()
+        assert output.splitlines() == [json.dumps(data, separators=(",", ":"))] * 2
+
 
 class TestProgressBars:
     """Tests for progress bar methods."""
@@ -236,48 +362,26 @@ class TestProgressBars:
         # Verify no exception raised
 
     def test_dependency_progress(self, wizard) -> None:
-        """Test dependency_progress() method."""
+        """Test dependency_progress() without an action."""
         deps = ["requests", "click", "rich"]
-        # dependency_progress is a context manager that yields multiple times
-        gen = wizard.dependency_progress(deps)
-        # Get the first yield
-        first_yield = gen.__enter__()
-        progress, task, dep = first_yield
-        progress.advance(task)
-        # Consume all remaining yields to allow the generator to complete
-        try:
-            while True:
-                progress, task, dep = next(gen.gen)
-                progress.advance(task)
-        except (StopIteration, AttributeError):
-            pass
-        # Exit the context manager
-        gen.__exit__(None, None, None)
-        # Verify no exception raised
+        with wizard.dependency_progress(deps) as (progress, task, items):
+            assert list(items) == deps
+        assert progress.tasks[task].completed == 3
 
     def test_package_install_progress(self, wizard) -> None:
-        """Test package_install_progress() method."""
+        """Test package_install_progress() without an action."""
         packages = [("requests", "2.31.0"), ("click", "8.1.0")]
-        # package_install_progress is a context manager that yields multiple times
-        gen = wizard.package_install_progress(packages)
-        first_yield = gen.__enter__()
-        progress, task, pkg, ver = first_yield
-        progress.advance(task)
-        # Consume all remaining yields
-        try:
-            while True:
-                progress, task, pkg, ver = next(gen.gen)
-                progress.advance(task)
-        except (StopIteration, AttributeError):
-            pass
-        gen.__exit__(None, None, None)
-        # Verify no exception raised
+        with wizard.package_install_progress(packages) as (progress, task, items):
+            for package_name, version in items:
+                assert progress.tasks[task].fields["package"] == package_name
+                assert progress.tasks[task].fields["version"] == version
+        assert progress.tasks[task].completed == 2
 
     def test_step_progress(self, wizard) -> None:
         """Test step_progress() method."""
         steps = [("Init", "Initializing"), ("Install", "Installing")]
         with wizard.step_progress(steps) as (progress, task, steps_list):
-            for i in range(len(steps)):
+            for _ in range(len(steps)):
                 progress.advance(task)
         # Verify no exception raised
 
@@ -285,63 +389,35 @@ class TestProgressBars:
         """Test file_copy_progress() method."""
         files = ["file1.txt", "file2.txt", "file3.txt"]
         with wizard.file_copy_progress(files) as (progress, task, files_list):
-            for i in range(len(files)):
+            for _ in range(len(files)):
                 progress.advance(task)
         # Verify no exception raised
 
     def test_installation_progress(self, wizard) -> None:
-        """Test installation_progress() method."""
+        """Test installation_progress() without an action."""
         steps = [("Init", "Initializing"), ("Install", "Installing")]
-        # installation_progress is a context manager that yields multiple times
-        gen = wizard.installation_progress(steps)
-        first_yield = gen.__enter__()
-        progress, task, name, desc = first_yield
-        progress.advance(task)
-        # Consume all remaining yields
-        try:
-            while True:
-                progress, task, name, desc = next(gen.gen)
-                progress.advance(task)
-        except (StopIteration, AttributeError):
-            pass
-        gen.__exit__(None, None, None)
-        # Verify no exception raised
+        with wizard.installation_progress(steps) as (progress, task, items):
+            done = []
+            for name, _detail in items:
+                done.append(name)
+                assert progress.tasks[task].completed == len(done) - 1
+        assert done == ["Init", "Install"]
+        assert progress.tasks[task].completed == 2
 
     def test_build_progress(self, wizard) -> None:
-        """Test build_progress() method."""
+        """Test build_progress() adds each phase weight."""
         phases = [("Compile", 50), ("Test", 30), ("Package", 20)]
-        # build_progress is a context manager that yields multiple times
-        gen = wizard.build_progress(phases)
-        first_yield = gen.__enter__()
-        progress, task, phase, weight = first_yield
-        progress.update(task, completed=progress.tasks[task].completed + weight)
-        # Consume all remaining yields
-        try:
-            while True:
-                progress, task, phase, weight = next(gen.gen)
-                progress.update(task, completed=progress.tasks[task].completed + weight)
-        except (StopIteration, AttributeError):
-            pass
-        gen.__exit__(None, None, None)
-        # Verify no exception raised
+        with wizard.build_progress(phases) as (progress, task, items):
+            assert list(items) == phases
+        assert progress.tasks[task].completed == 100
 
     def test_deployment_progress(self, wizard) -> None:
-        """Test deployment_progress() method."""
+        """Test deployment_progress() without an action."""
         stages = ["Prepare", "Deploy", "Verify"]
-        # deployment_progress is a context manager that yields multiple times
-        gen = wizard.deployment_progress(stages)
-        first_yield = gen.__enter__()
-        progress, task, stage = first_yield
-        progress.advance(task)
-        # Consume all remaining yields
-        try:
-            while True:
-                progress, task, stage = next(gen.gen)
-                progress.advance(task)
-        except (StopIteration, AttributeError):
-            pass
-        gen.__exit__(None, None, None)
-        # Verify no exception raised
+        with wizard.deployment_progress(stages) as (progress, task, items):
+            for stage in items:
+                assert progress.tasks[task].fields["current_stage"] == stage
+        assert progress.tasks[task].completed == 3
 
     def test_layered_progress(self, wizard) -> None:
         """Test layered_progress() method."""
@@ -350,11 +426,85 @@ class TestProgressBars:
             {"name": "Layer2", "total": 50},
         ]
         with wizard.layered_progress(layers) as (progress, task_ids):
-            for layer_name, task_id in task_ids.items():
+            for task_id in task_ids.values():
                 progress.update(task_id, advance=50)
         # Verify no exception raised
 
 
+class TestProgressActions:
+    """Tests for progress helpers driven by real work."""
+
+    def test_actions_run_in_order(self, wizard) -> None:
+        """Test that action results come back in item order."""
+        deps = ["requests", "click", "rich"]
+        with wizard.dependency_progress(deps, action=str.upper) as (
+            progress,
+            task,
+            results,
+        ):
+            assert results == ["REQUESTS", "CLICK", "RICH"]
+            assert progress._tasks[task].completed == 3
+
+    def test_tuple_items_unpacked(self, wizard) -> None:
+        """Test that tuple items are passed as separate arguments."""
+        packages = [("requests", "2.31.0"), ("click", "8.1.0")]
+        with wizard.package_install_progress(
+            packages, action=lambda name, version: f"{name}=={version}"
+        ) as (_, _, results):
+            assert results == ["requests==2.31.0", "click==8.1.0"]
+        steps = iter([("Init", "Initializing..."), ("Install", "Installing...")])
+        with wizard.installation_progress(steps, action=lambda name, _: name) as (
+            _,
+            _,
+            results,
+        ):
+            assert results == ["Init", "Install"]
+
+    def test_actions_run_concurrently(self, wizard) -> None:
+        """Test that max_workers runs actions in parallel threads."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def stage(name: str) -> str:
+            barrier.wait()  # Only passes if 4 actions run at once
+            return name
+
+        stages = [f"stage{i}" for i in range(8)]
+        with wizard.deployment_progress(stages, action=stage, max_workers=4) as (
+            progress,
+            task,
+            results,
+        ):
+            assert results == stages
+            assert progress._tasks[task].completed == 8
+
+    def test_action_error_propagates(self, wizard) -> None:
+        """Test that a failing action raises and cancels pending items."""
+        started: list[str] = []
+
+        def install(dependency: str) -> None:
+            started.append(dependency)
+            raise RuntimeError(dependency)
+
+        with (
+            pytest.raises(RuntimeError, match="a"),
+            wizard.dependency_progress(["a", "b", "c"], action=install),
+        ):
+            pass
+        assert started == ["a"]
+
+    def test_no_simulated_delay(self, wizard) -> None:
+        """Test that items are not slowed down unless simulate=True."""
+        start = time.perf_counter()
+        with wizard.dependency_progress([f"dep{i}" for i in range(50)], action=len) as (
+            _,
+            _,
+            results,
+        ):
+            pass
+        assert time.perf_counter() - start < 2.5  # 50 x 0.1 s before
+        assert results == [4] * 10 + [5] * 40
+
+
 class TestDynamicProgress:
     """Tests for dynamic layered progress."""
 
@@ -467,6 +617,231 @@ class TestDynamicProgress:
         # Verify no exception raised
 
 
+class TestDynamicProgressAnimations:
+    """Tests for non-blocking dynamic progress animations."""
+
+    @staticmethod
+    def _layered(console: Console, count: int, fast=None) -> DynamicLayeredProgress:
+        stages = [
+            {"name": f"layer{index}", "type": "progress", "total": 10}
+            for index in range(count)
+        ]
+        return DynamicLayeredProgress(console, "", stages, fast=fast)
+
+    def test_fast_mode_without_terminal(self) -> None:
+        """Test that animations are skipped when output is not a terminal."""
+        progress = self._layered(Console(file=StringIO()), 2)
+        assert progress.fast
+        progress.start()
+        progress.complete_layer("layer0")
+        assert "layer0" not in progress.task_ids
+        progress.stop()
+
+    def test_complete_layer_returns_immediately(self) -> None:
+        """Test that success animations do not block the caller."""
+        console = Console(file=StringIO(), force_terminal=True)
+        progress = self._layered(console, 200, fast=False)
+        assert not progress.fast
+        progress.start()
+        started = time.perf_counter()
+        for index in range(200):
+            progress.complete_layer(f"layer{index}")
+        assert time.perf_counter() - started < 1.0
+        progress.stop()
+        # Pending animations are fast-forwarded when stopping
+        assert progress.task_ids == {}
+        assert not progress.progress.live.is_started
+
+    def test_animation_runs_on_refresh(self) -> None:
+        """Test that the refresh timer removes the layer after its animation."""
+        console = Console(file=StringIO(), force_terminal=True)
+        progress = self._layered(console, 2, fast=False)
+        progress.start()
+        progress.complete_layer("layer0")
+        assert "layer0" in progress.task_ids  # Still animating
+        deadline = time.monotonic() + 3.0
+        while "layer0" in progress.task_ids and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert "layer0" not in progress.task_ids
+        assert "layer1" in progress.task_ids
+        progress.stop()
+
+    def test_emergency_stop_returns_immediately(self) -> None:
+        """Test that the failure animation runs after emergency_stop returns."""
+        console = Console(file=StringIO(), force_terminal=True)
+        progress = self._layered(console, 3, fast=False)
+        progress.start()
+        started = time.perf_counter()
+        progress.emergency_stop("boom")
+        assert time.perf_counter() - started < 0.1
+        assert progress.is_emergency_stopped()
+        progress.wait_for_animations()
+        assert not progress.progress.live.is_started
+        assert "Stopped: boom" in console.file.getvalue()
+
+
+class TestDynamicProgressUpdates:
+    """Tests for coalesced dynamic progress updates."""
+
+    def test_updates_pushed_once_per_refresh(self) -> None:
+        """Test that many updates reach Rich as a single update."""
+        stages = [{"name": "work", "type": "progress", "total": 1000}]
+        progress = DynamicLayeredProgress(Console(file=StringIO()), "", stages)
+        progress.start()
+        rich_updates = []
+        update = progress.progress.update
+        progress.progress.update = lambda *a, **k: (
+            rich_updates.append(k),
+            update(*a, **k),
+        )
+        try:
+            for index in range(1000):
+                progress.update_layer("work", index, f"item {index}")
+            assert rich_updates == []
+            progress.progress.refresh()
+            assert rich_updates == [{"completed": 999, "details": "item 999"}]
+        finally:
+            progress.stop()
+
+    def test_step_description_not_repeated(self) -> None:
+        """Test that step layers describe only the current step."""
+        stages = [{"name": "work", "type": "steps", "steps": ["A", "B", "C"]}]
+        progress = DynamicLayeredProgress(Console(file=StringIO()), "", stages)
+        progress.start()
+        task_id = progress.task_ids["work"]
+        for index in range(3):
+            progress.update_layer("work", index)
+            progress.progress.refresh()
+        description = progress.progress._tasks[task_id].description
+        progress.stop()
+        assert description.endswith("work - Step 3/3: C")
+
+    def test_advance_layer_from_threads(self) -> None:
+        """Test that concurrent increments are all counted."""
+        stages = [{"name": "work", "type": "progress", "total": 4000}]
+        progress = DynamicLayeredProgress(Console(file=StringIO()), "", stages)
+        progress.start()
+        task_id = progress.task_ids["work"]
+
+        def work() -> None:
+            for _ in range(1000):
+                progress.advance_layer("work")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        progress.advance_layer("work", 0, "done")
+        progress.stop()
+        task = progress.progress._tasks[task_id]
+        assert task.completed == 4000
+        assert task.fields["details"] == "done"
+
+
+class TestProgressHub:
+    """Tests for the progress hub fed by parallel workers."""
+
+    @staticmethod
+    def _hub() -> ProgressHub:
+        return ProgressHub(Console(file=StringIO()), show_time=False)
+
+    def test_wizard_progress_hub(self, wizard) -> None:
+        """Test progress_hub() from the wizard."""
+        with wizard.progress_hub() as hub:
+            handle = hub.add_task("Work", total=3)
+            handle.advance(3)
+        assert hub.progress._tasks[handle.task_id].completed == 3
+
+    def test_handles_from_threads(self) -> None:
+        """Test that concurrent advances are all counted."""
+        hub = self._hub()
+        with hub:
+            handle = hub.add_task("Threads", total=8000)
+
+            def work() -> None:
+                for _ in range(1000):
+                    handle.advance()
+
+            threads = [threading.Thread(target=work) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert hub.progress._tasks[handle.task_id].completed == 8000
+
+    def test_updates_pushed_on_refresh(self) -> None:
+        """Test that handles only set values until the next refresh."""
+        hub = self._hub()
+        handle = hub.add_task("Work", total=10)
+        handle.update(completed=4, description="Half")
+        task = hub.progress._tasks[handle.task_id]
+        assert task.completed == 0
+        hub.sync()
+        assert (task.completed, task.description) == (4, "Half")
+
+    def test_handles_from_asyncio(self) -> None:
+        """Test reporting from asyncio tasks."""
+        hub = self._hub()
+
+        async def work(handle) -> None:
+            for _ in range(10):
+                handle.advance()
+                await asyncio.sleep(0)
+
+        with hub:
+            handle = hub.add_task("Async", total=50)
+
+            async def main() -> None:
+                await asyncio.gather(*(work(handle) for _ in range(5)))
+
+            asyncio.run(main())
+        assert hub.progress._tasks[handle.task_id].completed == 50
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="requires fork",
+    )
+    def test_remote_handles_from_processes(self) -> None:
+        """Test reporting from ProcessPoolExecutor workers."""
+        hub = self._hub()
+        with hub:
+            handle = hub.add_task("Processes", total=400)
+            remote = handle.remote()
+            remote.update(description="Encoding")
+            with ProcessPoolExecutor(
+                2, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                pids = list(pool.map(_remote_work, [remote] * 4, [100] * 4))
+            assert os.getpid() not in pids
+        task = hub.progress._tasks[handle.task_id]
+        assert (task.completed, task.description) == (400, "Encoding")
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="requires fork",
+    )
+    def test_remote_handles_share_a_connection(self) -> None:
+        """Test unflushed advances and one hub connection per process."""
+        hub = self._hub()
+        with hub:
+            handle = hub.add_task("Chunks", total=40)
+            with ProcessPoolExecutor(
+                2, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                pids = set(pool.map(_remote_advance_once, [handle.remote()] * 40))
+        assert hub.progress._tasks[handle.task_id].completed == 40
+        assert len(hub._readers) == len(pids)
+
+    def test_unreachable_hub_drops_updates(self) -> None:
+        """Test that a remote handle without a hub does not raise."""
+        hub = self._hub()
+        remote = hub.add_task("Gone").remote()
+        hub.stop()
+        remote.update(completed=1)
+        remote.close()
+
+
 class TestErrorHandling:
     """Tests for error handling in wizard methods."""
 